@@ -14,6 +14,7 @@ CONFIGFOLDER=$CURRENT_DIR/../conf/pytest
 CONFIGFILE_UNITARY=$CONFIGFOLDER/unitary.ini
 CONFIGFILE_INTEGRATION=$CONFIGFOLDER/integration.ini
 CONFIGFILE_E2E=$CONFIGFOLDER/e2e.ini
+CONFIGFILE_BENCHMARKS=$CONFIGFOLDER/benchmarks.ini
 
 run_tests() {
     local test_type=$1
@@ -29,6 +30,12 @@ run_tests() {
     fi
 }
 
+run_benchmarks() {
+    echo "Running benchmarks..."
+    chmod +x $ROOT_DIR/tests/test_files/*.py
+    python -m pytest -v --cache-clear -c=$CONFIGFILE_BENCHMARKS --rootdir="${ROOT_DIR}" "$@"
+}
+
 pushd "${ROOT_DIR}" > /dev/null
 
     TEST_TYPE=${1:-all}
@@ -50,9 +57,13 @@ pushd "${ROOT_DIR}" > /dev/null
             python -m coverage combine $RCFOLDER
             python -m coverage xml
             ;;
+        benchmarks)
+            run_benchmarks "${@:2}"
+            exit $?
+            ;;
         *)
             echo "Invalid test type: $TEST_TYPE"
-            echo -e "Valid types:\n\tall (default)\n\tunitary\n\tintegration\n\te2e"
+            echo -e "Valid types:\n\tall (default)\n\tunitary\n\tintegration\n\te2e\n\tbenchmarks"
             exit 1
             ;;
     esac
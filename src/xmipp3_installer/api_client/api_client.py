@@ -4,58 +4,203 @@ from __future__ import annotations
 
 import http.client
 import json
-import socket
+import time
 from urllib.parse import ParseResult, urlparse
 
+from xmipp3_installer.api_client import connectivity_probe
 from xmipp3_installer.application.logger.logger import logger
 from xmipp3_installer.installer import urls
+from xmipp3_installer.repository.config_vars import default_values, variables
 
-INTERNET_CHECK_TIMEOUT = 0.3
-INTERNET_CHECK_IP = "1.1.1.1" # Cloudflare DNS, chosen for its reliability and speed
-INTERNET_CHECK_PORT = 53 # DNS typically uses port 53, which is less likely to be blocked by firewalls compared to HTTP/HTTPS ports
+__TIMEOUT_SECONDS = 6
+__SEND_ATTEMPTS = 3
+__RETRY_DELAY_SECONDS = 2
+__TOO_MANY_REQUESTS = 429
+__CLIENT_ERROR = 400
+__SERVER_ERROR = 500
+__SUCCESS_RANGE = range(200, 300)
 
 
-def send_installation_attempt(installation_info: dict | None):
+def send_installation_attempt(installation_info: dict | None) -> bool:
   """
   ### Sends a POST request to Xmipp's metrics's API.
   
   #### Params:
   - installation_info (dict): Dictionary containing all the installation information.
+
+  #### Returns:
+  - (bool): True if the API received the installation attempt, False if it has to be sent again later.
   """
   if installation_info is None:
-    return
+    return True
   params = json.dumps(installation_info)
   headers = {"Content-type": "application/json"}
   parsed_url = urlparse(urls.API_URL)
   conn = None
   try:
-    conn = __get_https_connection(parsed_url, 6)
+    conn = __get_https_connection(parsed_url, __TIMEOUT_SECONDS)
     conn.request("POST", parsed_url.path, body=params, headers=headers)
-    conn.getresponse()
+    return __is_delivered(conn.getresponse().status)
   except TimeoutError:
     logger(
       logger.yellow("There was a timeout while sending installation data."),
       show_in_terminal=False
     )
+    return False
+  except (OSError, http.client.HTTPException):
+    return False
   finally:
     if conn is not None:
       conn.close()
 
 
+def send_installation_attempts(installation_infos: list[dict]) -> tuple[int, int]:
+  """
+  ### Sends several installation attempts to Xmipp's metrics's API.
+
+  The attempts are sent one by one, in the same format as send_installation_attempt,
+  all of them through the same connection.
+  An attempt that fails because of the network or the server is retried a few times.
+  If it keeps failing, the remaining attempts are not sent.
+  An attempt the API rejects as invalid would be rejected again, so it is skipped and the next one is sent.
+
+  #### Params:
+  - installation_infos (list(dict)): Installation attempts to send.
+
+  #### Returns:
+  - (tuple(int, int)): Number of attempts, from the start of the list, that the API accepted or rejected as invalid, and number of them that it accepted.
+  """
+  parsed_url = urlparse(urls.API_URL)
+  headers = {"Content-type": "application/json"}
+  conn = __get_https_connection(parsed_url, __TIMEOUT_SECONDS)
+  n_done, n_sent = 0, 0
+  try:
+    for installation_info in installation_infos:
+      status = __send_with_retries(conn, parsed_url.path, json.dumps(installation_info), headers)
+      if status is None or not (__is_delivered(status) or __is_rejected(status)):
+        break
+      n_done += 1
+      n_sent += __is_delivered(status)
+  finally:
+    conn.close()
+  return n_done, n_sent
+
+
 def internet_available() -> bool:
   """
-  ### Checks if the internet is available by trying to connect to the API URL.
+  ### Checks if the internet is available by trying to connect to the default probe targets.
+
+  The result is reused from the disk cache for the default time to live of the connectivity probe.
 
   #### Returns:
   - (bool): True if the connection was successful, False otherwise.
   """
+  targets = connectivity_probe.parse_targets(
+    None,
+    default_values.CONFIG_DEFAULT_VALUES[variables.INTERNET_CHECK_TARGETS]
+  )
+  return connectivity_probe.is_connected(
+    targets,
+    cache_ttl=int(default_values.CONFIG_DEFAULT_VALUES[variables.INTERNET_CHECK_CACHE_TTL])
+  )
+
+
+def __send_with_retries(
+  conn: http.client.HTTPSConnection,
+  path: str,
+  body: str,
+  headers: dict
+) -> int | None:
+  """
+  ### Sends an installation attempt, retrying if the network or the server fail.
+
+  #### Params:
+  - conn (HTTPSConnection): Connection to send the attempt through.
+  - path (str): Path of the API endpoint.
+  - body (str): Installation attempt in JSON format.
+  - headers (dict): Headers of the request.
+
+  #### Returns:
+  - (int | None): Status of the last response, or None if the last attempt got no response.
+  """
+  status = None
+  for attempt in range(__SEND_ATTEMPTS):
+    if attempt:
+      time.sleep(__RETRY_DELAY_SECONDS * attempt)
+    status = __post(conn, path, body, headers)
+    if status is not None and not __is_retryable(status):
+      break
+  return status
+
+
+def __post(
+  conn: http.client.HTTPSConnection,
+  path: str,
+  body: str,
+  headers: dict
+) -> int | None:
+  """
+  ### Sends a POST request through the given connection.
+
+  The response is read completely so the connection can be reused,
+  and the connection is closed on errors so the next request opens it again.
+
+  #### Params:
+  - conn (HTTPSConnection): Connection to send the request through.
+  - path (str): Path of the API endpoint.
+  - body (str): Body of the request.
+  - headers (dict): Headers of the request.
+
+  #### Returns:
+  - (int | None): Status of the response, or None if there was no response.
+  """
   try:
-    socket.setdefaulttimeout(INTERNET_CHECK_TIMEOUT)
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-      s.connect((INTERNET_CHECK_IP, INTERNET_CHECK_PORT))
-    return True
-  except OSError:
-    return False
+    conn.request("POST", path, body=body, headers=headers)
+    response = conn.getresponse()
+    response.read()
+  except (OSError, http.client.HTTPException):
+    conn.close()
+    return None
+  return response.status
+
+
+def __is_delivered(status: int) -> bool:
+  """
+  ### Checks if a request with the given response status was accepted by the API.
+
+  #### Params:
+  - status (int): Status of the response.
+
+  #### Returns:
+  - (bool): True if the status is a success one, False otherwise.
+  """
+  return status in __SUCCESS_RANGE
+
+
+def __is_rejected(status: int) -> bool:
+  """
+  ### Checks if a request with the given response status was rejected by the API as invalid.
+
+  #### Params:
+  - status (int): Status of the response.
+
+  #### Returns:
+  - (bool): True if the status is a client error other than too many requests, False otherwise.
+  """
+  return __CLIENT_ERROR <= status < __SERVER_ERROR and status != __TOO_MANY_REQUESTS
+
+
+def __is_retryable(status: int) -> bool:
+  """
+  ### Checks if a request with the given response status can succeed if it is sent again.
+
+  #### Params:
+  - status (int): Status of the response.
+
+  #### Returns:
+  - (bool): True if the server failed or asked to retry later, False otherwise.
+  """
+  return status >= __SERVER_ERROR or status == __TOO_MANY_REQUESTS
 
 
 def __get_https_connection(parsed_url: ParseResult, timeout_seconds: int) -> http.client.HTTPSConnection:
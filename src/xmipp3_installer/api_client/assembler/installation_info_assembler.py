@@ -14,10 +14,15 @@ from xmipp3_installer.installer import constants, orquestrator
 from xmipp3_installer.installer.constants import paths
 from xmipp3_installer.installer.handlers import (
   git_handler,
-  shell_handler,
+  system_info_handler,
   versions_manager,
 )
 from xmipp3_installer.installer.handlers.cmake import cmake_constants, cmake_handler
+from xmipp3_installer.shared import file_operations
+
+__ENVIRONMENT_INFO_TIMEOUT = 30
+__BRANCH_FRESHNESS_CACHE_TTL = 3600
+__BRANCH_FRESHNESS_TIMEOUT = 5
 
 
 def get_installation_info(version_manager: versions_manager.VersionsManager, ret_code: int=0) -> dict:
@@ -34,15 +39,10 @@ def get_installation_info(version_manager: versions_manager.VersionsManager, ret
   library_versions = cmake_handler.get_library_versions_from_cmake_file(
     paths.LIBRARY_VERSIONS_FILE
   )
-  environment_info = orquestrator.run_parallel_jobs(
-    [
-      __get_cpu_flags,
-      git_handler.get_current_branch,
-      git_handler.is_branch_up_to_date,
-      __is_installed_by_scipion,
-      __get_log_tail
-    ],
-    [(), (), (), (), ()]
+  git_info = orquestrator.run_parallel_jobs(
+    [git_handler.get_current_branch, git_handler.is_branch_up_to_date],
+    [(), ("./", __BRANCH_FRESHNESS_CACHE_TTL, __BRANCH_FRESHNESS_TIMEOUT)],
+    timeout=__ENVIRONMENT_INFO_TIMEOUT
   )
 
   return {
@@ -51,7 +51,7 @@ def get_installation_info(version_manager: versions_manager.VersionsManager, ret
     },
     "version": {
       "os": get_os_release_name(),
-      "cpuFlags": environment_info[0],
+      "cpuFlags": system_info_handler.get_cpu_flags(),
       "cuda": library_versions.get(cmake_constants.CMAKE_CUDA),
       "cmake": library_versions.get(cmake_constants.CMAKE_CMAKE),
       "gcc": library_versions.get(cmake_constants.CMAKE_GCC),
@@ -65,13 +65,13 @@ def get_installation_info(version_manager: versions_manager.VersionsManager, ret
     },
     "xmipp": {
       "branch": __get_installation_branch_name(
-        environment_info[1], version_manager
+        git_info[0], version_manager
       ),
-      "updated": environment_info[2],
-      "installedByScipion": environment_info[3]
+      "updated": git_info[1],
+      "installedByScipion": __is_installed_by_scipion()
     },
     "returnCode": ret_code,
-    "logTail": __anonymize_log_tail(environment_info[4]) if ret_code else None # Only needed if something went wrong
+    "logTail": __anonymize_log_tail(__get_log_tail()) if ret_code else None # Only needed if something went wrong
   }
 
 def get_os_release_name() -> str:
@@ -106,7 +106,7 @@ def __get_user_id() -> str:
   #### Returns:
   - (str): User id, or 'Anoymous' if there were any errors.
   """
-  identifier = __get_mac_address()
+  identifier = system_info_handler.get_mac_address()
   if not identifier:
     identifier = getpass.getuser()
     if not identifier:
@@ -116,20 +116,6 @@ def __get_user_id() -> str:
   sha256.update(identifier.encode())
   return sha256.hexdigest()
 
-def __get_cpu_flags() -> list[str]:
-  """
-  ### This function obtains the list of compilation flags supported by the CPU.
-
-  #### Returns:
-  - (list(str)): List of flags supported by the CPU.  
-  """
-  flags_header = "Flags:"
-  ret_code, flags_line = shell_handler.run_shell_command(f'lscpu | grep \"{flags_header}\"')
-  if ret_code:
-    return []
-  flags_line = flags_line.replace(flags_header, "").strip()
-  return [flag for flag in flags_line.split(" ") if flag]
-
 def __get_log_tail() -> str | None:
   """
   ### Returns the last lines of the installation log.
@@ -137,10 +123,7 @@ def __get_log_tail() -> str | None:
   #### Returns:
   - (str | None): Installation log's last lines, or None if there were any errors.
   """
-  ret_code, output = shell_handler.run_shell_command(
-    f"tail -n {constants.TAIL_LOG_NCHARS} {paths.LOG_FILE}"
-  )
-  return output if ret_code == 0 else None
+  return file_operations.read_tail(paths.LOG_FILE, constants.TAIL_LOG_NCHARS)
 
 def __anonymize_log_tail(log_text: str | None) -> str | None:
   """
@@ -158,35 +141,6 @@ def __anonymize_log_tail(log_text: str | None) -> str | None:
   pattern = re.compile(r'(/home/)([^/\s]+)')
   return pattern.sub(r'\1REDACTED', log_text)
 
-def __get_mac_address() -> str | None:
-  """
-  ### Returns a physical MAC address for this machine. It prioritizes ethernet over wireless.
-  
-  #### Returns:
-  - (str | None): MAC address, or None if there were any errors.
-  """
-  ret_code, output = shell_handler.run_shell_command("ip addr")
-  return __find_mac_address_in_lines(output.split('\n')) if ret_code == 0 else None
-
-def __find_mac_address_in_lines(lines: list[str]) -> str | None:
-  """
-  ### Returns a physical MAC address within the text lines provided.
-
-  #### Params:
-  - lines (list(str)): Lines of text where MAC address should be looked for.
-  
-  #### Returns:
-  - (str | None): MAC address if found, None otherwise.
-  """
-  for line_index in range(len(lines) - 1):
-    match = re.match(r"^\d+: (enp|wlp|eth|ens|eno)\w+", lines[line_index])
-    if not match:
-      continue
-    mac_match = re.search(r"link/ether ([0-9a-f:]{17})", lines[line_index + 1])
-    if mac_match:
-      return mac_match.group(1)
-  return None
-
 def __is_installed_by_scipion() -> bool:
   """
   ### Checks if the current xmipp installation is being carried out from Scipion.
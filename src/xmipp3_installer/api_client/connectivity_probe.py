@@ -0,0 +1,141 @@
+"""### Functions to check if the network is reachable."""
+
+from __future__ import annotations
+
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from xmipp3_installer.installer.constants import paths
+from xmipp3_installer.shared import ttl_cache
+
+PROBE_TIMEOUT = 0.3
+
+def parse_targets(value: str | None, default_value: str) -> list[tuple[str, int]]:
+  """
+  ### Parses the probe targets from the config value.
+
+  Targets are given as host:port pairs separated by commas or spaces.
+  IPv6 addresses are written between brackets, as in [::1]:53.
+
+  #### Params:
+  - value (str | None): Value read from the config.
+  - default_value (str): Value to use if the given one does not contain any valid target.
+
+  #### Returns:
+  - (list(tuple(str, int))): Host and port of each target.
+  """
+  targets = __get_targets(value or "")
+  return targets if targets else __get_targets(default_value)
+
+def is_connected(targets: list[tuple[str, int]], timeout: float=PROBE_TIMEOUT, cache_ttl: int=0) -> bool:
+  """
+  ### Checks if any of the given targets accepts a TCP connection.
+
+  All targets are probed concurrently, each socket with its own timeout,
+  so the global default timeout of the process is not modified.
+  The timeout of each target also covers resolving its host name.
+  If a cache time to live is given, a recent enough result stored
+  on disk by a previous run is returned instead of probing again.
+
+  #### Params:
+  - targets (list(tuple(str, int))): Host and port of each target.
+  - timeout (float): Optional. Seconds each target has to be resolved and accept the connection.
+  - cache_ttl (int): Optional. Seconds the result can be reused from the disk cache. Default is 0 (disabled).
+
+  #### Returns:
+  - (bool): True if the connection to any target succeeded, False otherwise.
+  """
+  if not targets:
+    return False
+  cache_key = ",".join(f"{host}:{port}" for host, port in targets)
+  connected = ttl_cache.get_cached_value(paths.CONNECTIVITY_CACHE_FILE, cache_key, cache_ttl)
+  if isinstance(connected, bool):
+    return connected
+  with ThreadPoolExecutor(max_workers=len(targets)) as pool:
+    connected = any(pool.map(lambda target: __can_connect(target, timeout), targets))
+  if cache_ttl > 0:
+    ttl_cache.set_cached_value(paths.CONNECTIVITY_CACHE_FILE, cache_key, connected)
+  return connected
+
+def __get_targets(value: str) -> list[tuple[str, int]]:
+  """
+  ### Returns the valid targets in the given text.
+
+  #### Params:
+  - value (str): Text with the targets.
+
+  #### Returns:
+  - (list(tuple(str, int))): Host and port of each valid target.
+  """
+  targets = []
+  for item in value.replace(",", " ").split():
+    host, _, port = item.rpartition(":")
+    host = host[1:-1] if host.startswith("[") and host.endswith("]") else host
+    if host and port.isdigit() and 0 < int(port) < 2**16:
+      targets.append((host, int(port)))
+  return targets
+
+def __can_connect(target: tuple[str, int], timeout: float) -> bool:
+  """
+  ### Checks if the given target accepts a TCP connection.
+
+  #### Params:
+  - target (tuple(str, int)): Host and port of the target.
+  - timeout (float): Seconds the target has to be resolved and accept the connection.
+
+  #### Returns:
+  - (bool): True if the connection to any of its addresses succeeded, False otherwise.
+  """
+  deadline = time.monotonic() + timeout
+  for address in __resolve(target, timeout):
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+      return False
+    if __connect(address, remaining):
+      return True
+  return False
+
+def __resolve(target: tuple[str, int], timeout: float) -> list[tuple[str, int]]:
+  """
+  ### Resolves the addresses of the given target.
+
+  The system resolver has no timeout of its own, so it runs in a daemon thread,
+  which neither keeps the probe waiting nor the process from exiting after the timeout.
+
+  #### Params:
+  - target (tuple(str, int)): Host and port of the target.
+  - timeout (float): Seconds the resolution can take.
+
+  #### Returns:
+  - (list(tuple(str, int))): IP and port of each address of the target, empty if it could not be resolved in time.
+  """
+  addresses = []
+  def resolve():
+    try:
+      address_infos = socket.getaddrinfo(*target, type=socket.SOCK_STREAM)
+    except OSError:
+      return
+    addresses.extend((address_info[4][0], address_info[4][1]) for address_info in address_infos)
+  resolver = threading.Thread(target=resolve, daemon=True)
+  resolver.start()
+  resolver.join(timeout)
+  return addresses if not resolver.is_alive() else []
+
+def __connect(address: tuple[str, int], timeout: float) -> bool:
+  """
+  ### Checks if the given address accepts a TCP connection.
+
+  #### Params:
+  - address (tuple(str, int)): IP and port to connect to.
+  - timeout (float): Seconds the address has to accept the connection.
+
+  #### Returns:
+  - (bool): True if the connection succeeded, False otherwise.
+  """
+  try:
+    with socket.create_connection(address, timeout=timeout):
+      return True
+  except OSError:
+    return False
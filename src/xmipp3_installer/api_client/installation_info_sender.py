@@ -0,0 +1,71 @@
+"""### Functions to send the installation info without making the installer wait for it."""
+
+from __future__ import annotations
+
+from xmipp3_installer.api_client import api_client, connectivity_probe, installation_spool
+from xmipp3_installer.api_client.assembler import installation_info_assembler
+from xmipp3_installer.application.logger.logger import logger
+from xmipp3_installer.installer import orquestrator
+from xmipp3_installer.installer.constants import paths
+from xmipp3_installer.installer.handlers import versions_manager
+from xmipp3_installer.repository import config
+from xmipp3_installer.repository.config_vars import default_values, variables
+from xmipp3_installer.shared import background_process, numeric
+
+__SEND_COMMAND = (
+  "from xmipp3_installer.api_client import installation_info_sender; "
+  "installation_info_sender.send_installation_info({ret_code!r})"
+)
+
+def send_in_background(ret_code: int) -> bool:
+  """
+  ### Assembles and sends the installation info from a detached process.
+
+  Gathering the info involves checking the connection and listing the remote branch, and sending it
+  a request with its own timeout, so none of it is done while the user waits for the installer to exit.
+
+  #### Params:
+  - ret_code (int): Return code of the installation.
+
+  #### Returns:
+  - (bool): True if the process was started, False otherwise.
+  """
+  return background_process.start_detached_python(__SEND_COMMAND.format(ret_code=ret_code))
+
+def send_installation_info(ret_code: int):
+  """
+  ### Assembles and sends the installation info.
+
+  The connection is checked while the info is being assembled.
+  If it cannot be sent, it is stored in the spool to be sent in a later run.
+  If it is sent, the ones stored in the spool by previous runs are sent too.
+
+  #### Params:
+  - ret_code (int): Return code of the installation.
+  """
+  config_values = config.ConfigurationFileHandler(path=paths.CONFIG_FILE, show_errors=False).values
+  probe_targets = connectivity_probe.parse_targets(
+    config_values[variables.INTERNET_CHECK_TARGETS],
+    default_values.CONFIG_DEFAULT_VALUES[variables.INTERNET_CHECK_TARGETS]
+  )
+  probe_cache_ttl = numeric.get_non_negative_int(
+    config_values[variables.INTERNET_CHECK_CACHE_TTL],
+    int(default_values.CONFIG_DEFAULT_VALUES[variables.INTERNET_CHECK_CACHE_TTL])
+  )
+  is_connected, installation_info = orquestrator.run_parallel_jobs(
+    [connectivity_probe.is_connected, installation_info_assembler.get_installation_info],
+    [
+      (probe_targets, connectivity_probe.PROBE_TIMEOUT, probe_cache_ttl),
+      (versions_manager.VersionsManager(paths.VERSION_INFO_FILE), ret_code)
+    ]
+  )
+  if installation_info is None:
+    return
+  if not is_connected:
+    logger("No internet connection available. Installation info will be sent later.", show_in_terminal=False)
+    installation_spool.add_to_spool(paths.INSTALLATION_SPOOL_PATH, installation_info)
+    return
+  if not api_client.send_installation_attempt(installation_info):
+    installation_spool.add_to_spool(paths.INSTALLATION_SPOOL_PATH, installation_info)
+    return
+  installation_spool.drain_spool(paths.INSTALLATION_SPOOL_PATH)
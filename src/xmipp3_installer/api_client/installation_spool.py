@@ -0,0 +1,190 @@
+"""### Functions to keep the installation attempts that could not be sent until they can be."""
+
+from __future__ import annotations
+
+import contextlib
+import fcntl
+import json
+import os
+import tempfile
+import time
+
+from xmipp3_installer.api_client import api_client
+
+MAX_SPOOL_SIZE = 1024 * 1024
+__ENTRY_SUFFIX = ".json"
+__LOCK_FILE = ".lock"
+
+def add_to_spool(spool_path: str, installation_info: dict, max_size: int=MAX_SPOOL_SIZE) -> bool:
+  """
+  ### Stores the given installation attempt in the spool.
+
+  Each attempt is written atomically to its own file. If the spool grows over
+  the maximum size, the oldest attempts are discarded until it fits again.
+
+  #### Params:
+  - spool_path (str): Spool directory.
+  - installation_info (dict): Installation attempt to store.
+  - max_size (int): Optional. Maximum size of the spool in bytes.
+
+  #### Returns:
+  - (bool): True if the attempt was stored, False otherwise.
+  """
+  try:
+    os.makedirs(spool_path, exist_ok=True)
+    file_descriptor, tmp_path = tempfile.mkstemp(dir=spool_path, suffix=".tmp")
+  except OSError:
+    return False
+  entry_path = os.path.join(spool_path, f"{time.time_ns()}-{os.getpid()}{__ENTRY_SUFFIX}")
+  try:
+    with os.fdopen(file_descriptor, "w") as tmp_file:
+      json.dump(installation_info, tmp_file)
+    os.replace(tmp_path, entry_path)
+  except (OSError, TypeError, ValueError):
+    __remove(tmp_path)
+    return False
+  return entry_path not in __trim(spool_path, max_size)
+
+def drain_spool(spool_path: str) -> int:
+  """
+  ### Sends the installation attempts stored in the spool, oldest first.
+
+  Each attempt is removed from the spool once the API accepts it, or rejects it as invalid,
+  so an attempt that can never be accepted does not hold back the ones stored after it.
+  Attempts that could not be sent are kept for a later run.
+  Only one process drains the spool at a time; if another one is already doing it, nothing is done.
+
+  #### Params:
+  - spool_path (str): Spool directory.
+
+  #### Returns:
+  - (int): Number of attempts sent.
+  """
+  if not os.path.isdir(spool_path):
+    return 0
+  try:
+    with open(os.path.join(spool_path, __LOCK_FILE), "w") as lock_file:
+      fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+      return __send_entries(spool_path)
+  except OSError:
+    return 0
+
+def __send_entries(spool_path: str) -> int:
+  """
+  ### Sends the installation attempts stored in the spool and removes the ones accepted or rejected.
+
+  #### Params:
+  - spool_path (str): Spool directory.
+
+  #### Returns:
+  - (int): Number of attempts sent.
+  """
+  entries = __read_entries(spool_path)
+  if not entries:
+    return 0
+  n_done, n_sent = api_client.send_installation_attempts(
+    [installation_info for _, installation_info in entries]
+  )
+  for entry_path, _ in entries[:n_done]:
+    __remove(entry_path)
+  return n_sent
+
+def __get_entry_paths(spool_path: str) -> list[str]:
+  """
+  ### Returns the files of the attempts stored in the spool, oldest first.
+
+  #### Params:
+  - spool_path (str): Spool directory.
+
+  #### Returns:
+  - (list(str)): Paths of the stored attempts.
+  """
+  try:
+    names = os.listdir(spool_path)
+  except OSError:
+    return []
+  return [os.path.join(spool_path, name) for name in sorted(names) if name.endswith(__ENTRY_SUFFIX)]
+
+def __read_entries(spool_path: str) -> list[tuple[str, dict]]:
+  """
+  ### Reads the attempts stored in the spool, oldest first.
+
+  Files that cannot be parsed are removed, since they could never be sent.
+
+  #### Params:
+  - spool_path (str): Spool directory.
+
+  #### Returns:
+  - (list(tuple(str, dict))): Path and content of each stored attempt.
+  """
+  entries = []
+  for entry_path in __get_entry_paths(spool_path):
+    installation_info = __read_entry(entry_path)
+    if isinstance(installation_info, dict):
+      entries.append((entry_path, installation_info))
+    else:
+      __remove(entry_path)
+  return entries
+
+def __read_entry(entry_path: str) -> dict | None:
+  """
+  ### Reads a stored attempt.
+
+  #### Params:
+  - entry_path (str): Path of the stored attempt.
+
+  #### Returns:
+  - (dict | None): Content of the attempt, or None if it could not be read.
+  """
+  try:
+    with open(entry_path) as entry_file:
+      return json.load(entry_file)
+  except (OSError, ValueError):
+    return None
+
+def __trim(spool_path: str, max_size: int) -> list[str]:
+  """
+  ### Removes the oldest attempts until the spool fits in the given size.
+
+  #### Params:
+  - spool_path (str): Spool directory.
+  - max_size (int): Maximum size of the spool in bytes.
+
+  #### Returns:
+  - (list(str)): Paths of the removed attempts.
+  """
+  entry_sizes = [(entry_path, __get_size(entry_path)) for entry_path in __get_entry_paths(spool_path)]
+  total_size = sum(size for _, size in entry_sizes)
+  removed_paths = []
+  for entry_path, size in entry_sizes:
+    if total_size <= max_size:
+      break
+    __remove(entry_path)
+    removed_paths.append(entry_path)
+    total_size -= size
+  return removed_paths
+
+def __get_size(path: str) -> int:
+  """
+  ### Returns the size of the given file.
+
+  #### Params:
+  - path (str): Path of the file.
+
+  #### Returns:
+  - (int): Size in bytes, or 0 if it could not be read.
+  """
+  try:
+    return os.path.getsize(path)
+  except OSError:
+    return 0
+
+def __remove(path: str):
+  """
+  ### Removes the given file, ignoring any error.
+
+  #### Params:
+  - path (str): Path of the file.
+  """
+  with contextlib.suppress(OSError):
+    os.remove(path)
@@ -6,6 +6,9 @@ from xmipp3_installer.application.cli.arguments.params import (
   PARAM_ALL_FUNCTIONS,
   PARAM_ALL_PROGRAMS,
   PARAM_BRANCH,
+  PARAM_CLONE_STRATEGY,
+  PARAM_DRY_RUN,
+  PARAM_FORCE,
   PARAM_GIT_COMMAND,
   PARAM_JOBS,
   PARAM_KEEP_OUTPUT,
@@ -13,9 +16,12 @@ from xmipp3_installer.application.cli.arguments.params import (
   PARAM_MODEL_PATH,
   PARAM_MODELS_DIRECTORY,
   PARAM_OVERWRITE,
+  PARAM_REPORT,
+  PARAM_RESUME,
   PARAM_SHORT,
   PARAM_SHOW_TESTS,
   PARAM_TEST_NAMES,
+  PARAM_TRACE,
   PARAM_UPDATE,
   PARAMS,
   SHORT_VERSION,
@@ -100,18 +106,21 @@ MODES = {
 MODE_ARGS = {
   MODE_VERSION: [PARAM_SHORT],
   MODE_COMPILE_AND_INSTALL: [PARAM_JOBS, PARAM_KEEP_OUTPUT],
-  MODE_ALL: [PARAM_JOBS, PARAM_BRANCH, PARAM_KEEP_OUTPUT],
-  MODE_CONFIG_BUILD: [PARAM_KEEP_OUTPUT],
+  MODE_ALL: [PARAM_JOBS, PARAM_BRANCH, PARAM_CLONE_STRATEGY, PARAM_KEEP_OUTPUT, PARAM_RESUME, PARAM_FORCE],
+  MODE_CONFIG_BUILD: [PARAM_KEEP_OUTPUT, PARAM_FORCE],
   MODE_CONFIG: [PARAM_OVERWRITE],
   MODE_GET_MODELS: [PARAM_MODELS_DIRECTORY],
-  MODE_GET_SOURCES: [PARAM_BRANCH, PARAM_KEEP_OUTPUT],
-  MODE_CLEAN_BIN: [],
-  MODE_CLEAN_ALL: [],
+  MODE_GET_SOURCES: [PARAM_JOBS, PARAM_BRANCH, PARAM_CLONE_STRATEGY, PARAM_KEEP_OUTPUT],
+  MODE_CLEAN_BIN: [PARAM_DRY_RUN, PARAM_REPORT],
+  MODE_CLEAN_ALL: [PARAM_DRY_RUN, PARAM_REPORT],
   MODE_TEST: [[PARAM_TEST_NAMES], [PARAM_SHOW_TESTS], [PARAM_ALL_FUNCTIONS], [PARAM_ALL_PROGRAMS]],
   MODE_GIT: [PARAM_GIT_COMMAND],
   MODE_ADD_MODEL: [PARAM_LOGIN, PARAM_MODEL_PATH, PARAM_UPDATE]
 }
 
+# Arguments accepted by every mode, on top of its own
+COMMON_ARGS = [PARAM_TRACE]
+
 # Examples for the help message of each mode
 MODE_EXAMPLES = {
   MODE_VERSION: [
@@ -128,9 +137,15 @@ MODE_EXAMPLES = {
     f'./xmipp {PARAMS[PARAM_JOBS][SHORT_VERSION]} 20',
     f'./xmipp {PARAMS[PARAM_BRANCH][SHORT_VERSION]} main',
     (f'./xmipp {MODE_ALL} {PARAMS[PARAM_JOBS][SHORT_VERSION]} 20 '
-    f'{PARAMS[PARAM_BRANCH][SHORT_VERSION]} main')
+    f'{PARAMS[PARAM_BRANCH][SHORT_VERSION]} main'),
+    f'./xmipp {PARAMS[PARAM_CLONE_STRATEGY][LONG_VERSION]} {constants.CLONE_STRATEGY_SHALLOW}',
+    f'./xmipp {PARAMS[PARAM_RESUME][LONG_VERSION]}',
+    f'./xmipp {PARAMS[PARAM_TRACE][LONG_VERSION]} installation-trace.json'
+  ],
+  MODE_CONFIG_BUILD: [
+    f'./xmipp {MODE_CONFIG_BUILD}',
+    f'./xmipp {MODE_CONFIG_BUILD} {PARAMS[PARAM_FORCE][LONG_VERSION]}'
   ],
-  MODE_CONFIG_BUILD: [],
   MODE_CONFIG: [
     f'./xmipp {MODE_CONFIG} {PARAMS[PARAM_OVERWRITE][LONG_VERSION]}'
   ],
@@ -140,10 +155,19 @@ MODE_EXAMPLES = {
   ],
   MODE_GET_SOURCES: [
     f'./xmipp {MODE_GET_SOURCES}',
-    f'./xmipp {MODE_GET_SOURCES} {PARAMS[PARAM_BRANCH][SHORT_VERSION]} main'
+    f'./xmipp {MODE_GET_SOURCES} {PARAMS[PARAM_BRANCH][SHORT_VERSION]} main',
+    f'./xmipp {MODE_GET_SOURCES} {PARAMS[PARAM_JOBS][SHORT_VERSION]} 1',
+    f'./xmipp {MODE_GET_SOURCES} {PARAMS[PARAM_CLONE_STRATEGY][LONG_VERSION]} {constants.CLONE_STRATEGY_PARTIAL}'
+  ],
+  MODE_CLEAN_BIN: [
+    f'./xmipp {MODE_CLEAN_BIN}',
+    f'./xmipp {MODE_CLEAN_BIN} {PARAMS[PARAM_DRY_RUN][LONG_VERSION]}',
+    f'./xmipp {MODE_CLEAN_BIN} {PARAMS[PARAM_DRY_RUN][LONG_VERSION]} {PARAMS[PARAM_REPORT][LONG_VERSION]} clean-report.json'
+  ],
+  MODE_CLEAN_ALL: [
+    f'./xmipp {MODE_CLEAN_ALL}',
+    f'./xmipp {MODE_CLEAN_ALL} {PARAMS[PARAM_DRY_RUN][LONG_VERSION]}'
   ],
-  MODE_CLEAN_BIN: [],
-  MODE_CLEAN_ALL: [],
   MODE_TEST: [
     f'./xmipp {MODE_TEST} xmipp_sample_test',
     f'./xmipp {MODE_TEST} {PARAMS[PARAM_SHOW_TESTS][LONG_VERSION]}',
@@ -22,6 +22,12 @@ PARAM_MODEL_PATH = 'modelPath'
 PARAM_UPDATE = 'update'
 PARAM_OVERWRITE = 'overwrite'
 PARAM_KEEP_OUTPUT = "keep_output"
+PARAM_CLONE_STRATEGY = "clone_strategy"
+PARAM_RESUME = "resume"
+PARAM_FORCE = "force"
+PARAM_TRACE = "trace"
+PARAM_DRY_RUN = "dry_run"
+PARAM_REPORT = "report"
 PARAMS = {
   PARAM_SHORT: {
     LONG_VERSION: "--short",
@@ -82,5 +88,29 @@ PARAMS = {
   PARAM_KEEP_OUTPUT: {
     LONG_VERSION: "--keep-output",
     DESCRIPTION: "If set, output sent through the terminal won't substitute lines, looking more like the log."
+  },
+  PARAM_CLONE_STRATEGY: {
+    LONG_VERSION: "--clone-strategy",
+    DESCRIPTION: "Clone strategy for the source repositories: full, shallow (only the target commit), or partial (file contents downloaded on demand)."
+  },
+  PARAM_RESUME: {
+    LONG_VERSION: "--resume",
+    DESCRIPTION: "If set, the installation stages completed by the previous run are skipped, resuming from the first incomplete one."
+  },
+  PARAM_FORCE: {
+    LONG_VERSION: "--force",
+    DESCRIPTION: "If set, the project is configured with CMake even if nothing changed since the last successful configuration."
+  },
+  PARAM_TRACE: {
+    LONG_VERSION: "--trace",
+    DESCRIPTION: "File where a timeline of the run is written, in Chrome trace format (viewable in chrome://tracing or Perfetto). The installation info is sent in the background after the run, so it is not part of the timeline."
+  },
+  PARAM_DRY_RUN: {
+    LONG_VERSION: "--dry-run",
+    DESCRIPTION: "If set, the paths that would be deleted are listed with their sizes, but nothing is deleted."
+  },
+  PARAM_REPORT: {
+    LONG_VERSION: "--report",
+    DESCRIPTION: "File where the paths to delete and their sizes are written in JSON format."
   }
 }
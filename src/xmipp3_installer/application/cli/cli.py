@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import argparse
-import multiprocessing
 import os
 import sys
 from typing import Any
@@ -21,7 +20,8 @@ from xmipp3_installer.application.cli.parsers.mode_help_formatter import (
   ModeHelpFormatter,
 )
 from xmipp3_installer.application.logger.logger import logger
-from xmipp3_installer.installer import installer_service
+from xmipp3_installer.installer import constants, installer_service
+from xmipp3_installer.installer.handlers import resources_handler
 
 
 def main():
@@ -60,42 +60,59 @@ def __add_params(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
   subparsers = parser.add_subparsers(dest=modes.MODE)
   default_jobs = __get_default_job_number()
 
-  add_model_subparser = subparsers.add_parser(modes.MODE_ADD_MODEL, formatter_class=ModeHelpFormatter)
+  add_model_subparser = __add_mode_subparser(subparsers, modes.MODE_ADD_MODEL)
   __add_params_mode_add_model(add_model_subparser)
 
-  all_subparser = subparsers.add_parser(modes.MODE_ALL, formatter_class=ModeHelpFormatter)
+  all_subparser = __add_mode_subparser(subparsers, modes.MODE_ALL)
   __add_params_mode_all(all_subparser, default_jobs)
 
-  subparsers.add_parser(modes.MODE_CLEAN_ALL, formatter_class=ModeHelpFormatter)
+  clean_all_subparser = __add_mode_subparser(subparsers, modes.MODE_CLEAN_ALL)
+  __add_params_mode_clean(clean_all_subparser)
 
-  subparsers.add_parser(modes.MODE_CLEAN_BIN, formatter_class=ModeHelpFormatter)
+  clean_bin_subparser = __add_mode_subparser(subparsers, modes.MODE_CLEAN_BIN)
+  __add_params_mode_clean(clean_bin_subparser)
 
-  compile_and_install_subparser = subparsers.add_parser(modes.MODE_COMPILE_AND_INSTALL, formatter_class=ModeHelpFormatter)
+  compile_and_install_subparser = __add_mode_subparser(subparsers, modes.MODE_COMPILE_AND_INSTALL)
   __add_params_mode_compile_and_install(compile_and_install_subparser, default_jobs)
 
-  build_config_subparser = subparsers.add_parser(modes.MODE_CONFIG_BUILD, formatter_class=ModeHelpFormatter)
+  build_config_subparser = __add_mode_subparser(subparsers, modes.MODE_CONFIG_BUILD)
   __add_params_mode_config_build(build_config_subparser)
 
-  config_subparser = subparsers.add_parser(modes.MODE_CONFIG, formatter_class=ModeHelpFormatter)
+  config_subparser = __add_mode_subparser(subparsers, modes.MODE_CONFIG)
   __add_params_mode_config(config_subparser)
 
-  get_models_subparser = subparsers.add_parser(modes.MODE_GET_MODELS, formatter_class=ModeHelpFormatter)
+  get_models_subparser = __add_mode_subparser(subparsers, modes.MODE_GET_MODELS)
   __add_params_mode_get_models(get_models_subparser)
 
-  get_sources_subparser = subparsers.add_parser(modes.MODE_GET_SOURCES, formatter_class=ModeHelpFormatter)
-  __add_params_mode_get_sources(get_sources_subparser)
+  get_sources_subparser = __add_mode_subparser(subparsers, modes.MODE_GET_SOURCES)
+  __add_params_mode_get_sources(get_sources_subparser, default_jobs)
 
-  git_subparser = subparsers.add_parser(modes.MODE_GIT, formatter_class=ModeHelpFormatter)
+  git_subparser = __add_mode_subparser(subparsers, modes.MODE_GIT)
   __add_params_mode_git(git_subparser)
 
-  test_subparser = subparsers.add_parser(modes.MODE_TEST, formatter_class=ModeHelpFormatter)
+  test_subparser = __add_mode_subparser(subparsers, modes.MODE_TEST)
   __add_params_mode_test(test_subparser)
 
-  version_subparser = subparsers.add_parser(modes.MODE_VERSION, formatter_class=ModeHelpFormatter)
+  version_subparser = __add_mode_subparser(subparsers, modes.MODE_VERSION)
   __add_params_mode_version(version_subparser)
 
   return parser
 
+def __add_mode_subparser(subparsers: argparse._SubParsersAction, mode: str) -> argparse.ArgumentParser:
+  """
+  ### Adds the subparser of the given mode, with the params common to all modes.
+
+  #### Params:
+  - subparsers (_SubParsersAction): Subparsers of the main parser.
+  - mode (str): Mode to add the subparser for.
+
+  #### Returns:
+  - (ArgumentParser): Subparser of the mode.
+  """
+  subparser = subparsers.add_parser(mode, formatter_class=ModeHelpFormatter)
+  subparser.add_argument(*format.get_param_names(params.PARAM_TRACE))
+  return subparser
+
 def __add_params_mode_add_model(subparser: argparse.ArgumentParser):
   """
   ### Adds params for mode "addModel".
@@ -117,7 +134,23 @@ def __add_params_mode_all(subparser: argparse.ArgumentParser, default_jobs: int)
   """
   subparser.add_argument(*format.get_param_names(params.PARAM_JOBS), type=int, default=default_jobs)
   subparser.add_argument(*format.get_param_names(params.PARAM_BRANCH))
+  subparser.add_argument(
+    *format.get_param_names(params.PARAM_CLONE_STRATEGY),
+    choices=constants.CLONE_STRATEGIES
+  )
   subparser.add_argument(*format.get_param_names(params.PARAM_KEEP_OUTPUT), action='store_true')
+  subparser.add_argument(*format.get_param_names(params.PARAM_RESUME), action='store_true')
+  subparser.add_argument(*format.get_param_names(params.PARAM_FORCE), action='store_true')
+
+def __add_params_mode_clean(subparser: argparse.ArgumentParser):
+  """
+  ### Adds params for modes "cleanAll" and "cleanBin".
+
+  #### Params:
+  - subparser (ArgumentParser): Subparser to add the params to.
+  """
+  subparser.add_argument(*format.get_param_names(params.PARAM_DRY_RUN), action='store_true')
+  subparser.add_argument(*format.get_param_names(params.PARAM_REPORT))
 
 def __add_params_mode_compile_and_install(subparser: argparse.ArgumentParser, default_jobs: int):
   """
@@ -139,6 +172,7 @@ def __add_params_mode_config_build(subparser: argparse.ArgumentParser):
   - subparser (ArgumentParser): Subparser to add the params to.
   """
   subparser.add_argument(*format.get_param_names(params.PARAM_KEEP_OUTPUT), action='store_true')
+  subparser.add_argument(*format.get_param_names(params.PARAM_FORCE), action='store_true')
 
 def __add_params_mode_config(subparser: argparse.ArgumentParser):
   """
@@ -161,14 +195,20 @@ def __add_params_mode_get_models(subparser: argparse.ArgumentParser):
     default=os.path.abspath(arguments.DEFAULT_MODELS_DIR)
   )
 
-def __add_params_mode_get_sources(subparser: argparse.ArgumentParser):
+def __add_params_mode_get_sources(subparser: argparse.ArgumentParser, default_jobs: int):
   """
   ### Adds params for mode "getSources".
 
   #### Params:
   - subparser (ArgumentParser): Subparser to add the params to.
+  - default_jobs (int): Default number of jobs to run the task.
   """
+  subparser.add_argument(*format.get_param_names(params.PARAM_JOBS), type=int, default=default_jobs)
   subparser.add_argument(*format.get_param_names(params.PARAM_BRANCH))
+  subparser.add_argument(
+    *format.get_param_names(params.PARAM_CLONE_STRATEGY),
+    choices=constants.CLONE_STRATEGIES
+  )
   subparser.add_argument(*format.get_param_names(params.PARAM_KEEP_OUTPUT), action='store_true')
 
 def __add_params_mode_git(subparser: argparse.ArgumentParser):
@@ -206,13 +246,10 @@ def __get_default_job_number() -> int:
   """
   ### Gets the default number of jobs to be used by parallelizable tasks.
 
-  Returned number will be 120% of CPU cores, due to not all jobs taking 
-  100% of CPU time continuously.
-
   #### Returns:
-  - (int): Default number of jobs.
+  - (int): Default number of jobs, based on the CPUs the installer is allowed to use.
   """
-  return multiprocessing.cpu_count() + int(multiprocessing.cpu_count() * 0.2)
+  return resources_handler.get_default_job_number()
 
 def __add_default_usage_mode():
   """### Sets the usage mode as the default one when a mode has not been specifically provided."""
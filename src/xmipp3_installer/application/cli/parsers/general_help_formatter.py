@@ -16,6 +16,7 @@ class GeneralHelpFormatter(BaseHelpFormatter):
     help_message = "Run Xmipp's installer script\n\nUsage: xmipp [options]\n"
     for section in modes.MODES:
       help_message += self._get_section_message(section)
+    help_message += f"\nCommon options of all modes: {self._get_mode_arg_group_str(modes.COMMON_ARGS)}\n"
     help_message += f"\n{self._get_epilog()}"
     help_message += self._get_note()
     return format.get_formatting_tabs(help_message)
@@ -67,6 +67,8 @@ class ModeHelpFormatter(BaseHelpFormatter):
 
     help_message += f'Usage: {arguments.XMIPP_PROGRAM_NAME} {mode}{options_str}\n{separator}'
     help_message += self._get_args_info(args)
+    help_message += self._get_help_separator() + '\t# Common options #\n\n'
+    help_message += self._get_args_group_info(modes.COMMON_ARGS)
     return help_message
 
   @staticmethod
@@ -13,6 +13,7 @@ CMAKE_CONFIGURE_ERROR = 4
 CMAKE_COMPILE_ERROR = 5
 CMAKE_INSTALL_ERROR = 6
 IO_ERROR = 7
+TIMEOUT_ERROR = 8
 
 # Error messages
 __CHECK_LOG_MESSAGE = f'Check the inside file \'{paths.LOG_FILE}\'.'
@@ -24,5 +25,6 @@ ERROR_CODES = {
   CMAKE_CONFIGURE_ERROR: ['Error configuring with CMake.', __CHECK_LOG_MESSAGE],
   CMAKE_COMPILE_ERROR: ['Error compiling with CMake.', __CHECK_LOG_MESSAGE],
   CMAKE_INSTALL_ERROR: ['Error installing with CMake.', __CHECK_LOG_MESSAGE],
-  IO_ERROR: ['Input/output error.', 'This error can be caused by the installer not being able to read/write/create/delete a file. Check your permissions on this directory.']
+  IO_ERROR: ['Input/output error.', 'This error can be caused by the installer not being able to read/write/create/delete a file. Check your permissions on this directory.'],
+  TIMEOUT_ERROR: ['A command took too long and was terminated.', 'Please review the internet connection or the resources of the machine, and try again.']
 }
@@ -2,7 +2,9 @@
 
 import logging
 import shutil
+import threading
 from io import BufferedReader
+from typing import Callable, List, Tuple
 
 from xmipp3_installer.application.logger import errors
 from xmipp3_installer.installer import urls
@@ -32,6 +34,7 @@ class Logger(Singleton):
     self._file_logger = None
     self._last_printed_elem = None
     self._allow_substitution = True
+    self._thread_state = threading.local()
   
   def green(self, text: str) -> str:
     """
@@ -124,6 +127,26 @@ class Logger(Singleton):
     """
     self._allow_substitution = allow_substitution
 
+  def defer_output(self, deferred_output: 'DeferredOutput | None'):
+    """
+    ### Holds the messages logged from the current thread in the given deferred output.
+
+    Messages logged from other threads, even if they were started by this one, are not affected.
+
+    #### Params:
+    - deferred_output (DeferredOutput | None): Where messages are held until released. If None, messages are logged directly again.
+    """
+    self._thread_state.deferred_output = deferred_output
+
+  def release_output(self, deferred_output: 'DeferredOutput'):
+    """
+    ### Logs the messages held by the given deferred output, and logs directly any further ones.
+
+    #### Params:
+    - deferred_output (DeferredOutput): Deferred output to release.
+    """
+    deferred_output.release(self.__call__)
+
   def __call__(self, text: str, show_in_terminal: bool=True, substitute: bool=False):
     """
     ### Log a message.
@@ -133,6 +156,10 @@ class Logger(Singleton):
     - show_in_terminal (bool): Optional. If True, text is also printed through terminal.
     - substitute (bool): Optional. If True, previous line is substituted with new text. Only used when show_in_terminal = True.
     """
+    deferred_output = getattr(self._thread_state, "deferred_output", None)
+    if deferred_output is not None and deferred_output.hold(text, show_in_terminal, substitute):
+      return
+
     if self._file_logger is not None:
       self._file_logger.info(self._remove_non_printable(text))
 
@@ -235,6 +262,50 @@ class Logger(Singleton):
     substitution_chars = [f'{self._UP}{self._REMOVE_LINE}' for _ in range(self._get_n_last_lines())]
     return f"{''.join(substitution_chars)}{text}"
   
+class DeferredOutput:
+  """### Holds logged messages until they can be shown, so that concurrent tasks do not mix their output."""
+
+  def __init__(self, deferred: bool=True):
+    """
+    ### Constructor.
+
+    #### Params:
+    - deferred (bool): Optional. If False, messages are not held from the start.
+    """
+    self._lock = threading.Lock()
+    self._messages: List[Tuple[str, bool, bool]] = []
+    self._deferred = deferred
+
+  def hold(self, text: str, show_in_terminal: bool, substitute: bool) -> bool:
+    """
+    ### Holds the given message if the output has not been released yet.
+
+    #### Params:
+    - text (str): Message to hold.
+    - show_in_terminal (bool): If True, text will also be printed through terminal.
+    - substitute (bool): If True, previous line will be substituted with new text.
+
+    #### Returns:
+    - (bool): True if the message was held, False if it must be logged directly.
+    """
+    with self._lock:
+      if self._deferred:
+        self._messages.append((text, show_in_terminal, substitute))
+      return self._deferred
+
+  def release(self, log: Callable[[str, bool, bool], None]):
+    """
+    ### Logs the held messages in order, and stops holding new ones.
+
+    #### Params:
+    - log (callable): Function used to log each message.
+    """
+    with self._lock:
+      for text, show_in_terminal, substitute in self._messages:
+        log(text, show_in_terminal, substitute)
+      self._messages = []
+      self._deferred = False
+
 """
 ### Global logger.
 """
@@ -5,7 +5,6 @@ This module contains functions to generate standard log messages.
 """
 
 from xmipp3_installer.application.logger.logger import logger
-from xmipp3_installer.installer.handlers import git_handler
 
 __SECTION_MESSAGE_LEN = 60
 
@@ -60,6 +59,7 @@ def get_success_message(tag_version: str) -> str:
   #### Returms:
   - (str): Success message.
   """
+  from xmipp3_installer.installer.handlers import git_handler  # noqa: PLC0415
   release_name = tag_version if git_handler.is_tag() else git_handler.get_current_branch()
 
   box_wrapper = '*  *'
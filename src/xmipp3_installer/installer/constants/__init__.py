@@ -9,6 +9,12 @@ XMIPP_SOURCES = [XMIPP_CORE, XMIPP_VIZ]
 # Branch names
 MAIN_BRANCHNAME = 'main'
 
+# Clone strategies
+CLONE_STRATEGY_FULL = 'full'
+CLONE_STRATEGY_SHALLOW = 'shallow'
+CLONE_STRATEGY_PARTIAL = 'partial'
+CLONE_STRATEGIES = [CLONE_STRATEGY_FULL, CLONE_STRATEGY_SHALLOW, CLONE_STRATEGY_PARTIAL]
+
 # Context
 VERSIONS_CONTEXT_KEY = "versions"
 
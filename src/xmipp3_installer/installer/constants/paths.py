@@ -14,12 +14,29 @@ BUILD_PATH = "build"
 INSTALL_PATH = "dist"
 BINARIES_PATH = os.path.join(INSTALL_PATH, "bin")
 SCIPION_SOFTWARE_EM = os.path.join("scipionfiles", "downloads", "scipion", "software", "em")
+TRASH_PATH = ".xmipp3-installer-trash"
 
 # General file paths
 LOG_FILE = 'compilation.log'
 LIBRARY_VERSIONS_FILE = os.path.join(BUILD_PATH, 'versions.txt')
 CONFIG_FILE = 'xmipp.conf'
 VERSION_INFO_FILE = "version-info.json"
+CMAKE_CACHE_FILE = os.path.join(BUILD_PATH, "CMakeCache.txt")
+CMAKE_FINGERPRINT_FILE = os.path.join(BUILD_PATH, "configure-fingerprint.txt")
+PIPELINE_PROGRESS_FILE = os.path.join(BUILD_PATH, "pipeline-progress.json")
+NINJA_LOG_FILE = os.path.join(BUILD_PATH, ".ninja_log")
+BUILD_REPORT_FILE = os.path.join(BUILD_PATH, "build-report.json")
+
+# User cache paths
+USER_CACHE_PATH = os.path.join(
+  os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+  "xmipp3-installer"
+)
+SOURCES_CACHE_PATH = os.path.join(USER_CACHE_PATH, "sources")
+REMOTE_REFS_CACHE_FILE = os.path.join(USER_CACHE_PATH, "remote-refs.json")
+REMOTE_HEADS_CACHE_FILE = os.path.join(USER_CACHE_PATH, "remote-heads.json")
+CONNECTIVITY_CACHE_FILE = os.path.join(USER_CACHE_PATH, "connectivity.json")
+INSTALLATION_SPOOL_PATH = os.path.join(USER_CACHE_PATH, "installation-spool")
 
 # Source paths
 def get_source_path(source: str) -> str:
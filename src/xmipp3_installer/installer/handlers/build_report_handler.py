@@ -0,0 +1,161 @@
+"""### Functions that report how long each target of a build took."""
+
+from __future__ import annotations
+
+import json
+import os
+
+REPORT_TOP_TARGETS = 20
+
+__LOG_FIELDS = 5
+__OBJECT_EXTENSIONS = (".o", ".obj")
+__KIND_COMPILE = "compile"
+__KIND_LINK = "link"
+__MS_PER_SECOND = 1000
+
+def get_log_position(log_path: str) -> tuple[int, int]:
+  """
+  ### Returns the current size and inode of the Ninja log, so entries written afterwards can be told apart.
+
+  #### Params:
+  - log_path (str): Path to the .ninja_log file.
+
+  #### Returns:
+  - (tuple(int, int)): Size of the log in bytes and its inode, (0, 0) if it does not exist.
+  """
+  try:
+    log_stat = os.stat(log_path)
+  except OSError:
+    return 0, 0
+  return log_stat.st_size, log_stat.st_ino
+
+def get_build_entries(log_path: str, position: tuple[int, int] | None=None) -> list[tuple[str, int, int]]:
+  """
+  ### Returns the build steps recorded in the Ninja log after the given position.
+
+  Steps producing several outputs are reported once, under their first output.
+  Ninja recompacts a big log by writing a smaller copy over it, so the saved offset is only used
+  if the log is still the same file and has not shrunk. Otherwise, only the entries of the last
+  run are returned. Times are relative to the start of each run, so a run is taken to begin
+  where an end time is lower than the one before it.
+
+  #### Params:
+  - log_path (str): Path to the .ninja_log file.
+  - position (tuple(int, int)): Optional. Size and inode of the log when the build started, as returned by get_log_position. If not provided, every entry of the log is returned.
+
+  #### Returns:
+  - (list(tuple(str, int, int))): Output, start, and end (in milliseconds since the build started) of each step.
+  """
+  try:
+    lines, only_last_run = __read_log_lines(log_path, position)
+  except OSError:
+    return []
+  steps, last_end = {}, 0
+  for line in lines:
+    fields = line.split("\t")
+    if line.startswith("#") or len(fields) < __LOG_FIELDS or not fields[0].isdigit() or not fields[1].isdigit():
+      continue
+    start, end, _, output, command_hash = fields[:__LOG_FIELDS]
+    if only_last_run and int(end) < last_end:
+      steps = {}
+    last_end = int(end)
+    steps.setdefault((start, end, command_hash), (output, int(start), int(end)))
+  return list(steps.values())
+
+def get_build_report(entries: list[tuple[str, int, int]], top_targets: int=REPORT_TOP_TARGETS) -> dict:
+  """
+  ### Summarizes the durations of the given build steps.
+
+  Durations of every target are sorted by name, so reports of different builds can be compared line by line.
+
+  #### Params:
+  - entries (list(tuple(str, int, int))): Output, start, and end of each step, as returned by get_build_entries.
+  - top_targets (int): Optional. Number of slowest targets to list.
+
+  #### Returns:
+  - (dict): Report with the number of targets, CPU and wall times in seconds, parallelism, slowest targets, and all durations.
+  """
+  durations = {output: (end - start) / __MS_PER_SECOND for output, start, end in entries}
+  wall_time = (
+    max(end for _, _, end in entries) - min(start for _, start, _ in entries)
+  ) / __MS_PER_SECOND if entries else 0.0
+  cpu_time = sum(durations.values())
+  slowest_targets = sorted(durations.items(), key=lambda duration: (-duration[1], duration[0]))[:top_targets]
+  return {
+    "targets": len(durations),
+    "cpu_time": round(cpu_time, 3),
+    "wall_time": round(wall_time, 3),
+    "parallelism": round(cpu_time / wall_time, 2) if wall_time else 0.0,
+    "slowest": [
+      {"target": target, "kind": __get_target_kind(target), "duration": duration}
+      for target, duration in slowest_targets
+    ],
+    "durations": dict(sorted(durations.items()))
+  }
+
+def write_build_report(report: dict, report_path: str):
+  """
+  ### Writes the given build report as JSON.
+
+  #### Params:
+  - report (dict): Report, as returned by get_build_report.
+  - report_path (str): Path of the report file.
+  """
+  with open(report_path, "w", encoding="utf-8") as report_file:
+    json.dump(report, report_file, indent=2)
+    report_file.write("\n")
+
+def get_build_report_message(report: dict, report_path: str) -> str:
+  """
+  ### Returns a message summarizing the given build report.
+
+  #### Params:
+  - report (dict): Report, as returned by get_build_report.
+  - report_path (str): Path where the report was written.
+
+  #### Returns:
+  - (str): Message with the totals of the build and its slowest target.
+  """
+  message = (
+    f"Build report saved to {report_path}: {report['targets']} targets, "
+    f"{report['cpu_time']:.1f}s of CPU time in {report['wall_time']:.1f}s "
+    f"({report['parallelism']:.1f}x parallelism)."
+  )
+  if report["slowest"]:
+    slowest = report["slowest"][0]
+    message += f" Slowest: {slowest['target']} ({slowest['duration']:.1f}s)."
+  return message
+
+def __get_target_kind(target: str) -> str:
+  """
+  ### Returns the kind of build step that produces the given target.
+
+  #### Params:
+  - target (str): Output of the step.
+
+  #### Returns:
+  - (str): "compile" for object files, "link" for anything else.
+  """
+  return __KIND_COMPILE if target.endswith(__OBJECT_EXTENSIONS) else __KIND_LINK
+
+def __read_log_lines(log_path: str, position: tuple[int, int] | None) -> tuple[list[str], bool]:
+  """
+  ### Reads the lines of the Ninja log written after the given position.
+
+  #### Params:
+  - log_path (str): Path to the .ninja_log file.
+  - position (tuple(int, int) | None): Size and inode of the log when the build started.
+
+  #### Returns:
+  - (tuple(list(str), bool)): Lines read, and whether the log was replaced or shrunk, so the whole log was read.
+
+  #### Raises:
+  - OSError: If the log cannot be read.
+  """
+  with open(log_path, "rb") as log_file:
+    log_stat = os.fstat(log_file.fileno())
+    offset, inode = position or (0, log_stat.st_ino)
+    is_same_log = log_stat.st_ino == inode and log_stat.st_size >= offset
+    if is_same_log:
+      log_file.seek(offset)
+    return log_file.read().decode("utf-8", errors="replace").splitlines(), not is_same_log
@@ -3,6 +3,8 @@
 from xmipp3_installer.repository.config_vars import variables
 
 DEFAULT_CMAKE = 'cmake'
+NINJA = 'ninja'
+NINJA_GENERATOR = 'Ninja'
 
 # CMake cache file variables to look for
 XMIPP_USE_CUDA=variables.CUDA
@@ -10,9 +12,14 @@ XMIPP_USE_MPI=variables.MPI
 XMIPP_USE_MATLAB=variables.MATLAB
 XMIPP_LINK_TO_SCIPION=variables.LINK_SCIPION
 CMAKE_BUILD_TYPE='CMAKE_BUILD_TYPE'
+CMAKE_GENERATOR='CMAKE_GENERATOR'
+CMAKE_MAKE_PROGRAM='CMAKE_MAKE_PROGRAM'
 CMAKE_C_COMPILER=variables.CC
 CMAKE_CXX_COMPILER=variables.CXX
 CMAKE_CUDA_COMPILER=variables.CUDA_COMPILER
+CMAKE_C_COMPILER_LAUNCHER='CMAKE_C_COMPILER_LAUNCHER'
+CMAKE_CXX_COMPILER_LAUNCHER='CMAKE_CXX_COMPILER_LAUNCHER'
+CMAKE_CUDA_COMPILER_LAUNCHER='CMAKE_CUDA_COMPILER_LAUNCHER'
 
 # CMake saved version variables
 CMAKE_PYTHON = 'Python3'
@@ -18,6 +18,18 @@ def get_cmake_path() -> str | None:
   """
   return shutil.which(cmake_constants.DEFAULT_CMAKE)
 
+def get_default_generator() -> str | None:
+  """
+  ### Returns the generator CMake should use when none is configured.
+
+  #### Returns:
+  - (str | None): Generator set in the environment, or Ninja if it is installed. None to let CMake choose.
+  """
+  environment_generator = os.environ.get(cmake_constants.CMAKE_GENERATOR)
+  if environment_generator:
+    return environment_generator
+  return cmake_constants.NINJA_GENERATOR if shutil.which(cmake_constants.NINJA) else None
+
 def get_cmake_params(variables: list[tuple[str, str | bool]]) -> str:
   """
   ### Converts the given list of variable names into CMake parameters.
@@ -30,6 +42,26 @@ def get_cmake_params(variables: list[tuple[str, str | bool]]) -> str:
     result.append(f"-D{key}={value}")
   return ' '.join(result)
 
+def get_cmake_cache_variable(path: str, name: str) -> str | None:
+  """
+  ### Obtains the value of a variable from the CMake cache file.
+
+  #### Params:
+  - path (str): Path to the CMake cache file.
+  - name (str): Name of the variable.
+
+  #### Returns:
+  - (str | None): Value of the variable, or None if the file or the variable do not exist.
+  """
+  if not os.path.exists(path):
+    return None
+  with open(path, encoding="utf-8", errors="replace") as cache_file:
+    for line in cache_file:
+      key, separator, value = line.rstrip("\n").partition("=")
+      if separator and key.split(":")[0] == name:
+        return value
+  return None
+
 def get_library_versions_from_cmake_file(path: str) -> dict[str, Any]:
   """
   ### Obtains the library versions from the CMake cache file.
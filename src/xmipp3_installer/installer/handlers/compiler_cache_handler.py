@@ -0,0 +1,106 @@
+"""### Functions that interact with compiler caches (ccache, sccache)."""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+
+from xmipp3_installer.installer.handlers import shell_handler
+
+CCACHE = "ccache"
+SCCACHE = "sccache"
+COMPILER_CACHES = (CCACHE, SCCACHE)
+
+__CCACHE_HIT_KEYS = ("direct_cache_hit", "preprocessed_cache_hit")
+__CCACHE_MISS_KEY = "cache_miss"
+
+def get_compiler_launcher() -> str | None:
+  """
+  ### Returns the path to the first compiler cache found in the PATH.
+
+  #### Returns:
+  - (str | None): Path to ccache or sccache, in that order of preference. None if none was found.
+  """
+  for compiler_cache in COMPILER_CACHES:
+    compiler_cache_path = shutil.which(compiler_cache)
+    if compiler_cache_path:
+      return compiler_cache_path
+  return None
+
+def get_statistics(launcher: str) -> tuple[int, int] | None:
+  """
+  ### Returns the accumulated hit and miss counts of the given compiler cache.
+
+  #### Params:
+  - launcher (str): Path to the compiler cache executable.
+
+  #### Returns:
+  - (tuple(int, int) | None): Tuple containing the number of cache hits and misses. None if they could not be obtained.
+  """
+  launcher_name = os.path.basename(launcher)
+  if launcher_name == CCACHE:
+    ret_code, output = shell_handler.run_shell_command(f"{launcher} --print-stats")
+    return None if ret_code else __parse_ccache_statistics(output)
+  if launcher_name == SCCACHE:
+    ret_code, output = shell_handler.run_shell_command(f"{launcher} --show-stats --stats-format=json")
+    return None if ret_code else __parse_sccache_statistics(output)
+  return None
+
+def get_statistics_message(launcher: str, start: tuple[int, int], end: tuple[int, int]) -> str:
+  """
+  ### Returns a message summarizing the compiler cache usage between two statistics samples.
+
+  #### Params:
+  - launcher (str): Path to the compiler cache executable.
+  - start (tuple(int, int)): Hit and miss counts before compiling.
+  - end (tuple(int, int)): Hit and miss counts after compiling.
+
+  #### Returns:
+  - (str): Message with the hits, misses, and hit rate.
+  """
+  if end[0] < start[0] or end[1] < start[1]:
+    start = (0, 0) # Statistics were reset while compiling
+  hits = end[0] - start[0]
+  misses = end[1] - start[1]
+  total = hits + misses
+  hit_rate = f" ({100 * hits / total:.1f}% hit rate)" if total else ""
+  return f"Compiler cache ({os.path.basename(launcher)}): {hits} hits, {misses} misses{hit_rate}."
+
+def __parse_ccache_statistics(output: str) -> tuple[int, int] | None:
+  """
+  ### Parses the output of 'ccache --print-stats'.
+
+  #### Params:
+  - output (str): Tab separated key and value lines.
+
+  #### Returns:
+  - (tuple(int, int) | None): Tuple containing the number of cache hits and misses. None if they were not found.
+  """
+  statistics = {}
+  for line in output.splitlines():
+    key, _, value = line.partition("\t")
+    if value.strip().isdigit():
+      statistics[key.strip()] = int(value)
+  if __CCACHE_MISS_KEY not in statistics:
+    return None
+  hits = sum(statistics.get(hit_key, 0) for hit_key in __CCACHE_HIT_KEYS)
+  return hits, statistics[__CCACHE_MISS_KEY]
+
+def __parse_sccache_statistics(output: str) -> tuple[int, int] | None:
+  """
+  ### Parses the output of 'sccache --show-stats --stats-format=json'.
+
+  #### Params:
+  - output (str): JSON statistics.
+
+  #### Returns:
+  - (tuple(int, int) | None): Tuple containing the number of cache hits and misses. None if they were not found.
+  """
+  try:
+    statistics = json.loads(output)["stats"]
+    hits = sum(statistics["cache_hits"]["counts"].values())
+    misses = sum(statistics["cache_misses"]["counts"].values())
+  except (ValueError, KeyError, TypeError, AttributeError):
+    return None
+  return hits, misses
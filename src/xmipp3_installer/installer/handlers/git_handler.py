@@ -3,10 +3,20 @@
 from __future__ import annotations
 
 import os
+import threading
 
 from xmipp3_installer.application.logger.logger import logger
 from xmipp3_installer.installer.constants import paths
 from xmipp3_installer.installer.handlers import shell_handler
+from xmipp3_installer.shared import ttl_cache
+
+__HEADS = "heads"
+__TAGS = "tags"
+__PEELED_SUFFIX = "^{}"
+__HEAD_BRANCH_PREFIX = "ref: refs/heads/"
+__REMOTE_REFS = {}
+__REMOTE_REFS_LOCKS = {}
+__REMOTE_REFS_LOCKS_LOCK = threading.Lock()
 
 
 def get_current_branch(dir: str='./') -> str:
@@ -19,6 +29,9 @@ def get_current_branch(dir: str='./') -> str:
   #### Returns:
   - (str): The name of the branch, 'HEAD' if it is a tag, or empty string if the given directory is not a repository or a recognizable tag.
   """
+  branch_name = __read_head_branch(dir)
+  if branch_name:
+    return branch_name
   ret_code, branch_name = shell_handler.run_shell_command("git rev-parse --abbrev-ref HEAD", cwd=dir)
   # If there was an error, we are in no branch
   return '' if ret_code else branch_name
@@ -38,30 +51,64 @@ def is_tag(dir: str='./') -> bool:
   ret_code, _ = shell_handler.run_shell_command("git describe --tags --exact-match HEAD", cwd=dir)
   return not ret_code
 
-def is_branch_up_to_date(dir: str='./') -> bool:
+def is_branch_up_to_date(dir: str='./', cache_ttl: int=0, timeout: float | None=None) -> bool | None:
   """
-  ### Returns True if the current branch is up to date, or False otherwise or if some error happened.
+  ### Checks if the current branch points to the same commit as its counterpart in the remote repository.
+
+  The remote commit is obtained by listing only that branch with 'git ls-remote',
+  so no objects are downloaded and the local repository is not modified.
+  If a cache time to live is given, a recent enough remote commit stored on disk
+  by a previous run is used instead of accessing the network.
   
   #### Params:
   - dir (str): Optional. Directory of the repository to get current branch from. Default is current directory.
+  - cache_ttl (int): Optional. Seconds the remote commit can be reused from the disk cache. Default is 0 (disabled).
+  - timeout (float | None): Optional. Seconds the remote repository has to answer. Default is no timeout.
   
   #### Returns:
-  - (bool): True if the current branch is up to date, or False otherwise or if some error happened.
+  - (bool | None): True if the current branch is up to date, False if it is not, or None if it could not be determined.
   """
   current_branch = get_current_branch(dir=dir)
-  if not current_branch:
-    return False
-  
-  ret_code = shell_handler.run_shell_command("git fetch", cwd=dir)[0]
-  if ret_code != 0:
-    return False
-
-  latest_local_commit = shell_handler.run_shell_command(f"git rev-parse {current_branch}", cwd=dir)[1]
-  ret_code, latest_remote_commit = shell_handler.run_shell_command(f"git rev-parse origin/{current_branch}")
-  if ret_code != 0:
-    return False
-  
-  return latest_local_commit == latest_remote_commit
+  if not current_branch or current_branch == "HEAD":
+    return None
+  ret_code, local_commit = shell_handler.run_shell_command("git rev-parse HEAD", cwd=dir)
+  if ret_code:
+    return None
+  remote_commit = __get_remote_branch_commit(dir, current_branch, cache_ttl, timeout)
+  if remote_commit is None:
+    return None
+  return local_commit == remote_commit
+
+def is_shallow_repository(dir: str="./") -> bool:
+  """
+  ### Returns True if the repository of the given directory is a shallow clone.
+
+  #### Params:
+  - dir (str): Optional. Directory of the repository. Default is current directory.
+
+  #### Returns:
+  - (bool): True if the repository is shallow. False otherwise or if some error happened.
+  """
+  ret_code, output = shell_handler.run_shell_command("git rev-parse --is-shallow-repository", cwd=dir)
+  return not ret_code and output == "true"
+
+def unshallow_repository(dir: str="./") -> tuple[int, str]:
+  """
+  ### Turns the shallow clone of the given directory into a complete one.
+
+  The whole history of all the remote branches is fetched,
+  so the repository can be used as if it had been fully cloned.
+
+  #### Params:
+  - dir (str): Optional. Directory of the repository. Default is current directory.
+
+  #### Returns:
+  - (tuple(int, str)): Tuple containing the return code and the text output produced by the command.
+  """
+  ret_code, output = shell_handler.run_shell_command('git remote set-branches origin "*"', cwd=dir)
+  if ret_code:
+    return ret_code, output
+  return shell_handler.run_shell_command("git fetch --unshallow --tags origin", cwd=dir)
 
 def get_current_commit(dir: str="./") -> str:
   """
@@ -94,33 +141,40 @@ def get_commit_branch(commit: str, dir: str="./") -> str:
     return ''
   return output.replace(commit, "").replace(" ", "")
 
-def branch_exists_in_repo(repo_url: str, branch: str) -> bool:
+def branch_exists_in_repo(repo_url: str, branch: str, cache_ttl: int=0) -> bool:
   """
   ### Checks if the given branch exists in the given repository.
 
   #### Params:
   - repo (str): Repository to check from.
   - branch (str): Name of the branch to check for.
+  - cache_ttl (int): Optional. Seconds the repository's refs can be reused from the disk cache. Default is 0 (disabled).
 
   #### Returns:
   - (bool): True if the branch exists, False otherwise.
   """
-  return __ref_exists_in_repo(repo_url, branch, True)
+  return __ref_exists_in_repo(repo_url, branch, True, cache_ttl)
 
-def tag_exists_in_repo(repo_url: str, tag: str) -> bool:
+def tag_exists_in_repo(repo_url: str, tag: str, cache_ttl: int=0) -> bool:
   """
   ### Checks if the given tag exists in the given repository.
 
   #### Params:
   - repo_url (str): Repository to check from.
   - tag (str): Name of the tag to check for.
+  - cache_ttl (int): Optional. Seconds the repository's refs can be reused from the disk cache. Default is 0 (disabled).
 
   #### Returns:
   - (bool): True if the tag exists, False otherwise.
   """
-  return __ref_exists_in_repo(repo_url, tag, False)
+  return __ref_exists_in_repo(repo_url, tag, False, cache_ttl)
 
-def get_clonable_branch(repo_url: str, preferred_branch: str, viable_tag: str | None) -> str | None:
+def get_clonable_branch(
+  repo_url: str,
+  preferred_branch: str,
+  viable_tag: str | None,
+  cache_ttl: int=0
+) -> str | None:
   """
   ### Decides the target to be cloned from a given repository.
 
@@ -133,16 +187,62 @@ def get_clonable_branch(repo_url: str, preferred_branch: str, viable_tag: str |
   - repo_url (str): Url of the repositori to be cloned.
   - preferred_branch (str): Preferred branch to clone into.
   - viable_tag (str | None): If exists, it is returned if branch does not.
+  - cache_ttl (int): Optional. Seconds the repository's refs can be reused from the disk cache. Default is 0 (disabled).
 
   #### Returns:
   - (str | None): Name of the branch to clone the repository into, or None if not found.
   """
-  if preferred_branch and branch_exists_in_repo(repo_url, preferred_branch):
+  if preferred_branch and branch_exists_in_repo(repo_url, preferred_branch, cache_ttl=cache_ttl):
     return preferred_branch
-  if viable_tag and tag_exists_in_repo(repo_url, viable_tag):
+  if viable_tag and tag_exists_in_repo(repo_url, viable_tag, cache_ttl=cache_ttl):
     return viable_tag
   return None
 
+def get_remote_refs(repo_url: str, cache_ttl: int=0) -> dict[str, dict[str, str]]:
+  """
+  ### Returns the branches and tags of the given repository.
+
+  All of them are listed with a single 'git ls-remote' call,
+  and the result is kept in memory until clear_remote_refs is called.
+  Different repositories can be listed concurrently from several threads.
+  If a cache time to live is given, a recent enough result stored
+  on disk by a previous run is used instead of accessing the network.
+
+  #### Params:
+  - repo_url (str): Repository to list the refs from.
+  - cache_ttl (int): Optional. Seconds the refs can be reused from the disk cache. Default is 0 (disabled).
+
+  #### Returns:
+  - (dict(str, dict(str, str))): Dictionary with the commit hash of each branch under 'heads' and of each tag under 'tags'. Both are empty if the refs could not be listed.
+  """
+  with __REMOTE_REFS_LOCKS_LOCK:
+    repo_lock = __REMOTE_REFS_LOCKS.setdefault(repo_url, threading.Lock())
+  with repo_lock:
+    if repo_url in __REMOTE_REFS:
+      return __REMOTE_REFS[repo_url]
+    remote_refs = ttl_cache.get_cached_value(paths.REMOTE_REFS_CACHE_FILE, repo_url, cache_ttl)
+    if remote_refs is None:
+      ret_code, output = shell_handler.run_shell_command(
+        f"git ls-remote --heads --tags {repo_url}"
+      )
+      if ret_code:
+        return {__HEADS: {}, __TAGS: {}}
+      remote_refs = __parse_remote_refs(output)
+      if cache_ttl > 0:
+        ttl_cache.set_cached_value(paths.REMOTE_REFS_CACHE_FILE, repo_url, remote_refs)
+    __REMOTE_REFS[repo_url] = remote_refs
+    return remote_refs
+
+def clear_remote_refs():
+  """
+  ### Forgets the refs kept in memory by get_remote_refs.
+
+  It must be called at the start of each run that lists remote refs, so a run never
+  reuses the refs listed by a previous one beyond the disk cache time to live.
+  """
+  with __REMOTE_REFS_LOCKS_LOCK:
+    __REMOTE_REFS.clear()
+
 def execute_git_command_for_source(command: str, source: str) -> tuple[int, str]:
   """
   ### Executes the git command for a specific source.
@@ -168,7 +268,7 @@ def execute_git_command_for_source(command: str, source: str) -> tuple[int, str]
     show_error=True
   )
 
-def __ref_exists_in_repo(repo_url: str, ref: str, is_branch: bool) -> bool:
+def __ref_exists_in_repo(repo_url: str, ref: str, is_branch: bool, cache_ttl: int) -> bool:
   """
   ### Checks if a given reference exists in the given repository.
 
@@ -176,14 +276,86 @@ def __ref_exists_in_repo(repo_url: str, ref: str, is_branch: bool) -> bool:
   - repo_url (str): Repository to check from.
   - ref (str): Reference to check for.
   - is_branch (bool): If True, the reference is a branch. If False, it is a tag.
+  - cache_ttl (int): Seconds the repository's refs can be reused from the disk cache.
 
   #### Returns:
   - (bool): True if the ref exists, False otherwise.
   """
-  ref_type = "heads" if is_branch else "tags"
+  ref_type = __HEADS if is_branch else __TAGS
+  return ref in get_remote_refs(repo_url, cache_ttl=cache_ttl).get(ref_type, {})
+
+def __read_head_branch(dir: str) -> str | None:
+  """
+  ### Returns the branch the repository's HEAD points to, read directly from its HEAD file.
+
+  Detached HEADs and layouts where .git is not a folder (worktrees, submodules)
+  are left to git, so None is returned for them.
+
+  #### Params:
+  - dir (str): Directory of the repository.
+
+  #### Returns:
+  - (str | None): Name of the branch, or None if it could not be read from the HEAD file.
+  """
+  try:
+    with open(os.path.join(dir, ".git", "HEAD"), encoding="utf-8") as head_file:
+      head = head_file.read().strip()
+  except (OSError, UnicodeDecodeError):
+    return None
+  if not head.startswith(__HEAD_BRANCH_PREFIX):
+    return None
+  return head[len(__HEAD_BRANCH_PREFIX):] or None
+
+def __get_remote_branch_commit(dir: str, branch: str, cache_ttl: int, timeout: float | None) -> str | None:
+  """
+  ### Returns the commit the given branch points to in the 'origin' remote of the repository.
+
+  #### Params:
+  - dir (str): Directory of the repository.
+  - branch (str): Name of the branch.
+  - cache_ttl (int): Seconds the commit can be reused from the disk cache.
+  - timeout (float | None): Seconds the remote repository has to answer.
+
+  #### Returns:
+  - (str | None): Commit hash of the remote branch, or None if it could not be obtained.
+  """
+  cache_key = f"{os.path.abspath(dir)}:{branch}"
+  remote_commit = ttl_cache.get_cached_value(paths.REMOTE_HEADS_CACHE_FILE, cache_key, cache_ttl)
+  if remote_commit is not None:
+    return remote_commit
   ret_code, output = shell_handler.run_shell_command(
-    f"git ls-remote --{ref_type} {repo_url}.git refs/{ref_type}/{ref}"
+    f"git ls-remote --heads origin refs/heads/{branch}",
+    cwd=dir,
+    timeout=timeout
   )
   if ret_code:
-    return False
-  return f"refs/{ref_type}/{ref}" in output
+    return None
+  remote_commit = __parse_remote_refs(output)[__HEADS].get(branch)
+  if remote_commit is not None and cache_ttl > 0:
+    ttl_cache.set_cached_value(paths.REMOTE_HEADS_CACHE_FILE, cache_key, remote_commit)
+  return remote_commit
+
+def __parse_remote_refs(ls_remote_output: str) -> dict[str, dict[str, str]]:
+  """
+  ### Builds the index of branches and tags from the output of 'git ls-remote'.
+
+  #### Params:
+  - ls_remote_output (str): Output of the command, with the commit hash and the name of a ref in each line.
+
+  #### Returns:
+  - (dict(str, dict(str, str))): Dictionary with the commit hash of each branch under 'heads' and of each tag under 'tags'.
+  """
+  remote_refs = {__HEADS: {}, __TAGS: {}}
+  for line in ls_remote_output.splitlines():
+    commit, _, ref = line.strip().partition("\t")
+    for ref_type, refs in remote_refs.items():
+      prefix = f"refs/{ref_type}/"
+      if not ref.startswith(prefix):
+        continue
+      name = ref[len(prefix):]
+      is_peeled = name.endswith(__PEELED_SUFFIX)
+      name = name[:-len(__PEELED_SUFFIX)] if is_peeled else name
+      # Annotated tags point to the tag object, their peeled line contains the commit
+      if is_peeled or name not in refs:
+        refs[name] = commit
+  return remote_refs
@@ -0,0 +1,116 @@
+"""### Functions to find the paths matching a set of rules in a single pass over a directory tree."""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+
+MATCH_FILES = "files"
+MATCH_DIRS = "dirs"
+MATCH_EMPTY_DIRS = "empty_dirs"
+
+def scan_paths(
+  rules: list[tuple[str, str, str]],
+  pruned_paths: list[str] | None=None,
+  root: str="."
+) -> list[str]:
+  """
+  ### Returns the paths under the given root that match any of the rules.
+
+  Each rule is a tuple containing:
+  - The scope where it applies, as a directory relative to the root. An empty scope applies everywhere.
+  - The pattern that the name of the entry must match (fnmatch syntax).
+  - The kind of entries it matches: files (MATCH_FILES), directories (MATCH_DIRS), or empty directories (MATCH_EMPTY_DIRS).
+
+  The tree is traversed once without following symlinks.
+  Directories matching a MATCH_DIRS rule and the given pruned paths are not entered,
+  since everything inside them goes along with them. Directories that cannot be read are skipped.
+
+  #### Params:
+  - rules (list(tuple(str, str, str))): Scope, pattern, and kind of each rule.
+  - pruned_paths (list(str)): Optional. Directories relative to the root that must not be entered.
+  - root (str): Optional. Directory where the scan starts.
+
+  #### Returns:
+  - (list(str)): Sorted matching paths, relative to the root.
+  """
+  normalized_rules = [(os.path.normpath(scope) if scope else "", pattern, kind) for scope, pattern, kind in rules]
+  pruned = {os.path.normpath(path) for path in pruned_paths or []}
+  matches = []
+  pending_dirs = [""]
+  while pending_dirs:
+    relative_dir = pending_dirs.pop()
+    dir_rules = [rule for rule in normalized_rules if __is_in_scope(relative_dir, rule[0])]
+    entries = __get_entries(os.path.join(root, relative_dir))
+    if entries is None:
+      continue
+    if relative_dir and not entries and __matches(os.path.basename(relative_dir), dir_rules, MATCH_EMPTY_DIRS):
+      matches.append(relative_dir)
+    for entry in entries:
+      relative_path = os.path.join(relative_dir, entry.name)
+      if not __is_dir(entry):
+        if __matches(entry.name, dir_rules, MATCH_FILES):
+          matches.append(relative_path)
+      elif __matches(entry.name, dir_rules, MATCH_DIRS):
+        matches.append(relative_path)
+      elif relative_path not in pruned:
+        pending_dirs.append(relative_path)
+  return sorted(matches)
+
+def __get_entries(directory: str) -> list[os.DirEntry] | None:
+  """
+  ### Returns the entries of the given directory.
+
+  #### Params:
+  - directory (str): Directory to list.
+
+  #### Returns:
+  - (list(DirEntry) | None): Entries of the directory, or None if it could not be read.
+  """
+  try:
+    with os.scandir(directory) as entries:
+      return list(entries)
+  except OSError:
+    return None
+
+def __is_dir(entry: os.DirEntry) -> bool:
+  """
+  ### Checks if the given entry is a directory, without following symlinks.
+
+  #### Params:
+  - entry (DirEntry): Entry to check.
+
+  #### Returns:
+  - (bool): True if the entry is a directory, False otherwise.
+  """
+  try:
+    return entry.is_dir(follow_symlinks=False)
+  except OSError:
+    return False
+
+def __is_in_scope(relative_dir: str, scope: str) -> bool:
+  """
+  ### Checks if the given directory is inside the scope of a rule.
+
+  #### Params:
+  - relative_dir (str): Directory relative to the root of the scan.
+  - scope (str): Scope of the rule.
+
+  #### Returns:
+  - (bool): True if the rule applies to the directory, False otherwise.
+  """
+  return not scope or relative_dir == scope or relative_dir.startswith(f"{scope}{os.sep}")
+
+def __matches(name: str, rules: list[tuple[str, str, str]], kind: str) -> bool:
+  """
+  ### Checks if the given name matches any of the rules of the given kind.
+
+  #### Params:
+  - name (str): Name of the entry.
+  - rules (list(tuple(str, str, str))): Rules that apply to the entry.
+  - kind (str): Kind of the entry.
+
+  #### Returns:
+  - (bool): True if any rule matches, False otherwise.
+  """
+  return any(rule_kind == kind and fnmatch.fnmatch(name, pattern) for _, pattern, rule_kind in rules)
@@ -0,0 +1,287 @@
+"""### Functions that inspect the resources available to the installer."""
+
+from __future__ import annotations
+
+import os
+
+from xmipp3_installer.shared import numeric
+
+__MEMINFO_FILE = "/proc/meminfo"
+__MEMINFO_AVAILABLE_KEY = "MemAvailable"
+__PROC_CGROUP_FILE = "/proc/self/cgroup"
+__CGROUP_V2_PATH = "/sys/fs/cgroup"
+__CGROUP_V2_MEMORY_LIMIT_FILE = "memory.max"
+__CGROUP_V2_MEMORY_USAGE_FILE = "memory.current"
+__CGROUP_V2_CPU_MAX_FILE = "cpu.max"
+__CGROUP_V1_MEMORY_CONTROLLER = "memory"
+__CGROUP_V1_MEMORY_PATH = os.path.join(__CGROUP_V2_PATH, __CGROUP_V1_MEMORY_CONTROLLER)
+__CGROUP_V1_MEMORY_LIMIT_FILE = "memory.limit_in_bytes"
+__CGROUP_V1_MEMORY_USAGE_FILE = "memory.usage_in_bytes"
+__CGROUP_V1_UNLIMITED_THRESHOLD = 2 ** 60 # cgroup v1 reports "no limit" as a huge page-aligned number
+__CGROUP_V1_CPU_CONTROLLER = "cpu"
+__CGROUP_V1_CPU_PATH = os.path.join(__CGROUP_V2_PATH, __CGROUP_V1_CPU_CONTROLLER)
+__CGROUP_V1_CPU_QUOTA_FILE = "cpu.cfs_quota_us"
+__CGROUP_V1_CPU_PERIOD_FILE = "cpu.cfs_period_us"
+__BATCH_SCHEDULER_CPU_VARIABLES = (
+  "SLURM_CPUS_PER_TASK", # Slurm
+  "NSLOTS",              # Grid Engine
+  "PBS_NP",              # PBS/Torque
+  "LSB_DJOB_NUMPROC"     # LSF
+)
+__EXTRA_JOBS_RATIO = 0.2
+__BYTES_PER_KB = 1024
+
+def get_available_cpu_count() -> int:
+  """
+  ### Returns the number of CPUs the installer is allowed to use.
+
+  The CPUs the process is pinned to, the CPU quota of the current cgroup, and the
+  allocation of the batch scheduler (if any) are considered, keeping the lowest one.
+
+  #### Returns:
+  - (int): Number of usable CPUs, never less than 1.
+  """
+  cpu_counts = [
+    cpu_count for cpu_count in (
+      __get_affinity_cpu_count(),
+      __get_cgroup_cpu_count(),
+      __get_batch_scheduler_cpu_count()
+    )
+    if cpu_count is not None
+  ]
+  return max(1, min(cpu_counts)) if cpu_counts else 1
+
+def get_default_job_number() -> int:
+  """
+  ### Gets the default number of jobs to be used by parallelizable tasks.
+
+  Returned number will be 120% of the usable CPUs, due to not all jobs taking 
+  100% of CPU time continuously.
+
+  #### Returns:
+  - (int): Default number of jobs.
+  """
+  cpu_count = get_available_cpu_count()
+  return cpu_count + int(cpu_count * __EXTRA_JOBS_RATIO)
+
+def get_available_memory_mb() -> int | None:
+  """
+  ### Returns the memory available for new processes.
+
+  Both the memory available in the system and the one left by the cgroup limit (if any) are considered.
+
+  #### Returns:
+  - (int | None): Available memory in megabytes, or None if it could not be obtained.
+  """
+  available_memories = [
+    available_memory for available_memory in (__get_system_available_memory(), __get_cgroup_available_memory())
+    if available_memory is not None
+  ]
+  if not available_memories:
+    return None
+  return min(available_memories) // numeric.BYTES_PER_MB
+
+def get_memory_limited_jobs(jobs: int, job_memory_mb: int) -> int:
+  """
+  ### Returns the number of jobs that fit in the available memory.
+
+  #### Params:
+  - jobs (int): Number of jobs requested.
+  - job_memory_mb (int): Estimated memory needed by each job, in megabytes. 0 disables the limit.
+
+  #### Returns:
+  - (int): Number of jobs, never more than requested and never less than 1.
+  """
+  available_memory = get_available_memory_mb() if job_memory_mb else None
+  if available_memory is None:
+    return jobs
+  return max(1, min(jobs, available_memory // job_memory_mb))
+
+def get_load_average() -> float | None:
+  """
+  ### Returns the system load average over the last minute.
+
+  #### Returns:
+  - (float | None): Load average, or None if it is not available in this platform.
+  """
+  try:
+    return os.getloadavg()[0]
+  except (AttributeError, OSError):
+    return None
+
+def __get_affinity_cpu_count() -> int | None:
+  """
+  ### Returns the number of CPUs the current process can run on.
+
+  #### Returns:
+  - (int | None): Number of CPUs, or None if it could not be obtained.
+  """
+  try:
+    return len(os.sched_getaffinity(0))
+  except (AttributeError, OSError):
+    return os.cpu_count() # Affinity is not available in all platforms
+
+def __get_cgroup_cpu_count() -> int | None:
+  """
+  ### Returns the number of CPUs allowed by the CPU quota of the current cgroup.
+
+  The quotas of the cgroup the process belongs to and of all its ancestors are considered, keeping the lowest one.
+
+  #### Returns:
+  - (int | None): Number of CPUs, rounded up, or None if there is no quota or it could not be read.
+  """
+  quotas = [
+    (__read_file(os.path.join(cgroup_dir, __CGROUP_V2_CPU_MAX_FILE)) or "").partition(" ")[::2]
+    for cgroup_dir in __get_cgroup_dirs(__CGROUP_V2_PATH, None)
+  ]
+  quotas.extend(
+    (
+      __read_file(os.path.join(cgroup_dir, __CGROUP_V1_CPU_QUOTA_FILE)),
+      __read_file(os.path.join(cgroup_dir, __CGROUP_V1_CPU_PERIOD_FILE))
+    )
+    for cgroup_dir in __get_cgroup_dirs(__CGROUP_V1_CPU_PATH, __CGROUP_V1_CPU_CONTROLLER)
+  )
+  cpu_counts = [
+    cpu_count for cpu_count in (__get_quota_cpu_count(quota, period) for quota, period in quotas)
+    if cpu_count is not None
+  ]
+  return min(cpu_counts) if cpu_counts else None
+
+def __get_quota_cpu_count(quota: str | None, period: str | None) -> int | None:
+  """
+  ### Returns the number of CPUs corresponding to a CFS quota.
+
+  #### Params:
+  - quota (str | None): CPU time allowed per period, "max" or "-1" for no limit.
+  - period (str | None): Length of the period.
+
+  #### Returns:
+  - (int | None): Number of CPUs, rounded up, or None if there is no limit or the values are not valid.
+  """
+  try:
+    quota_us, period_us = int(quota or ""), int(period or "")
+  except ValueError:
+    return None # Includes "max", the cgroup v2 value for no limit
+  if quota_us <= 0 or period_us <= 0:
+    return None
+  return -(-quota_us // period_us)
+
+def __get_batch_scheduler_cpu_count() -> int | None:
+  """
+  ### Returns the number of CPUs allocated by the batch scheduler running the installer.
+
+  #### Returns:
+  - (int | None): Number of CPUs, or None if not running inside a batch job.
+  """
+  for variable in __BATCH_SCHEDULER_CPU_VARIABLES:
+    value = os.environ.get(variable, "")
+    if value.isdigit() and int(value) > 0:
+      return int(value)
+  return None
+
+def __get_system_available_memory() -> int | None:
+  """
+  ### Returns the memory available in the system, as reported by the kernel.
+
+  #### Returns:
+  - (int | None): Available memory in bytes, or None if it could not be read.
+  """
+  try:
+    with open(__MEMINFO_FILE, encoding="utf-8") as meminfo_file:
+      for line in meminfo_file:
+        key, _, value = line.partition(":")
+        if key == __MEMINFO_AVAILABLE_KEY:
+          return int(value.split()[0]) * __BYTES_PER_KB
+  except (OSError, ValueError, IndexError):
+    return None
+  return None
+
+def __get_cgroup_available_memory() -> int | None:
+  """
+  ### Returns the memory left before reaching the limit of the current cgroup.
+
+  The limits of the cgroup the process belongs to and of all its ancestors are considered, keeping the lowest one.
+
+  #### Returns:
+  - (int | None): Available memory in bytes, or None if there is no limit or it could not be read.
+  """
+  available_memories = []
+  for mount_path, controller, limit_file, usage_file in (
+    (__CGROUP_V2_PATH, None, __CGROUP_V2_MEMORY_LIMIT_FILE, __CGROUP_V2_MEMORY_USAGE_FILE),
+    (__CGROUP_V1_MEMORY_PATH, __CGROUP_V1_MEMORY_CONTROLLER, __CGROUP_V1_MEMORY_LIMIT_FILE, __CGROUP_V1_MEMORY_USAGE_FILE)
+  ):
+    for cgroup_dir in __get_cgroup_dirs(mount_path, controller):
+      limit = __read_int_file(os.path.join(cgroup_dir, limit_file))
+      if limit is None or limit >= __CGROUP_V1_UNLIMITED_THRESHOLD:
+        continue
+      usage = __read_int_file(os.path.join(cgroup_dir, usage_file)) or 0
+      available_memories.append(max(0, limit - usage))
+  return min(available_memories) if available_memories else None
+
+def __get_cgroup_dirs(mount_path: str, controller: str | None) -> list[str]:
+  """
+  ### Returns the directories of the cgroup of the process and of its ancestors.
+
+  If the cgroup of the process cannot be found under the mount point,
+  as happens in containers without their own cgroup namespace,
+  its missing directories are ignored and the mount point is still used.
+
+  #### Params:
+  - mount_path (str): Path where the cgroup hierarchy is mounted.
+  - controller (str | None): cgroup v1 controller of the hierarchy, or None for the cgroup v2 one.
+
+  #### Returns:
+  - (list(str)): Directories from the one of the process up to the mount point.
+  """
+  parts = [part for part in __get_cgroup_path(controller).split("/") if part]
+  return [os.path.join(mount_path, *parts[:n_parts]) for n_parts in range(len(parts), -1, -1)]
+
+def __get_cgroup_path(controller: str | None) -> str:
+  """
+  ### Returns the path of the cgroup of the process inside the given hierarchy.
+
+  #### Params:
+  - controller (str | None): cgroup v1 controller of the hierarchy, or None for the cgroup v2 one.
+
+  #### Returns:
+  - (str): Path of the cgroup, or the root one if it could not be read.
+  """
+  for line in (__read_file(__PROC_CGROUP_FILE) or "").splitlines():
+    hierarchy_id, _, rest = line.partition(":")
+    controllers, _, cgroup_path = rest.partition(":")
+    if controller is None and hierarchy_id == "0" and not controllers:
+      return cgroup_path
+    if controller is not None and controller in controllers.split(","):
+      return cgroup_path
+  return "/"
+
+def __read_file(path: str) -> str | None:
+  """
+  ### Reads a small text file.
+
+  #### Params:
+  - path (str): Path to the file.
+
+  #### Returns:
+  - (str | None): Content of the file without surrounding whitespace, or None if it could not be read.
+  """
+  try:
+    with open(path, encoding="utf-8") as text_file:
+      return text_file.read().strip()
+  except OSError:
+    return None
+
+def __read_int_file(path: str) -> int | None:
+  """
+  ### Reads a file containing a single integer.
+
+  #### Params:
+  - path (str): Path to the file.
+
+  #### Returns:
+  - (int | None): Integer in the file, or None if the file does not exist or does not contain an integer (such as "max").
+  """
+  try:
+    return int(__read_file(path) or "")
+  except ValueError:
+    return None
@@ -3,20 +3,35 @@
 from __future__ import annotations
 
 import os
+import signal
 import subprocess
 import threading
+from typing import IO
 
 from xmipp3_installer.application.logger import errors
 from xmipp3_installer.application.logger.logger import logger
+from xmipp3_installer.installer.tracer import tracer
 
+CAPTURE_FULL = "full"
+CAPTURE_TAIL = "tail"
+CAPTURE_NONE = "none"
+DEFAULT_TAIL_SIZE = 64 * 1024
 
-def run_shell_command(
+__READ_CHUNK_SIZE = 64 * 1024
+__TERMINATION_GRACE_PERIOD = 5
+__DRAIN_JOIN_TIMEOUT = 5
+
+
+def run_shell_command(  # noqa: PLR0913
   cmd: str,
   *,
   cwd: str='./',
   show_command: bool=False,
   show_output: bool=False,
-  show_error: bool=False
+  show_error: bool=False,
+  capture: str=CAPTURE_FULL,
+  tail_size: int=DEFAULT_TAIL_SIZE,
+  timeout: float | None=None
 ) -> tuple[int, str]:
   """
   ### This function runs the given command.
@@ -27,6 +42,9 @@ def run_shell_command(
   - show_output (bool): Optional. If True, output is printed.
   - show_error (bool): Optional. If True, errors are printed.
   - show_command (bool): Optional. If True, command is printed in blue.
+  - capture (str): Optional. How the output is kept: whole (CAPTURE_FULL), only its last bytes (CAPTURE_TAIL), or not at all (CAPTURE_NONE).
+  - tail_size (int): Optional. Maximum number of bytes kept for each stream when only the tail is captured.
+  - timeout (float | None): Optional. Seconds after which the command and all its subprocesses are terminated. Default is no timeout.
 
   #### Returns:
   - (int): Return code.
@@ -34,7 +52,13 @@ def run_shell_command(
   """
   if show_command:
     logger(logger.blue(cmd))
-  ret_code, output_str = __run_command(cmd, cwd=cwd)
+  ret_code, output_str = __run_command(
+    cmd,
+    cwd=cwd,
+    capture=capture,
+    tail_size=tail_size,
+    timeout=timeout
+  )
 
   if not ret_code and show_output:
     logger(output_str)
@@ -44,12 +68,14 @@ def run_shell_command(
   
   return ret_code, output_str
 
-def run_shell_command_in_streaming(
+def run_shell_command_in_streaming(  # noqa: PLR0913
   cmd: str,
   cwd: str='./',
   show_output: bool=False,
   show_error: bool=False,
-  substitute: bool=False
+  substitute: bool=False,
+  *,
+  env: dict[str, str] | None=None
 ) -> int:
   """
   ### Runs the given command and shows its output as it is being generated.
@@ -60,55 +86,219 @@ def run_shell_command_in_streaming(
   - show_output (bool): Optional. If True, output is printed.
   - show_error (bool): Optional. If True, errors are printed.
   - substitute (bool): Optional. If True, output will replace previous line.
+  - env (dict(str, str) | None): Optional. Environment variables added to the current ones for the command.
 
   #### Returns:
   - (int): Return code.
   """
   logger(cmd, substitute=substitute)
-  process = subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=True)
+  with tracer.span(cmd, tracer.CATEGORY_COMMAND, cwd=cwd) as trace_args:
+    process = subprocess.Popen(
+      cmd,
+      cwd=cwd,
+      env={**os.environ, **env} if env else None,
+      stdout=subprocess.PIPE,
+      stderr=subprocess.PIPE,
+      shell=True
+    )
+    trace_args[tracer.ARG_PID] = process.pid
   
-  thread_out = threading.Thread(
-    target=logger.log_in_streaming,
-    args=(process.stdout,),
-    kwargs={"show_in_terminal": show_output, "substitute": substitute, "err": False}
-  )
-  thread_err = threading.Thread(
-    target=logger.log_in_streaming,
-    args=(process.stderr,),
-    kwargs={"show_in_terminal": show_error, "substitute": substitute, "err": True}
-  )
-  thread_out.start()
-  thread_err.start()
+    thread_out = threading.Thread(
+      target=logger.log_in_streaming,
+      args=(process.stdout,),
+      kwargs={"show_in_terminal": show_output, "substitute": substitute, "err": False}
+    )
+    thread_err = threading.Thread(
+      target=logger.log_in_streaming,
+      args=(process.stderr,),
+      kwargs={"show_in_terminal": show_error, "substitute": substitute, "err": True}
+    )
+    thread_out.start()
+    thread_err.start()
 
-  try:
-    process.wait()
-    thread_out.join()
-    thread_err.join()
-  except KeyboardInterrupt:
-    process.returncode = errors.INTERRUPTED_ERROR
-  
+    try:
+      process.wait()
+      thread_out.join()
+      thread_err.join()
+    except KeyboardInterrupt:
+      process.returncode = errors.INTERRUPTED_ERROR
+    trace_args[tracer.ARG_RET_CODE] = process.returncode
   return process.returncode
 
-def __run_command(cmd: str, cwd: str='./') -> tuple[int, str]:
+def __run_command(
+  cmd: str,
+  cwd: str='./',
+  capture: str=CAPTURE_FULL,
+  tail_size: int=DEFAULT_TAIL_SIZE,
+  timeout: float | None=None
+) -> tuple[int, str]:
   """
   ### Runs the given shell command.
 
+  Both output streams are drained while the command runs,
+  so it can never block on a full pipe.
+  If a timeout is given, the command is started in its own process group,
+  so that it can be terminated together with all of its subprocesses.
+
   #### Params:
   - cmd (str): Command to run.
   - cwd (str): Optional. Path to run the command from.
+  - capture (str): Optional. How the output is kept (CAPTURE_FULL, CAPTURE_TAIL, or CAPTURE_NONE).
+  - tail_size (int): Optional. Maximum number of bytes kept for each stream when only the tail is captured.
+  - timeout (float | None): Optional. Seconds after which the command is terminated.
 
   #### Returns:
   - (int): Return code of the operation.
   - (str): Return message of the operation.
   """
-  process = subprocess.Popen(cmd, cwd=cwd, env=os.environ, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=True)
+  with tracer.span(cmd, tracer.CATEGORY_COMMAND, cwd=cwd) as trace_args:
+    process = subprocess.Popen(
+      cmd,
+      cwd=cwd,
+      env=os.environ,
+      stdout=subprocess.PIPE,
+      stderr=subprocess.PIPE,
+      shell=True,
+      start_new_session=timeout is not None
+    )
+    trace_args[tracer.ARG_PID] = process.pid
+    stdout_buffer = _OutputBuffer(capture, tail_size)
+    stderr_buffer = _OutputBuffer(capture, tail_size)
+    drain_threads = [
+      __start_drain_thread(process.stdout, stdout_buffer),
+      __start_drain_thread(process.stderr, stderr_buffer)
+    ]
+    try:
+      ret_code = process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+      __terminate_process(process, kill_group=True)
+      __join_drain_threads(drain_threads)
+      trace_args[tracer.ARG_RET_CODE] = errors.TIMEOUT_ERROR
+      error_output = __decode_output(stderr_buffer.get_value())
+      timeout_message = f"Command '{cmd}' timed out after {timeout} seconds."
+      return errors.TIMEOUT_ERROR, "\n".join(filter(None, [error_output, timeout_message]))
+    except KeyboardInterrupt:
+      __terminate_process(process, kill_group=timeout is not None)
+      trace_args[tracer.ARG_RET_CODE] = errors.INTERRUPTED_ERROR
+      return errors.INTERRUPTED_ERROR, ""
+    
+    __join_drain_threads(drain_threads)
+    trace_args[tracer.ARG_RET_CODE] = ret_code
+    output = stdout_buffer.get_value()
+    return ret_code, __decode_output(output if not ret_code and output else stderr_buffer.get_value())
+
+class _OutputBuffer:
+  """### Stores the output of a stream according to the selected capture mode."""
+
+  def __init__(self, capture: str, tail_size: int):
+    """
+    ### Constructor.
+
+    #### Params:
+    - capture (str): How the output is kept (CAPTURE_FULL, CAPTURE_TAIL, or CAPTURE_NONE).
+    - tail_size (int): Maximum number of bytes kept when only the tail is captured.
+    """
+    self.capture = capture
+    self.tail_size = max(tail_size, 0)
+    self.__content = bytearray()
+  
+  def write(self, chunk: bytes):
+    """
+    ### Stores the given chunk of output.
+
+    #### Params:
+    - chunk (bytes): Output read from the stream.
+    """
+    if self.capture == CAPTURE_NONE:
+      return
+    self.__content.extend(chunk)
+    if self.capture == CAPTURE_TAIL and len(self.__content) > self.tail_size:
+      del self.__content[:len(self.__content) - self.tail_size]
+  
+  def get_value(self) -> bytes:
+    """
+    ### Returns the stored output.
+
+    #### Returns:
+    - (bytes): Stored output.
+    """
+    return bytes(self.__content)
+
+def __start_drain_thread(stream: IO[bytes], buffer: _OutputBuffer) -> threading.Thread:
+  """
+  ### Starts a thread that reads the given stream until it is closed.
+
+  #### Params:
+  - stream (IO[bytes]): Stream to read from.
+  - buffer (_OutputBuffer): Buffer where the output is stored.
+
+  #### Returns:
+  - (Thread): The started thread.
+  """
+  def __drain():
+    with stream:
+      for chunk in iter(lambda: stream.read1(__READ_CHUNK_SIZE), b""):
+        buffer.write(chunk)
+  thread = threading.Thread(target=__drain, daemon=True)
+  thread.start()
+  return thread
+
+def __join_drain_threads(threads: list[threading.Thread]):
+  """
+  ### Waits for the given drain threads to read all the remaining output.
+
+  The wait is limited, as a detached subprocess could keep the streams open.
+
+  #### Params:
+  - threads (list(Thread)): Threads to wait for.
+  """
+  for thread in threads:
+    thread.join(timeout=__DRAIN_JOIN_TIMEOUT)
+
+def __terminate_process(process: subprocess.Popen, kill_group: bool):
+  """
+  ### Terminates the given process, killing it if it does not end in time.
+
+  #### Params:
+  - process (Popen): Process to terminate.
+  - kill_group (bool): If True, all the processes of its process group are terminated as well.
+  """
+  __send_signal(process, signal.SIGTERM, kill_group)
   try:
+    process.wait(timeout=__TERMINATION_GRACE_PERIOD)
+  except subprocess.TimeoutExpired:
+    __send_signal(process, signal.SIGKILL, kill_group)
     process.wait()
-  except KeyboardInterrupt:
-    return errors.INTERRUPTED_ERROR, ""
-  
-  ret_code = process.returncode
-  output, err = process.communicate()
-  output_str = output.decode() if not ret_code and output else err.decode()
-  output_str = output_str[:-1] if output_str.endswith('\n') else output_str
-  return ret_code, output_str
+  if kill_group:
+    # The process group may outlive its leader
+    __send_signal(process, signal.SIGKILL, kill_group)
+
+def __send_signal(process: subprocess.Popen, sig: int, to_group: bool):
+  """
+  ### Sends the given signal to the process or its process group.
+
+  #### Params:
+  - process (Popen): Process to send the signal to.
+  - sig (int): Signal to send.
+  - to_group (bool): If True, the signal is sent to the whole process group.
+  """
+  try:
+    if to_group:
+      os.killpg(process.pid, sig)
+    else:
+      process.send_signal(sig)
+  except (ProcessLookupError, PermissionError):
+    pass
+
+def __decode_output(output: bytes) -> str:
+  """
+  ### Decodes the given output, removing the final line break.
+
+  #### Params:
+  - output (bytes): Output to decode.
+
+  #### Returns:
+  - (str): Decoded output.
+  """
+  output_str = output.decode(errors="replace")
+  return output_str[:-1] if output_str.endswith('\n') else output_str
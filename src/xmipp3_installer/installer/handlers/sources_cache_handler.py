@@ -0,0 +1,161 @@
+"""### Functions that manage the local cache of bare mirrors of the source repositories."""
+
+from __future__ import annotations
+
+import contextlib
+import os
+
+from xmipp3_installer.installer.constants import paths
+from xmipp3_installer.installer.handlers import shell_handler
+from xmipp3_installer.shared import file_operations, numeric
+
+_MIRROR_EXTENSION = ".git"
+
+
+def get_mirror_path(source_name: str) -> str:
+  """
+  ### Returns the path to the bare mirror of the given source.
+
+  #### Params:
+  - source_name (str): Name of the source.
+
+  #### Returns:
+  - (str): Path to the source's bare mirror inside the cache.
+  """
+  return os.path.join(paths.SOURCES_CACHE_PATH, f"{source_name}{_MIRROR_EXTENSION}")
+
+def get_mirror_url(source_name: str) -> str:
+  """
+  ### Returns the local repository url of the given source's mirror.
+
+  A file:// url is used instead of the plain path, because git ignores
+  options like --depth when cloning from a plain local path.
+
+  #### Params:
+  - source_name (str): Name of the source.
+
+  #### Returns:
+  - (str): Local url of the source's bare mirror.
+  """
+  return f"file://{os.path.abspath(get_mirror_path(source_name))}"
+
+def mirror_exists(source_name: str) -> bool:
+  """
+  ### Checks if the given source has a mirror in the cache.
+
+  #### Params:
+  - source_name (str): Name of the source.
+
+  #### Returns:
+  - (bool): True if the mirror exists, False otherwise.
+  """
+  return os.path.isdir(get_mirror_path(source_name))
+
+def update_mirror(source_name: str, repo_url: str) -> tuple[int, str]:
+  """
+  ### Creates or updates the bare mirror of the given source.
+
+  #### Params:
+  - source_name (str): Name of the source.
+  - repo_url (str): Url of the source's remote repository.
+
+  #### Returns:
+  - (tuple(int, str)): Tuple containing the return code and the text output produced by the command, or the error if the cache directory could not be created.
+  """
+  mirror_path = get_mirror_path(source_name)
+  if mirror_exists(source_name):
+    ret_code, output = shell_handler.run_shell_command(
+      "git fetch --prune --tags origin",
+      cwd=mirror_path
+    )
+  else:
+    try:
+      os.makedirs(paths.SOURCES_CACHE_PATH, exist_ok=True)
+    except OSError as os_error:
+      return 1, str(os_error)
+    ret_code, output = shell_handler.run_shell_command(
+      f"git clone --mirror {repo_url} {mirror_path}"
+    )
+  if not ret_code:
+    mark_mirror_as_used(source_name)
+  return ret_code, output
+
+def mark_mirror_as_used(source_name: str):
+  """
+  ### Updates the last usage time of the given source's mirror.
+
+  The time only decides which mirror is evicted first, so failing to update it is ignored.
+
+  #### Params:
+  - source_name (str): Name of the source.
+  """
+  mirror_path = get_mirror_path(source_name)
+  if os.path.isdir(mirror_path):
+    with contextlib.suppress(OSError):
+      os.utime(mirror_path)
+
+def get_cache_size() -> int:
+  """
+  ### Returns the total size of the sources cache.
+
+  #### Returns:
+  - (int): Size of the cache in bytes.
+  """
+  return sum(__get_dir_size(mirror) for mirror in __get_mirrors())
+
+def evict_mirrors(max_size_mb: int) -> list[str]:
+  """
+  ### Deletes the least recently used mirrors until the cache fits in the given size.
+
+  Mirrors of the current sources are evicted too if needed,
+  in which case they are mirrored again the next time they are used.
+
+  #### Params:
+  - max_size_mb (int): Maximum size of the cache in megabytes.
+
+  #### Returns:
+  - (list(str)): Paths of the evicted mirrors.
+  """
+  max_size = max_size_mb * numeric.BYTES_PER_MB
+  mirror_sizes = {mirror: __get_dir_size(mirror) for mirror in __get_mirrors()}
+  total_size = sum(mirror_sizes.values())
+  evicted = []
+  for mirror in sorted(mirror_sizes, key=os.path.getmtime):
+    if total_size <= max_size:
+      break
+    file_operations.delete_paths([mirror])
+    total_size -= mirror_sizes[mirror]
+    evicted.append(mirror)
+  return evicted
+
+def __get_mirrors() -> list[str]:
+  """
+  ### Returns the paths of all the mirrors stored in the cache.
+
+  #### Returns:
+  - (list(str)): Paths to all the mirrors.
+  """
+  if not os.path.isdir(paths.SOURCES_CACHE_PATH):
+    return []
+  return [
+    entry.path for entry in os.scandir(paths.SOURCES_CACHE_PATH)
+    if entry.is_dir() and entry.name.endswith(_MIRROR_EXTENSION)
+  ]
+
+def __get_dir_size(path: str) -> int:
+  """
+  ### Returns the size of all the files inside the given directory.
+
+  #### Params:
+  - path (str): Path to the directory.
+
+  #### Returns:
+  - (int): Size of the directory in bytes.
+  """
+  total_size = 0
+  for root, _, files in os.walk(path):
+    for file in files:
+      file_path = os.path.join(root, file)
+      if not os.path.islink(file_path):
+        total_size += os.path.getsize(file_path)
+  return total_size
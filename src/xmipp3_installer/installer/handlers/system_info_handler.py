@@ -0,0 +1,72 @@
+"""### Functions that read information about the system directly from the kernel, without running commands."""
+
+from __future__ import annotations
+
+import os
+import re
+
+__CPUINFO_FILE = "/proc/cpuinfo"
+__CPU_FLAGS_KEYS = ("flags", "Features") # x86 and ARM names
+__NET_INTERFACES_PATH = "/sys/class/net"
+__PHYSICAL_INTERFACE_REGEX = re.compile(r"^(enp|wlp|eth|ens|eno)\w+")
+__ETHERNET_TYPE = "1" # ARPHRD_ETHER, used by both ethernet and wireless interfaces
+__EMPTY_MAC_ADDRESS = "00:00:00:00:00:00"
+
+def get_cpu_flags() -> list[str]:
+  """
+  ### Returns the list of flags supported by the CPU.
+
+  #### Returns:
+  - (list(str)): Flags of the first CPU, or an empty list if they could not be read.
+  """
+  try:
+    with open(__CPUINFO_FILE, encoding="utf-8", errors="replace") as cpuinfo:
+      for line in cpuinfo:
+        key, _, value = line.partition(":")
+        if key.strip() in __CPU_FLAGS_KEYS:
+          return value.split()
+  except OSError:
+    pass
+  return []
+
+def get_mac_address() -> str | None:
+  """
+  ### Returns the MAC address of the first physical network interface.
+
+  Interfaces are taken in the order of their index, as listed by 'ip addr'.
+
+  #### Returns:
+  - (str | None): MAC address, or None if there is no physical interface or it could not be read.
+  """
+  try:
+    interfaces = os.listdir(__NET_INTERFACES_PATH)
+  except OSError:
+    return None
+  physical_interfaces = []
+  for interface in interfaces:
+    if not __PHYSICAL_INTERFACE_REGEX.match(interface):
+      continue
+    interface_path = os.path.join(__NET_INTERFACES_PATH, interface)
+    if __read_value(os.path.join(interface_path, "type")) != __ETHERNET_TYPE:
+      continue
+    index = __read_value(os.path.join(interface_path, "ifindex"))
+    address = __read_value(os.path.join(interface_path, "address"))
+    if index and index.isdigit() and address and address != __EMPTY_MAC_ADDRESS:
+      physical_interfaces.append((int(index), address))
+  return min(physical_interfaces)[1] if physical_interfaces else None
+
+def __read_value(path: str) -> str | None:
+  """
+  ### Returns the value stored in the given sysfs file.
+
+  #### Params:
+  - path (str): Path of the file.
+
+  #### Returns:
+  - (str | None): Value without surrounding whitespace, or None if it could not be read.
+  """
+  try:
+    with open(path, encoding="utf-8") as value_file:
+      return value_file.read().strip()
+  except OSError:
+    return None
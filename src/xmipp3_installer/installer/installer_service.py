@@ -8,9 +8,7 @@ from __future__ import annotations
 
 from typing import cast
 
-from xmipp3_installer.api_client import api_client
-from xmipp3_installer.api_client.assembler import installation_info_assembler
-from xmipp3_installer.application.cli.arguments import modes
+from xmipp3_installer.application.cli.arguments import modes, params
 from xmipp3_installer.application.logger import errors, predefined_messages
 from xmipp3_installer.application.logger.logger import logger
 from xmipp3_installer.installer import constants
@@ -18,8 +16,12 @@ from xmipp3_installer.installer.constants import paths
 from xmipp3_installer.installer.handlers import versions_manager
 from xmipp3_installer.installer.modes import mode_selector
 from xmipp3_installer.installer.modes.mode_executor import ModeExecutor
+from xmipp3_installer.installer.tracer import tracer
 from xmipp3_installer.repository import config
 from xmipp3_installer.repository.config_vars import variables
+from xmipp3_installer.shared import file_operations, lazy_modules
+
+installation_info_sender = lazy_modules.lazy_import("xmipp3_installer.api_client.installation_info_sender")
 
 
 class InstallationManager:
@@ -37,6 +39,7 @@ class InstallationManager:
     - args (dict): Dictionary containing all parsed command-line arguments.
     """
     self.mode = args.pop(modes.MODE, modes.MODE_ALL)
+    self.trace_file = args.pop(params.PARAM_TRACE, None)
     config_handler = config.ConfigurationFileHandler(path=paths.CONFIG_FILE, show_errors=False)
     self.context = {
       **args,
@@ -44,18 +47,26 @@ class InstallationManager:
       variables.LAST_MODIFIED_KEY: config_handler.last_modified,
       constants.VERSIONS_CONTEXT_KEY: versions_manager.VersionsManager(paths.VERSION_INFO_FILE)
     }
-    self.mode_executor: ModeExecutor = mode_selector.MODE_EXECUTORS[self.mode](self.context)
+    self.mode_executor: ModeExecutor = mode_selector.get_mode_executor(self.mode)(self.context)
 
   def run_installer(self):
     """
     ### Runs the installer with the given arguments.
 
+    Whatever a previous clean left in the trash directory is deleted in the background.
+    The installation info is also sent in the background, so the exit does not wait on the network.
+
     #### Returns:
     - (int): Return code.
     """
+    if self.trace_file:
+      tracer.start(self.trace_file)
+    file_operations.sweep_trash_in_background(paths.TRASH_PATH)
     try:
       try:
-        ret_code, output = self.mode_executor.run()
+        with tracer.span(self.mode, tracer.CATEGORY_MODE) as trace_args:
+          ret_code, output = self.mode_executor.run()
+          trace_args[tracer.ARG_RET_CODE] = ret_code
       except KeyboardInterrupt:
         logger.log_error("", ret_code=errors.INTERRUPTED_ERROR, add_portal_link=False)
         return errors.INTERRUPTED_ERROR
@@ -63,12 +74,7 @@ class InstallationManager:
         logger.log_error(output, ret_code=ret_code, add_portal_link=ret_code != errors.INTERRUPTED_ERROR)
       if self._should_send_installation_info():
         logger("Sending anonymous installation info...", show_in_terminal=False)
-        api_client.send_installation_attempt(
-          installation_info_assembler.get_installation_info(
-            self.context[constants.VERSIONS_CONTEXT_KEY],
-            ret_code=ret_code
-          )
-        )
+        installation_info_sender.send_in_background(ret_code)
       if not ret_code and self.mode_executor.prints_banner_on_exit:
         logger(predefined_messages.get_success_message(
           cast(
@@ -78,6 +84,7 @@ class InstallationManager:
         ))
       return ret_code
     finally:
+      _write_trace()
       logger.close()
 
   def _should_send_installation_info(self) -> bool:
@@ -87,11 +94,17 @@ class InstallationManager:
     #### Returns:
     - (bool): True if installation information should be sent, False otherwise.
     """
-    if not self.mode_executor.sends_installation_info or not self.context[variables.SEND_INSTALLATION_STATISTICS]:
-      return False
-    
-    if not api_client.internet_available():
-      logger("No internet connection available. Installation info will not be sent.", show_in_terminal=False)
-      return False
-    
-    return True
+    return bool(
+      self.mode_executor.sends_installation_info and
+      self.context[variables.SEND_INSTALLATION_STATISTICS]
+    )
+
+def _write_trace():
+  """### Writes the timeline of the run, if it was being recorded."""
+  try:
+    trace_file = tracer.write()
+  except OSError as os_error:
+    logger(logger.yellow(f"The trace of the run could not be written: {os_error}"))
+    return
+  if trace_file:
+    logger(f"Trace of the run written to {trace_file}.")
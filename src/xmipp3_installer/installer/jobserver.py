@@ -0,0 +1,175 @@
+"""
+### Jobserver Module.
+
+This module contains the class to throttle the jobs of a build
+according to the memory and load of the system while it runs.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import shutil
+import tempfile
+import threading
+
+from xmipp3_installer.installer.handlers import generic_package_handler, resources_handler
+
+_TOKEN = b"+"
+_FIFO_NAME = "jobserver"
+_DEFAULT_INTERVAL = 1.0
+_GNU_MAKE_NAME = "GNU Make"
+_NINJA_NAME = "ninja"
+_MIN_GNU_MAKE_VERSION = (4, 4)
+_MIN_NINJA_VERSION = (1, 13)
+_VERSION_REGEX = re.compile(r"(\d+)\.(\d+)")
+
+
+class Jobserver:
+  """
+  ### GNU make compatible jobserver.
+
+  Build tools (GNU make >= 4.4, Ninja >= 1.13) started with the environment it provides
+  take a token from it before starting each job. While it runs, tokens are withheld when
+  memory or CPU are exhausted, and given back when they are available again.
+  """
+
+  def __init__(self, jobs: int, job_memory_mb: int, interval: float=_DEFAULT_INTERVAL):
+    """
+    ### Constructor.
+
+    #### Params:
+    - jobs (int): Maximum number of jobs running at the same time.
+    - job_memory_mb (int): Estimated memory needed by each job, in megabytes. 0 ignores memory.
+    - interval (float): Optional. Seconds between checks of the system resources.
+    """
+    self.jobs = max(1, jobs)
+    self.job_memory_mb = job_memory_mb
+    self.interval = interval
+    self.withheld_tokens = 0
+    self.__directory: str | None = None
+    self.__fifo_fd: int | None = None
+    self.__stop_event = threading.Event()
+    self.__thread: threading.Thread | None = None
+
+  @staticmethod
+  def is_supported(build_tool: str | None) -> bool:
+    """
+    ### Checks if the jobserver can be used in this platform by the given build tool.
+
+    Older build tools ignore the jobserver and run as many jobs as they choose,
+    so the jobs would not be bounded at all.
+
+    #### Params:
+    - build_tool (str | None): Path to the build tool (make or ninja) that runs the jobs.
+
+    #### Returns:
+    - (bool): True if named pipes are available and the build tool is GNU make >= 4.4 or Ninja >= 1.13.
+    """
+    if not hasattr(os, "mkfifo") or not build_tool:
+      return False
+    return _is_jobserver_client(build_tool, generic_package_handler.get_package_version(build_tool))
+
+  @property
+  def fifo_path(self) -> str:
+    """### Path to the named pipe holding the tokens."""
+    return os.path.join(self.__directory or "", _FIFO_NAME)
+
+  def __enter__(self) -> Jobserver:
+    """
+    ### Creates the token pipe and starts following the system resources.
+
+    #### Returns:
+    - (Jobserver): The started jobserver.
+    """
+    self.__directory = tempfile.mkdtemp(prefix="xmipp-jobserver-")
+    os.mkfifo(self.fifo_path, 0o600)
+    self.__fifo_fd = os.open(self.fifo_path, os.O_RDWR | os.O_NONBLOCK)
+    os.write(self.__fifo_fd, _TOKEN * (self.jobs - 1)) # Every client owns an implicit token
+    self.withheld_tokens = 0
+    self.__stop_event.clear()
+    self.__thread = threading.Thread(target=self.__follow_resources, daemon=True)
+    self.__thread.start()
+    return self
+
+  def __exit__(self, *_):
+    """### Stops following the system resources and removes the token pipe."""
+    self.__stop_event.set()
+    if self.__thread is not None:
+      self.__thread.join()
+    if self.__fifo_fd is not None:
+      os.close(self.__fifo_fd)
+    if self.__directory is not None:
+      shutil.rmtree(self.__directory, ignore_errors=True)
+    self.__thread = None
+    self.__fifo_fd = None
+    self.__directory = None
+
+  def get_environment(self) -> dict[str, str]:
+    """
+    ### Returns the environment variables that make build tools use this jobserver.
+
+    #### Returns:
+    - (dict(str, str)): Environment variables to add to the build command.
+    """
+    return {"MAKEFLAGS": f"-j{self.jobs} --jobserver-auth=fifo:{self.fifo_path}"}
+
+  def adjust_tokens(self):
+    """### Withholds or gives back one token, depending on the current memory and load."""
+    available_memory = resources_handler.get_available_memory_mb() if self.job_memory_mb else None
+    load_average = resources_handler.get_load_average()
+    cpu_count = resources_handler.get_available_cpu_count()
+    if (
+      (available_memory is not None and available_memory < self.job_memory_mb) or
+      (load_average is not None and load_average > cpu_count)
+    ):
+      self.__withhold_token()
+    elif (
+      (available_memory is None or available_memory >= 2 * self.job_memory_mb) and
+      (load_average is None or load_average < cpu_count)
+    ):
+      self.__give_back_token()
+
+  def __follow_resources(self):
+    """### Adjusts the tokens periodically until the jobserver is stopped."""
+    while not self.__stop_event.wait(self.interval):
+      self.adjust_tokens()
+
+  def __withhold_token(self):
+    """### Takes a free token from the pipe, if any, so that one job less can run."""
+    if self.__fifo_fd is None or self.withheld_tokens >= self.jobs - 1:
+      return
+    try:
+      if os.read(self.__fifo_fd, 1):
+        self.withheld_tokens += 1
+    except BlockingIOError:
+      pass # All tokens are in use, it will be taken when a job finishes
+
+  def __give_back_token(self):
+    """### Returns a withheld token to the pipe, so that one job more can run."""
+    if self.__fifo_fd is None or not self.withheld_tokens:
+      return
+    os.write(self.__fifo_fd, _TOKEN)
+    self.withheld_tokens -= 1
+
+def _is_jobserver_client(build_tool: str, version_output: str | None) -> bool:
+  """
+  ### Checks if the given build tool takes its tokens from a named pipe jobserver.
+
+  #### Params:
+  - build_tool (str): Path to the build tool.
+  - version_output (str | None): Output of the build tool's '--version' command.
+
+  #### Returns:
+  - (bool): True if it is GNU make >= 4.4 or Ninja >= 1.13.
+  """
+  first_line = (version_output or "").split("\n", 1)[0]
+  version_match = _VERSION_REGEX.search(first_line)
+  if not version_match:
+    return False
+  version = (int(version_match.group(1)), int(version_match.group(2)))
+  if first_line.startswith(_GNU_MAKE_NAME):
+    return version >= _MIN_GNU_MAKE_VERSION
+  if os.path.basename(build_tool).startswith(_NINJA_NAME):
+    return version >= _MIN_NINJA_VERSION
+  return False
@@ -6,8 +6,10 @@ This module contains the class to run the whole installation process.
 
 from __future__ import annotations
 
-from xmipp3_installer.application.cli.arguments import params
+from xmipp3_installer.application.cli.arguments import modes, params
 from xmipp3_installer.application.logger.logger import logger
+from xmipp3_installer.installer import pipeline
+from xmipp3_installer.installer.constants import paths
 from xmipp3_installer.installer.modes import (
   mode_config_executor,
   mode_executor,
@@ -24,6 +26,9 @@ class ModeAllExecutor(mode_executor.ModeExecutor):
   ### Mode All Executor.
 
   Runs the whole installation process with the appropriate parameters.
+  The only stages that overlap are config and getSources, as neither
+  depends on the other. configBuild needs both of them, and
+  compileAndInstall needs configBuild, so those two run in sequence.
   """
   
   def __init__(self, context: dict):
@@ -45,12 +50,34 @@ class ModeAllExecutor(mode_executor.ModeExecutor):
     compile_and_install_executor = mode_compile_and_install_executor.ModeCompileAndInstallExecutor(
       context
     )
-    self.executors = [
-      config_executor,
-      get_sources_executor,
-      config_build_executor,
-      compile_and_install_executor
-    ]
+    self.pipeline = pipeline.Pipeline(
+      [
+        pipeline.Stage(
+          modes.MODE_CONFIG,
+          config_executor.run,
+          outputs=[paths.CONFIG_FILE]
+        ),
+        pipeline.Stage(
+          modes.MODE_GET_SOURCES,
+          get_sources_executor.run,
+          outputs=paths.XMIPP_SOURCE_PATHS
+        ),
+        pipeline.Stage(
+          modes.MODE_CONFIG_BUILD,
+          config_build_executor.run,
+          inputs=[paths.CONFIG_FILE, *paths.XMIPP_SOURCE_PATHS],
+          outputs=[paths.CMAKE_CACHE_FILE]
+        ),
+        pipeline.Stage(
+          modes.MODE_COMPILE_AND_INSTALL,
+          compile_and_install_executor.run,
+          inputs=[paths.CMAKE_CACHE_FILE],
+          outputs=[paths.INSTALL_PATH]
+        )
+      ],
+      paths.PIPELINE_PROGRESS_FILE
+    )
+    self.resume = context[params.PARAM_RESUME]
     super().__init__(context)
 
   def _set_executor_config(self):
@@ -65,13 +92,12 @@ class ModeAllExecutor(mode_executor.ModeExecutor):
     """
     ### Runs the whole installation process with the appropiate params.
 
+    A summary of the time spent on each stage is shown at the end.
+
     #### Returns:
     - (tuple(int, str)): Tuple containing the error status and an error message if there was an error. 
     """
-    for executor_index in range(len(self.executors)):
-      if executor_index != 0:
-        logger("")
-      ret_code, output = self.executors[executor_index].run()
-      if ret_code:
-        return ret_code, output
-    return 0, ""
+    ret_code, output = self.pipeline.run(resume=self.resume)
+    logger("")
+    logger(self.pipeline.get_timings_summary())
+    return ret_code, output
@@ -6,16 +6,23 @@ This module contains the class to clean compiled binaries and related files.
 
 from __future__ import annotations
 
-import fnmatch
-import glob
 import os
-import pathlib
 
 from xmipp3_installer.application.logger.logger import logger
 from xmipp3_installer.installer import constants
 from xmipp3_installer.installer.constants import paths
+from xmipp3_installer.installer.handlers import path_scanner
 from xmipp3_installer.installer.modes.mode_clean import mode_clean_executor
 
+_PROGRAMS_PATH = os.path.join(paths.SOURCES_PATH, constants.XMIPP, "applications", "programs")
+_SCAN_RULES = [
+  ("", "*.dblite", path_scanner.MATCH_FILES),
+  *[(paths.SOURCES_PATH, pattern, path_scanner.MATCH_FILES) for pattern in ["*.so", "*.os", "*.o"]],
+  (_PROGRAMS_PATH, "*", path_scanner.MATCH_EMPTY_DIRS),
+  ("", "__pycache__", path_scanner.MATCH_DIRS)
+]
+_WHOLE_PATHS = [paths.BUILD_PATH, paths.BINARIES_PATH]
+
 
 class ModeCleanBinExecutor(mode_clean_executor.ModeCleanExecutor):
   """
@@ -34,20 +41,16 @@ class ModeCleanBinExecutor(mode_clean_executor.ModeCleanExecutor):
     """
     ### Returns a list of all the paths to be deleted.
 
+    These are the *.dblite files and __pycache__ directories anywhere, the compilation files in the sources,
+    the empty program directories, and the build and binaries directories,
+    which are not scanned, as they are deleted whole. The trash directory is not scanned either.
+
     #### Returns:
     - (list(str)): List containing all the paths to delete.
     """
-    dblite_files = glob.glob(
-      "**/*.dblite",
-      recursive=True
-    )
     return [
-      *dblite_files,
-      *ModeCleanBinExecutor._get_compilation_files(),
-      *ModeCleanBinExecutor._get_empty_dirs(),
-      *ModeCleanBinExecutor._get_pycache_dirs(),
-      paths.BUILD_PATH,
-      paths.BINARIES_PATH
+      *path_scanner.scan_paths(_SCAN_RULES, pruned_paths=[*_WHOLE_PATHS, paths.TRASH_PATH]),
+      *_WHOLE_PATHS
     ]
   
   def _get_confirmation_message(self) -> str:
@@ -61,46 +64,3 @@ class ModeCleanBinExecutor(mode_clean_executor.ModeCleanExecutor):
       logger.yellow(f"WARNING: This will DELETE from {paths.SOURCES_PATH} all *.so, *.os and *.o files. Also the *.pyc and *.dblite files"),
       logger.yellow(f"If you are sure you want to do this, type '{self.confirmation_keyword}' (case sensitive):")
     ])
-  
-  @staticmethod
-  def _get_compilation_files():
-    """
-    ### Returns a list of all the compilation-related files.
-
-    #### Returns:
-    - (list(str)): List containing all the paths to compilation-related files.
-    """
-    compilation_files = []
-    for root, _, files in os.walk(paths.SOURCES_PATH):
-      for pattern in ['*.so', '*.os', '*.o']:
-        matches = [os.path.join(root, filename) for filename in fnmatch.filter(files, pattern)]
-        compilation_files.extend(matches)
-    return compilation_files
-
-  @staticmethod
-  def _get_empty_dirs() -> list[str]:
-    """
-    ### Returns a list with all the empty directories inside the programs folder.
-
-    #### Returns:
-    - (list(str)): List containing the paths to all the empty directories.
-    """
-    empty_dirs = [] 
-    for root, dirs, files in os.walk(os.path.join(
-      paths.SOURCES_PATH, constants.XMIPP, "applications", "programs"
-    )): 
-      if not len(dirs) and not len(files): 
-        empty_dirs.append(root) 
-    return empty_dirs
-
-  @staticmethod
-  def _get_pycache_dirs() -> list[str]:
-    """
-    ### Returns a list of all the __pycache__ directories.
-
-    #### Returns:
-    - (list(str)): List containing all the paths to __pycache__ directories.
-    """
-    return [
-      str(path) for path in pathlib.Path().rglob('__pycache__')
-    ]
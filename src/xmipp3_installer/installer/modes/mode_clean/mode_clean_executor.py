@@ -6,13 +6,18 @@ This module contains the base class for executors that clean compiled binaries.
 
 from __future__ import annotations
 
+import json
+import os
 from abc import abstractmethod
 
 from xmipp3_installer.application import user_interactions
+from xmipp3_installer.application.cli.arguments import params
 from xmipp3_installer.application.logger import errors, predefined_messages
 from xmipp3_installer.application.logger.logger import logger
+from xmipp3_installer.installer.constants import paths
 from xmipp3_installer.installer.modes import mode_executor
-from xmipp3_installer.shared import file_operations
+from xmipp3_installer.shared import file_operations, numeric
+
 
 
 class ModeCleanExecutor(mode_executor.ModeExecutor):
@@ -21,18 +26,51 @@ class ModeCleanExecutor(mode_executor.ModeExecutor):
 
   Base class for executors that clean compiled binaries.
   """
+
+  def __init__(self, context: dict):
+    """
+    ### Constructor.
+
+    #### Params:
+    - context (dict): Dictionary containing the installation context variables.
+    """
+    super().__init__(context)
+    self.dry_run = context.pop(params.PARAM_DRY_RUN, False)
+    self.report_file = context.pop(params.PARAM_REPORT, None)
   
   def run(self) -> tuple[int, str]:
     """
     ### Deletes the compiled binaries.
 
+    The paths are first moved into the trash directory, and then the new batch of the trash
+    is handed to a detached process, so the installer does not wait for it to be emptied.
+    If that process cannot be started, the batch is emptied in parallel before returning.
+    Paths that cannot be moved there are deleted where they are.
+    In a dry run, the paths are only listed with their sizes.
+
     #### Returns:
     - (tuple(int, str)): Tuple containing the error status and an error message if there was an error. 
     """
+    if self.dry_run:
+      report = _get_report(self.__class__._get_paths_to_delete())
+      logger(_get_report_message(report))
+      return self._write_report(report)
     if not self._get_confirmation():
       return errors.INTERRUPTED_ERROR, ""
-    file_operations.delete_paths(self.__class__._get_paths_to_delete())
+    paths_to_delete = self.__class__._get_paths_to_delete()
+    ret_code, output = self._write_report(_get_report(paths_to_delete)) if self.report_file else (0, "")
+    if ret_code:
+      return ret_code, output
+    batch, unmoved_paths = file_operations.move_to_trash(paths_to_delete, paths.TRASH_PATH)
+    file_operations.delete_paths(unmoved_paths)
     logger(predefined_messages.get_done_message())
+    if not batch:
+      return 0, ""
+    if file_operations.sweep_trash_in_background(paths.TRASH_PATH, [batch]):
+      logger("The disk space is being freed in the background.")
+    else:
+      freed_bytes = file_operations.sweep_trash(paths.TRASH_PATH, [batch])
+      logger(f"Freed {_get_size_text(freed_bytes)} of disk space.")
     return 0, ""
   
   def _get_confirmation(self) -> bool:
@@ -44,6 +82,27 @@ class ModeCleanExecutor(mode_executor.ModeExecutor):
     """
     logger(self._get_confirmation_message())
     return user_interactions.get_user_confirmation(self.confirmation_keyword)
+
+  def _write_report(self, report: dict) -> tuple[int, str]:
+    """
+    ### Writes the given report as JSON, if a report file was requested.
+
+    #### Params:
+    - report (dict): Report, as returned by _get_report.
+
+    #### Returns:
+    - (tuple(int, str)): Tuple containing the error status and an error message if there was an error.
+    """
+    if not self.report_file:
+      return 0, ""
+    try:
+      with open(self.report_file, "w", encoding="utf-8") as report_file:
+        json.dump(report, report_file, indent=2)
+        report_file.write("\n")
+    except OSError as os_error:
+      return errors.IO_ERROR, f"The report could not be written to {self.report_file}: {os_error}"
+    logger(f"Report saved to {self.report_file}.")
+    return 0, ""
   
   @property
   @abstractmethod
@@ -58,3 +117,50 @@ class ModeCleanExecutor(mode_executor.ModeExecutor):
   @abstractmethod
   def _get_confirmation_message(self) -> str:
     """Get confirmation message method to be implemented by the inheriting classes."""
+
+def _get_report(paths_to_delete: list[str]) -> dict:
+  """
+  ### Returns the paths to delete that exist, with their sizes.
+
+  #### Params:
+  - paths_to_delete (list(str)): List of paths to delete.
+
+  #### Returns:
+  - (dict): Each existing path with its size, and the total size, in bytes.
+  """
+  existing_paths = [path for path in paths_to_delete if os.path.lexists(path)]
+  sizes = file_operations.get_sizes(existing_paths)
+  return {
+    "paths": [{"path": path, "size": size} for path, size in zip(existing_paths, sizes)],
+    "total_size": sum(sizes)
+  }
+
+def _get_report_message(report: dict) -> str:
+  """
+  ### Returns the message listing the paths of the given report.
+
+  #### Params:
+  - report (dict): Report, as returned by _get_report.
+
+  #### Returns:
+  - (str): Paths that would be deleted with their sizes, and the total.
+  """
+  if not report["paths"]:
+    return "Nothing to delete."
+  return '\n'.join([
+    "The following paths would be deleted:",
+    *[f"{_get_size_text(entry['size']):>12}  {entry['path']}" for entry in report["paths"]],
+    f"Total: {_get_size_text(report['total_size'])}"
+  ])
+
+def _get_size_text(size: int) -> str:
+  """
+  ### Returns the given size in a human-readable format.
+
+  #### Params:
+  - size (int): Size in bytes.
+
+  #### Returns:
+  - (str): Size in MB.
+  """
+  return f"{size / numeric.BYTES_PER_MB:.1f} MB"
@@ -9,9 +9,18 @@ from __future__ import annotations
 from xmipp3_installer.application.cli.arguments import params
 from xmipp3_installer.application.logger import errors, predefined_messages
 from xmipp3_installer.application.logger.logger import logger
+from xmipp3_installer.installer import jobserver
 from xmipp3_installer.installer.constants import paths
-from xmipp3_installer.installer.handlers import shell_handler
+from xmipp3_installer.installer.handlers import (
+  build_report_handler,
+  compiler_cache_handler,
+  resources_handler,
+  shell_handler,
+)
+from xmipp3_installer.installer.handlers.cmake import cmake_constants, cmake_handler
 from xmipp3_installer.installer.modes.mode_cmake import mode_cmake_executor
+from xmipp3_installer.repository.config_vars import default_values, variables
+from xmipp3_installer.shared import numeric
 
 
 class ModeCompileAndInstallExecutor(mode_cmake_executor.ModeCMakeExecutor):
@@ -30,6 +39,11 @@ class ModeCompileAndInstallExecutor(mode_cmake_executor.ModeCMakeExecutor):
     """
     super().__init__(context)
     self.jobs = context[params.PARAM_JOBS]
+    self.job_memory = numeric.get_non_negative_int(
+      context[variables.BUILD_JOB_MEMORY],
+      int(default_values.CONFIG_DEFAULT_VALUES[variables.BUILD_JOB_MEMORY])
+    )
+    self.use_jobserver = context[variables.BUILD_JOBSERVER]
 
   def _set_executor_config(self):
     """### Sets the specific executor params for this mode."""
@@ -47,11 +61,19 @@ class ModeCompileAndInstallExecutor(mode_cmake_executor.ModeCMakeExecutor):
     - (tuple(int, str)): Tuple containing the error status and an error message if there was an error. 
     """
     logger(predefined_messages.get_section_message("Compiling with CMake"))
-    cmd = f"{cmake} --build {paths.BUILD_PATH} --config {self.build_type} -j {self.jobs}"
-    ret_code = shell_handler.run_shell_command_in_streaming(cmd, show_output=True, substitute=self.substitute)
+    launcher = cmake_handler.get_cmake_cache_variable(
+      paths.CMAKE_CACHE_FILE,
+      cmake_constants.CMAKE_CXX_COMPILER_LAUNCHER
+    )
+    start_statistics = compiler_cache_handler.get_statistics(launcher) if launcher else None
+    log_position = build_report_handler.get_log_position(paths.NINJA_LOG_FILE)
+    ret_code = self._run_build(cmake, self._get_build_jobs())
     if ret_code:
       return self._get_error_code(ret_code, errors.CMAKE_COMPILE_ERROR), ""
     logger(predefined_messages.get_done_message(), substitute=self.substitute)
+    if launcher and start_statistics:
+      _log_compiler_cache_statistics(launcher, start_statistics)
+    _write_build_report(log_position)
     
     installation_section_message = predefined_messages.get_section_message("Installing with CMake")
     logger(f"\n{installation_section_message}")
@@ -61,3 +83,83 @@ class ModeCompileAndInstallExecutor(mode_cmake_executor.ModeCMakeExecutor):
       return self._get_error_code(ret_code, errors.CMAKE_INSTALL_ERROR), ""
     logger(predefined_messages.get_done_message(), substitute=self.substitute)
     return 0, ""
+
+  def _get_build_jobs(self) -> int:
+    """
+    ### Returns the number of compilation jobs that fit in the available memory.
+
+    #### Returns:
+    - (int): Number of jobs, never more than requested.
+    """
+    jobs = resources_handler.get_memory_limited_jobs(self.jobs, self.job_memory)
+    if jobs < self.jobs:
+      logger(logger.yellow(
+        f"Compiling with {jobs} jobs instead of {self.jobs} to fit in the available memory "
+        f"({self.job_memory} MB per job, set by {variables.BUILD_JOB_MEMORY})."
+      ))
+    return jobs
+
+  def _run_build(self, cmake: str, jobs: int) -> int:
+    """
+    ### Runs the CMake compilation with the given number of jobs.
+
+    If the jobserver is enabled and supported by the build tool, the jobs running at the same time
+    follow the memory and load of the system, and the jobserver bounds them to the given number.
+    '-j' is not passed then, as make and Ninja stop using the jobserver when it is given explicitly.
+
+    #### Params:
+    - cmake (str): Path to CMake executable.
+    - jobs (int): Maximum number of jobs.
+
+    #### Returns:
+    - (int): Return code of the compilation.
+    """
+    cmd = f"{cmake} --build {paths.BUILD_PATH} --config {self.build_type}"
+    if not self.use_jobserver or not jobserver.Jobserver.is_supported(_get_build_tool()):
+      return shell_handler.run_shell_command_in_streaming(
+        f"{cmd} -j {jobs}", show_output=True, substitute=self.substitute
+      )
+    with jobserver.Jobserver(jobs, self.job_memory) as build_jobserver:
+      return shell_handler.run_shell_command_in_streaming(
+        cmd, show_output=True, substitute=self.substitute, env=build_jobserver.get_environment()
+      )
+
+def _get_build_tool() -> str | None:
+  """
+  ### Returns the build tool chosen by CMake for the configured build.
+
+  #### Returns:
+  - (str | None): Path to the build tool, or None if the build is not configured.
+  """
+  return cmake_handler.get_cmake_cache_variable(paths.CMAKE_CACHE_FILE, cmake_constants.CMAKE_MAKE_PROGRAM)
+
+def _log_compiler_cache_statistics(launcher: str, start_statistics: tuple[int, int]):
+  """
+  ### Logs the compiler cache hits and misses of the compilation.
+
+  #### Params:
+  - launcher (str): Path to the compiler cache executable.
+  - start_statistics (tuple(int, int)): Hit and miss counts before compiling.
+  """
+  end_statistics = compiler_cache_handler.get_statistics(launcher)
+  if end_statistics:
+    logger(compiler_cache_handler.get_statistics_message(launcher, start_statistics, end_statistics))
+
+def _write_build_report(log_position: tuple[int, int]):
+  """
+  ### Writes the report with the duration of each target built by Ninja.
+
+  Nothing is written if no target was built or the generator is not Ninja.
+
+  #### Params:
+  - log_position (tuple(int, int)): Size and inode of the Ninja log before compiling.
+  """
+  entries = build_report_handler.get_build_entries(paths.NINJA_LOG_FILE, log_position)
+  if not entries:
+    return
+  report = build_report_handler.get_build_report(entries)
+  try:
+    build_report_handler.write_build_report(report, paths.BUILD_REPORT_FILE)
+  except OSError:
+    return
+  logger(build_report_handler.get_build_report_message(report, paths.BUILD_REPORT_FILE))
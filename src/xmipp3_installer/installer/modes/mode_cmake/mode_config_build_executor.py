@@ -6,15 +6,28 @@ This module contains the class to configure the build using CMake.
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import shutil
 from typing import Union, cast
 
+from xmipp3_installer.application.cli.arguments import modes, params
 from xmipp3_installer.application.logger import errors, predefined_messages
 from xmipp3_installer.application.logger.logger import logger
 from xmipp3_installer.installer.constants import paths
-from xmipp3_installer.installer.handlers import shell_handler
-from xmipp3_installer.installer.handlers.cmake import cmake_handler
+from xmipp3_installer.installer.handlers import (
+  compiler_cache_handler,
+  git_handler,
+  shell_handler,
+)
+from xmipp3_installer.installer.handlers.cmake import cmake_constants, cmake_handler
 from xmipp3_installer.installer.modes.mode_cmake import mode_cmake_executor
 from xmipp3_installer.repository.config_vars import variables
+from xmipp3_installer.shared import file_operations
+
+_DEFAULT_COMPILERS = ("cc", "c++")
+_COMPILER_ENVIRONMENT_VARIABLES = ("CC", "CXX", "CUDACXX")
 
 
 class ModeConfigBuildExecutor(mode_cmake_executor.ModeCMakeExecutor):
@@ -22,7 +35,19 @@ class ModeConfigBuildExecutor(mode_cmake_executor.ModeCMakeExecutor):
   ### Mode Config Build Executor.
 
   Configures the build using CMake with the appropriate parameters.
+  The configuration is skipped if nothing changed since the last successful one.
   """
+
+  def __init__(self, context: dict):
+    """
+    ### Constructor.
+    
+    #### Params:
+    - context (dict): Dictionary containing the installation context variables.
+    """
+    super().__init__(context)
+    self.force = context[params.PARAM_FORCE]
+    self.generator = context[variables.CMAKE_GENERATOR]
   
   def _run_cmake_mode(self, cmake: str) -> tuple[int, str]:
     """
@@ -35,12 +60,57 @@ class ModeConfigBuildExecutor(mode_cmake_executor.ModeCMakeExecutor):
     - (tuple(int, str)): Tuple containing the error status and an error message if there was an error. 
     """
     logger(predefined_messages.get_section_message("Configuring with CMake"))
-    cmd = f"{cmake} -S . -B {paths.BUILD_PATH} -DCMAKE_BUILD_TYPE={self.build_type} {self._get_cmake_vars()}"
+    configured_generator = cmake_handler.get_cmake_cache_variable(
+      paths.CMAKE_CACHE_FILE,
+      cmake_constants.CMAKE_GENERATOR
+    )
+    if self.generator and configured_generator and self.generator != configured_generator:
+      return errors.CMAKE_CONFIGURE_ERROR, _get_generator_mismatch_message(configured_generator, self.generator)
+    generator = self.generator or configured_generator or cmake_handler.get_default_generator()
+    cmake_vars = " ".join(filter(None, [self._get_cmake_vars(), self._get_compiler_launcher_params()]))
+    fingerprint = self._get_configuration_fingerprint(cmake, generator, cmake_vars)
+    if not self.force and _is_configuration_up_to_date(fingerprint):
+      force_param = params.PARAMS[params.PARAM_FORCE][params.LONG_VERSION]
+      logger(f"Nothing changed since the last configuration, skipping it. Use {force_param} to configure anyway.")
+      logger(predefined_messages.get_done_message(), substitute=self.substitute)
+      return 0, ""
+    file_operations.delete_paths([paths.CMAKE_FINGERPRINT_FILE])
+    generator_param = f'-G "{generator}" ' if generator else ""
+    cmd = f"{cmake} {generator_param}-S . -B {paths.BUILD_PATH} -DCMAKE_BUILD_TYPE={self.build_type} {cmake_vars}"
     ret_code = shell_handler.run_shell_command_in_streaming(cmd, show_output=True, substitute=self.substitute)
     if ret_code:
       return self._get_error_code(ret_code, errors.CMAKE_CONFIGURE_ERROR), ""
+    _write_configuration_fingerprint(fingerprint)
     logger(predefined_messages.get_done_message(), substitute=self.substitute)
     return 0, ""
+
+  def _get_configuration_fingerprint(self, cmake: str, generator: str | None, cmake_vars: str) -> str:
+    """
+    ### Returns a fingerprint of everything the CMake configuration depends on.
+
+    #### Params:
+    - cmake (str): Path to CMake executable.
+    - generator (str | None): CMake generator, or None if CMake chooses it.
+    - cmake_vars (str): CMake variables passed to the configuration.
+
+    #### Returns:
+    - (str): Hash of the CMake executable, the generator, the variables, the source commits, and the compilers.
+    """
+    configuration = {
+      "cmake": _resolve_executable(cmake),
+      "generator": generator,
+      "build_type": self.build_type,
+      "variables": cmake_vars,
+      "sources": [
+        git_handler.get_current_commit(dir=source_path) if os.path.isdir(source_path) else ""
+        for source_path in paths.XMIPP_SOURCE_PATHS
+      ],
+      "compilers": _get_compiler_paths([
+        cast(str, self.context[variable_key])
+        for variable_key in (variables.CC, variables.CXX, variables.CUDA_COMPILER)
+      ])
+    }
+    return hashlib.sha256(json.dumps(configuration, sort_keys=True).encode()).hexdigest()
   
   def _get_cmake_vars(self) -> str:
     """
@@ -57,6 +127,26 @@ class ModeConfigBuildExecutor(mode_cmake_executor.ModeCMakeExecutor):
       if not _is_empty(self.context[variable_key])
     ]
     return cmake_handler.get_cmake_params(non_empty_variables)
+
+  def _get_compiler_launcher_params(self) -> str:
+    """
+    ### Returns the CMake params setting the compiler cache as compiler launcher.
+
+    If the compiler cache is disabled or not found, any launcher set by a previous configuration is removed.
+
+    #### Returns:
+    - (str): String containing the compiler launcher params.
+    """
+    launcher_variables = [cmake_constants.CMAKE_C_COMPILER_LAUNCHER, cmake_constants.CMAKE_CXX_COMPILER_LAUNCHER]
+    if self.context[variables.CUDA]:
+      launcher_variables.append(cmake_constants.CMAKE_CUDA_COMPILER_LAUNCHER)
+    launcher = compiler_cache_handler.get_compiler_launcher() if self.context[variables.COMPILER_CACHE] else None
+    if launcher:
+      return cmake_handler.get_cmake_params([(variable, launcher) for variable in launcher_variables])
+    return " ".join(
+      f"-U{variable}" for variable in launcher_variables
+      if cmake_handler.get_cmake_cache_variable(paths.CMAKE_CACHE_FILE, variable)
+    )
   
 def _get_non_internal_config_vars() -> list[str]:
   """
@@ -73,6 +163,87 @@ def _get_non_internal_config_vars() -> list[str]:
   non_internal_keys.sort() # To keep order consistency
   return non_internal_keys
 
+def _get_generator_mismatch_message(configured_generator: str, selected_generator: str) -> str:
+  """
+  ### Returns the message explaining how to solve a generator mismatch.
+
+  #### Params:
+  - configured_generator (str): Generator the build directory was configured with.
+  - selected_generator (str): Generator selected in the config file.
+
+  #### Returns:
+  - (str): Message with the steps to use the selected generator, or to keep the current one.
+  """
+  return '\n'.join([
+    f"The build directory was configured with the '{configured_generator}' generator, "
+    f"but '{selected_generator}' is selected in {paths.CONFIG_FILE}.",
+    f"To rebuild with '{selected_generator}', remove the build directory with './xmipp {modes.MODE_CLEAN_BIN}' and run the installation again.",
+    f"To keep the current build, set {variables.CMAKE_GENERATOR}={configured_generator} in {paths.CONFIG_FILE}, or leave it empty."
+  ])
+
+def _get_compiler_paths(configured_compilers: list[str | None]) -> list[str | None]:
+  """
+  ### Returns the resolved paths of the compilers CMake can pick.
+
+  #### Params:
+  - configured_compilers (list(str | None)): Compilers set in the config file.
+
+  #### Returns:
+  - (list(str | None)): Resolved paths of the configured compilers, the ones set in the environment, and the default ones.
+  """
+  compilers = [
+    *configured_compilers,
+    *[os.environ.get(variable_name) for variable_name in _COMPILER_ENVIRONMENT_VARIABLES],
+    *_DEFAULT_COMPILERS
+  ]
+  return [_resolve_executable(compiler) if compiler else None for compiler in compilers]
+
+def _resolve_executable(executable: str) -> str:
+  """
+  ### Returns the real path of the given executable, following symlinks.
+
+  #### Params:
+  - executable (str): Name or path of the executable.
+
+  #### Returns:
+  - (str): Real path of the executable, or the given value if it was not found.
+  """
+  executable_path = shutil.which(executable)
+  return os.path.realpath(executable_path) if executable_path else executable
+
+def _is_configuration_up_to_date(fingerprint: str) -> bool:
+  """
+  ### Checks if the last successful configuration was done with the given fingerprint.
+
+  #### Params:
+  - fingerprint (str): Fingerprint of the current configuration.
+
+  #### Returns:
+  - (bool): True if the build directory is configured and the fingerprints match.
+  """
+  if not os.path.exists(paths.CMAKE_CACHE_FILE):
+    return False
+  try:
+    with open(paths.CMAKE_FINGERPRINT_FILE, encoding="utf-8") as fingerprint_file:
+      return fingerprint_file.read().strip() == fingerprint
+  except OSError:
+    return False
+
+def _write_configuration_fingerprint(fingerprint: str):
+  """
+  ### Stores the fingerprint of a successful configuration.
+
+  Any error writing it is ignored, as it only allows skipping the next configuration.
+
+  #### Params:
+  - fingerprint (str): Fingerprint of the configuration.
+  """
+  try:
+    with open(paths.CMAKE_FINGERPRINT_FILE, "w", encoding="utf-8") as fingerprint_file:
+      fingerprint_file.write(fingerprint)
+  except OSError:
+    pass
+
 def _is_empty(value: bool | str | None) -> bool:
   """
   ### Checks if the given config value is empty.
@@ -7,6 +7,7 @@ This module contains the class to clone or update Xmipp source repositories.
 from __future__ import annotations
 
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from xmipp3_installer.application.cli.arguments import params
 from xmipp3_installer.application.logger import errors, predefined_messages
@@ -16,9 +17,18 @@ from xmipp3_installer.installer.constants import paths
 from xmipp3_installer.installer.handlers import (
   git_handler,
   shell_handler,
+  sources_cache_handler,
   versions_manager,
 )
 from xmipp3_installer.installer.modes import mode_executor
+from xmipp3_installer.repository.config_vars import default_values, variables
+from xmipp3_installer.shared import numeric
+
+_CLONE_STRATEGY_ARGS = {
+  constants.CLONE_STRATEGY_FULL: "",
+  constants.CLONE_STRATEGY_SHALLOW: " --depth 1",
+  constants.CLONE_STRATEGY_PARTIAL: " --filter=blob:none"
+}
 
 
 class ModeGetSourcesExecutor(mode_executor.ModeExecutor):
@@ -38,24 +48,65 @@ class ModeGetSourcesExecutor(mode_executor.ModeExecutor):
     """
     super().__init__(context)
     self.substitute = not context[params.PARAM_KEEP_OUTPUT]
+    self.jobs = context[params.PARAM_JOBS]
     self.target_branch = context.pop(params.PARAM_BRANCH)
     versions: versions_manager.VersionsManager = context[constants.VERSIONS_CONTEXT_KEY]
     self.xmipp_tag_name = versions.xmipp_version_name
     self.source_versions: dict = versions.sources_versions
+    self.offline = context[variables.OFFLINE]
+    self.use_cache = context[variables.SOURCES_CACHE] or self.offline
+    self.cache_max_size = numeric.get_non_negative_int(
+      context[variables.SOURCES_CACHE_MAX_SIZE],
+      int(default_values.CONFIG_DEFAULT_VALUES[variables.SOURCES_CACHE_MAX_SIZE])
+    )
+    self.clone_strategy = _get_clone_strategy(
+      context[params.PARAM_CLONE_STRATEGY],
+      context[variables.CLONE_STRATEGY]
+    )
+    self.refs_cache_ttl = numeric.get_non_negative_int(
+      context[variables.REMOTE_REFS_CACHE_TTL],
+      int(default_values.CONFIG_DEFAULT_VALUES[variables.REMOTE_REFS_CACHE_TTL])
+    )
   
   def run(self) -> tuple[int, str]:
     """
     ### Clones or updates Xmipp source repositories.
 
+    All sources are obtained concurrently, but their progress is reported
+    in the order they are declared, so the output is always the same.
+
     #### Returns:
     - (tuple(int, str)): Tuple containing the return code and an error message if there was an error.
     """
     logger(predefined_messages.get_section_message("Getting Xmipp sources"))
-    for source in constants.XMIPP_SOURCES:
-      ret_code, output = self._get_source(source)
-      if ret_code:
-        return errors.SOURCE_CLONE_ERROR, output
+    git_handler.clear_remote_refs()
+    with ThreadPoolExecutor(max_workers=self._get_n_workers()) as pool:
+      source_futures = [
+        pool.submit(self._clone_source, source)
+        for source in constants.XMIPP_SOURCES
+      ]
+      for source, source_future in zip(constants.XMIPP_SOURCES, source_futures):
+        ret_code, output = self._get_source(source, source_future)
+        if ret_code:
+          for pending_future in source_futures:
+            pending_future.cancel()
+          return errors.SOURCE_CLONE_ERROR, output
+    if self.use_cache and not self.offline:
+      self._evict_mirrors()
     return 0, ""
+
+  def _evict_mirrors(self):
+    """
+    ### Evicts mirrors from the sources cache until it fits in its maximum size.
+
+    A warning is shown if any mirror is evicted, since it has to be mirrored again on the next run.
+    """
+    evicted = sources_cache_handler.evict_mirrors(self.cache_max_size)
+    if evicted:
+      logger(logger.yellow(
+        f"Warning: the sources cache exceeded its maximum size of {self.cache_max_size} MB, "
+        f"so {len(evicted)} mirror(s) were removed and will be mirrored again on the next run."
+      ))
   
   def _set_executor_config(self):
     """### Sets the specific executor params for this mode."""
@@ -77,16 +128,68 @@ class ModeGetSourcesExecutor(mode_executor.ModeExecutor):
     tag_name = None
     if (not current_branch or current_branch == self.xmipp_tag_name):
       tag_name = self.source_versions.get(source_name)
-    return git_handler.get_clonable_branch(source_repo, self.target_branch, tag_name)
+    return git_handler.get_clonable_branch(
+      source_repo,
+      self.target_branch,
+      tag_name,
+      cache_ttl=self.refs_cache_ttl
+    )
   
-  def _get_source(self, source_name: str) -> tuple[int, str]:
+  def _get_n_workers(self) -> int:
+    """
+    ### Returns the number of sources that can be obtained at the same time.
+
+    #### Returns:
+    - (int): Number of concurrent workers, limited by the number of jobs and sources.
+    """
+    return max(1, min(self.jobs, len(constants.XMIPP_SOURCES)))
+
+  def _clone_source(self, source_name: str) -> tuple[int, str, str | None]:
+    """
+    ### Selects the reference to clone for the given source and clones it.
+
+    It does not print anything, so it can be safely run in a separate thread.
+
+    #### Params:
+    - source_name (str): Name of the source to clone.
+
+    #### Returns:
+    - (tuple(int, str, str | None)): Tuple containing the return code, the text output produced by the command, and the selected reference.
     """
-    ### Gets the given source.
+    repo_url = f"{urls.I2PC_REPOSITORY_URL}{source_name}.git"
+    source_exists = os.path.exists(paths.get_source_path(source_name))
+    clone_url, reference = repo_url, None
+    if self.use_cache and not source_exists:
+      ret_code, output, reference = _prepare_source_mirror(source_name, repo_url, self.offline)
+      if ret_code:
+        return ret_code, output, None
+    if self.offline:
+      clone_url, reference = sources_cache_handler.get_mirror_url(source_name), None
+    clone_branch = self._select_ref_to_clone(source_name, clone_url)
+    ret_code, output = _run_source_command(
+      source_name,
+      clone_url,
+      clone_branch,
+      reference=reference,
+      clone_strategy=self.clone_strategy
+    )
+    if not ret_code and not source_exists and clone_url != repo_url:
+      ret_code, output = shell_handler.run_shell_command(
+        f"git remote set-url origin {repo_url}",
+        cwd=paths.get_source_path(source_name)
+      )
+    return ret_code, output, clone_branch
+  
+  def _get_source(self, source_name: str, source_future: Future) -> tuple[int, str]:
+    """
+    ### Waits for the given source to be obtained and reports its progress.
     
     It is cloned if it does not already exist locally.
+    An unexpected error while obtaining it is reported as a failed clone.
 
     #### Params:
     - source_name (str): Name of the source to clone.
+    - source_future (Future): Future containing the result of the clone for that source.
 
     #### Returns:
     - (tuple(int, str)): Tuple containing the return code and the text output produced by the command.
@@ -95,7 +198,10 @@ class ModeGetSourcesExecutor(mode_executor.ModeExecutor):
     logger(f"Cloning {source_name}...", substitute=self.substitute)
     logger(predefined_messages.get_working_message(), substitute=self.substitute)
 
-    clone_branch = self._select_ref_to_clone(source_name, repo_url)
+    try:
+      ret_code, output, clone_branch = source_future.result()
+    except Exception as error: # Errors of the worker thread are reported as a failed clone
+      return errors.SOURCE_CLONE_ERROR, f"Unexpected error while getting {source_name}: {error}"
     if self.target_branch and not clone_branch:
       warning_message = "\n".join([
         logger.yellow(f"Warning: branch \'{self.target_branch}\' does not exist for repository with url {repo_url}"),
@@ -103,27 +209,88 @@ class ModeGetSourcesExecutor(mode_executor.ModeExecutor):
       ])
       logger(warning_message, substitute=self.substitute)
     
-    ret_code, output = _run_source_command(source_name, repo_url, clone_branch)
     if not ret_code:
       logger(predefined_messages.get_done_message(), substitute=self.substitute)
     return ret_code, output
 
-def _run_source_command(source_name: str, source_repo: str, target_branch: str | None) -> tuple[int, str]:
+def _prepare_source_mirror(source_name: str, source_repo: str, offline: bool) -> tuple[int, str, str | None]:
+  """
+  ### Gets the cached mirror of the given source ready to be cloned from.
+
+  In offline mode the mirror is used as it is, otherwise it is created or updated first.
+  If the mirror cannot be updated, the source is cloned without it.
+
+  #### Params:
+  - source_name (str): Name of the source repository.
+  - source_repo (str): URL of the git repository to mirror.
+  - offline (bool): If True, the network is never accessed.
+
+  #### Returns:
+  - (tuple(int, str, str | None)): Tuple containing the return code, an error message if there was an error, and the path to the mirror to clone from.
+  """
+  if offline:
+    if not sources_cache_handler.mirror_exists(source_name):
+      return 1, f"Source {source_name} is not available in the cache at {paths.SOURCES_CACHE_PATH}, and offline mode is enabled.", None
+    sources_cache_handler.mark_mirror_as_used(source_name)
+    return 0, "", sources_cache_handler.get_mirror_path(source_name)
+  
+  ret_code, _ = sources_cache_handler.update_mirror(source_name, source_repo)
+  if ret_code:
+    return 0, "", None
+  return 0, "", sources_cache_handler.get_mirror_path(source_name)
+
+def _get_clone_strategy(param_value: str | None, config_value: str | None) -> str:
+  """
+  ### Returns the clone strategy to use for the source repositories.
+
+  The value given through the command line takes precedence over the one in the config file.
+  If the resulting value is not a valid strategy, a warning is shown and a full clone is used.
+
+  #### Params:
+  - param_value (str | None): Clone strategy received as a command line param.
+  - config_value (str | None): Clone strategy read from the config file.
+
+  #### Returns:
+  - (str): Clone strategy to use.
+  """
+  clone_strategy = param_value or config_value or constants.CLONE_STRATEGY_FULL
+  if clone_strategy not in constants.CLONE_STRATEGIES:
+    logger(logger.yellow(
+      f"Warning: unknown clone strategy '{clone_strategy}'. "
+      f"Valid values are: {', '.join(constants.CLONE_STRATEGIES)}. "
+      f"Falling back to '{constants.CLONE_STRATEGY_FULL}'."
+    ))
+    return constants.CLONE_STRATEGY_FULL
+  return clone_strategy
+
+def _run_source_command(
+  source_name: str,
+  source_repo: str,
+  target_branch: str | None,
+  reference: str | None=None,
+  clone_strategy: str=constants.CLONE_STRATEGY_FULL
+) -> tuple[int, str]:
   """
   ### Executes git clone/checkout commands for a source repository.
   
   If the source already exists locally:
-  - If target_branch is specified, checks out that branch.
+  - If target_branch is specified, checks out that branch,
+  fetching the full history first if the clone is shallow.
   - If no target_branch, returns success without changes.
   
   If the source doesn't exist:
   - Clones the repository with the specified branch.
   - If no branch specified, clones with default branch.
+  - If a reference mirror is given, objects are taken from it instead of the network.
+  - A shallow clone only fetches the target commit, and a partial
+  one fetches the whole history but downloads file contents on demand.
 
   #### Params:
   - source_name (str): Name of the source repository.
   - source_repo (str): URL of the git repository to clone from.
   - target_branch (str | None): Branch or tag to checkout/clone.
+  - reference (str | None): Optional. Path to a local mirror of the repository.
+  - clone_strategy (str): Optional. Strategy used to clone the repository. Default is a full clone.
 
   #### Returns:
   - (tuple(int, str)): Tuple containing the return code and the text output produced by the command.
@@ -132,6 +299,10 @@ def _run_source_command(source_name: str, source_repo: str, target_branch: str |
   if os.path.exists(source_path):
     if not target_branch:
       return 0, ""
+    if git_handler.is_shallow_repository(dir=source_path):
+      ret_code, output = git_handler.unshallow_repository(dir=source_path)
+      if ret_code:
+        return ret_code, output
     return shell_handler.run_shell_command(
       f"git checkout {target_branch}",
       cwd=source_path
@@ -141,4 +312,9 @@ def _run_source_command(source_name: str, source_repo: str, target_branch: str |
     f" {params.PARAMS[params.PARAM_BRANCH][params.LONG_VERSION]} {target_branch}"
     if target_branch else ""
   )
-  return shell_handler.run_shell_command(f"git clone{branch_str} {source_repo}.git", cwd=paths.SOURCES_PATH)
+  reference_str = f" --reference {reference} --dissociate" if reference else ""
+  strategy_str = _CLONE_STRATEGY_ARGS[clone_strategy]
+  return shell_handler.run_shell_command(
+    f"git clone{branch_str}{strategy_str}{reference_str} {source_repo}",
+    cwd=paths.SOURCES_PATH
+  )
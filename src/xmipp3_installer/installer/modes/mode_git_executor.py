@@ -6,6 +6,8 @@ This module contains the class to execute git commands on all Xmipp source repos
 
 from __future__ import annotations
 
+import os
+
 from xmipp3_installer.application.cli.arguments import params
 from xmipp3_installer.application.logger.logger import logger
 from xmipp3_installer.installer import constants
@@ -36,6 +38,9 @@ class ModeGitExecutor(mode_executor.ModeExecutor):
     """
     ### Executes the given git command into all xmipp source repositories.
 
+    Sources obtained with a shallow clone are deepened first,
+    so the command has access to their whole history.
+
     #### Returns:
     - (tuple(int, str)): Tuple containing the return code and an error message if there was an error.
     """
@@ -45,6 +50,9 @@ class ModeGitExecutor(mode_executor.ModeExecutor):
       logger("\n" + logger.blue(
         f"Running command for {source} in path {paths.get_source_path(source)}..."
       ))
+      ret_code, output = _deepen_source(source)
+      if ret_code:
+        return ret_code, output
       ret_code, output = git_handler.execute_git_command_for_source(
         self.command, source
       )
@@ -52,3 +60,19 @@ class ModeGitExecutor(mode_executor.ModeExecutor):
         return ret_code, output
 
     return 0, ""
+
+def _deepen_source(source: str) -> tuple[int, str]:
+  """
+  ### Fetches the whole history of the given source if it was shallow cloned.
+
+  #### Params:
+  - source (str): The source repository name.
+
+  #### Returns:
+  - (tuple(int, str)): Tuple containing the return code and the text output produced by the command.
+  """
+  source_path = paths.get_source_path(source)
+  if not os.path.exists(source_path) or not git_handler.is_shallow_repository(dir=source_path):
+    return 0, ""
+  logger(f"Source {source} is a shallow clone. Fetching its whole history...")
+  return git_handler.unshallow_repository(dir=source_path)
@@ -2,41 +2,47 @@
 ### Mode Selector Module.
 
 This module maps command-line modes to their corresponding executor classes.
+
+Executor modules are only imported when their mode is selected,
+so running a mode does not pay for the dependencies of all the others.
 """
 
+from __future__ import annotations
+
+import importlib
+
 from xmipp3_installer.application.cli.arguments import modes
-from xmipp3_installer.installer.modes import (
-  mode_all_executor,
-  mode_config_executor,
-  mode_get_sources_executor,
-  mode_git_executor,
-  mode_version_executor,
-)
-from xmipp3_installer.installer.modes.mode_clean import (
-  mode_clean_all_executor,
-  mode_clean_bin_executor,
-)
-from xmipp3_installer.installer.modes.mode_cmake import (
-  mode_compile_and_install_executor,
-  mode_config_build_executor,
-)
-from xmipp3_installer.installer.modes.mode_sync import (
-  mode_add_model_executor,
-  mode_get_models_executor,
-  mode_test_executor,
-)
+from xmipp3_installer.installer.modes.mode_executor import ModeExecutor
+
+__MODES_PACKAGE = "xmipp3_installer.installer.modes"
 
 MODE_EXECUTORS = {
-  modes.MODE_ADD_MODEL: mode_add_model_executor.ModeAddModelExecutor,
-  modes.MODE_ALL: mode_all_executor.ModeAllExecutor,
-  modes.MODE_CLEAN_ALL: mode_clean_all_executor.ModeCleanAllExecutor,
-  modes.MODE_CLEAN_BIN: mode_clean_bin_executor.ModeCleanBinExecutor,
-  modes.MODE_COMPILE_AND_INSTALL: mode_compile_and_install_executor.ModeCompileAndInstallExecutor,
-  modes.MODE_CONFIG_BUILD: mode_config_build_executor.ModeConfigBuildExecutor,
-  modes.MODE_CONFIG: mode_config_executor.ModeConfigExecutor,
-  modes.MODE_GET_MODELS: mode_get_models_executor.ModeGetModelsExecutor,
-  modes.MODE_GET_SOURCES: mode_get_sources_executor.ModeGetSourcesExecutor,
-  modes.MODE_GIT: mode_git_executor.ModeGitExecutor,
-  modes.MODE_TEST: mode_test_executor.ModeTestExecutor,
-  modes.MODE_VERSION: mode_version_executor.ModeVersionExecutor
+  modes.MODE_ADD_MODEL: f"{__MODES_PACKAGE}.mode_sync.mode_add_model_executor:ModeAddModelExecutor",
+  modes.MODE_ALL: f"{__MODES_PACKAGE}.mode_all_executor:ModeAllExecutor",
+  modes.MODE_CLEAN_ALL: f"{__MODES_PACKAGE}.mode_clean.mode_clean_all_executor:ModeCleanAllExecutor",
+  modes.MODE_CLEAN_BIN: f"{__MODES_PACKAGE}.mode_clean.mode_clean_bin_executor:ModeCleanBinExecutor",
+  modes.MODE_COMPILE_AND_INSTALL: f"{__MODES_PACKAGE}.mode_cmake.mode_compile_and_install_executor:ModeCompileAndInstallExecutor",
+  modes.MODE_CONFIG_BUILD: f"{__MODES_PACKAGE}.mode_cmake.mode_config_build_executor:ModeConfigBuildExecutor",
+  modes.MODE_CONFIG: f"{__MODES_PACKAGE}.mode_config_executor:ModeConfigExecutor",
+  modes.MODE_GET_MODELS: f"{__MODES_PACKAGE}.mode_sync.mode_get_models_executor:ModeGetModelsExecutor",
+  modes.MODE_GET_SOURCES: f"{__MODES_PACKAGE}.mode_get_sources_executor:ModeGetSourcesExecutor",
+  modes.MODE_GIT: f"{__MODES_PACKAGE}.mode_git_executor:ModeGitExecutor",
+  modes.MODE_TEST: f"{__MODES_PACKAGE}.mode_sync.mode_test_executor:ModeTestExecutor",
+  modes.MODE_VERSION: f"{__MODES_PACKAGE}.mode_version_executor:ModeVersionExecutor"
 }
+
+def get_mode_executor(mode: str) -> type[ModeExecutor]:
+  """
+  ### Returns the executor class of the given mode, importing its module.
+
+  #### Params:
+  - mode (str): Name of the mode.
+
+  #### Returns:
+  - (type(ModeExecutor)): Class that executes the given mode.
+
+  #### Raises:
+  - KeyError: If the given mode is not registered.
+  """
+  module_name, class_name = MODE_EXECUTORS[mode].split(":")
+  return getattr(importlib.import_module(module_name), class_name)
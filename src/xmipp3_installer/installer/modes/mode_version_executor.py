@@ -8,15 +8,20 @@ from __future__ import annotations
 
 import os
 
-from xmipp3_installer.api_client.assembler import installation_info_assembler
 from xmipp3_installer.application.cli.arguments import params
 from xmipp3_installer.application.logger.logger import logger
 from xmipp3_installer.installer import constants
 from xmipp3_installer.installer.constants import paths
-from xmipp3_installer.installer.handlers import git_handler, versions_manager
-from xmipp3_installer.installer.handlers.cmake import cmake_handler
+from xmipp3_installer.installer.handlers import versions_manager
 from xmipp3_installer.installer.modes import mode_executor
 from xmipp3_installer.repository.config_vars import variables
+from xmipp3_installer.shared import lazy_modules
+
+git_handler = lazy_modules.lazy_import("xmipp3_installer.installer.handlers.git_handler")
+cmake_handler = lazy_modules.lazy_import("xmipp3_installer.installer.handlers.cmake.cmake_handler")
+installation_info_assembler = lazy_modules.lazy_import(
+  "xmipp3_installer.api_client.assembler.installation_info_assembler"
+)
 
 
 class ModeVersionExecutor(mode_executor.ModeExecutor):
@@ -24,6 +29,7 @@ class ModeVersionExecutor(mode_executor.ModeExecutor):
   ### Mode Version Executor.
 
   Collects and displays version information for the installation.
+  Handlers only needed for the full version are loaded when used, so the short version starts faster.
   """
   
   _LEFT_TEXT_LEN = 25
@@ -145,7 +151,7 @@ class ModeVersionExecutor(mode_executor.ModeExecutor):
     #### Returns:
     - (str): Libraries with their version.
     """
-    version_lines = [] 
+    version_lines = []
     for library, version in cmake_handler.get_library_versions_from_cmake_file(
       paths.LIBRARY_VERSIONS_FILE
     ).items():
@@ -2,37 +2,136 @@
 
 from __future__ import annotations
 
-import multiprocessing
+import concurrent.futures
+import time
+from concurrent.futures import (
+  Executor,
+  Future,
+  ThreadPoolExecutor,
+)
 from typing import Any, Callable
 
+from xmipp3_installer.installer.handlers import resources_handler
 
-def run_parallel_jobs(
+EXECUTOR_THREAD = "thread"
+EXECUTOR_PROCESS = "process"
+EXECUTOR_INLINE = "inline"
+
+
+def run_parallel_jobs(  # noqa: PLR0913
   funcs: list[Callable],
   func_args: list[tuple[Any, ...]],
-  n_jobs: int=multiprocessing.cpu_count()
+  *,
+  n_jobs: int | None=None,
+  executor: str=EXECUTOR_THREAD,
+  timeout: float | None=None,
+  default: Any=None
 ) -> list:
   """
   ### Runs the given command list in parallel.
 
+  A task that raises an exception or does not finish in time
+  gets the default value as its result, so the rest of results are still returned.
+  Tasks that time out are abandoned, but cannot be interrupted.
+
   #### Params:
   - funcs (list(callable)): Functions to run.
   - func_args (list(tuple(any, ...))): Arguments for each function.
-  - n_jobs (int): Optional. Number of parallel jobs.
+  - n_jobs (int | None): Optional. Maximum number of parallel jobs. Default is one per function, limited to the default job number of the system when running in worker processes.
+  - executor (str): Optional. Where the functions run: worker threads (EXECUTOR_THREAD), worker processes (EXECUTOR_PROCESS), or sequentially in the caller (EXECUTOR_INLINE).
+  - timeout (float | None): Optional. Seconds the functions have to finish since the jobs start. Not enforced when running inline. Default is no timeout.
+  - default (any): Optional. Result of the functions that fail or time out.
 
   #### Returns:
   - (list): List containing the return of each function.
   """
-  with multiprocessing.Pool(n_jobs) as p:
-    return p.starmap(__run_lambda, zip(funcs, func_args))
+  if executor == EXECUTOR_INLINE or not funcs:
+    return [__run_safely(func, args, default) for func, args in zip(funcs, func_args)]
+  if n_jobs is None and executor == EXECUTOR_PROCESS:
+    n_jobs = resources_handler.get_default_job_number()
+  pool = __get_executor(executor, __get_n_workers(n_jobs, len(funcs)))
+  futures = [pool.submit(__run_lambda, func, args) for func, args in zip(funcs, func_args)]
+  deadline = time.monotonic() + timeout if timeout is not None else None
+  try:
+    return [__get_result(future, deadline, default) for future in futures]
+  finally:
+    for future in futures:
+      future.cancel()
+    pool.shutdown(wait=False)
+
+def __get_executor(executor: str, n_workers: int) -> Executor:
+  """
+  ### Creates the pool of workers for the given executor type.
+
+  #### Params:
+  - executor (str): Executor type (EXECUTOR_THREAD or EXECUTOR_PROCESS).
+  - n_workers (int): Number of workers of the pool.
+
+  #### Returns:
+  - (Executor): Pool of workers.
+  """
+  if executor == EXECUTOR_PROCESS:
+    return concurrent.futures.ProcessPoolExecutor(max_workers=n_workers) # Only loads multiprocessing when used
+  return ThreadPoolExecutor(max_workers=n_workers)
+
+def __get_n_workers(n_jobs: int | None, n_tasks: int) -> int:
+  """
+  ### Returns the number of workers needed to run the given number of tasks.
+
+  #### Params:
+  - n_jobs (int | None): Maximum number of parallel jobs requested.
+  - n_tasks (int): Number of tasks to run.
+
+  #### Returns:
+  - (int): Number of workers, never more than the number of tasks.
+  """
+  if not n_jobs or n_jobs < 1:
+    return n_tasks
+  return min(n_jobs, n_tasks)
+
+def __get_result(future: Future, deadline: float | None, default: Any) -> Any:
+  """
+  ### Waits for the result of the given task.
+
+  #### Params:
+  - future (Future): Task to get the result from.
+  - deadline (float | None): Monotonic time by which the task must have finished.
+  - default (any): Value returned if the task fails or does not finish in time.
+
+  #### Returns:
+  - (any): Return of the task, or the default value.
+  """
+  remaining_time = max(0, deadline - time.monotonic()) if deadline is not None else None
+  try:
+    return future.result(timeout=remaining_time)
+  except Exception: # Includes timeouts and cancellations
+    return default
+
+def __run_safely(func: Callable, args: tuple[Any, ...], default: Any) -> Any:
+  """
+  ### Runs the given function with its args, returning the default value if it fails.
+
+  #### Params:
+  - func (callable): Function to run.
+  - args (tuple(any, ...)): Arguments for the function.
+  - default (any): Value returned if the function raises an exception.
+
+  #### Returns:
+  - (any): Return of the called function, or the default value.
+  """
+  try:
+    return func(*args)
+  except Exception:
+    return default
 
 def __run_lambda(func: Callable, args: tuple[Any, ...]) -> Any:
   """
   ### Runs the given function with its args.
-  
+
   #### Params:
   - func (callable): Function to run.
   - args (tuple(any, ...)): Arguments for the function.
-  
+
   #### Returns:
   - (any): Return of the called function.
   """
@@ -0,0 +1,295 @@
+"""
+### Pipeline Module.
+
+This module contains the classes to run a set of dependent stages,
+overlapping the ones that do not depend on each other.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable
+
+from xmipp3_installer.application.logger import errors, predefined_messages
+from xmipp3_installer.application.logger.logger import DeferredOutput, logger
+from xmipp3_installer.installer.tracer import tracer
+
+_COMPLETED_KEY = "completed"
+
+
+class Stage:
+  """
+  ### Stage of a pipeline.
+
+  A stage depends on every previous stage producing any of its inputs.
+  """
+
+  def __init__(
+    self,
+    name: str,
+    run: Callable[[], tuple[int, str]],
+    inputs: list[str] | None=None,
+    outputs: list[str] | None=None
+  ):
+    """
+    ### Constructor.
+
+    #### Params:
+    - name (str): Name of the stage.
+    - run (callable): Function running the stage, returning the return code and an error message.
+    - inputs (list(str) | None): Optional. Paths the stage needs.
+    - outputs (list(str) | None): Optional. Paths the stage produces.
+    """
+    self.name = name
+    self.run = run
+    self.inputs = inputs or []
+    self.outputs = outputs or []
+
+
+class Pipeline:
+  """
+  ### Pipeline of stages.
+
+  Each stage starts as soon as all the stages it depends on are completed.
+  The output of stages running at the same time is shown in the order they were declared.
+  """
+
+  def __init__(self, stages: list[Stage], progress_file: str):
+    """
+    ### Constructor.
+
+    #### Params:
+    - stages (list(Stage)): Stages of the pipeline. Stages must be declared after the ones they depend on.
+    - progress_file (str): Path to the file where completed stages are recorded.
+    """
+    self.stages = stages
+    self.progress_file = progress_file
+    self.dependencies = {
+      stage.name: _get_dependencies(stage, stages[:stage_index])
+      for stage_index, stage in enumerate(stages)
+    }
+    self.timings: dict[str, float | None] = {}
+    self.total_time = 0.0
+    self.__results: dict[str, tuple[int, str]] = {}
+    self.__deferred_outputs: dict[str, DeferredOutput] = {}
+
+  def run(self, resume: bool=False) -> tuple[int, str]:
+    """
+    ### Runs the stages of the pipeline.
+
+    If a stage fails, no more stages are started.
+
+    #### Params:
+    - resume (bool): Optional. If True, the stages completed by the previous run are skipped, up to the first incomplete one.
+
+    #### Returns:
+    - (tuple(int, str)): Tuple containing the return code and an error message of the first failed stage, in declaration order.
+    """
+    start_time = time.monotonic()
+    skipped_stages = self.__get_completed_stages() if resume else []
+    self.timings = dict.fromkeys(skipped_stages)
+    self.__results = dict.fromkeys(skipped_stages, (0, ""))
+    self.__deferred_outputs = {}
+    _write_progress(self.progress_file, skipped_stages)
+    if skipped_stages:
+      logger(f"Resuming installation. Skipping already completed stages: {', '.join(skipped_stages)}.")
+    try:
+      self.__run_stages()
+    except KeyboardInterrupt:
+      self.__release_outputs()
+      return errors.INTERRUPTED_ERROR, ""
+    finally:
+      self.total_time = time.monotonic() - start_time
+    return next(
+      (self.__results[stage.name] for stage in self.stages if self.__results.get(stage.name, (0, ""))[0]),
+      (0, "")
+    )
+
+  def get_timings_summary(self) -> str:
+    """
+    ### Returns a summary of the time spent on each stage of the last run.
+
+    #### Returns:
+    - (str): Summary with one line per stage that was run or skipped.
+    """
+    lines = [predefined_messages.get_section_message("Stage timings")]
+    for stage in self.stages:
+      if stage.name not in self.timings:
+        continue
+      stage_time = self.timings[stage.name]
+      lines.append(f"{stage.name} ({'skipped' if stage_time is None else f'{stage_time:.1f}s'})")
+    lines.append(f"Total ({self.total_time:.1f}s)")
+    return "\n".join(lines)
+
+  def __run_stages(self):
+    """### Runs every stage as soon as its dependencies are completed, until all are done or one fails."""
+    with ThreadPoolExecutor(max_workers=max(1, len(self.stages))) as pool:
+      running: dict[Future, Stage] = {}
+      while True:
+        if not self.__has_failed():
+          for stage in self.__get_ready_stages():
+            self.__deferred_outputs[stage.name] = DeferredOutput(deferred=not self.__is_first_unfinished(stage))
+            running[pool.submit(self.__run_stage, stage)] = stage
+        self.__release_outputs()
+        if not running:
+          return
+        done_futures, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in done_futures:
+          stage = running.pop(future)
+          self.__results[stage.name] = future.result()
+          if not self.__results[stage.name][0]:
+            _write_progress(self.progress_file, self.__get_finished_stage_names())
+
+  def __run_stage(self, stage: Stage) -> tuple[int, str]:
+    """
+    ### Runs the given stage, holding its output until it is its turn to be shown.
+
+    #### Params:
+    - stage (Stage): Stage to run.
+
+    #### Returns:
+    - (tuple(int, str)): Tuple containing the return code and an error message if there was an error.
+    """
+    logger.defer_output(self.__deferred_outputs[stage.name])
+    start_time = time.monotonic()
+    try:
+      if self.stages.index(stage) != 0:
+        logger("")
+      with tracer.span(stage.name, tracer.CATEGORY_STAGE) as trace_args:
+        result = stage.run()
+        trace_args[tracer.ARG_RET_CODE] = result[0]
+      return result
+    finally:
+      self.timings[stage.name] = time.monotonic() - start_time
+      logger.defer_output(None)
+
+  def __get_ready_stages(self) -> list[Stage]:
+    """
+    ### Returns the stages that can be started.
+
+    #### Returns:
+    - (list(Stage)): Stages not started yet whose dependencies are all completed.
+    """
+    return [
+      stage for stage in self.stages
+      if stage.name not in self.__results and stage.name not in self.__deferred_outputs
+      and all(
+        self.__results.get(dependency, (1, ""))[0] == 0
+        for dependency in self.dependencies[stage.name]
+      )
+    ]
+
+  def __is_first_unfinished(self, stage: Stage) -> bool:
+    """
+    ### Checks if all the stages declared before the given one are finished.
+
+    #### Params:
+    - stage (Stage): Stage to check.
+
+    #### Returns:
+    - (bool): True if the output of the stage can be shown directly.
+    """
+    previous_stages = self.stages[:self.stages.index(stage)]
+    return all(previous_stage.name in self.__results for previous_stage in previous_stages)
+
+  def __release_outputs(self):
+    """### Shows, in declaration order, the output of finished stages and of the first running one."""
+    for stage in self.stages:
+      deferred_output = self.__deferred_outputs.get(stage.name)
+      if deferred_output is None:
+        if stage.name in self.__results or self.__has_failed():
+          continue # Skipped stage, or one that will never start
+        return
+      logger.release_output(deferred_output)
+      if stage.name not in self.__results:
+        return
+
+  def __has_failed(self) -> bool:
+    """
+    ### Checks if any finished stage has failed.
+
+    #### Returns:
+    - (bool): True if a stage has failed.
+    """
+    return any(ret_code for ret_code, _ in self.__results.values())
+
+  def __get_finished_stage_names(self) -> list[str]:
+    """
+    ### Returns the names of the stages successfully completed, in declaration order.
+
+    #### Returns:
+    - (list(str)): Names of the completed stages.
+    """
+    return [
+      stage.name for stage in self.stages
+      if stage.name in self.__results and not self.__results[stage.name][0]
+    ]
+
+  def __get_completed_stages(self) -> list[str]:
+    """
+    ### Returns the leading stages completed by the previous run whose outputs still exist.
+
+    #### Returns:
+    - (list(str)): Names of the stages that can be skipped.
+    """
+    completed_stages = _read_progress(self.progress_file)
+    skippable_stages = []
+    for stage in self.stages:
+      if stage.name not in completed_stages or not all(os.path.exists(output) for output in stage.outputs):
+        break
+      skippable_stages.append(stage.name)
+    return skippable_stages
+
+def _get_dependencies(stage: Stage, previous_stages: list[Stage]) -> list[str]:
+  """
+  ### Returns the names of the stages the given one depends on.
+
+  #### Params:
+  - stage (Stage): Stage to get the dependencies from.
+  - previous_stages (list(Stage)): Stages declared before the given one.
+
+  #### Returns:
+  - (list(str)): Names of the previous stages producing any of the inputs of the stage.
+  """
+  inputs = set(stage.inputs)
+  return [
+    previous_stage.name for previous_stage in previous_stages
+    if inputs.intersection(previous_stage.outputs)
+  ]
+
+def _read_progress(progress_file: str) -> list[str]:
+  """
+  ### Reads the names of the completed stages from the progress file.
+
+  #### Params:
+  - progress_file (str): Path to the progress file.
+
+  #### Returns:
+  - (list(str)): Names of the completed stages, or an empty list if the file could not be read.
+  """
+  try:
+    with open(progress_file) as progress:
+      completed_stages = json.load(progress).get(_COMPLETED_KEY, [])
+  except (OSError, ValueError, AttributeError):
+    return []
+  return completed_stages if isinstance(completed_stages, list) else []
+
+def _write_progress(progress_file: str, completed_stages: list[str]):
+  """
+  ### Writes the names of the completed stages into the progress file.
+
+  Any error writing it is ignored, as it only allows resuming the installation.
+
+  #### Params:
+  - progress_file (str): Path to the progress file.
+  - completed_stages (list(str)): Names of the completed stages.
+  """
+  try:
+    os.makedirs(os.path.dirname(progress_file) or ".", exist_ok=True)
+    with open(progress_file, "w") as progress:
+      json.dump({_COMPLETED_KEY: completed_stages}, progress)
+  except OSError:
+    pass
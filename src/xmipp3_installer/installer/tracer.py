@@ -0,0 +1,126 @@
+"""### Provides a global tracer that records a timeline of the installer run."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from xmipp3_installer.shared.singleton import Singleton
+
+_PROCESS_NAME = "xmipp3-installer"
+_MICROSECONDS_PER_SECOND = 1_000_000
+
+
+class Tracer(Singleton):
+  """
+  ### Tracer class for keeping track of how long each part of the installation takes.
+
+  Recorded spans are written in the Chrome trace event format,
+  which can be opened with chrome://tracing or Perfetto.
+  Only the installer process is traced: the installation info, including its
+  connectivity probes, is sent from a detached process and never appears in the timeline.
+  """
+
+  CATEGORY_MODE = "mode"
+  CATEGORY_STAGE = "stage"
+  CATEGORY_COMMAND = "command"
+  ARG_PID = "pid"
+  ARG_RET_CODE = "ret_code"
+
+  def __init__(self):
+    """### Constructor."""
+    self._trace_file: str | None = None
+    self._events: list[dict[str, Any]] = []
+    self._origin = time.perf_counter()
+    self._lock = threading.Lock()
+
+  @property
+  def is_enabled(self) -> bool:
+    """### True if spans are being recorded."""
+    return self._trace_file is not None
+
+  def start(self, trace_file: str):
+    """
+    ### Starts recording spans, discarding previously recorded ones.
+
+    #### Params:
+    - trace_file (str): Path where the trace will be written.
+    """
+    with self._lock:
+      self._trace_file = trace_file
+      self._origin = time.perf_counter()
+      self._events = [{
+        "name": "process_name",
+        "ph": "M",
+        "pid": os.getpid(),
+        "args": {"name": _PROCESS_NAME}
+      }]
+
+  @contextmanager
+  def span(self, name: str, category: str, **args: Any) -> Iterator[dict[str, Any]]:
+    """
+    ### Records the time spent inside the context as a span of the timeline.
+
+    #### Params:
+    - name (str): Name of the span.
+    - category (str): Category of the span (CATEGORY_MODE, CATEGORY_STAGE, or CATEGORY_COMMAND).
+    - **args (any): Details shown with the span.
+
+    #### Returns:
+    - (dict(str, any)): Details of the span, which can be completed inside the context.
+    """
+    if not self.is_enabled:
+      yield args
+      return
+    start = time.perf_counter()
+    try:
+      yield args
+    finally:
+      end = time.perf_counter()
+      with self._lock:
+        self._events.append({
+          "name": name,
+          "cat": category,
+          "ph": "X",
+          "ts": round((start - self._origin) * _MICROSECONDS_PER_SECOND),
+          "dur": round((end - start) * _MICROSECONDS_PER_SECOND),
+          "pid": os.getpid(),
+          "tid": _get_lane_id(),
+          "args": args
+        })
+
+  def write(self) -> str | None:
+    """
+    ### Writes the recorded spans into the trace file and stops recording.
+
+    #### Returns:
+    - (str | None): Path of the written trace file, or None if spans were not being recorded.
+
+    #### Raises:
+    - OSError: If the trace file could not be written.
+    """
+    with self._lock:
+      trace_file, events = self._trace_file, self._events
+      self._trace_file, self._events = None, []
+    if trace_file is None:
+      return None
+    with open(trace_file, "w", encoding="utf-8") as trace:
+      json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, trace, default=str)
+    return trace_file
+
+def _get_lane_id() -> int:
+  """
+  ### Returns the identifier of the timeline lane for the code currently running.
+
+  Each thread gets its own lane, so concurrent commands do not overlap in the timeline.
+
+  #### Returns:
+  - (int): Lane identifier.
+  """
+  return threading.get_ident()
+
+tracer = Tracer()
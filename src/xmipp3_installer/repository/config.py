@@ -94,6 +94,10 @@ class ConfigurationFileHandler(Singleton):
     lines.append("\n##### COMPILATION FLAGS #####\n")
     lines.append("# We recommend not modifying this variables unless you know what you are doing.\n")
     lines.extend(self._get_section_lines(variables.COMPILATION_FLAGS, values))
+
+    lines.append("\n##### INSTALLER SECTION #####\n")
+    lines.append("# Use this variables to tune the behaviour of the installer itself.\n")
+    lines.extend(self._get_section_lines(variables.INSTALLER, values))
     
     if values:
       lines.append("\n##### UNKNOWN VARIABLES #####\n")
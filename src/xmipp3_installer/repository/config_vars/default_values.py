@@ -1,5 +1,6 @@
 """### Contains the default values for the config variables."""
 
+from xmipp3_installer.installer import constants
 from xmipp3_installer.installer.constants import paths
 from xmipp3_installer.installer.handlers import conda_handler
 from xmipp3_installer.repository.config_vars import variables
@@ -32,5 +33,16 @@ CONFIG_DEFAULT_VALUES = {
   variables.LINK_SCIPION: ON,
   variables.BUILD_TESTING: OFF,
   variables.SKIP_RPATH: ON,
-  variables.BUILD_TYPE: "Release"
+  variables.BUILD_TYPE: "Release",
+  variables.CMAKE_GENERATOR: None,
+  variables.SOURCES_CACHE: OFF,
+  variables.OFFLINE: OFF,
+  variables.SOURCES_CACHE_MAX_SIZE: "1024",
+  variables.CLONE_STRATEGY: constants.CLONE_STRATEGY_FULL,
+  variables.REMOTE_REFS_CACHE_TTL: "60",
+  variables.COMPILER_CACHE: ON,
+  variables.BUILD_JOB_MEMORY: "2048",
+  variables.BUILD_JOBSERVER: OFF,
+  variables.INTERNET_CHECK_TARGETS: "1.1.1.1:53", # Cloudflare DNS, reliable and rarely blocked by firewalls
+  variables.INTERNET_CHECK_CACHE_TTL: "30"
 }
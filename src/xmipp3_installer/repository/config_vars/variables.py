@@ -24,6 +24,17 @@ LINK_SCIPION = 'XMIPP_LINK_TO_SCIPION'
 BUILD_TESTING = 'BUILD_TESTING'
 SKIP_RPATH='CMAKE_SKIP_RPATH'
 BUILD_TYPE = "BUILD_TYPE"
+CMAKE_GENERATOR = "CMAKE_GENERATOR"
+SOURCES_CACHE = 'SOURCES_CACHE'
+OFFLINE = 'OFFLINE'
+SOURCES_CACHE_MAX_SIZE = 'SOURCES_CACHE_MAX_SIZE_MB'
+CLONE_STRATEGY = 'SOURCES_CLONE_STRATEGY'
+REMOTE_REFS_CACHE_TTL = 'REMOTE_REFS_CACHE_TTL_SECONDS'
+COMPILER_CACHE = 'COMPILER_CACHE'
+BUILD_JOB_MEMORY = 'BUILD_JOB_MEMORY_MB'
+BUILD_JOBSERVER = 'BUILD_JOBSERVER'
+INTERNET_CHECK_TARGETS = 'INTERNET_CHECK_TARGETS'
+INTERNET_CHECK_CACHE_TTL = 'INTERNET_CHECK_CACHE_TTL_SECONDS'
 
 # Not stored in ket=value format
 LAST_MODIFIED_KEY = "last_modified"
@@ -32,20 +43,31 @@ LAST_MODIFIED_KEY = "last_modified"
 TOGGLES = 'toggles'
 LOCATIONS = 'locations'
 COMPILATION_FLAGS = 'flags'
+INSTALLER = 'installer'
 CONFIG_VARIABLES = {
   TOGGLES: [
-    SEND_INSTALLATION_STATISTICS, CUDA, MPI, MATLAB, LINK_SCIPION, BUILD_TESTING, SKIP_RPATH
+    SEND_INSTALLATION_STATISTICS, CUDA, MPI, MATLAB, LINK_SCIPION, BUILD_TESTING, SKIP_RPATH,
+    SOURCES_CACHE, OFFLINE, COMPILER_CACHE, BUILD_JOBSERVER
   ],
   LOCATIONS: [
     CMAKE, CC, CXX, CMAKE_INSTALL_PREFIX, PREFIX_PATH, MPI_HOME,
     CUDA_COMPILER, PYTHON_HOME, FFTW_HOME, TIFF_HOME, 
      HDF5_HOME, JPEG_HOME, SQLITE_HOME, CUDA_CXX
   ],
-  COMPILATION_FLAGS: [CC_FLAGS, CXX_FLAGS, BUILD_TYPE]
+  COMPILATION_FLAGS: [CC_FLAGS, CXX_FLAGS, BUILD_TYPE, CMAKE_GENERATOR],
+  INSTALLER: [
+    SOURCES_CACHE_MAX_SIZE, CLONE_STRATEGY, REMOTE_REFS_CACHE_TTL, BUILD_JOB_MEMORY,
+    INTERNET_CHECK_TARGETS, INTERNET_CHECK_CACHE_TTL
+  ]
 }
 
 # Do not pass this variables to CMake, only for installer logic
-INTERNAL_LOGIC_VARS = [SEND_INSTALLATION_STATISTICS, CMAKE, BUILD_TYPE]
+INTERNAL_LOGIC_VARS = [
+  SEND_INSTALLATION_STATISTICS, CMAKE, BUILD_TYPE, CMAKE_GENERATOR,
+  SOURCES_CACHE, OFFLINE, SOURCES_CACHE_MAX_SIZE, CLONE_STRATEGY,
+  REMOTE_REFS_CACHE_TTL, COMPILER_CACHE, BUILD_JOB_MEMORY, BUILD_JOBSERVER,
+  INTERNET_CHECK_TARGETS, INTERNET_CHECK_CACHE_TTL
+]
 
 # Prefix to be used when setting config variables in the environment
 ENVIRONMENT_VARIABLES_PREFIX = "XMIPP3_"
@@ -0,0 +1,32 @@
+"""### Functions to run work in processes that outlive the installer."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+
+def start_detached_python(code: str) -> bool:
+  """
+  ### Runs the given Python code in a detached process.
+
+  The process uses the same interpreter as the installer, has no standard streams attached,
+  and runs in its own session, so it is neither waited for nor interrupted along with the installer.
+
+  #### Params:
+  - code (str): Python code to run.
+
+  #### Returns:
+  - (bool): True if the process was started, False otherwise.
+  """
+  try:
+    subprocess.Popen(
+      [sys.executable, "-c", code],
+      stdin=subprocess.DEVNULL,
+      stdout=subprocess.DEVNULL,
+      stderr=subprocess.DEVNULL,
+      start_new_session=True
+    )
+  except OSError:
+    return False
+  return True
@@ -2,9 +2,21 @@
 
 from __future__ import annotations
 
+import contextlib
+import fcntl
 import os
 import shutil
+import stat
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
+from xmipp3_installer.shared import background_process
+
+__TAIL_BLOCK_SIZE = 8192
+__SWEEP_COMMAND = (
+  "from xmipp3_installer.shared import file_operations; "
+  "file_operations.sweep_trash({trash_path!r}, {batches!r})"
+)
 
 def delete_paths(paths: list[str]):
   """
@@ -20,3 +32,261 @@ def delete_paths(paths: list[str]):
       shutil.rmtree(path, ignore_errors=True)
     else:
       os.remove(path)
+
+def read_tail(path: str, n_lines: int) -> str | None:
+  """
+  ### Returns the last lines of the given text file.
+
+  The file is read backwards from its end, block by block,
+  so only the requested lines are loaded no matter how big the file is.
+
+  #### Params:
+  - path (str): Path of the file.
+  - n_lines (int): Number of lines to return.
+
+  #### Returns:
+  - (str | None): Last lines of the file, or None if it could not be read.
+  """
+  try:
+    with open(path, "rb") as text_file:
+      position = text_file.seek(0, os.SEEK_END)
+      tail = b""
+      while position > 0 and tail.count(b"\n") <= n_lines:
+        block_size = min(__TAIL_BLOCK_SIZE, position)
+        position -= block_size
+        text_file.seek(position)
+        tail = text_file.read(block_size) + tail
+  except OSError:
+    return None
+  if n_lines <= 0:
+    return ""
+  lines = tail.split(b"\n")
+  line_end = b""
+  if tail.endswith(b"\n"):
+    lines, line_end = lines[:-1], b"\n"
+  return (b"\n".join(lines[-n_lines:]) + line_end).decode("utf-8", errors="replace")
+
+def move_to_trash(paths: list[str], trash_path: str) -> tuple[str | None, list[str]]:
+  """
+  ### Moves the given paths into a new batch inside the trash directory.
+
+  Renaming is atomic and does not depend on the size of the path when the trash
+  is in the same filesystem, so the paths are gone before their contents are deleted.
+  Paths that do not exist are ignored.
+
+  #### Params:
+  - paths (list(str)): List of paths to move.
+  - trash_path (str): Trash directory.
+
+  #### Returns:
+  - (str | None): Batch directory containing the moved paths, or None if it could not be created.
+  - (list(str)): Paths that could not be moved, which must be deleted where they are.
+  """
+  existing_paths = [path for path in paths if os.path.lexists(path)]
+  if not existing_paths:
+    return None, []
+  try:
+    os.makedirs(trash_path, exist_ok=True)
+    batch = tempfile.mkdtemp(dir=trash_path)
+  except OSError:
+    return None, existing_paths
+  unmoved_paths = [
+    path for index, path in enumerate(existing_paths)
+    if not __rename(path, os.path.join(batch, f"{index}-{os.path.basename(os.path.normpath(path))}"))
+  ]
+  return batch, unmoved_paths
+
+def delete_from_trash(trash_path: str, batches: list[str], n_jobs: int | None=None) -> int:
+  """
+  ### Deletes the given batches of the trash directory using a pool of threads.
+
+  The contents of each trashed directory are deleted in parallel, so big trees
+  are not removed one entry at a time. The trash directory is also removed if it is left empty.
+  Entries that cannot be deleted are left behind.
+
+  #### Params:
+  - trash_path (str): Trash directory.
+  - batches (list(str)): Batch directories to delete.
+  - n_jobs (int): Optional. Number of threads. Defaults to the one chosen by ThreadPoolExecutor.
+
+  #### Returns:
+  - (int): Number of bytes freed.
+  """
+  jobs = []
+  for batch in batches:
+    for entry in __list_dir(batch):
+      jobs.extend(__list_dir(entry) if __is_dir(entry) else [entry])
+  freed_bytes = 0
+  if jobs:
+    with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+      freed_bytes += sum(pool.map(__remove_path, jobs))
+  freed_bytes += sum(__remove_path(batch) for batch in batches)
+  with contextlib.suppress(OSError):
+    os.rmdir(trash_path)
+  return freed_bytes
+
+def get_sizes(paths: list[str], n_jobs: int | None=None) -> list[int]:
+  """
+  ### Returns the size of each of the given paths using a pool of threads.
+
+  The entries of each directory are measured in parallel, so big trees
+  are not walked one entry at a time. Symlinks are not followed, and
+  paths that do not exist or cannot be read count as empty.
+
+  #### Params:
+  - paths (list(str)): List of paths to measure.
+  - n_jobs (int): Optional. Number of threads. Defaults to the one chosen by ThreadPoolExecutor.
+
+  #### Returns:
+  - (list(int)): Size in bytes of the files under each path, in the same order.
+  """
+  jobs = [
+    (index, job_path) for index, path in enumerate(paths)
+    for job_path in (__list_dir(path) if __is_dir(path) else [path])
+  ]
+  sizes = [0] * len(paths)
+  if not jobs:
+    return sizes
+  with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+    for (index, _), size in zip(jobs, pool.map(__get_size, [job_path for _, job_path in jobs])):
+      sizes[index] += size
+  return sizes
+
+def sweep_trash(trash_path: str, batches: list[str]) -> int:
+  """
+  ### Deletes the given batches of the trash directory, one sweep at a time.
+
+  An exclusive lock on the trash directory is held while deleting,
+  so the sweeps started by overlapping runs wait for each other instead of
+  deleting the same entries at once.
+
+  #### Params:
+  - trash_path (str): Trash directory.
+  - batches (list(str)): Batch directories to delete.
+
+  #### Returns:
+  - (int): Number of bytes freed.
+  """
+  try:
+    trash_fd = os.open(trash_path, os.O_RDONLY)
+  except OSError:
+    return 0
+  try:
+    fcntl.flock(trash_fd, fcntl.LOCK_EX)
+    return delete_from_trash(trash_path, batches)
+  finally:
+    os.close(trash_fd)
+
+def sweep_trash_in_background(trash_path: str, batches: list[str] | None=None) -> bool:
+  """
+  ### Deletes batches of the trash directory from a detached process.
+
+  By default, only the batches present when this function is called are deleted,
+  so the ones created afterwards by the current run are not removed under its feet.
+  The process outlives the installer, which does not wait for it.
+
+  #### Params:
+  - trash_path (str): Trash directory.
+  - batches (list(str)): Optional. Batch directories to delete. Defaults to the ones in the trash directory.
+
+  #### Returns:
+  - (bool): True if the process was started, False if there was nothing to delete or it could not be started.
+  """
+  trash_path = os.path.abspath(trash_path)
+  batches = __list_dir(trash_path) if batches is None else [os.path.abspath(batch) for batch in batches]
+  if not batches:
+    return False
+  return background_process.start_detached_python(
+    __SWEEP_COMMAND.format(trash_path=trash_path, batches=batches)
+  )
+
+def __rename(path: str, new_path: str) -> bool:
+  """
+  ### Renames the given path.
+
+  #### Params:
+  - path (str): Path to rename.
+  - new_path (str): New path.
+
+  #### Returns:
+  - (bool): True if the path was renamed, False otherwise.
+  """
+  try:
+    os.rename(path, new_path)
+  except OSError:
+    return False
+  return True
+
+def __list_dir(path: str) -> list[str]:
+  """
+  ### Returns the paths of the entries of the given directory.
+
+  #### Params:
+  - path (str): Directory to list.
+
+  #### Returns:
+  - (list(str)): Paths of the entries, or an empty list if it could not be read.
+  """
+  try:
+    with os.scandir(path) as entries:
+      return [entry.path for entry in entries]
+  except OSError:
+    return []
+
+def __is_dir(path: str) -> bool:
+  """
+  ### Checks if the given path is a directory, without following symlinks.
+
+  #### Params:
+  - path (str): Path to check.
+
+  #### Returns:
+  - (bool): True if the path is a directory, False otherwise.
+  """
+  try:
+    return stat.S_ISDIR(os.lstat(path).st_mode)
+  except OSError:
+    return False
+
+def __get_size(path: str) -> int:
+  """
+  ### Returns the size of the given file or directory tree, without following symlinks.
+
+  #### Params:
+  - path (str): Path to measure.
+
+  #### Returns:
+  - (int): Size in bytes of the files under the path.
+  """
+  try:
+    path_stat = os.lstat(path)
+  except OSError:
+    return 0
+  if not stat.S_ISDIR(path_stat.st_mode):
+    return path_stat.st_size
+  return sum(__get_size(entry) for entry in __list_dir(path))
+
+def __remove_path(path: str) -> int:
+  """
+  ### Deletes the given file or directory tree, without following symlinks.
+
+  #### Params:
+  - path (str): Path to delete.
+
+  #### Returns:
+  - (int): Size in bytes of the files deleted.
+  """
+  try:
+    path_stat = os.lstat(path)
+  except OSError:
+    return 0
+  if not stat.S_ISDIR(path_stat.st_mode):
+    try:
+      os.unlink(path)
+    except OSError:
+      return 0
+    return path_stat.st_size
+  freed_bytes = sum(__remove_path(entry) for entry in __list_dir(path))
+  with contextlib.suppress(OSError):
+    os.rmdir(path)
+  return freed_bytes
@@ -0,0 +1,42 @@
+"""### Functions to import modules only when they are first used."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(module_name: str) -> ModuleType:
+  """
+  ### Returns the given module, which is not loaded until one of its attributes is accessed.
+
+  If the module was already imported, it is returned as it is.
+  Loading is not thread-safe before Python 3.12, so a lazy module must not be
+  used for the first time from several threads at once. Since the lazy module
+  also replaces the real one for every later importer, only lazy-import modules
+  that are never shared with worker threads.
+
+  #### Params:
+  - module_name (str): Full name of the module.
+
+  #### Returns:
+  - (ModuleType): Module that loads itself when first used.
+
+  #### Raises:
+  - ModuleNotFoundError: If the module does not exist.
+  """
+  if module_name in sys.modules:
+    return sys.modules[module_name]
+  spec = importlib.util.find_spec(module_name)
+  if spec is None or spec.loader is None:
+    raise ModuleNotFoundError(f"No module named '{module_name}'", name=module_name)
+  loader = importlib.util.LazyLoader(spec.loader)
+  spec.loader = loader
+  module = importlib.util.module_from_spec(spec)
+  sys.modules[module_name] = module
+  loader.exec_module(module)
+  parent_name, _, child_name = module_name.rpartition(".")
+  if parent_name:
+    setattr(sys.modules[parent_name], child_name, module)
+  return module
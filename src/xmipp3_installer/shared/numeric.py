@@ -0,0 +1,22 @@
+"""### Numeric constants and conversions shared by several modules."""
+
+from __future__ import annotations
+
+BYTES_PER_MB = 1024 * 1024
+
+def get_non_negative_int(value: str | None, default_value: int) -> int:
+  """
+  ### Parses a non-negative integer from a config value.
+
+  #### Params:
+  - value (str | None): Value read from the config.
+  - default_value (int): Value to use if the given one is missing, not an integer, or negative.
+
+  #### Returns:
+  - (int): Parsed value, or the default one.
+  """
+  try:
+    number = int(value) if value is not None else default_value
+  except ValueError:
+    return default_value
+  return number if number >= 0 else default_value
@@ -1,6 +1,11 @@
 """### Contains a generic singleton class."""
 
-from typing_extensions import Self
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+  from typing_extensions import Self
 
 
 class Singleton:
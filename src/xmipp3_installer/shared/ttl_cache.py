@@ -0,0 +1,99 @@
+"""### Functions to store values in a JSON file that expire after some time."""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+import tempfile
+import time
+from typing import Any
+
+__TIMESTAMP_KEY = "timestamp"
+__VALUE_KEY = "value"
+__LOCK_SUFFIX = ".lock"
+
+
+def get_cached_value(cache_file: str, key: str, ttl: int) -> Any | None:
+  """
+  ### Returns the value stored under the given key if it has not expired.
+
+  #### Params:
+  - cache_file (str): Path to the cache file.
+  - key (str): Key of the value.
+  - ttl (int): Maximum age in seconds of the value. If it is not positive, the cache is not read.
+
+  #### Returns:
+  - (Any | None): The cached value, or None if it does not exist, has expired, or could not be read.
+  """
+  if ttl <= 0:
+    return None
+  entry = __read_cache(cache_file).get(key)
+  if not isinstance(entry, dict) or __VALUE_KEY not in entry:
+    return None
+  timestamp = entry.get(__TIMESTAMP_KEY)
+  if not isinstance(timestamp, (int, float)) or not 0 <= time.time() - timestamp <= ttl:
+    return None
+  return entry[__VALUE_KEY]
+
+def set_cached_value(cache_file: str, key: str, value: Any):
+  """
+  ### Stores the given value under the given key with the current time.
+
+  The file is replaced atomically, and any error writing it is ignored,
+  as the cache is only an optimization. An exclusive lock on a file next to
+  the cache is held from reading it to replacing it, so concurrent writers,
+  whether threads or processes, do not drop each other's entries.
+
+  #### Params:
+  - cache_file (str): Path to the cache file.
+  - key (str): Key of the value.
+  - value (Any): JSON serializable value to store.
+  """
+  cache_dir = os.path.dirname(cache_file) or "."
+  try:
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(f"{cache_file}{__LOCK_SUFFIX}", "w") as lock_file:
+      fcntl.flock(lock_file, fcntl.LOCK_EX)
+      content = __read_cache(cache_file)
+      content[key] = {__TIMESTAMP_KEY: time.time(), __VALUE_KEY: value}
+      __write_cache(cache_file, content)
+  except OSError:
+    return
+
+def __read_cache(cache_file: str) -> dict:
+  """
+  ### Reads the whole content of the cache file.
+
+  #### Params:
+  - cache_file (str): Path to the cache file.
+
+  #### Returns:
+  - (dict): Content of the cache, or an empty dictionary if it could not be read.
+  """
+  try:
+    with open(cache_file) as cache:
+      content = json.load(cache)
+  except (OSError, ValueError):
+    return {}
+  return content if isinstance(content, dict) else {}
+
+def __write_cache(cache_file: str, content: dict):
+  """
+  ### Replaces the content of the cache file atomically.
+
+  #### Params:
+  - cache_file (str): Path to the cache file.
+  - content (dict): New content of the cache.
+
+  #### Raises:
+  - OSError: If the temporary file could not be created.
+  """
+  file_descriptor, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_file) or ".", suffix=".tmp")
+  try:
+    with os.fdopen(file_descriptor, "w") as tmp_file:
+      json.dump(content, tmp_file)
+    os.replace(tmp_path, cache_file)
+  except (OSError, TypeError, ValueError):
+    if os.path.exists(tmp_path):
+      os.remove(tmp_path)
@@ -0,0 +1,133 @@
+import math
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+XMIPP3_INSTALLER_PROGRAM = "xmipp3_installer"
+__P95_PERCENTILE = 95
+__BYTES_PER_KB = 1024
+
+def run_benchmark(
+  command_words: List[str],
+  cwd: str,
+  repeats: int,
+  env: Optional[Dict[str, str]]=None,
+  setup: Optional[Callable[[], None]]=None
+) -> dict:
+  """
+  ### Runs the given command several times and measures each run.
+
+  Every run is a new process, so the startup of the installer is always measured.
+  The peak RSS of a run is the largest one among the process and the subprocesses it waited for (git, cmake...).
+
+  #### Params:
+  - command_words (list(str)): Command to run.
+  - cwd (str): Directory where the command runs.
+  - repeats (int): Number of runs.
+  - env (dict(str, str)): Optional. Environment of the command.
+  - setup (callable): Optional. Function that leaves the directory ready before each run, which is not measured.
+
+  #### Returns:
+  - (dict): Wall time of each run, their median and p95 in seconds, and the peak RSS in MB.
+
+  #### Raises:
+  - subprocess.CalledProcessError: If any run fails.
+  """
+  wall_times, peak_rss = [], 0.0
+  for _ in range(repeats):
+    if setup:
+      setup()
+    wall_time, rss = __run_measured_command(command_words, cwd, env)
+    wall_times.append(wall_time)
+    peak_rss = max(peak_rss, rss)
+  return {
+    "command": " ".join(command_words),
+    "wall_times": [round(wall_time, 4) for wall_time in wall_times],
+    "median": round(statistics.median(wall_times), 4),
+    "p95": round(get_percentile(wall_times, __P95_PERCENTILE), 4),
+    "peak_rss_mb": round(peak_rss, 1)
+  }
+
+def get_percentile(values: List[float], percentile: int) -> float:
+  """
+  ### Returns the given percentile of the values, using the nearest-rank method.
+
+  #### Params:
+  - values (list(float)): Values to get the percentile from.
+  - percentile (int): Percentile, from 1 to 100.
+
+  #### Returns:
+  - (float): Smallest value that is greater or equal than the given percentage of the values.
+  """
+  sorted_values = sorted(values)
+  rank = math.ceil(percentile / 100 * len(sorted_values))
+  return sorted_values[max(rank, 1) - 1]
+
+def get_regressions(results: dict, baseline: dict, tolerance: float) -> List[str]:
+  """
+  ### Returns the benchmarks that got slower or bigger than in the baseline.
+
+  Benchmarks that are not in the baseline are not compared.
+
+  #### Params:
+  - results (dict): Results of the current run, by benchmark name.
+  - baseline (dict): Results of a previous run, by benchmark name.
+  - tolerance (float): Allowed growth, as a fraction of the baseline value.
+
+  #### Returns:
+  - (list(str)): Description of each regression found.
+  """
+  regressions = []
+  for name, result in results.items():
+    for metric in ("median", "p95", "peak_rss_mb"):
+      previous = baseline.get(name, {}).get(metric)
+      if previous and result[metric] > previous * (1 + tolerance):
+        regressions.append(f"{name}: {metric} went from {previous} to {result[metric]}")
+  return regressions
+
+def __run_measured_command(command_words: List[str], cwd: str, env: Optional[Dict[str, str]]) -> tuple:
+  """
+  ### Runs the given command and measures it.
+
+  #### Params:
+  - command_words (list(str)): Command to run.
+  - cwd (str): Directory where the command runs.
+  - env (dict(str, str) | None): Environment of the command.
+
+  #### Returns:
+  - (tuple(float, float)): Wall time in seconds and peak RSS in MB.
+
+  #### Raises:
+  - subprocess.CalledProcessError: If the command fails.
+  """
+  with tempfile.TemporaryFile() as output:
+    start = time.perf_counter()
+    process = subprocess.Popen(command_words, cwd=cwd, env=env, stdout=output, stderr=subprocess.STDOUT)
+    _, status, usage = os.wait4(process.pid, 0)
+    wall_time = time.perf_counter() - start
+    process.returncode = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -os.WTERMSIG(status)
+    if process.returncode:
+      output.seek(0)
+      raise subprocess.CalledProcessError(
+        process.returncode,
+        command_words,
+        output=output.read().decode(errors="replace")
+      )
+  return wall_time, __get_rss_mb(usage.ru_maxrss)
+
+def __get_rss_mb(max_rss: int) -> float:
+  """
+  ### Converts the peak RSS reported by the OS into MB.
+
+  #### Params:
+  - max_rss (int): Peak RSS, in bytes on macOS and in KB elsewhere.
+
+  #### Returns:
+  - (float): Peak RSS in MB.
+  """
+  kilobytes = max_rss / __BYTES_PER_KB if sys.platform == "darwin" else max_rss
+  return kilobytes / __BYTES_PER_KB
@@ -0,0 +1,125 @@
+import datetime
+import json
+import os
+import platform
+import shutil
+import subprocess
+
+import pytest
+
+from xmipp3_installer.installer import constants, urls
+from xmipp3_installer.installer.constants import paths
+
+from . import get_regressions, run_benchmark
+from .. import copy_file_from_reference, create_versions_json_file, get_test_file
+
+collect_ignore_glob = [] if hasattr(os, "wait4") else ["*_test.py"]
+
+__DEFAULT_REPEATS = 5
+__DEFAULT_OUTPUT = "benchmark-results.json"
+__DEFAULT_TOLERANCE = 0.25
+__GIT_IDENTITY = ["-c", "user.name=xmipp3-installer", "-c", "user.email=xmipp3-installer@localhost"]
+
+def pytest_addoption(parser):
+  parser.addoption(
+    "--benchmark-repeats", type=int, default=__DEFAULT_REPEATS,
+    help="Number of times each benchmark is run."
+  )
+  parser.addoption(
+    "--benchmark-output", default=__DEFAULT_OUTPUT,
+    help="JSON file where the results are stored."
+  )
+  parser.addoption(
+    "--benchmark-baseline", default=None,
+    help="JSON file with the results of a previous run to compare with."
+  )
+  parser.addoption(
+    "--benchmark-tolerance", type=float, default=__DEFAULT_TOLERANCE,
+    help="Allowed growth of the median and p95 wall times and the peak RSS over the baseline, as a fraction."
+  )
+
+@pytest.fixture(scope="session")
+def benchmark_results(request):
+  results = {}
+  yield results
+  with open(request.config.getoption("--benchmark-output"), "w", encoding="utf-8") as output_file:
+    json.dump({
+      "created": datetime.datetime.now().isoformat(timespec="seconds"),
+      "python": platform.python_version(),
+      "platform": platform.platform(),
+      "repeats": request.config.getoption("--benchmark-repeats"),
+      "benchmarks": results
+    }, output_file, indent=2)
+    output_file.write("\n")
+
+@pytest.fixture(scope="session")
+def benchmark_baseline(request):
+  baseline_file = request.config.getoption("--benchmark-baseline")
+  if not baseline_file:
+    return {}
+  with open(baseline_file, encoding="utf-8") as baseline:
+    return json.load(baseline)["benchmarks"]
+
+@pytest.fixture
+def benchmark(request, benchmark_results, benchmark_baseline, benchmark_env):
+  def __benchmark(name: str, command_words: list, cwd: str, setup=None) -> dict:
+    try:
+      result = run_benchmark(
+        command_words,
+        cwd,
+        request.config.getoption("--benchmark-repeats"),
+        env=benchmark_env,
+        setup=setup
+      )
+    except subprocess.CalledProcessError as error:
+      pytest.fail(f"{error}\n{error.output}")
+    benchmark_results[name] = result
+    regressions = get_regressions(
+      {name: result},
+      benchmark_baseline,
+      request.config.getoption("--benchmark-tolerance")
+    )
+    assert not regressions, "\n".join(["Performance regressions found:", *regressions])
+    return result
+  return __benchmark
+
+@pytest.fixture(scope="session")
+def benchmark_env(tmp_path_factory, bare_repositories):
+  return {
+    **os.environ,
+    "CMAKE_GENERATOR": "Ninja",
+    "XDG_CACHE_HOME": str(tmp_path_factory.mktemp("cache")),
+    "GIT_TERMINAL_PROMPT": "0",
+    "GIT_CONFIG_COUNT": "1",
+    "GIT_CONFIG_KEY_0": f"url.{bare_repositories}{os.sep}.insteadOf",
+    "GIT_CONFIG_VALUE_0": urls.I2PC_REPOSITORY_URL
+  }
+
+@pytest.fixture(scope="session")
+def bare_repositories(tmp_path_factory):
+  repositories_path = tmp_path_factory.mktemp("repositories")
+  for source in constants.XMIPP_SOURCES:
+    work_path = repositories_path / f"{source}-work"
+    work_path.mkdir()
+    (work_path / "README.md").write_text(f"# {source}\n")
+    for command_words in [
+      ["git", "init", "-q"],
+      ["git", "add", "README.md"],
+      ["git", *__GIT_IDENTITY, "commit", "-q", "-m", "Initial commit"],
+      ["git", "tag", "v3"],
+      ["git", "clone", "-q", "--bare", ".", str(repositories_path / f"{source}.git")]
+    ]:
+      subprocess.run(command_words, cwd=work_path, check=True, capture_output=True)
+    shutil.rmtree(work_path)
+  return str(repositories_path)
+
+@pytest.fixture
+def project_path(tmp_path):
+  project = tmp_path / "project"
+  shutil.copytree(get_test_file(os.path.join("cmake-cases", "valid")), project)
+  create_versions_json_file(output_path=str(project))
+  copy_file_from_reference(
+    get_test_file(os.path.join("conf-files", "input", "all-off.conf")),
+    str(project / paths.CONFIG_FILE)
+  )
+  return str(project)
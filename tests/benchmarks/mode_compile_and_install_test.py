@@ -0,0 +1,32 @@
+import os
+import subprocess
+
+from xmipp3_installer.application.cli.arguments import modes, params
+from xmipp3_installer.installer.constants import paths
+from xmipp3_installer.shared import file_operations
+
+from . import XMIPP3_INSTALLER_PROGRAM
+
+def test_benchmarks_compile_and_install(benchmark, benchmark_env, project_path):
+  def __setup():
+    file_operations.delete_paths([
+      os.path.join(project_path, paths.BUILD_PATH),
+      os.path.join(project_path, paths.INSTALL_PATH)
+    ])
+    subprocess.run(
+      [XMIPP3_INSTALLER_PROGRAM, modes.MODE_CONFIG_BUILD],
+      cwd=project_path,
+      env=benchmark_env,
+      check=True,
+      capture_output=True
+    )
+  benchmark(
+    modes.MODE_COMPILE_AND_INSTALL,
+    [
+      XMIPP3_INSTALLER_PROGRAM,
+      modes.MODE_COMPILE_AND_INSTALL,
+      params.PARAMS[params.PARAM_KEEP_OUTPUT][params.LONG_VERSION]
+    ],
+    project_path,
+    setup=__setup
+  )
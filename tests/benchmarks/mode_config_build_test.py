@@ -0,0 +1,19 @@
+import os
+
+from xmipp3_installer.application.cli.arguments import modes, params
+from xmipp3_installer.installer.constants import paths
+from xmipp3_installer.shared import file_operations
+
+from . import XMIPP3_INSTALLER_PROGRAM
+
+def test_benchmarks_config_build(benchmark, project_path):
+  benchmark(
+    modes.MODE_CONFIG_BUILD,
+    [
+      XMIPP3_INSTALLER_PROGRAM,
+      modes.MODE_CONFIG_BUILD,
+      params.PARAMS[params.PARAM_KEEP_OUTPUT][params.LONG_VERSION]
+    ],
+    project_path,
+    setup=lambda: file_operations.delete_paths([os.path.join(project_path, paths.BUILD_PATH)])
+  )
@@ -0,0 +1,15 @@
+import os
+
+from xmipp3_installer.application.cli.arguments import modes
+from xmipp3_installer.installer.constants import paths
+from xmipp3_installer.shared import file_operations
+
+from . import XMIPP3_INSTALLER_PROGRAM
+
+def test_benchmarks_config(benchmark, project_path):
+  benchmark(
+    modes.MODE_CONFIG,
+    [XMIPP3_INSTALLER_PROGRAM, modes.MODE_CONFIG],
+    project_path,
+    setup=lambda: file_operations.delete_paths([os.path.join(project_path, paths.CONFIG_FILE)])
+  )
@@ -0,0 +1,25 @@
+import os
+import shutil
+
+from xmipp3_installer.application.cli.arguments import modes, params
+from xmipp3_installer.installer.constants import paths
+from xmipp3_installer.installer.modes.mode_sync import mode_sync_executor
+
+from . import XMIPP3_INSTALLER_PROGRAM
+from .. import get_test_file
+
+def test_benchmarks_get_models(benchmark, project_path):
+  sync_program_path = os.path.join(project_path, paths.BINARIES_PATH, mode_sync_executor._SYNC_PROGRAM_NAME)
+  os.makedirs(os.path.dirname(sync_program_path))
+  shutil.copy(get_test_file("xmipp_sync_data.py"), sync_program_path)
+  os.chmod(sync_program_path, 0o755)
+  benchmark(
+    modes.MODE_GET_MODELS,
+    [
+      XMIPP3_INSTALLER_PROGRAM,
+      modes.MODE_GET_MODELS,
+      params.PARAMS[params.PARAM_MODELS_DIRECTORY][params.SHORT_VERSION],
+      "models"
+    ],
+    project_path
+  )
@@ -0,0 +1,27 @@
+import os
+
+from xmipp3_installer.application.cli.arguments import modes, params
+from xmipp3_installer.installer import constants
+from xmipp3_installer.installer.constants import paths
+from xmipp3_installer.shared import file_operations
+
+from . import XMIPP3_INSTALLER_PROGRAM
+
+def test_benchmarks_get_sources(benchmark, benchmark_env, project_path):
+  sources_path = os.path.join(project_path, paths.SOURCES_PATH)
+  def __setup():
+    file_operations.delete_paths([
+      *[os.path.join(sources_path, source) for source in constants.XMIPP_SOURCES],
+      os.path.join(benchmark_env["XDG_CACHE_HOME"], "xmipp3-installer")
+    ])
+    os.makedirs(sources_path, exist_ok=True)
+  benchmark(
+    modes.MODE_GET_SOURCES,
+    [
+      XMIPP3_INSTALLER_PROGRAM,
+      modes.MODE_GET_SOURCES,
+      params.PARAMS[params.PARAM_KEEP_OUTPUT][params.LONG_VERSION]
+    ],
+    project_path,
+    setup=__setup
+  )
@@ -0,0 +1,6 @@
+from xmipp3_installer.application.cli.arguments import modes
+
+from . import XMIPP3_INSTALLER_PROGRAM
+
+def test_benchmarks_version(benchmark, project_path):
+  benchmark(modes.MODE_VERSION, [XMIPP3_INSTALLER_PROGRAM, modes.MODE_VERSION], project_path)
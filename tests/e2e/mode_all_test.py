@@ -55,8 +55,10 @@ def test_returns_expected_full_installation_output(
           mode_compile_and_install.remove_ninja_error_code(
             mode_compile_and_install.remove_ninja_output(
               mode_config_build.normalize_execution_times(
-                mode_config_build.remove_generator_line(
-                  mode_cmake.normalize_cmake_executable(result)
+                mode_compile_and_install.normalize_build_report(
+                  mode_config_build.remove_generator_line(
+                    mode_cmake.normalize_cmake_executable(result)
+                  )
                 )
               )
             )
@@ -1,3 +1,4 @@
+import json
 import os
 import subprocess
 
@@ -26,6 +27,16 @@ __EMPTY_DIR = "empty_dir"
 __NON_EMPTY_DIR = "non_empty"
 __DBLITE_FILE = "test.dblite"
 __PYCACHE_ROOT = "pycache_root"
+__DELETABLE_PATHS = [
+  __DBLITE_FILE,
+  __SO_FILE,
+  __OS_FILE,
+  __O_FILE,
+  os.path.join(__PYCACHE_ROOT, "__pycache__"),
+  os.path.join(__DIR_STRUCT_ROOT, __EMPTY_DIR),
+  paths.BUILD_PATH,
+  paths.BINARIES_PATH
+]
 
 @pytest.mark.parametrize(
   "confirmation_text",
@@ -47,16 +58,7 @@ def test_deletes_expected_files(__setup_environment, confirmation_text):
     check=False
   )
   
-  for remaining_path in [
-    __DBLITE_FILE,
-    __SO_FILE,
-    __OS_FILE,
-    __O_FILE,
-    os.path.join(__PYCACHE_ROOT, "__pycache__"),
-    os.path.join(__DIR_STRUCT_ROOT, __EMPTY_DIR),
-    paths.BUILD_PATH,
-    paths.BINARIES_PATH
-  ]:
+  for remaining_path in __DELETABLE_PATHS:
     file_exists = os.path.exists(remaining_path)
     assert (
       file_exists == remain
@@ -69,6 +71,22 @@ def test_deletes_expected_files(__setup_environment, confirmation_text):
     os.path.exists(__DUMMY_FILE)
   ), f"{__DUMMY_FILE} must always remain."
 
+def test_reports_paths_without_deleting_them_in_dry_run(__setup_environment, tmp_path):
+  report_file = str(tmp_path / "report.json")
+  command_words = [
+    "xmipp3_installer", modes.MODE_CLEAN_BIN, "--dry-run", "--report", report_file
+  ]
+  result = subprocess.run(command_words, capture_output=True, text=True, check=False)
+  with open(report_file, encoding="utf-8") as report:
+    reported_paths = sorted(os.path.abspath(entry["path"]) for entry in json.load(report)["paths"])
+  expected_paths = sorted(os.path.abspath(path) for path in __DELETABLE_PATHS)
+  assert (
+    result.returncode == 0 and reported_paths == expected_paths
+  ), get_assertion_message("reported paths", expected_paths, reported_paths)
+  assert (
+    all(os.path.exists(path) for path in __DELETABLE_PATHS)
+  ), "No path must be deleted in a dry run."
+
 def __create_file(path):
   with open(path, "w") as empty_file:
     empty_file.write("")
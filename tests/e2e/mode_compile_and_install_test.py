@@ -57,7 +57,9 @@ def test_returns_expected_compile_and_install_output(
         __setup_evironment,
         mode_compile_and_install.remove_ninja_error_code(
           mode_compile_and_install.remove_ninja_output(
-            mode_cmake.normalize_cmake_executable(result)
+            mode_compile_and_install.normalize_build_report(
+              mode_cmake.normalize_cmake_executable(result)
+            )
           )
         )
       )
@@ -1,10 +1,12 @@
 import os
 import subprocess
+from typing import Dict, Optional
 
 import pytest
 
 from xmipp3_installer.application.cli.arguments import modes, params
 from xmipp3_installer.installer.constants import paths
+from xmipp3_installer.repository.config_vars import variables
 from xmipp3_installer.shared import file_operations
 
 from . import get_cmake_project_path
@@ -27,29 +29,64 @@ def test_returns_expected_config_build_output(
   __setup_evironment,
   expected_output
 ):
+  result = __run_config_build(__setup_evironment)
+  assert (
+    result == expected_output
+  ), get_assertion_message("config build output", expected_output, result)
+
+@pytest.mark.parametrize(
+  "force,expected_output",
+  [
+    pytest.param(False, mode_config_build.UP_TO_DATE, id="Up to date"),
+    pytest.param(True, mode_config_build.SUCCESS, id="Forced")
+  ]
+)
+def test_returns_expected_config_build_output_when_configured_again(
+  force,
+  expected_output,
+  __setup_evironment
+):
+  __run_config_build(__setup_evironment)
+  result = __run_config_build(__setup_evironment, force=force)
+  assert (
+    result == expected_output
+  ), get_assertion_message("config build output", expected_output, result)
+
+def test_returns_generator_mismatch_error_when_configured_again_with_other_generator(
+  __setup_evironment
+):
+  __run_config_build(__setup_evironment)
+  result = __run_config_build(
+    __setup_evironment,
+    env={**mode_cmake.ENV, f"{variables.ENVIRONMENT_VARIABLES_PREFIX}{variables.CMAKE_GENERATOR}": "Unix Makefiles"}
+  )
+  assert (
+    result == mode_config_build.GENERATOR_MISMATCH
+  ), get_assertion_message("config build output", mode_config_build.GENERATOR_MISMATCH, result)
+
+def __run_config_build(project_path: str, force: bool=False, env: Optional[Dict[str, str]]=None) -> str:
   command_words = [
     "xmipp3_installer",
     modes.MODE_CONFIG_BUILD,
     params.PARAMS[params.PARAM_KEEP_OUTPUT][params.LONG_VERSION]
   ]
+  if force:
+    command_words.append(params.PARAMS[params.PARAM_FORCE][params.LONG_VERSION])
   result = subprocess.run(
     command_words,
     capture_output=True,
     text=True,
-    cwd=__setup_evironment,
-    env=mode_cmake.ENV,
+    cwd=project_path,
+    env=env or mode_cmake.ENV,
     check=False
   ).stdout
-  result = __normalize_paths(
+  return __normalize_paths(
     mode_config_build.normalize_execution_times(
       mode_config_build.remove_generator_line(
         mode_cmake.normalize_cmake_executable(result)
       )
     )
   )
-  assert (
-    result == expected_output
-  ), get_assertion_message("config build output", expected_output, result)
 
 def __normalize_paths(raw_output: str) -> str: # Absolute paths are different per user and OS
   raw_output_lines = raw_output.splitlines(keepends=True)
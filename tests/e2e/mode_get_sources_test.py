@@ -9,7 +9,7 @@ from xmipp3_installer.application.cli import cli
 from xmipp3_installer.application.cli import arguments
 from xmipp3_installer.application.cli.arguments import modes, params
 from xmipp3_installer.installer.constants import paths
-from xmipp3_installer.installer.handlers import shell_handler
+from xmipp3_installer.installer.handlers import git_handler, shell_handler
 from xmipp3_installer.shared import file_operations
 
 from .shell_command_outputs import mode_get_sources
@@ -62,7 +62,7 @@ from .. import get_assertion_message, create_versions_json_file
         params.PARAMS[params.PARAM_BRANCH][params.SHORT_VERSION],
         mode_get_sources.BRANCH_NAME
       ],
-      (0, f"refs/heads/{mode_get_sources.BRANCH_NAME}"),
+      (0, f"{mode_get_sources.COMMIT_HASH}\trefs/heads/{mode_get_sources.BRANCH_NAME}"),
       False,
       mode_get_sources.SUCCESS,
       id="Clone success existing different branch"
@@ -125,6 +125,13 @@ def __setup_evironment(request):
       paths.VERSION_INFO_FILE
     ])
 
+@pytest.fixture(autouse=True)
+def __mock_remote_refs_cache(tmp_path):
+  with patch.dict(git_handler.__REMOTE_REFS, clear=True), patch.object(
+    paths, "REMOTE_REFS_CACHE_FILE", str(tmp_path / "remote-refs.json")
+  ):
+    yield
+
 @pytest.fixture(autouse=True)
 def __mock_sys_argv(request):
   args = [
@@ -1,5 +1,7 @@
 import os
 import subprocess
+import sys
+from typing import Dict, Tuple
 
 import pytest
 
@@ -13,6 +15,20 @@ from .. import (
   get_test_file, create_versions_json_file, JSON_XMIPP_VERSION_NAME
 )
 
+__SHORT_VERSION_IMPORT_BUDGET_MS = 250
+__SHORT_VERSION_UNNEEDED_MODULES = [
+  "asyncio",
+  "distro",
+  "http.client",
+  "multiprocessing",
+  "xmipp3_installer.api_client.api_client",
+  "xmipp3_installer.api_client.assembler.installation_info_assembler",
+  "xmipp3_installer.installer.handlers.git_handler",
+  "xmipp3_installer.installer.handlers.shell_handler",
+  "xmipp3_installer.installer.modes.mode_all_executor",
+  "xmipp3_installer.installer.modes.mode_get_sources_executor"
+]
+
 def test_returns_short_version(__setup_evironment):
   command_words = ["xmipp3_installer", modes.MODE_VERSION, "--short"]
   result = subprocess.run(
@@ -26,6 +42,22 @@ def test_returns_short_version(__setup_evironment):
     result == expected_version
   ), get_assertion_message("short version", expected_version, result)
 
+def test_does_not_import_unneeded_modules_when_returning_short_version(__setup_evironment):
+  import_times = __get_short_version_import_times()
+  unneeded_modules = [module for module in __SHORT_VERSION_UNNEEDED_MODULES if module in import_times]
+  assert (
+    unneeded_modules == []
+  ), get_assertion_message("unneeded imported modules", [], unneeded_modules)
+
+def test_imports_modules_within_budget_when_returning_short_version(__setup_evironment):
+  import_time = sum(
+    cumulative_time for module, (cumulative_time, is_top_level) in __get_short_version_import_times().items()
+    if is_top_level
+  ) / 1000
+  assert (
+    import_time <= __SHORT_VERSION_IMPORT_BUDGET_MS
+  ), get_assertion_message("import time (ms)", f"<= {__SHORT_VERSION_IMPORT_BUDGET_MS}", import_time)
+
 @pytest.mark.parametrize(
   "__setup_evironment,expected_output_function",
   [
@@ -52,6 +84,22 @@ def test_returns_full_version(
     result == expected_output
   ), get_assertion_message("full version", expected_output, result)
 
+def __get_short_version_import_times() -> Dict[str, Tuple[int, bool]]:
+  stderr = subprocess.run(
+    [sys.executable, "-X", "importtime", "-m", "xmipp3_installer", modes.MODE_VERSION, "--short"],
+    capture_output=True,
+    text=True,
+    check=False
+  ).stderr
+  import_times = {}
+  for line in stderr.splitlines():
+    fields = line.split("|")
+    if not line.startswith("import time:") or not fields[1].strip().isdigit():
+      continue
+    module = fields[2].rstrip()
+    import_times[module.strip()] = (int(fields[1]), not module.startswith("  "))
+  return import_times
+
 def __delete_library_versions_file():
   file_operations.delete_paths(
     [os.path.dirname(paths.LIBRARY_VERSIONS_FILE)]
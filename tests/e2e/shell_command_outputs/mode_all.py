@@ -3,11 +3,21 @@ from xmipp3_installer.application.logger import predefined_messages
 from . import mode_cmake
 from .mode_cmake import mode_config_build, mode_compile_and_install
 
+__STAGES = ["config", "getSources", "configBuild", "compileAndInstall"]
+
 def __get_build_project_subpath(project_name: str) -> str:
   return mode_cmake.get_project_abs_subpath(
     project_name,
     "build"
   )
+
+def __add_timings_summary(output: str, final_message: str, n_stages: int) -> str:
+  summary = "\n".join([
+    predefined_messages.get_section_message("Stage timings"),
+    *[f"{stage} ({mode_config_build.EXECUTION_TIME}s)" for stage in __STAGES[:n_stages]],
+    f"Total ({mode_config_build.EXECUTION_TIME}s)"
+  ])
+  return output.replace(final_message, f"\n{summary}\n{final_message}")
 __COMMON_SECTION = f"""------------------- Managing config file -------------------
 Reading config file...
 {predefined_messages.get_done_message()}
@@ -38,17 +48,33 @@ __CONFIG_SUCCESS = f"""{__COMMON_CONFIG_SUCCESS}
 {predefined_messages.get_done_message()}
 """
 
-CONFIG_BUILD_FAILURE = f"""{__COMMON_SECTION}
-{mode_config_build.FAILURE}"""
+CONFIG_BUILD_FAILURE = __add_timings_summary(
+  f"""{__COMMON_SECTION}
+{mode_config_build.FAILURE}""",
+  mode_cmake.get_predefined_error(4, "configuring"),
+  3
+)
 
-BUILD_FAILURE = f"""{__COMMON_SECTION}
+BUILD_FAILURE = __add_timings_summary(
+  f"""{__COMMON_SECTION}
 {__CONFIG_SUCCESS_BUILD_FAILURE}
-{mode_compile_and_install.BUILD_FAILURE}"""
+{mode_compile_and_install.BUILD_FAILURE}""",
+  mode_cmake.get_predefined_error(5, "compiling"),
+  4
+)
 
-INSTALL_FAILURE = f"""{__COMMON_SECTION}
+INSTALL_FAILURE = __add_timings_summary(
+  f"""{__COMMON_SECTION}
 {__CONFIG_SUCCESS_INSTALL_FAILURE}
-{mode_compile_and_install.INSTALL_FAILURE}"""
+{mode_compile_and_install.INSTALL_FAILURE}""",
+  mode_cmake.get_predefined_error(6, "installing"),
+  4
+)
 
-SUCCESS = f"""{__COMMON_SECTION}
+SUCCESS = __add_timings_summary(
+  f"""{__COMMON_SECTION}
 {__CONFIG_SUCCESS}
-{mode_compile_and_install.SUCCESS}"""
+{mode_compile_and_install.SUCCESS}""",
+  predefined_messages.get_success_message(""),
+  4
+)
@@ -1,4 +1,5 @@
 import os
+import re
 
 from xmipp3_installer.application.logger import predefined_messages
 
@@ -6,6 +7,7 @@ from . import (
   get_predefined_error, get_project_abs_subpath,
   BUILD_ERROR_PROJECT, CMAKE_EXECUTABLE
 )
+from .mode_config_build import EXECUTION_TIME
 
 ERROR_TARGET_MESSAGE_START = "FAILED: CMakeFiles/build_error_target "
 __INSTALLING_MESSAGE_LINE = "------------------- Installing with CMake ------------------"
@@ -13,10 +15,16 @@ BUILD_ERROR_TARGET_SUBPATH = os.path.join("build", "CMakeFiles", "build_error_ta
 
 __COMMON_SECTION = f"""------------------- Compiling with CMake -------------------
 {CMAKE_EXECUTABLE} --build build --config Release -j 1"""
+__BUILD_REPORT_MESSAGE_START = "Build report saved to "
+__BUILD_REPORT = (
+  f"{__BUILD_REPORT_MESSAGE_START}build/build-report.json: 1 targets, {EXECUTION_TIME}s of CPU time in "
+  f"{EXECUTION_TIME}s ({EXECUTION_TIME}x parallelism). Slowest: CMakeFiles/valid_target ({EXECUTION_TIME}s)."
+)
+__INSTALLATION_SECTION = f"""{__INSTALLING_MESSAGE_LINE}
+{CMAKE_EXECUTABLE} --install build --config Release"""
 __COMPILATION_SUCCESS = f"""{predefined_messages.get_done_message()}
 
-{__INSTALLING_MESSAGE_LINE}
-{CMAKE_EXECUTABLE} --install build --config Release"""
+{__INSTALLATION_SECTION}"""
 
 BUILD_FAILURE = f"""{__COMMON_SECTION}
 [1/1] This command is expected to fail:
@@ -31,7 +39,10 @@ INSTALL_FAILURE = f"""{__COMMON_SECTION}
 
 SUCCESS = f"""{__COMMON_SECTION}
 [1/1] This command is expected to succeed
-{__COMPILATION_SUCCESS}
+{predefined_messages.get_done_message()}
+{__BUILD_REPORT}
+
+{__INSTALLATION_SECTION}
 {predefined_messages.get_done_message()}
 {predefined_messages.get_success_message("")}
 """
@@ -48,6 +59,15 @@ def remove_ninja_output(raw_output: str) -> str: # Ninja output is printed or no
     new_lines.append(line)
   return "".join(new_lines)
 
+def normalize_build_report(raw_output: str) -> str: # Build times vary from one execution to another
+  new_lines = []
+  for line in raw_output.splitlines(keepends=True):
+    new_line = line
+    if line.startswith(__BUILD_REPORT_MESSAGE_START):
+      new_line = re.sub(r'\d+\.\d([sx])', f"{EXECUTION_TIME}\\1", line)
+    new_lines.append(new_line)
+  return "".join(new_lines)
+
 def remove_command_error_line(raw_output: str) -> str: # Error line containing system-specific details
   splitted = raw_output.splitlines(keepends=True)
   new_output_lines = []
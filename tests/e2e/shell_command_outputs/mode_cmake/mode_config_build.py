@@ -1,7 +1,9 @@
 import re
 
 from xmipp3_installer.application.logger import predefined_messages
+from xmipp3_installer.application.logger.logger import logger
 
+from .. import XMIPP_DOCS
 from . import (
   CMAKE_EXECUTABLE, VALID_PROJECT,
   get_project_abs_subpath, get_predefined_error
@@ -12,7 +14,7 @@ BUILD_FILES_WRITTEN_MESSAGE_START = "-- Build files have been written to: "
 VALID_PATH = get_project_abs_subpath(VALID_PROJECT, "build")
 
 __COMMON_SECTION = f"""------------------ Configuring with CMake ------------------
-{CMAKE_EXECUTABLE} -S . -B build -DCMAKE_BUILD_TYPE=Release -DBUILD_TESTING=False -DCMAKE_CXX_FLAGS=-mtune=native -DCMAKE_C_FLAGS=-mtune=native -DCMAKE_INSTALL_PREFIX=dist -DCMAKE_SKIP_RPATH=True -DXMIPP_LINK_TO_SCIPION=False -DXMIPP_USE_CUDA=False -DXMIPP_USE_MATLAB=False -DXMIPP_USE_MPI=False"""
+{CMAKE_EXECUTABLE} -G "Ninja" -S . -B build -DCMAKE_BUILD_TYPE=Release -DBUILD_TESTING=False -DCMAKE_CXX_FLAGS=-mtune=native -DCMAKE_C_FLAGS=-mtune=native -DCMAKE_INSTALL_PREFIX=dist -DCMAKE_SKIP_RPATH=True -DXMIPP_LINK_TO_SCIPION=False -DXMIPP_USE_CUDA=False -DXMIPP_USE_MATLAB=False -DXMIPP_USE_MPI=False"""
 
 SUCCESS = f"""{__COMMON_SECTION}
 -- Configuring done ({EXECUTION_TIME}s)
@@ -21,6 +23,23 @@ SUCCESS = f"""{__COMMON_SECTION}
 {predefined_messages.get_done_message()}
 """
 
+UP_TO_DATE = f"""------------------ Configuring with CMake ------------------
+Nothing changed since the last configuration, skipping it. Use --force to configure anyway.
+{predefined_messages.get_done_message()}
+"""
+
+GENERATOR_MISMATCH = f"""------------------ Configuring with CMake ------------------
+{logger.red(chr(10).join([
+  "The build directory was configured with the 'Ninja' generator, but 'Unix Makefiles' is selected in xmipp.conf.",
+  "To rebuild with 'Unix Makefiles', remove the build directory with './xmipp cleanBin' and run the installation again.",
+  "To keep the current build, set CMAKE_GENERATOR=Ninja in xmipp.conf, or leave it empty.",
+  "",
+  "Error 4: Error configuring with CMake.",
+  "Check the inside file 'compilation.log'.",
+  XMIPP_DOCS
+]))}
+"""
+
 FAILURE = f"""{__COMMON_SECTION}
 -- Configuring incomplete, errors occurred!
 {get_predefined_error(4, "configuring")}
@@ -10,6 +10,8 @@ __CLONING_XMIPP_CORE = f"Cloning {constants.XMIPP_CORE}..."
 __CLONING_XMIPP_VIZ = f"Cloning {constants.XMIPP_VIZ}..."
 
 BRANCH_NAME = "branch_name"
+COMMIT_HASH = "4fb11a33809108b5f4550ac2657cb7cac448253f"
+
 def __get_branch_not_found_warning(source_name: str) -> str:
   return "\n".join([
     logger.yellow(f"Warning: branch \'{BRANCH_NAME}\' does not exist for repository with url https://github.com/i2pc/{source_name}"),
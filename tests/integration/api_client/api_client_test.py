@@ -1,11 +1,10 @@
 import http.client
+import json
 import os
 import shlex
 import ssl
 import tempfile
-import socket
 from unittest.mock import patch
-from urllib.parse import urlparse
 
 import pytest
 
@@ -13,8 +12,9 @@ from xmipp3_installer.api_client import api_client
 from xmipp3_installer.api_client.assembler import installation_info_assembler
 from xmipp3_installer.installer import constants, urls
 from xmipp3_installer.installer.constants import paths
+from xmipp3_installer.installer.handlers import system_info_handler
 
-from . import shell_command_outputs, file_contents
+from . import file_contents
 from ... import get_assertion_message, JSON_XMIPP_VERSION_NAME
 
 def test_records_api_call_when_sending_installation_attempt(
@@ -24,7 +24,6 @@ def test_records_api_call_when_sending_installation_attempt(
   __mock_get_cpu_flags,
   __mock_get_current_branch,
   __mock_is_branch_up_to_date,
-  __mock_log_tail,
   __mock_get_os_release_name,
   __mock_is_tag,
   __mock_server
@@ -37,30 +36,39 @@ def test_records_api_call_when_sending_installation_attempt(
   assert (
     __mock_server.requests[0].method == "POST"
   ), get_assertion_message("request method", "POST", __mock_server.requests[0].method)
+  cpu_flags = json.loads(__mock_server.requests[0].data)["version"]["cpuFlags"]
+  assert (
+    cpu_flags == file_contents.CPU_FLAGS
+  ), get_assertion_message("sent CPU flags", file_contents.CPU_FLAGS, cpu_flags)
+  updated = json.loads(__mock_server.requests[0].data)["xmipp"]["updated"]
+  assert (
+    updated is True
+  ), get_assertion_message("sent updated status", True, updated)
 
-def test_internet_available_integration_true(httpserver, monkeypatch):
-  httpserver.serve_content(content=None, code=200, store_request_data=True)
-
-  parsed = urlparse(httpserver.url)
-  monkeypatch.setattr(api_client, "INTERNET_CHECK_IP", parsed.hostname)
-  monkeypatch.setattr(api_client, "INTERNET_CHECK_PORT", parsed.port)
-  monkeypatch.setattr(api_client, "INTERNET_CHECK_TIMEOUT", 1.0)
-
-  assert api_client.internet_available() is True
-
-
-def test_internet_available_integration_false(monkeypatch):
-  # pick an ephemeral port and close it to simulate no-listener
-  s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-  s.bind(("127.0.0.1", 0))
-  _, port = s.getsockname()
-  s.close()
-
-  monkeypatch.setattr(api_client, "INTERNET_CHECK_IP", "127.0.0.1")
-  monkeypatch.setattr(api_client, "INTERNET_CHECK_PORT", port)
-  monkeypatch.setattr(api_client, "INTERNET_CHECK_TIMEOUT", 0.2)
+def test_sends_anonymized_log_tail_when_installation_failed(
+  __mock_mac_address,
+  __mock_library_versions_file,
+  __mock_run_parallel_jobs,
+  __mock_get_cpu_flags,
+  __mock_get_current_branch,
+  __mock_is_branch_up_to_date,
+  __mock_log_file,
+  __mock_get_os_release_name,
+  __mock_is_tag,
+  __mock_server
+):
+  api_client.send_installation_attempt(
+    installation_info_assembler.get_installation_info(__get_version_manager(), ret_code=1)
+  )
+  log_tail = json.loads(__mock_server.requests[0].data)["logTail"]
+  log_lines = __get_log_content().split("\n")[-constants.TAIL_LOG_NCHARS:]
+  expected_log_tail = "\n".join(log_lines).replace("/home/runner/", "/home/REDACTED/")
+  assert (
+    log_tail == expected_log_tail
+  ), get_assertion_message("sent log tail", expected_log_tail, log_tail)
 
-  assert api_client.internet_available() is False
+def __get_log_content():
+  return "\n".join([*["Older line"] * constants.TAIL_LOG_NCHARS, file_contents.LOG_TAIL])
 
 def __get_version_manager():
   class DummyVersionManager:
@@ -69,12 +77,14 @@ def __get_version_manager():
   return DummyVersionManager()
 
 @pytest.fixture
-def __mock_mac_address(fake_process):
-  fake_process.register_subprocess(
-    shlex.split("ip addr"),
-    stdout=shell_command_outputs.IP_ADDR
-  )
-  yield fake_process
+def __mock_mac_address(tmp_path):
+  interface_path = tmp_path / "net" / "eth0"
+  interface_path.mkdir(parents=True)
+  (interface_path / "ifindex").write_text("2\n")
+  (interface_path / "type").write_text("1\n")
+  (interface_path / "address").write_text("00:08:9b:c4:30:31\n")
+  with patch.object(system_info_handler, "__NET_INTERFACES_PATH", str(tmp_path / "net")):
+    yield
 
 @pytest.fixture
 def __mock_file():
@@ -96,48 +106,44 @@ def __mock_library_versions_file(__mock_file):
     yield
 
 @pytest.fixture
-def __mock_get_cpu_flags(fake_process):
-  fake_process.register_subprocess(
-    'lscpu | grep \"Flags:\"',
-    stdout=shell_command_outputs.LSCPU_FLAGS
-  )
-  yield fake_process
+def __mock_get_cpu_flags(tmp_path):
+  cpuinfo_file = tmp_path / "cpuinfo"
+  cpuinfo_file.write_text(file_contents.CPUINFO)
+  with patch.object(system_info_handler, "__CPUINFO_FILE", str(cpuinfo_file)):
+    yield
 
 @pytest.fixture
-def __mock_get_current_branch(fake_process):
-  fake_process.register_subprocess(
-    shlex.split("git rev-parse --abbrev-ref HEAD"),
-    stdout=constants.MAIN_BRANCHNAME,
-    occurrences=2
-  )
-  yield fake_process
+def __mock_get_current_branch(tmp_path, monkeypatch):
+  git_dir = tmp_path / ".git"
+  git_dir.mkdir()
+  (git_dir / "HEAD").write_text(f"ref: refs/heads/{constants.MAIN_BRANCHNAME}\n")
+  monkeypatch.chdir(tmp_path)
+  yield
 
 @pytest.fixture
-def __mock_is_branch_up_to_date(fake_process):
+def __mock_is_branch_up_to_date(fake_process, tmp_path):
   commit = "d46d18c25cb689eee68e412e4d3854cab6d3d065"
-  fake_process.register_subprocess(shlex.split("git fetch"))
   fake_process.register_subprocess(
-    shlex.split(f"git rev-parse {constants.MAIN_BRANCHNAME}"),
+    shlex.split("git rev-parse HEAD"),
     stdout=commit
   )
   fake_process.register_subprocess(
-    shlex.split(f"git rev-parse origin/{constants.MAIN_BRANCHNAME}"),
-    stdout=commit
+    shlex.split(f"git ls-remote --heads origin refs/heads/{constants.MAIN_BRANCHNAME}"),
+    stdout=f"{commit}\trefs/heads/{constants.MAIN_BRANCHNAME}"
   )
-  yield fake_process
+  with patch.object(paths, "REMOTE_HEADS_CACHE_FILE", str(tmp_path / "remote-heads.json")):
+    yield fake_process
 
 @pytest.fixture
-def __mock_log_tail(fake_process):
-  log_file_content = file_contents.LOG_TAIL
-  fake_process.register_subprocess(
-    shlex.split(f"tail -n {constants.TAIL_LOG_NCHARS} {paths.LOG_FILE}"),
-    stdout=log_file_content
-  )
-  yield fake_process
+def __mock_log_file(tmp_path):
+  log_file = tmp_path / paths.LOG_FILE
+  log_file.write_text(__get_log_content())
+  with patch.object(paths, "LOG_FILE", str(log_file)):
+    yield
 
 @pytest.fixture
 def __mock_run_parallel_jobs():
-  def __mimick_run_parallel_jobs(funcs, func_args, _=1):
+  def __mimick_run_parallel_jobs(funcs, func_args, **_):
     results = []
     for func, args in zip(funcs, func_args):
       results.append(func(*args))
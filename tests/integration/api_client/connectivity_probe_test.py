@@ -0,0 +1,67 @@
+import socket
+from unittest.mock import patch
+
+import pytest
+
+from xmipp3_installer.api_client import connectivity_probe
+from xmipp3_installer.installer.constants import paths
+
+from ... import get_assertion_message
+
+__LOCALHOST = "127.0.0.1"
+__CACHE_TTL = 60
+
+def test_returns_true_when_target_accepts_connections(__listening_target):
+  connected = connectivity_probe.is_connected([__listening_target])
+  assert (
+    connected is True
+  ), get_assertion_message("connected", True, connected)
+
+def test_returns_false_when_target_does_not_accept_connections(__closed_target):
+  connected = connectivity_probe.is_connected([__closed_target])
+  assert (
+    connected is False
+  ), get_assertion_message("connected", False, connected)
+
+def test_returns_true_when_any_target_accepts_connections(__closed_target, __listening_target):
+  connected = connectivity_probe.is_connected([__closed_target, __listening_target])
+  assert (
+    connected is True
+  ), get_assertion_message("connected", True, connected)
+
+def test_does_not_change_default_socket_timeout(__closed_target):
+  connectivity_probe.is_connected([__closed_target], timeout=0.2)
+  default_timeout = socket.getdefaulttimeout()
+  assert (
+    default_timeout is None
+  ), get_assertion_message("default socket timeout", None, default_timeout)
+
+def test_reuses_cached_result_when_checking_connection(__listening_target, __cache_file):
+  connectivity_probe.is_connected([__listening_target], cache_ttl=__CACHE_TTL)
+  with patch("socket.create_connection") as mock_create_connection:
+    connected = connectivity_probe.is_connected([__listening_target], cache_ttl=__CACHE_TTL)
+  mock_create_connection.assert_not_called()
+  assert (
+    connected is True
+  ), get_assertion_message("connected", True, connected)
+
+@pytest.fixture
+def __listening_target():
+  with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as listener:
+    listener.bind((__LOCALHOST, 0))
+    listener.listen()
+    yield listener.getsockname()
+
+@pytest.fixture
+def __closed_target():
+  # Ephemeral port closed right away, so nothing listens on it
+  with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as closed_socket:
+    closed_socket.bind((__LOCALHOST, 0))
+    target = closed_socket.getsockname()
+  yield target
+
+@pytest.fixture
+def __cache_file(tmp_path):
+  cache_file = str(tmp_path / "connectivity.json")
+  with patch.object(paths, "CONNECTIVITY_CACHE_FILE", cache_file):
+    yield cache_file
@@ -29,3 +29,19 @@ Done
 *     Xmipp main has been successfully installed, enjoy it!      *
 *                                                                *
 ******************************************************************"""
+
+CPU_FLAGS = [
+  "fpu", "vme", "de", "pse", "tsc", "msr", "pae", "mce", "cx8", "apic", "sep", "mtrr", "pge", "mca", "cmov",
+  "pat", "pse36", "clflush", "mmx", "fxsr", "sse", "sse2", "ht", "syscall", "nx", "lm", "constant_tsc",
+  "pni", "ssse3", "fma", "cx16", "sse4_1", "sse4_2", "popcnt", "aes", "xsave", "avx", "f16c", "avx2"
+]
+CPUINFO = f"""processor\t: 0
+vendor_id\t: AuthenticAMD
+model name\t: AMD EPYC 7763 64-Core Processor
+flags\t\t: {" ".join(CPU_FLAGS)}
+
+processor\t: 1
+vendor_id\t: AuthenticAMD
+model name\t: AMD EPYC 7763 64-Core Processor
+flags\t\t: {" ".join(CPU_FLAGS)}
+"""
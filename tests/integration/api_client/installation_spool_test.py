@@ -0,0 +1,119 @@
+import http.client
+import http.server
+import json
+import os
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from xmipp3_installer.api_client import api_client, installation_spool
+from xmipp3_installer.installer import urls
+
+from ... import get_assertion_message
+
+__INSTALLATION_INFOS = [{"user": f"user-{index}"} for index in range(5)]
+__RETRIED_STATUSES = [503, 200, 429, 200, 200, 200, 200]
+__N_ACCEPTED = 2
+
+def test_sends_each_spooled_attempt_as_json(__spool_path, __server):
+  installation_spool.drain_spool(__spool_path)
+  sent_attempts = [request["body"] for request in __server.requests]
+  assert (
+    sent_attempts == __INSTALLATION_INFOS
+  ), get_assertion_message("sent attempts", __INSTALLATION_INFOS, sent_attempts)
+
+def test_sends_all_attempts_through_one_connection(__spool_path, __server):
+  installation_spool.drain_spool(__spool_path)
+  client_ports = {request["client_port"] for request in __server.requests}
+  assert (
+    len(client_ports) == 1
+  ), get_assertion_message("number of connections", 1, len(client_ports))
+
+@pytest.mark.parametrize(
+  "__server",
+  [pytest.param(__RETRIED_STATUSES)],
+  indirect=["__server"]
+)
+def test_retries_attempts_when_server_fails(__spool_path, __server):
+  n_sent = installation_spool.drain_spool(__spool_path)
+  remaining_entries = __get_entries(__spool_path)
+  n_requests = len(__server.requests)
+  assert (
+    n_sent == len(__INSTALLATION_INFOS) and not remaining_entries and n_requests == len(__RETRIED_STATUSES)
+  ), get_assertion_message("number of requests", len(__RETRIED_STATUSES), n_requests)
+
+@pytest.mark.parametrize(
+  "__server",
+  [pytest.param([200, 200, 503, 503, 503])],
+  indirect=["__server"]
+)
+def test_keeps_unsent_attempts_when_server_fails(__spool_path, __server):
+  n_sent = installation_spool.drain_spool(__spool_path)
+  remaining_entries = len(__get_entries(__spool_path))
+  expected_remaining = len(__INSTALLATION_INFOS) - __N_ACCEPTED
+  assert (
+    n_sent == __N_ACCEPTED and remaining_entries == expected_remaining
+  ), get_assertion_message("remaining entries", expected_remaining, remaining_entries)
+
+@pytest.mark.parametrize(
+  "__server",
+  [pytest.param([400])],
+  indirect=["__server"]
+)
+def test_drops_rejected_attempt_and_delivers_the_rest(__spool_path, __server):
+  n_sent = installation_spool.drain_spool(__spool_path)
+  remaining_entries = __get_entries(__spool_path)
+  delivered_attempts = [request["body"] for request in __server.requests[1:]]
+  expected_delivered = __INSTALLATION_INFOS[1:]
+  assert (
+    n_sent == len(expected_delivered) and delivered_attempts == expected_delivered and not remaining_entries
+  ), get_assertion_message("delivered attempts", expected_delivered, delivered_attempts)
+
+def __get_entries(spool_path: str) -> list:
+  return [name for name in os.listdir(spool_path) if name.endswith(".json")]
+
+class __StandInHandler(http.server.BaseHTTPRequestHandler):
+  protocol_version = "HTTP/1.1"
+
+  def do_POST(self):
+    body = self.rfile.read(int(self.headers["Content-Length"]))
+    self.server.requests.append({
+      "client_port": self.client_address[1],
+      "body": json.loads(body)
+    })
+    status = self.server.statuses.pop(0) if self.server.statuses else 200
+    self.send_response(status)
+    self.send_header("Content-Length", "0")
+    self.end_headers()
+
+  def log_message(self, *_):
+    pass
+
+@pytest.fixture
+def __spool_path(tmp_path):
+  spool_path = str(tmp_path / "spool")
+  for index, installation_info in enumerate(__INSTALLATION_INFOS):
+    with patch("time.time_ns", return_value=index):
+      installation_spool.add_to_spool(spool_path, installation_info)
+  yield spool_path
+
+@pytest.fixture
+def __server(request):
+  server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), __StandInHandler)
+  server.requests = []
+  server.statuses = list(getattr(request, 'param', []))
+  thread = threading.Thread(target=server.serve_forever, daemon=True)
+  thread.start()
+  host, port = server.server_address
+  def __get_http_connection(parsed_url, timeout_seconds):
+    return http.client.HTTPConnection(parsed_url.hostname, parsed_url.port, timeout=timeout_seconds)
+  with patch.object(urls, "API_URL", f"http://{host}:{port}/attempts/"), \
+      patch.object(api_client, "__RETRY_DELAY_SECONDS", 0), \
+      patch(
+        "xmipp3_installer.api_client.api_client.__get_https_connection",
+        side_effect=__get_http_connection
+      ):
+    yield server
+  server.shutdown()
+  server.server_close()
@@ -15,8 +15,8 @@ Usage: xmipp [options]
 
     version [--short]                                                     Returns the version information. Add \'--short\' to print only the version number.
     compileAndInstall [-j] [--keep-output]                                Compiles and installs Xmipp based on already obtained sources.
-    all [-j] [-b] [--keep-output]                                         Default param. Runs config, configBuild, and compileAndInstall.
-    configBuild [--keep-output]                                           Configures the project with CMake.
+    all [-j] [-b] [--clone-strategy] [--keep-output] [--resume] [--force] Default param. Runs config, configBuild, and compileAndInstall.
+    configBuild [--keep-output] [--force]                                 Configures the project with CMake.
     --------------------------------------------------------------------
     # Config #
 
@@ -25,12 +25,12 @@ Usage: xmipp [options]
     # Downloads #
 
     getModels [-d]                                                        Downloads the Deep Learning Models required by the DLTK tools at dir/models (dist by default).
-    getSources [-b] [--keep-output]                                       Clones Xmipp\'s source repositories xmippCore & xmippViz.
+    getSources [-j] [-b] [--clone-strategy] [--keep-output]               Clones Xmipp\'s source repositories xmippCore & xmippViz.
     --------------------------------------------------------------------
     # Clean #
 
-    cleanBin                                                              Removes all compiled binaries.
-    cleanAll                                                              Removes all compiled binaries and sources, leaves the repository as if freshly cloned (without pulling).
+    cleanBin [--dry-run] [--report]                                       Removes all compiled binaries.
+    cleanAll [--dry-run] [--report]                                       Removes all compiled binaries and sources, leaves the repository as if freshly cloned (without pulling).
     --------------------------------------------------------------------
     # Test #
 
@@ -41,6 +41,8 @@ Usage: xmipp [options]
     git [command]                                                         Runs the given git action for all source repositories.
     addModel [login] [modelPath] [--update]                               Takes a DeepLearning model from the modelPath, makes a tgz of it and uploads the .tgz according to the <login>.
 
+Common options of all modes: [--trace]
+
 Example 1: ./xmipp
 Example 2: ./xmipp compileAndInstall -j 4
 {__NOTE_MESSAGE}""",
@@ -55,9 +57,9 @@ Usage: xmipp [options]
                                                                           number.
     compileAndInstall [-j] [--keep-output]                                Compiles and installs Xmipp based on
                                                                           already obtained sources.
-    all [-j] [-b] [--keep-output]                                         Default param. Runs config,
+    all [-j] [-b] [--clone-strategy] [--keep-output] [--resume] [--force] Default param. Runs config,
                                                                           configBuild, and compileAndInstall.
-    configBuild [--keep-output]                                           Configures the project with CMake.
+    configBuild [--keep-output] [--force]                                 Configures the project with CMake.
     --------------------------------------------------------------------
     # Config #
 
@@ -69,13 +71,13 @@ Usage: xmipp [options]
     getModels [-d]                                                        Downloads the Deep Learning Models
                                                                           required by the DLTK tools at
                                                                           dir/models (dist by default).
-    getSources [-b] [--keep-output]                                       Clones Xmipp\'s source repositories
+    getSources [-j] [-b] [--clone-strategy] [--keep-output]               Clones Xmipp\'s source repositories
                                                                           xmippCore & xmippViz.
     --------------------------------------------------------------------
     # Clean #
 
-    cleanBin                                                              Removes all compiled binaries.
-    cleanAll                                                              Removes all compiled binaries and
+    cleanBin [--dry-run] [--report]                                       Removes all compiled binaries.
+    cleanAll [--dry-run] [--report]                                       Removes all compiled binaries and
                                                                           sources, leaves the repository as if
                                                                           freshly cloned (without pulling).
     --------------------------------------------------------------------
@@ -92,6 +94,8 @@ Usage: xmipp [options]
                                                                           uploads the .tgz according to the
                                                                           <login>.
 
+Common options of all modes: [--trace]
+
 Example 1: ./xmipp
 Example 2: ./xmipp compileAndInstall -j 4
 {__NOTE_MESSAGE}"""
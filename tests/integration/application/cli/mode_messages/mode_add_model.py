@@ -24,6 +24,11 @@ Must have write permissions to such machine.
     login                                                                 Login (usr@server) for remote host to upload the model with. Must have write permissions to such machine.
     modelPath                                                             Path to the model to upload to remote host.
     --update                                                              Flag to update an existing model
+    --------------------------------------------------------------------
+    # Common options #
+
+    --trace                                                               File where a timeline of the run is written, in Chrome trace format (viewable in chrome://tracing or Perfetto). The
+                                                                          installation info is sent in the background after the run, so it is not part of the timeline.
 
 Example: ./xmipp addModel myuser@127.0.0.1 /home/myuser/mymodel
 """,
@@ -52,6 +57,15 @@ Must have write permissions to such machine.
     modelPath                                                             Path to the model to upload to remote
                                                                           host.
     --update                                                              Flag to update an existing model
+    --------------------------------------------------------------------
+    # Common options #
+
+    --trace                                                               File where a timeline of the run is
+                                                                          written, in Chrome trace format
+                                                                          (viewable in chrome://tracing or
+                                                                          Perfetto). The installation info is
+                                                                          sent in the background after the run,
+                                                                          so it is not part of the timeline.
 
 Example: ./xmipp addModel myuser@127.0.0.1 /home/myuser/mymodel
 """
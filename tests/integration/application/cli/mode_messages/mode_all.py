@@ -10,13 +10,25 @@ HELP_MESSAGE = {
 
     -j, --jobs                                                            Number of jobs. Defaults to all available.
     -b, --branch                                                          Branch for the source repositories.
+    --clone-strategy                                                      Clone strategy for the source repositories: full, shallow (only the target commit), or partial (file contents
+                                                                          downloaded on demand).
     --keep-output                                                         If set, output sent through the terminal won't substitute lines, looking more like the log.
+    --resume                                                              If set, the installation stages completed by the previous run are skipped, resuming from the first incomplete one.
+    --force                                                               If set, the project is configured with CMake even if nothing changed since the last successful configuration.
+    --------------------------------------------------------------------
+    # Common options #
+
+    --trace                                                               File where a timeline of the run is written, in Chrome trace format (viewable in chrome://tracing or Perfetto). The
+                                                                          installation info is sent in the background after the run, so it is not part of the timeline.
 
 Example 1: ./xmipp
 Example 2: ./xmipp all
 Example 3: ./xmipp -j 20
 Example 4: ./xmipp -b main
 Example 5: ./xmipp all -j 20 -b main
+Example 6: ./xmipp --clone-strategy shallow
+Example 7: ./xmipp --resume
+Example 8: ./xmipp --trace installation-trace.json
 """,
   terminal_sizes.SHORT_TERMINAL_WIDTH: f"""Default param. Runs config, configBuild, and compileAndInstall.
 
@@ -27,14 +39,38 @@ Example 5: ./xmipp all -j 20 -b main
     -j, --jobs                                                            Number of jobs. Defaults to all
                                                                           available.
     -b, --branch                                                          Branch for the source repositories.
+    --clone-strategy                                                      Clone strategy for the source
+                                                                          repositories: full, shallow (only the
+                                                                          target commit), or partial (file
+                                                                          contents downloaded on demand).
     --keep-output                                                         If set, output sent through the
                                                                           terminal won't substitute lines,
                                                                           looking more like the log.
+    --resume                                                              If set, the installation stages
+                                                                          completed by the previous run are
+                                                                          skipped, resuming from the first
+                                                                          incomplete one.
+    --force                                                               If set, the project is configured
+                                                                          with CMake even if nothing changed
+                                                                          since the last successful
+                                                                          configuration.
+    --------------------------------------------------------------------
+    # Common options #
+
+    --trace                                                               File where a timeline of the run is
+                                                                          written, in Chrome trace format
+                                                                          (viewable in chrome://tracing or
+                                                                          Perfetto). The installation info is
+                                                                          sent in the background after the run,
+                                                                          so it is not part of the timeline.
 
 Example 1: ./xmipp
 Example 2: ./xmipp all
 Example 3: ./xmipp -j 20
 Example 4: ./xmipp -b main
 Example 5: ./xmipp all -j 20 -b main
+Example 6: ./xmipp --clone-strategy shallow
+Example 7: ./xmipp --resume
+Example 8: ./xmipp --trace installation-trace.json
 """
 }
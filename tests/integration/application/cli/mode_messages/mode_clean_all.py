@@ -1,12 +1,47 @@
 from .. import terminal_sizes
+from . import NOTE_MESSAGE
 
 HELP_MESSAGE = {
-  terminal_sizes.LARGE_TERMINAL_WIDTH: """Removes all compiled binaries and sources, leaves the repository as if freshly cloned (without pulling).
+  terminal_sizes.LARGE_TERMINAL_WIDTH: f"""Removes all compiled binaries and sources, leaves the repository as if freshly cloned (without pulling).
 
-Usage: xmipp cleanAll
+{NOTE_MESSAGE}Usage: xmipp cleanAll [options]
+    --------------------------------------------------------------------
+    # Options #
+
+    --dry-run                                                             If set, the paths that would be deleted are listed with their sizes, but nothing is deleted.
+    --report                                                              File where the paths to delete and their sizes are written in JSON format.
+    --------------------------------------------------------------------
+    # Common options #
+
+    --trace                                                               File where a timeline of the run is written, in Chrome trace format (viewable in chrome://tracing or Perfetto). The
+                                                                          installation info is sent in the background after the run, so it is not part of the timeline.
+
+Example 1: ./xmipp cleanAll
+Example 2: ./xmipp cleanAll --dry-run
 """,
-  terminal_sizes.SHORT_TERMINAL_WIDTH: """Removes all compiled binaries and sources, leaves the repository as if freshly cloned (without pulling).
+  terminal_sizes.SHORT_TERMINAL_WIDTH: f"""Removes all compiled binaries and sources, leaves the repository as if freshly cloned (without pulling).
+
+{NOTE_MESSAGE}Usage: xmipp cleanAll [options]
+    --------------------------------------------------------------------
+    # Options #
+
+    --dry-run                                                             If set, the paths that would be
+                                                                          deleted are listed with their sizes,
+                                                                          but nothing is deleted.
+    --report                                                              File where the paths to delete and
+                                                                          their sizes are written in JSON
+                                                                          format.
+    --------------------------------------------------------------------
+    # Common options #
+
+    --trace                                                               File where a timeline of the run is
+                                                                          written, in Chrome trace format
+                                                                          (viewable in chrome://tracing or
+                                                                          Perfetto). The installation info is
+                                                                          sent in the background after the run,
+                                                                          so it is not part of the timeline.
 
-Usage: xmipp cleanAll
+Example 1: ./xmipp cleanAll
+Example 2: ./xmipp cleanAll --dry-run
 """
 }
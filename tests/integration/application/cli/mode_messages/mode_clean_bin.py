@@ -1,12 +1,49 @@
 from .. import terminal_sizes
+from . import NOTE_MESSAGE
 
 HELP_MESSAGE = {
-  terminal_sizes.LARGE_TERMINAL_WIDTH: """Removes all compiled binaries.
+  terminal_sizes.LARGE_TERMINAL_WIDTH: f"""Removes all compiled binaries.
 
-Usage: xmipp cleanBin
+{NOTE_MESSAGE}Usage: xmipp cleanBin [options]
+    --------------------------------------------------------------------
+    # Options #
+
+    --dry-run                                                             If set, the paths that would be deleted are listed with their sizes, but nothing is deleted.
+    --report                                                              File where the paths to delete and their sizes are written in JSON format.
+    --------------------------------------------------------------------
+    # Common options #
+
+    --trace                                                               File where a timeline of the run is written, in Chrome trace format (viewable in chrome://tracing or Perfetto). The
+                                                                          installation info is sent in the background after the run, so it is not part of the timeline.
+
+Example 1: ./xmipp cleanBin
+Example 2: ./xmipp cleanBin --dry-run
+Example 3: ./xmipp cleanBin --dry-run --report clean-report.json
 """,
-  terminal_sizes.SHORT_TERMINAL_WIDTH: """Removes all compiled binaries.
+  terminal_sizes.SHORT_TERMINAL_WIDTH: f"""Removes all compiled binaries.
+
+{NOTE_MESSAGE}Usage: xmipp cleanBin [options]
+    --------------------------------------------------------------------
+    # Options #
+
+    --dry-run                                                             If set, the paths that would be
+                                                                          deleted are listed with their sizes,
+                                                                          but nothing is deleted.
+    --report                                                              File where the paths to delete and
+                                                                          their sizes are written in JSON
+                                                                          format.
+    --------------------------------------------------------------------
+    # Common options #
+
+    --trace                                                               File where a timeline of the run is
+                                                                          written, in Chrome trace format
+                                                                          (viewable in chrome://tracing or
+                                                                          Perfetto). The installation info is
+                                                                          sent in the background after the run,
+                                                                          so it is not part of the timeline.
 
-Usage: xmipp cleanBin
+Example 1: ./xmipp cleanBin
+Example 2: ./xmipp cleanBin --dry-run
+Example 3: ./xmipp cleanBin --dry-run --report clean-report.json
 """
 }
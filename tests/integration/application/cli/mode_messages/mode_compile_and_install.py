@@ -10,6 +10,11 @@ HELP_MESSAGE = {
 
     -j, --jobs                                                            Number of jobs. Defaults to all available.
     --keep-output                                                         If set, output sent through the terminal won't substitute lines, looking more like the log.
+    --------------------------------------------------------------------
+    # Common options #
+
+    --trace                                                               File where a timeline of the run is written, in Chrome trace format (viewable in chrome://tracing or Perfetto). The
+                                                                          installation info is sent in the background after the run, so it is not part of the timeline.
 
 Example 1: ./xmipp compileAndInstall
 Example 2: ./xmipp compileAndInstall -j 20
@@ -25,6 +30,15 @@ Example 2: ./xmipp compileAndInstall -j 20
     --keep-output                                                         If set, output sent through the
                                                                           terminal won't substitute lines,
                                                                           looking more like the log.
+    --------------------------------------------------------------------
+    # Common options #
+
+    --trace                                                               File where a timeline of the run is
+                                                                          written, in Chrome trace format
+                                                                          (viewable in chrome://tracing or
+                                                                          Perfetto). The installation info is
+                                                                          sent in the background after the run,
+                                                                          so it is not part of the timeline.
 
 Example 1: ./xmipp compileAndInstall
 Example 2: ./xmipp compileAndInstall -j 20
@@ -9,6 +9,11 @@ HELP_MESSAGE = {
     # Options #
 
     -o, --overwrite                                                       If set, current config file will be overwritten with a new one.
+    --------------------------------------------------------------------
+    # Common options #
+
+    --trace                                                               File where a timeline of the run is written, in Chrome trace format (viewable in chrome://tracing or Perfetto). The
+                                                                          installation info is sent in the background after the run, so it is not part of the timeline.
 
 Example: ./xmipp config --overwrite
 """,
@@ -20,6 +25,15 @@ Example: ./xmipp config --overwrite
 
     -o, --overwrite                                                       If set, current config file will be
                                                                           overwritten with a new one.
+    --------------------------------------------------------------------
+    # Common options #
+
+    --trace                                                               File where a timeline of the run is
+                                                                          written, in Chrome trace format
+                                                                          (viewable in chrome://tracing or
+                                                                          Perfetto). The installation info is
+                                                                          sent in the background after the run,
+                                                                          so it is not part of the timeline.
 
 Example: ./xmipp config --overwrite
 """
@@ -9,6 +9,15 @@ HELP_MESSAGE = {
     # Options #
 
     --keep-output                                                         If set, output sent through the terminal won't substitute lines, looking more like the log.
+    --force                                                               If set, the project is configured with CMake even if nothing changed since the last successful configuration.
+    --------------------------------------------------------------------
+    # Common options #
+
+    --trace                                                               File where a timeline of the run is written, in Chrome trace format (viewable in chrome://tracing or Perfetto). The
+                                                                          installation info is sent in the background after the run, so it is not part of the timeline.
+
+Example 1: ./xmipp configBuild
+Example 2: ./xmipp configBuild --force
 """,
   terminal_sizes.SHORT_TERMINAL_WIDTH: f"""Configures the project with CMake.
 
@@ -19,5 +28,21 @@ HELP_MESSAGE = {
     --keep-output                                                         If set, output sent through the
                                                                           terminal won't substitute lines,
                                                                           looking more like the log.
+    --force                                                               If set, the project is configured
+                                                                          with CMake even if nothing changed
+                                                                          since the last successful
+                                                                          configuration.
+    --------------------------------------------------------------------
+    # Common options #
+
+    --trace                                                               File where a timeline of the run is
+                                                                          written, in Chrome trace format
+                                                                          (viewable in chrome://tracing or
+                                                                          Perfetto). The installation info is
+                                                                          sent in the background after the run,
+                                                                          so it is not part of the timeline.
+
+Example 1: ./xmipp configBuild
+Example 2: ./xmipp configBuild --force
 """
 }
@@ -10,6 +10,11 @@ Visit https://i2pc.github.io/docs/Installation/Optionals/index.html#deeplearning
     # Options #
 
     -d, --directory                                                       Directory where models will be saved. Default is "dist".
+    --------------------------------------------------------------------
+    # Common options #
+
+    --trace                                                               File where a timeline of the run is written, in Chrome trace format (viewable in chrome://tracing or Perfetto). The
+                                                                          installation info is sent in the background after the run, so it is not part of the timeline.
 
 Example 1: ./xmipp getModels
 Example 2: ./xmipp getModels -d /path/to/my/model/directory
@@ -23,6 +28,15 @@ Visit https://i2pc.github.io/docs/Installation/Optionals/index.html#deeplearning
 
     -d, --directory                                                       Directory where models will be saved.
                                                                           Default is "dist".
+    --------------------------------------------------------------------
+    # Common options #
+
+    --trace                                                               File where a timeline of the run is
+                                                                          written, in Chrome trace format
+                                                                          (viewable in chrome://tracing or
+                                                                          Perfetto). The installation info is
+                                                                          sent in the background after the run,
+                                                                          so it is not part of the timeline.
 
 Example 1: ./xmipp getModels
 Example 2: ./xmipp getModels -d /path/to/my/model/directory
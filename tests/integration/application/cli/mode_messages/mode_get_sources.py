@@ -8,11 +8,21 @@ HELP_MESSAGE = {
     --------------------------------------------------------------------
     # Options #
 
+    -j, --jobs                                                            Number of jobs. Defaults to all available.
     -b, --branch                                                          Branch for the source repositories.
+    --clone-strategy                                                      Clone strategy for the source repositories: full, shallow (only the target commit), or partial (file contents
+                                                                          downloaded on demand).
     --keep-output                                                         If set, output sent through the terminal won't substitute lines, looking more like the log.
+    --------------------------------------------------------------------
+    # Common options #
+
+    --trace                                                               File where a timeline of the run is written, in Chrome trace format (viewable in chrome://tracing or Perfetto). The
+                                                                          installation info is sent in the background after the run, so it is not part of the timeline.
 
 Example 1: ./xmipp getSources
 Example 2: ./xmipp getSources -b main
+Example 3: ./xmipp getSources -j 1
+Example 4: ./xmipp getSources --clone-strategy partial
 """,
   terminal_sizes.SHORT_TERMINAL_WIDTH: f"""Clones Xmipp\'s source repositories xmippCore & xmippViz.
 
@@ -20,12 +30,29 @@ Example 2: ./xmipp getSources -b main
     --------------------------------------------------------------------
     # Options #
 
+    -j, --jobs                                                            Number of jobs. Defaults to all
+                                                                          available.
     -b, --branch                                                          Branch for the source repositories.
+    --clone-strategy                                                      Clone strategy for the source
+                                                                          repositories: full, shallow (only the
+                                                                          target commit), or partial (file
+                                                                          contents downloaded on demand).
     --keep-output                                                         If set, output sent through the
                                                                           terminal won't substitute lines,
                                                                           looking more like the log.
+    --------------------------------------------------------------------
+    # Common options #
+
+    --trace                                                               File where a timeline of the run is
+                                                                          written, in Chrome trace format
+                                                                          (viewable in chrome://tracing or
+                                                                          Perfetto). The installation info is
+                                                                          sent in the background after the run,
+                                                                          so it is not part of the timeline.
 
 Example 1: ./xmipp getSources
 Example 2: ./xmipp getSources -b main
+Example 3: ./xmipp getSources -j 1
+Example 4: ./xmipp getSources --clone-strategy partial
 """
 }
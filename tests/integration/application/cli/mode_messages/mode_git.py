@@ -8,6 +8,11 @@ Usage: xmipp git [options]
     # Options #
 
     command                                                               Git command to run on all source repositories.
+    --------------------------------------------------------------------
+    # Common options #
+
+    --trace                                                               File where a timeline of the run is written, in Chrome trace format (viewable in chrome://tracing or Perfetto). The
+                                                                          installation info is sent in the background after the run, so it is not part of the timeline.
 
 Example 1: ./xmipp git pull
 Example 2: ./xmipp git checkout main
@@ -20,6 +25,15 @@ Usage: xmipp git [options]
 
     command                                                               Git command to run on all source
                                                                           repositories.
+    --------------------------------------------------------------------
+    # Common options #
+
+    --trace                                                               File where a timeline of the run is
+                                                                          written, in Chrome trace format
+                                                                          (viewable in chrome://tracing or
+                                                                          Perfetto). The installation info is
+                                                                          sent in the background after the run,
+                                                                          so it is not part of the timeline.
 
 Example 1: ./xmipp git pull
 Example 2: ./xmipp git checkout main
@@ -20,6 +20,11 @@ If used with '--all-programs', all program tests will run.
     --all-functions                                                       If set, all function tests will be run.
     ---------------
     --all-programs                                                        If set, all program tests will be run.
+    --------------------------------------------------------------------
+    # Common options #
+
+    --trace                                                               File where a timeline of the run is written, in Chrome trace format (viewable in chrome://tracing or Perfetto). The
+                                                                          installation info is sent in the background after the run, so it is not part of the timeline.
 
 Example 1: ./xmipp test xmipp_sample_test
 Example 2: ./xmipp test --show
@@ -47,6 +52,15 @@ If used with '--all-programs', all program tests will run.
     ---------------
     --all-programs                                                        If set, all program tests will be
                                                                           run.
+    --------------------------------------------------------------------
+    # Common options #
+
+    --trace                                                               File where a timeline of the run is
+                                                                          written, in Chrome trace format
+                                                                          (viewable in chrome://tracing or
+                                                                          Perfetto). The installation info is
+                                                                          sent in the background after the run,
+                                                                          so it is not part of the timeline.
 
 Example 1: ./xmipp test xmipp_sample_test
 Example 2: ./xmipp test --show
@@ -9,6 +9,11 @@ HELP_MESSAGE = {
     # Options #
 
     --short                                                               If set, only version number is shown.
+    --------------------------------------------------------------------
+    # Common options #
+
+    --trace                                                               File where a timeline of the run is written, in Chrome trace format (viewable in chrome://tracing or Perfetto). The
+                                                                          installation info is sent in the background after the run, so it is not part of the timeline.
 
 Example 1: ./xmipp version
 Example 2: ./xmipp version --short
@@ -20,6 +25,15 @@ Example 2: ./xmipp version --short
     # Options #
 
     --short                                                               If set, only version number is shown.
+    --------------------------------------------------------------------
+    # Common options #
+
+    --trace                                                               File where a timeline of the run is
+                                                                          written, in Chrome trace format
+                                                                          (viewable in chrome://tracing or
+                                                                          Perfetto). The installation info is
+                                                                          sent in the background after the run,
+                                                                          so it is not part of the timeline.
 
 Example 1: ./xmipp version
 Example 2: ./xmipp version --short
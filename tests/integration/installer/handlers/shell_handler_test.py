@@ -0,0 +1,68 @@
+import os
+import sys
+import time
+
+import pytest
+
+from xmipp3_installer.application.logger import errors
+from xmipp3_installer.installer.handlers import shell_handler
+
+from .... import get_assertion_message
+
+__OUTPUT_SIZE = 4 * 1024 * 1024
+__TAIL_SIZE = 16
+__TIMEOUT = 1
+__MAX_TIMEOUT_DURATION = 10
+
+def test_does_not_hang_when_command_fills_both_pipes():
+  ret_code, output = shell_handler.run_shell_command(
+    __get_python_command(
+      f"import sys; sys.stderr.write('e' * {__OUTPUT_SIZE}); sys.stdout.write('o' * {__OUTPUT_SIZE})"
+    ),
+    timeout=__MAX_TIMEOUT_DURATION
+  )
+  expected_output = 'o' * __OUTPUT_SIZE
+  assert (
+    (ret_code, output) == (0, expected_output)
+  ), get_assertion_message("return values", (0, "o" * 10 + "..."), (ret_code, output[:10] + "..."))
+
+@pytest.mark.parametrize(
+  "capture,expected_output",
+  [
+    pytest.param(shell_handler.CAPTURE_TAIL, 'e' * (__TAIL_SIZE - 3) + "end"),
+    pytest.param(shell_handler.CAPTURE_NONE, "")
+  ]
+)
+def test_keeps_expected_output_when_capturing_large_error_output(capture, expected_output):
+  ret_code, output = shell_handler.run_shell_command(
+    __get_python_command(
+      f"import sys; sys.stderr.write('e' * {__OUTPUT_SIZE} + 'end'); sys.exit(3)"
+    ),
+    capture=capture,
+    tail_size=__TAIL_SIZE
+  )
+  assert (
+    (ret_code, output) == (3, expected_output)
+  ), get_assertion_message("return values", (3, expected_output), (ret_code, output))
+
+def test_terminates_command_and_its_subprocesses_when_it_times_out(tmp_path):
+  marker_file = tmp_path / "marker"
+  start_time = time.time()
+  ret_code, _ = shell_handler.run_shell_command(
+    f"(sleep 3 && touch {marker_file}) & sleep 30",
+    timeout=__TIMEOUT
+  )
+  duration = time.time() - start_time
+  assert (
+    ret_code == errors.TIMEOUT_ERROR
+  ), get_assertion_message("return code", errors.TIMEOUT_ERROR, ret_code)
+  assert (
+    duration < __MAX_TIMEOUT_DURATION
+  ), get_assertion_message("duration", f"< {__MAX_TIMEOUT_DURATION}", duration)
+  time.sleep(3)
+  assert (
+    not os.path.exists(marker_file)
+  ), get_assertion_message("background subprocess finished", False, True)
+
+def __get_python_command(code: str) -> str:
+  return f'"{sys.executable}" -c "{code}"'
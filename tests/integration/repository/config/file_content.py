@@ -14,6 +14,10 @@ __TOGGLE_SECTION_LINES = [
   "XMIPP_LINK_TO_SCIPION=ON",
   "BUILD_TESTING=OFF",
   "CMAKE_SKIP_RPATH=ON",
+  "SOURCES_CACHE=OFF",
+  "OFFLINE=OFF",
+  "COMPILER_CACHE=ON",
+  "BUILD_JOBSERVER=OFF",
   ""
 ]
 
@@ -44,6 +48,19 @@ __COMPILATION_FLAGS_SECTION_LINES = [
   "CMAKE_C_FLAGS=-mtune=native",
   "CMAKE_CXX_FLAGS=-mtune=native",
   "BUILD_TYPE=Release",
+  "CMAKE_GENERATOR=",
+  ""
+]
+
+__INSTALLER_SECTION_LINES = [
+  "##### INSTALLER SECTION #####",
+  "# Use this variables to tune the behaviour of the installer itself.",
+  "SOURCES_CACHE_MAX_SIZE_MB=1024",
+  "SOURCES_CLONE_STRATEGY=full",
+  "REMOTE_REFS_CACHE_TTL_SECONDS=60",
+  "BUILD_JOB_MEMORY_MB=2048",
+  "INTERNET_CHECK_TARGETS=1.1.1.1:53",
+  "INTERNET_CHECK_CACHE_TTL_SECONDS=30",
   ""
 ]
 
@@ -55,7 +72,8 @@ UNKNOWN_VARIABLES_HEADER = [
 MANDATORY_SECTIONS_LINES = [
   *__TOGGLE_SECTION_LINES,
   *__PACKAGE_HOME_SECTION_LINES,
-  *__COMPILATION_FLAGS_SECTION_LINES
+  *__COMPILATION_FLAGS_SECTION_LINES,
+  *__INSTALLER_SECTION_LINES
 ]
 
 LAST_MODIFIED_LINE = f"# {ConfigurationFileHandler._LAST_MODIFIED_TEXT} {DATE}"
@@ -1,12 +1,15 @@
 import http.client
 import json
-from unittest.mock import patch
+from unittest.mock import MagicMock, call, patch
 from urllib.parse import urlparse
 
 import pytest
 
 from xmipp3_installer.api_client import api_client
 from xmipp3_installer.installer import urls
+from xmipp3_installer.repository.config_vars import default_values, variables
+
+from ... import get_assertion_message
 
 __API_URL = "https://hostname/path"
 __PARSED_URL = urlparse(__API_URL)
@@ -63,21 +66,145 @@ def test_calls_connection_close_when_sending_installation_attempt(
 	api_client.send_installation_attempt({})
 	__mock_httpsconnection().close.assert_called_once_with()
 
-def test_internet_available_true(__mock_socket_available):
-	_, set_timeout, instance = __mock_socket_available
+@pytest.mark.parametrize(
+	"__mock_httpsconnection,expected_sent",
+	[
+		pytest.param([200], True),
+		pytest.param([201], True),
+		pytest.param([400], False),
+		pytest.param([429], False),
+		pytest.param([503], False),
+		pytest.param([http.client.RemoteDisconnected()], False),
+		pytest.param([ConnectionResetError()], False)
+	],
+	indirect=["__mock_httpsconnection"]
+)
+def test_returns_if_installation_attempt_was_received(
+	__mock_httpsconnection,
+	expected_sent
+):
+	sent = api_client.send_installation_attempt({})
+	assert (
+		sent == expected_sent
+	), get_assertion_message("attempt received", expected_sent, sent)
 
-	assert api_client.internet_available() is True
-	set_timeout.assert_called_once_with(api_client.INTERNET_CHECK_TIMEOUT)
-	instance.connect.assert_called_once_with((api_client.INTERNET_CHECK_IP, api_client.INTERNET_CHECK_PORT))
+def test_sends_each_attempt_through_one_connection(
+	__mock_httpsconnection
+):
+	installation_infos = [{"var1": "value1"}, {"var2": "value2"}, {"var3": "value3"}]
+	__mock_httpsconnection.return_value.getresponse.side_effect = [
+		MagicMock(status=200) for _ in installation_infos
+	]
+	api_client.send_installation_attempts(installation_infos)
+	n_connections = __mock_httpsconnection.call_count
+	requests = __mock_httpsconnection.return_value.request.call_args_list
+	expected_requests = [
+		call(
+			"POST",
+			__PARSED_URL.path,
+			body=json.dumps(installation_info),
+			headers={"Content-type": "application/json"}
+		)
+		for installation_info in installation_infos
+	]
+	assert (
+		n_connections == 1 and requests == expected_requests
+	), get_assertion_message("sent requests", expected_requests, requests)
+
+@pytest.mark.parametrize(
+	"__mock_httpsconnection,expected_result",
+	[
+		pytest.param([200, 200], (2, 2)),
+		pytest.param([200, 400], (2, 1)),
+		pytest.param([400, 200], (2, 1)),
+		pytest.param([404, 422], (2, 0)),
+		pytest.param([503, 200, 200], (2, 2)),
+		pytest.param([ConnectionResetError(), 200, 200], (2, 2)),
+		pytest.param([200, 503, 503, 503], (1, 1)),
+		pytest.param([429, 429, 429], (0, 0)),
+		pytest.param([301], (0, 0))
+	],
+	indirect=["__mock_httpsconnection"]
+)
+def test_returns_number_of_done_and_accepted_attempts_when_sending_several_attempts(
+	__mock_httpsconnection,
+	__mock_sleep,
+	expected_result
+):
+	result = api_client.send_installation_attempts([{}, {}])
+	assert (
+		result == expected_result
+	), get_assertion_message("done and accepted attempts", expected_result, result)
 
-def test_internet_available_false(__mock_socket_unavailable):
-	assert api_client.internet_available() is False
+def test_does_not_retry_rejected_attempt_when_sending_several_attempts(
+	__mock_httpsconnection,
+	__mock_sleep
+):
+	__mock_httpsconnection.return_value.getresponse.side_effect = [MagicMock(status=400)]
+	api_client.send_installation_attempts([{}])
+	n_requests = __mock_httpsconnection.return_value.request.call_count
+	assert (
+		n_requests == 1
+	), get_assertion_message("number of requests", 1, n_requests)
+
+def test_waits_longer_before_each_retry_when_sending_several_attempts(
+	__mock_httpsconnection,
+	__mock_sleep
+):
+	__mock_httpsconnection.return_value.getresponse.side_effect = [
+		MagicMock(status=503), MagicMock(status=503), MagicMock(status=503)
+	]
+	api_client.send_installation_attempts([{}])
+	__mock_sleep.assert_has_calls([call(2), call(4)])
+
+def test_closes_connection_after_failed_request_when_sending_several_attempts(
+	__mock_httpsconnection,
+	__mock_sleep
+):
+	__mock_httpsconnection.return_value.getresponse.side_effect = [
+		ConnectionResetError(), MagicMock(status=200)
+	]
+	api_client.send_installation_attempts([{}])
+	n_closes = __mock_httpsconnection().close.call_count
+	expected_closes = 2 # After the failed request, and at the end
+	assert (
+		n_closes == expected_closes
+	), get_assertion_message("connection closes", expected_closes, n_closes)
+
+def test_probes_default_targets_with_default_cache_when_checking_internet(__mock_is_connected):
+	api_client.internet_available()
+	__mock_is_connected.assert_called_once_with(
+		[("1.1.1.1", 53)],
+		cache_ttl=int(default_values.CONFIG_DEFAULT_VALUES[variables.INTERNET_CHECK_CACHE_TTL])
+	)
+
+@pytest.mark.parametrize(
+	"__mock_is_connected",
+	[pytest.param(False), pytest.param(True)],
+	indirect=["__mock_is_connected"]
+)
+def test_returns_probe_result_when_checking_internet(__mock_is_connected):
+	available = api_client.internet_available()
+	expected_available = __mock_is_connected()
+	assert (
+		available == expected_available
+	), get_assertion_message("internet available", expected_available, available)
 
 @pytest.fixture
-def __mock_httpsconnection(__mock_api_url):
+def __mock_httpsconnection(__mock_api_url, request):
 	with patch.object(http.client, "HTTPSConnection") as mock_object:
+		statuses = getattr(request, "param", [200])
+		mock_object.return_value.getresponse.side_effect = [
+			status if isinstance(status, Exception) else MagicMock(status=status)
+			for status in statuses
+		]
 		yield mock_object
 
+@pytest.fixture
+def __mock_sleep():
+	with patch("time.sleep") as mock_method:
+		yield mock_method
+
 @pytest.fixture
 def __mock_api_url():
 	with patch.object(urls, "API_URL", __API_URL):
@@ -105,17 +232,9 @@ def __mock_logger_yellow():
 		yield mock_method
 
 @pytest.fixture
-def __mock_socket_available():
-	with patch("xmipp3_installer.api_client.api_client.socket.socket") as mock_socket, \
-			patch("xmipp3_installer.api_client.api_client.socket.setdefaulttimeout") as set_timeout:
-		instance = mock_socket.return_value.__enter__.return_value
-		instance.connect.return_value = None
-		yield mock_socket, set_timeout, instance
-
-
-@pytest.fixture
-def __mock_socket_unavailable():
-	with patch("xmipp3_installer.api_client.api_client.socket.socket") as mock_socket:
-		instance = mock_socket.return_value.__enter__.return_value
-		instance.connect.side_effect = OSError()
-		yield mock_socket
+def __mock_is_connected(request):
+	with patch(
+		"xmipp3_installer.api_client.connectivity_probe.is_connected"
+	) as mock_method:
+		mock_method.return_value = getattr(request, "param", True)
+		yield mock_method
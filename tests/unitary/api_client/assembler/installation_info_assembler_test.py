@@ -1,4 +1,4 @@
-from unittest.mock import patch, Mock, call
+from unittest.mock import patch, Mock
 
 import pytest
 
@@ -13,29 +13,6 @@ from .... import get_assertion_message
 __LINES = ["line1\n", "line2\n", "line3\n", "line4\n"]
 __LOG_TAIL = ''.join(__LINES)
 __ETH_MAC_ADDRESS = "00:08:9b:c4:30:31"
-__IP_ADDR_LINES = [
-  "1: Lo: <LOOPBACK, UP, LOWER_UP> mtu 16436 qdisc noqueue state UNKNOWN",
-  "\tlink/loopback 00:00:00:00:00:00 brd 00:00:00:00:00:00",
-  "\tinet 127.0.0.1/8 scope host lo",
-  "\tinet6 ::1/128 scope host",
-  "\t\tvalid_lft forever preferred_lft forever",
-  "2: eth0: <BROADCAST, MULTICAST> mtu 1500 qdisc noop state DOWN qlen 1000",
-  f"\tlink/ether {__ETH_MAC_ADDRESS} brd ff:ff:ff:ff:ff:ff",
-  "3: eth1: <BROADCAST, MULTICAST,UP,LOWER_UP> mtu 1500 qdisc pfifo_fast state UP qlen 1000",
-  "\tlink/ether 00:08:9b:c4:30:30 brd ff:ff:ff:ff:ff:ff",
-  "\tinet 192.168.1.10/24 brd 192.168.1.255 scope global eth1",
-  "\tineto fe80::208:9bff:fec4:3030/64 scope link",
-  "\t\tvalid_lft forever preferred_lft forever",
-  "4: enp0: <BROADCAST, MULTICAST> mtu 1500 qdisc noop state DOWN qlen 1000",
-  f"\tlink/ether {__ETH_MAC_ADDRESS} brd ff:ff:ff:ff:ff:ff",
-  "5: wlp0: <BROADCAST, MULTICAST> mtu 1500 qdisc noop state DOWN qlen 1000",
-  f"\tlink/ether {__ETH_MAC_ADDRESS} brd ff:ff:ff:ff:ff:ff",
-  "5: ens0: <BROADCAST, MULTICAST> mtu 1500 qdisc noop state DOWN qlen 1000",
-  f"\tlink/ether {__ETH_MAC_ADDRESS} brd ff:ff:ff:ff:ff:ff",
-  "5: eno0: <BROADCAST, MULTICAST> mtu 1500 qdisc noop state DOWN qlen 1000",
-  f"\tlink/ether {__ETH_MAC_ADDRESS} brd ff:ff:ff:ff:ff:ff"
-]
-__IP_ADDR_TEXT = '\n'.join(__IP_ADDR_LINES)
 __USER_ID = "test-user-id"
 __PLATFORM_SYSTEM_WINDOWS = "Windows"
 __PLATFORM_RELEASE_WINDOWS = "10"
@@ -58,20 +35,15 @@ __LIBRARY_VERSIONS = {
   cmake_constants.CMAKE_HDF5: "1.2.3",
   cmake_constants.CMAKE_JPEG: "3.2.1"
 }
-__ENVIROMENT_INFO = [
-  ["flag1", "flag2"],
-  "main",
-  True,
-  False,
-  __LOG_TAIL
-]
+__CPU_FLAGS = ["flag1", "flag2"]
+__GIT_INFO = ["main", True]
 __INSTALLATION_INFO = {
   "user": {
     "userId": __USER_ID
   },
   "version": {
     "os": __RELEASE_NAME_LINUX,
-    "cpuFlags": __ENVIROMENT_INFO[0],
+    "cpuFlags": __CPU_FLAGS,
     "cuda": __LIBRARY_VERSIONS.get(cmake_constants.CMAKE_CUDA),
     "cmake": __LIBRARY_VERSIONS.get(cmake_constants.CMAKE_CMAKE),
     "gcc": __LIBRARY_VERSIONS.get(cmake_constants.CMAKE_GCC),
@@ -84,12 +56,12 @@ __INSTALLATION_INFO = {
     "jpeg": __LIBRARY_VERSIONS.get(cmake_constants.CMAKE_JPEG)
   },
   "xmipp": {
-    "branch": __ENVIROMENT_INFO[1],
-    "updated": __ENVIROMENT_INFO[2],
-    "installedByScipion": __ENVIROMENT_INFO[3]
+    "branch": __GIT_INFO[0],
+    "updated": __GIT_INFO[1],
+    "installedByScipion": False
   },
   "returnCode": 0,
-  "logTail": __ENVIROMENT_INFO[4]
+  "logTail": __LOG_TAIL
 }
 __EMPTY_INSTALLATION_INFO = {
   "user": {
@@ -97,7 +69,7 @@ __EMPTY_INSTALLATION_INFO = {
   },
   "version": {
     "os": __RELEASE_NAME_LINUX,
-    "cpuFlags": None,
+    "cpuFlags": __CPU_FLAGS,
     "cuda": None,
     "cmake": None,
     "gcc": None,
@@ -112,7 +84,7 @@ __EMPTY_INSTALLATION_INFO = {
   "xmipp": {
     "branch": __XMIPP_VERSION_NAME,
     "updated": None,
-    "installedByScipion": None
+    "installedByScipion": False
   },
   "returnCode": 0,
   "logTail": None
@@ -120,28 +92,6 @@ __EMPTY_INSTALLATION_INFO = {
 __DEFAULT_USER_ID = "Anonymous"
 __USERNAME = "username"
 
-def test_calls_run_shell_command_when_getting_cpu_flags(__mock_run_shell_command):
-  installation_info_assembler.__get_cpu_flags()
-  __mock_run_shell_command.assert_called_once_with('lscpu | grep "Flags:"')
-
-@pytest.mark.parametrize(
-  "__mock_run_shell_command,expected_cpu_flags",
-  [
-    pytest.param((0, ""), []),
-    pytest.param((1, "flag1 flag2"), []),
-    pytest.param((0, "flag1 flag2"), ["flag1", "flag2"])
-  ],
-  indirect=["__mock_run_shell_command"]
-)
-def test_returns_expected_cpu_flags(
-  __mock_run_shell_command,
-  expected_cpu_flags
-):
-  architecture_name = installation_info_assembler.__get_cpu_flags()
-  assert (
-    architecture_name == expected_cpu_flags
-  ), get_assertion_message("architecture name", expected_cpu_flags, architecture_name)
-
 def test_calls_os_getenv_when_checking_if_is_installed_by_scipion(__mock_os_getenv):
   installation_info_assembler.__is_installed_by_scipion()
   __mock_os_getenv.assert_called_once_with("SCIPION_SOFTWARE")
@@ -164,120 +114,28 @@ def test_returns_expected_is_installed_by_scipion(
     is_installed == expected_is_installed
   ), get_assertion_message("\"is installed by Scipion\" value", expected_is_installed, is_installed)
 
-def test_calls_run_shell_command_when_getting_log_tail(__mock_run_shell_command):
+def test_calls_read_tail_when_getting_log_tail(__mock_read_tail):
   installation_info_assembler.__get_log_tail()
-  __mock_run_shell_command.assert_called_once_with(
-    f"tail -n {constants.TAIL_LOG_NCHARS} {paths.LOG_FILE}"
-  )
+  __mock_read_tail.assert_called_once_with(paths.LOG_FILE, constants.TAIL_LOG_NCHARS)
 
 @pytest.mark.parametrize(
-  "ret_code,n_chars,expected_log_tail",
+  "__mock_read_tail,expected_log_tail",
   [
-    pytest.param(1, 10, None),
-    pytest.param(0, 10, __LOG_TAIL[:10]),
-    pytest.param(0, 0, ""),
+    pytest.param(None, None),
+    pytest.param("", ""),
+    pytest.param(__LOG_TAIL, __LOG_TAIL)
   ],
+  indirect=["__mock_read_tail"]
 )
 def test_returns_expected_log_tail(
-  ret_code,
-  n_chars,
-  expected_log_tail,
-  __mock_run_shell_command
+  __mock_read_tail,
+  expected_log_tail
 ):
-  mocked_log_tail = ''.join([__LOG_TAIL[letter_index] for letter_index in range(n_chars)])
-  __mock_run_shell_command.return_value = (ret_code, mocked_log_tail)
   log_tail = installation_info_assembler.__get_log_tail()
   assert (
     log_tail == expected_log_tail
   ), get_assertion_message("log tail", expected_log_tail, log_tail)
 
-def test_does_not_call_re_match_when_finding_mac_address_in_lines_with_no_lines(__mock_re_match):
-  installation_info_assembler.__find_mac_address_in_lines([])
-  __mock_re_match.assert_not_called()
-
-def test_calls_re_match_when_finding_mac_address_in_lines_with_valid_lines(__mock_re_match):
-  __mock_re_match.return_value = None
-  installation_info_assembler.__find_mac_address_in_lines(__LINES)
-  __mock_re_match.assert_has_calls([
-    call(
-      r"^\d+: (enp|wlp|eth|ens|eno)\w+",
-      line
-    ) for line in __LINES[:-1]
-  ])
-
-def test_calls_re_search_when_finding_mac_address_in_lines(__mock_re_match, __mock_re_search):
-  __mock_re_match.return_value = __mock_re_groups("enp")
-  __mock_re_search.return_value = None
-  installation_info_assembler.__find_mac_address_in_lines(__LINES[:2])
-  __mock_re_search.assert_called_once_with(r"link/ether ([0-9a-f:]{17})", __LINES[1])
-
-def test_calls_re_search_group_when_finding_mac_address_in_lines(__mock_re_match, __mock_re_search):
-  __mock_re_match.return_value = __mock_re_groups("enp")
-  installation_info_assembler.__find_mac_address_in_lines(__LINES[:2])
-  __mock_re_search().group.assert_called_once_with(1)
-
-@pytest.mark.parametrize(
-  "input_lines,expected_mac_address",
-  [
-    pytest.param([], None),
-    pytest.param([""], None),
-    pytest.param(["something"], None),
-    pytest.param([__IP_ADDR_LINES[5]], None),
-    pytest.param(__IP_ADDR_LINES[0:2], None),
-    pytest.param(__IP_ADDR_LINES[5:7], __ETH_MAC_ADDRESS),
-    pytest.param(__IP_ADDR_LINES[12:14], __ETH_MAC_ADDRESS),
-    pytest.param(__IP_ADDR_LINES[14:16], __ETH_MAC_ADDRESS),
-    pytest.param(__IP_ADDR_LINES[16:18], __ETH_MAC_ADDRESS),
-    pytest.param(__IP_ADDR_LINES[18:], __ETH_MAC_ADDRESS),
-    pytest.param(__IP_ADDR_LINES, __ETH_MAC_ADDRESS)
-  ]
-)
-def test_returns_expected_result_when_finding_mac_address_in_lines(
-  input_lines,
-  expected_mac_address
-):
-  mac_address = installation_info_assembler.__find_mac_address_in_lines(input_lines)
-  assert (
-    mac_address == expected_mac_address
-  ), get_assertion_message("MAC address", expected_mac_address, mac_address)
-
-def test_calls_run_shell_command_when_getting_mac_address(__mock_run_shell_command):
-  __mock_run_shell_command.return_value = (1, "")
-  installation_info_assembler.__get_mac_address()
-  __mock_run_shell_command.assert_called_once_with("ip addr")
-
-@pytest.mark.parametrize(
-  "output",
-  [pytest.param(""), pytest.param("Test"), pytest.param("Test\n2")]
-)
-def test_calls_find_mac_address_in_lines_when_getting_mac_address(
-  output,
-  __mock_run_shell_command,
-  __mock_find_mac_address_in_lines
-):
-  __mock_run_shell_command.return_value = (0, output)
-  installation_info_assembler.__get_mac_address()
-  __mock_find_mac_address_in_lines.assert_called_once_with(output.split("\n"))
-
-@pytest.mark.parametrize(
-  "__mock_run_shell_command,expected_mac_address",
-  [
-    pytest.param((1, ""), None),
-    pytest.param((1, __IP_ADDR_TEXT), None),
-    pytest.param((0, ""), None),
-    pytest.param((0, __IP_ADDR_TEXT), "00:08:9b:c4:30:31")
-  ],
-  indirect=["__mock_run_shell_command"]
-)
-def test_returns_expected_mac_address_when_getting_mac_address(
-  __mock_run_shell_command,
-  expected_mac_address
-):
-  mac_address = installation_info_assembler.__get_mac_address()
-  assert (
-    mac_address == expected_mac_address
-  ), get_assertion_message("MAC address", expected_mac_address, mac_address)
-
 def test_calls_get_mac_address_when_getting_user_id(
   __mock_get_mac_address,
   __mock_getuser
@@ -448,26 +306,46 @@ def test_calls_run_parallel_jobs_when_getting_installation_info(
 ):
   installation_info_assembler.get_installation_info(__get_version_manager())
   __mock_run_parallel_jobs.assert_called_once_with(
+    [git_handler.get_current_branch, git_handler.is_branch_up_to_date],
     [
-      installation_info_assembler.__get_cpu_flags,
-      git_handler.get_current_branch,
-      git_handler.is_branch_up_to_date,
-      installation_info_assembler.__is_installed_by_scipion,
-      installation_info_assembler.__get_log_tail
+      (),
+      (
+        "./",
+        installation_info_assembler.__BRANCH_FRESHNESS_CACHE_TTL,
+        installation_info_assembler.__BRANCH_FRESHNESS_TIMEOUT
+      )
     ],
-    [(), (), (), (), ()]
+    timeout=installation_info_assembler.__ENVIRONMENT_INFO_TIMEOUT
   )
 
+@pytest.mark.parametrize(
+  "ret_code,expected_called",
+  [pytest.param(0, False), pytest.param(1, True)]
+)
+def test_reads_log_tail_only_when_installation_failed(
+  ret_code,
+  expected_called,
+  __mock_get_user_id,
+  __mock_get_library_versions_from_cmake_file,
+  __mock_run_parallel_jobs,
+  __mock_get_log_tail
+):
+  installation_info_assembler.get_installation_info(__get_version_manager(), ret_code=ret_code)
+  called = __mock_get_log_tail.called
+  assert (
+    called == expected_called
+  ), get_assertion_message("log tail read", expected_called, called)
+
 @pytest.mark.parametrize(
   "ret_code,"
   "__mock_get_library_versions_from_cmake_file,"
   "__mock_run_parallel_jobs,"
   "expected_info",
   [
-    pytest.param(0, {}, [None for _ in range(5)], __EMPTY_INSTALLATION_INFO),
-    pytest.param(1, {}, [None for _ in range(5)], {**__EMPTY_INSTALLATION_INFO, "returnCode": 1}),
-    pytest.param(0, __LIBRARY_VERSIONS, __ENVIROMENT_INFO, {**__INSTALLATION_INFO, "logTail": None}),
-    pytest.param(1, __LIBRARY_VERSIONS, __ENVIROMENT_INFO, {**__INSTALLATION_INFO, "returnCode": 1})
+    pytest.param(0, {}, [None, None], __EMPTY_INSTALLATION_INFO),
+    pytest.param(1, {}, [None, None], {**__EMPTY_INSTALLATION_INFO, "returnCode": 1, "logTail": __LOG_TAIL}),
+    pytest.param(0, __LIBRARY_VERSIONS, __GIT_INFO, {**__INSTALLATION_INFO, "logTail": None}),
+    pytest.param(1, __LIBRARY_VERSIONS, __GIT_INFO, {**__INSTALLATION_INFO, "returnCode": 1})
   ],
   indirect=[
     "__mock_get_library_versions_from_cmake_file",
@@ -480,7 +358,10 @@ def test_returns_expected_installation_info(
   __mock_get_library_versions_from_cmake_file,
   __mock_run_parallel_jobs,
   expected_info,
-  __mock_get_os_release_name
+  __mock_get_os_release_name,
+  __mock_get_cpu_flags,
+  __mock_get_log_tail,
+  __mock_os_getenv
 ):
   installation_info = installation_info_assembler.get_installation_info(
     __get_version_manager(),
@@ -500,41 +381,33 @@ def __get_version_manager():
   return DummyVersionManager()
 
 @pytest.fixture
-def __mock_run_shell_command(request):
+def __mock_read_tail(request):
   with patch(
-    "xmipp3_installer.installer.handlers.shell_handler.run_shell_command"
+    "xmipp3_installer.shared.file_operations.read_tail"
   ) as mock_method:
-    mock_method.return_value = getattr(request, 'param', (0, ""))
+    mock_method.return_value = getattr(request, 'param', __LOG_TAIL)
     yield mock_method
 
-def __mock_re_groups(group_value):
-  groups = Mock()
-  groups.group.side_effect = lambda _: group_value
-  return groups
-
 @pytest.fixture
-def __mock_re_match(request):
-  with patch("re.match") as mock_method:
-    mock_method.return_value = __mock_re_groups(getattr(request, 'param', ""))
-    yield mock_method
-
-@pytest.fixture
-def __mock_re_search(request):
-  with patch("re.search") as mock_method:
-    mock_method.return_value = __mock_re_groups(getattr(request, 'param', [""]))
+def __mock_get_log_tail():
+  with patch(
+    "xmipp3_installer.api_client.assembler.installation_info_assembler.__get_log_tail"
+  ) as mock_method:
+    mock_method.return_value = __LOG_TAIL
     yield mock_method
 
 @pytest.fixture
-def __mock_find_mac_address_in_lines():
+def __mock_get_cpu_flags():
   with patch(
-    "xmipp3_installer.api_client.assembler.installation_info_assembler.__find_mac_address_in_lines"
+    "xmipp3_installer.installer.handlers.system_info_handler.get_cpu_flags"
   ) as mock_method:
+    mock_method.return_value = __CPU_FLAGS
     yield mock_method
 
 @pytest.fixture
 def __mock_get_mac_address(request):
   with patch(
-    "xmipp3_installer.api_client.assembler.installation_info_assembler.__get_mac_address"
+    "xmipp3_installer.installer.handlers.system_info_handler.get_mac_address"
   ) as mock_method:
     mock_method.return_value = getattr(request, 'param', __ETH_MAC_ADDRESS)
     yield mock_method
@@ -569,7 +442,7 @@ def __mock_run_parallel_jobs(request):
   with patch(
     "xmipp3_installer.installer.orquestrator.run_parallel_jobs"
   ) as mock_method:
-    mock_method.side_effect = [getattr(request, 'param', __ENVIROMENT_INFO)]
+    mock_method.side_effect = [getattr(request, 'param', __GIT_INFO)]
     yield mock_method
 
 @pytest.fixture
@@ -0,0 +1,184 @@
+import socket
+import time
+from unittest.mock import patch
+
+import pytest
+
+from xmipp3_installer.api_client import connectivity_probe
+from xmipp3_installer.installer.constants import paths
+
+from ... import get_assertion_message
+
+__DEFAULT_TARGETS = "1.1.1.1:53"
+__TARGETS = [("1.1.1.1", 53), ("mirror.local", 443)]
+__CACHE_KEY = "1.1.1.1:53,mirror.local:443"
+__CACHE_TTL = 30
+__TIMEOUT = 0.5
+__ADDRESSES = {
+  ("1.1.1.1", 53): [("1.1.1.1", 53)],
+  ("mirror.local", 443): [("10.0.0.1", 443), ("10.0.0.2", 443)]
+}
+
+@pytest.mark.parametrize(
+  "value,expected_targets",
+  [
+    pytest.param(None, [("1.1.1.1", 53)]),
+    pytest.param("", [("1.1.1.1", 53)]),
+    pytest.param("no-port other:port", [("1.1.1.1", 53)]),
+    pytest.param("proxy:3128", [("proxy", 3128)]),
+    pytest.param("proxy:3128, mirror.local:443", [("proxy", 3128), ("mirror.local", 443)]),
+    pytest.param("[::1]:53 proxy:0 proxy:70000", [("::1", 53)])
+  ]
+)
+def test_returns_expected_targets_when_parsing_targets(value, expected_targets):
+  targets = connectivity_probe.parse_targets(value, __DEFAULT_TARGETS)
+  assert (
+    targets == expected_targets
+  ), get_assertion_message("probe targets", expected_targets, targets)
+
+def test_returns_false_without_probing_when_there_are_no_targets(__mock_create_connection):
+  connected = connectivity_probe.is_connected([])
+  __mock_create_connection.assert_not_called()
+  assert (
+    connected is False
+  ), get_assertion_message("connected", False, connected)
+
+def test_probes_every_resolved_address(__mock_create_connection, __mock_getaddrinfo):
+  __mock_create_connection.side_effect = OSError()
+  connectivity_probe.is_connected(__TARGETS, timeout=__TIMEOUT)
+  addresses = sorted(call_args.args[0] for call_args in __mock_create_connection.call_args_list)
+  expected_addresses = sorted(address for target in __TARGETS for address in __ADDRESSES[target])
+  assert (
+    addresses == expected_addresses
+  ), get_assertion_message("probed addresses", expected_addresses, addresses)
+
+def test_connects_within_target_timeout(__mock_create_connection, __mock_getaddrinfo):
+  __mock_create_connection.side_effect = OSError()
+  connectivity_probe.is_connected(__TARGETS, timeout=__TIMEOUT)
+  timeouts = [call_args.kwargs["timeout"] for call_args in __mock_create_connection.call_args_list]
+  assert (
+    all(0 < timeout <= __TIMEOUT for timeout in timeouts)
+  ), get_assertion_message("connection timeouts", f"<= {__TIMEOUT}", timeouts)
+
+def test_returns_false_without_connecting_if_resolving_takes_longer_than_timeout(
+  __mock_create_connection,
+  __mock_getaddrinfo
+):
+  def __slow_getaddrinfo(*args, **kwargs):
+    time.sleep(__TIMEOUT)
+    return []
+  __mock_getaddrinfo.side_effect = __slow_getaddrinfo
+  start = time.monotonic()
+  connected = connectivity_probe.is_connected(__TARGETS, timeout=__TIMEOUT / 5)
+  elapsed = time.monotonic() - start
+  __mock_create_connection.assert_not_called()
+  assert (
+    connected is False and elapsed < __TIMEOUT
+  ), get_assertion_message("connected and within timeout", (False, True), (connected, elapsed < __TIMEOUT))
+
+def test_returns_false_without_connecting_if_target_cannot_be_resolved(
+  __mock_create_connection,
+  __mock_getaddrinfo
+):
+  __mock_getaddrinfo.side_effect = socket.gaierror()
+  connected = connectivity_probe.is_connected(__TARGETS)
+  __mock_create_connection.assert_not_called()
+  assert (
+    connected is False
+  ), get_assertion_message("connected", False, connected)
+
+@pytest.mark.parametrize(
+  "side_effect,expected_connected",
+  [
+    pytest.param([OSError(), OSError()], False),
+    pytest.param([OSError(), None], True),
+    pytest.param([None, None], True)
+  ]
+)
+def test_returns_expected_value_when_checking_connection(
+  __mock_create_connection,
+  __mock_getaddrinfo,
+  side_effect,
+  expected_connected
+):
+  results = {address: result for target, result in zip(__TARGETS, side_effect) for address in __ADDRESSES[target]}
+  def __connect(address, timeout):
+    if isinstance(results[address], Exception):
+      raise results[address]
+    return __mock_create_connection.return_value
+  __mock_create_connection.side_effect = __connect
+  connected = connectivity_probe.is_connected(__TARGETS)
+  assert (
+    connected == expected_connected
+  ), get_assertion_message("connected", expected_connected, connected)
+
+@pytest.mark.parametrize(
+  "__mock_get_cached_value",
+  [pytest.param(False), pytest.param(True)],
+  indirect=["__mock_get_cached_value"]
+)
+def test_returns_cached_result_without_probing(
+  __mock_create_connection,
+  __mock_get_cached_value,
+  __mock_connectivity_cache_file
+):
+  connected = connectivity_probe.is_connected(__TARGETS, cache_ttl=__CACHE_TTL)
+  __mock_get_cached_value.assert_called_once_with(__mock_connectivity_cache_file, __CACHE_KEY, __CACHE_TTL)
+  __mock_create_connection.assert_not_called()
+  expected_connected = __mock_get_cached_value()
+  assert (
+    connected == expected_connected
+  ), get_assertion_message("connected", expected_connected, connected)
+
+@pytest.mark.parametrize(
+  "cache_ttl,expected_stored",
+  [pytest.param(0, False), pytest.param(__CACHE_TTL, True)]
+)
+def test_stores_result_in_disk_cache_only_if_enabled(
+  cache_ttl,
+  expected_stored,
+  __mock_create_connection,
+  __mock_getaddrinfo,
+  __mock_get_cached_value,
+  __mock_set_cached_value,
+  __mock_connectivity_cache_file
+):
+  connectivity_probe.is_connected(__TARGETS, cache_ttl=cache_ttl)
+  if expected_stored:
+    __mock_set_cached_value.assert_called_once_with(__mock_connectivity_cache_file, __CACHE_KEY, True)
+  else:
+    __mock_set_cached_value.assert_not_called()
+
+@pytest.fixture
+def __mock_create_connection():
+  with patch("socket.create_connection") as mock_method:
+    yield mock_method
+
+@pytest.fixture
+def __mock_getaddrinfo():
+  with patch("socket.getaddrinfo") as mock_method:
+    mock_method.side_effect = lambda host, port, type: [
+      (socket.AF_INET, type, socket.IPPROTO_TCP, "", address) for address in __ADDRESSES[(host, port)]
+    ]
+    yield mock_method
+
+@pytest.fixture
+def __mock_get_cached_value(request):
+  with patch(
+    "xmipp3_installer.shared.ttl_cache.get_cached_value"
+  ) as mock_method:
+    mock_method.return_value = getattr(request, 'param', None)
+    yield mock_method
+
+@pytest.fixture
+def __mock_set_cached_value():
+  with patch(
+    "xmipp3_installer.shared.ttl_cache.set_cached_value"
+  ) as mock_method:
+    yield mock_method
+
+@pytest.fixture
+def __mock_connectivity_cache_file():
+  cache_file = "/path/to/connectivity.json"
+  with patch.object(paths, "CONNECTIVITY_CACHE_FILE", cache_file):
+    yield cache_file
@@ -0,0 +1,198 @@
+from unittest.mock import patch
+
+import pytest
+
+from xmipp3_installer.api_client import connectivity_probe, installation_info_sender
+from xmipp3_installer.installer.constants import paths
+from xmipp3_installer.repository.config_vars import variables
+
+from ... import get_assertion_message
+
+__RET_CODE = 3
+__INSTALLATION_INFO = {
+  'user': 'some-user-id'
+}
+__CONFIG_VALUES = {
+  variables.INTERNET_CHECK_TARGETS: "proxy.example.org:3128, [::1]:53",
+  variables.INTERNET_CHECK_CACHE_TTL: "10"
+}
+
+@pytest.mark.parametrize(
+  "__mock_start_detached_python",
+  [pytest.param(False), pytest.param(True)],
+  indirect=["__mock_start_detached_python"]
+)
+def test_returns_whether_process_was_started_when_sending_in_background(
+  __mock_start_detached_python
+):
+  started = installation_info_sender.send_in_background(__RET_CODE)
+  expected_started = __mock_start_detached_python()
+  assert (
+    started == expected_started
+  ), get_assertion_message("process started", expected_started, started)
+
+def test_runs_send_installation_info_in_detached_process_when_sending_in_background(
+  __mock_start_detached_python
+):
+  installation_info_sender.send_in_background(__RET_CODE)
+  code = __mock_start_detached_python.call_args.args[0]
+  with patch(
+    "xmipp3_installer.api_client.installation_info_sender.send_installation_info"
+  ) as mock_send_installation_info:
+    exec(code)
+  mock_send_installation_info.assert_called_once_with(__RET_CODE)
+
+def test_spools_installation_info_when_there_is_no_internet(
+  __mock_is_connected,
+  __mock_get_installation_info,
+  __mock_send_installation_attempt,
+  __mock_add_to_spool,
+  __mock_drain_spool,
+  __mock_logger
+):
+  __mock_is_connected.return_value = False
+  installation_info_sender.send_installation_info(__RET_CODE)
+  __mock_send_installation_attempt.assert_not_called()
+  __mock_drain_spool.assert_not_called()
+  __mock_add_to_spool.assert_called_once_with(paths.INSTALLATION_SPOOL_PATH, __INSTALLATION_INFO)
+  __mock_logger.assert_called_once_with(
+    "No internet connection available. Installation info will be sent later.",
+    show_in_terminal=False
+  )
+
+@pytest.mark.parametrize(
+  "__mock_send_installation_attempt",
+  [pytest.param(False), pytest.param(True)],
+  indirect=["__mock_send_installation_attempt"]
+)
+def test_spools_installation_info_or_drains_spool_deppending_on_result_when_sending_installation_info(
+  __mock_is_connected,
+  __mock_get_installation_info,
+  __mock_send_installation_attempt,
+  __mock_add_to_spool,
+  __mock_drain_spool
+):
+  installation_info_sender.send_installation_info(__RET_CODE)
+  if __mock_send_installation_attempt.return_value:
+    __mock_add_to_spool.assert_not_called()
+    __mock_drain_spool.assert_called_once_with(paths.INSTALLATION_SPOOL_PATH)
+  else:
+    __mock_add_to_spool.assert_called_once_with(paths.INSTALLATION_SPOOL_PATH, __INSTALLATION_INFO)
+    __mock_drain_spool.assert_not_called()
+
+def test_checks_connection_with_configured_targets_when_sending_installation_info(
+  __mock_is_connected,
+  __mock_get_installation_info,
+  __mock_send_installation_attempt,
+  __mock_drain_spool,
+  __mock_configuration_file_handler
+):
+  installation_info_sender.send_installation_info(__RET_CODE)
+  __mock_configuration_file_handler.assert_called_once_with(path=paths.CONFIG_FILE, show_errors=False)
+  __mock_is_connected.assert_called_once_with(
+    [("proxy.example.org", 3128), ("::1", 53)],
+    connectivity_probe.PROBE_TIMEOUT,
+    10
+  )
+
+def test_does_not_send_or_spool_anything_when_installation_info_could_not_be_assembled(
+  __mock_is_connected,
+  __mock_get_installation_info,
+  __mock_send_installation_attempt,
+  __mock_add_to_spool,
+  __mock_drain_spool
+):
+  __mock_get_installation_info.side_effect = RuntimeError()
+  installation_info_sender.send_installation_info(__RET_CODE)
+  __mock_send_installation_attempt.assert_not_called()
+  __mock_add_to_spool.assert_not_called()
+  __mock_drain_spool.assert_not_called()
+
+def test_calls_get_installation_info_when_sending_installation_info(
+  __mock_is_connected,
+  __mock_get_installation_info,
+  __mock_send_installation_attempt,
+  __mock_drain_spool,
+  __mock_versions_manager
+):
+  installation_info_sender.send_installation_info(__RET_CODE)
+  __mock_versions_manager.assert_called_once_with(paths.VERSION_INFO_FILE)
+  __mock_get_installation_info.assert_called_once_with(__mock_versions_manager(), __RET_CODE)
+
+def test_calls_send_installation_attempt_when_sending_installation_info(
+  __mock_is_connected,
+  __mock_get_installation_info,
+  __mock_send_installation_attempt,
+  __mock_drain_spool,
+  __mock_versions_manager
+):
+  installation_info_sender.send_installation_info(__RET_CODE)
+  __mock_send_installation_attempt.assert_called_once_with(__INSTALLATION_INFO)
+
+@pytest.fixture
+def __mock_start_detached_python(request):
+  with patch(
+    "xmipp3_installer.shared.background_process.start_detached_python"
+  ) as mock_method:
+    mock_method.return_value = getattr(request, 'param', True)
+    yield mock_method
+
+@pytest.fixture
+def __mock_is_connected():
+  with patch(
+    "xmipp3_installer.api_client.connectivity_probe.is_connected"
+  ) as mock_method:
+    mock_method.return_value = True
+    yield mock_method
+
+@pytest.fixture
+def __mock_get_installation_info():
+  with patch(
+    "xmipp3_installer.api_client.assembler.installation_info_assembler.get_installation_info"
+  ) as mock_method:
+    mock_method.return_value = __INSTALLATION_INFO
+    yield mock_method
+
+@pytest.fixture
+def __mock_send_installation_attempt(request):
+  with patch(
+    "xmipp3_installer.api_client.api_client.send_installation_attempt"
+  ) as mock_method:
+    mock_method.return_value = getattr(request, 'param', True)
+    yield mock_method
+
+@pytest.fixture
+def __mock_add_to_spool():
+  with patch(
+    "xmipp3_installer.api_client.installation_spool.add_to_spool"
+  ) as mock_method:
+    yield mock_method
+
+@pytest.fixture
+def __mock_drain_spool():
+  with patch(
+    "xmipp3_installer.api_client.installation_spool.drain_spool"
+  ) as mock_method:
+    yield mock_method
+
+@pytest.fixture(autouse=True)
+def __mock_configuration_file_handler():
+  with patch(
+    "xmipp3_installer.repository.config.ConfigurationFileHandler"
+  ) as mock_class:
+    mock_class.return_value.values = __CONFIG_VALUES
+    yield mock_class
+
+@pytest.fixture(autouse=True)
+def __mock_versions_manager():
+  with patch(
+    "xmipp3_installer.installer.handlers.versions_manager.VersionsManager"
+  ) as mock_class:
+    yield mock_class
+
+@pytest.fixture
+def __mock_logger():
+  with patch(
+    "xmipp3_installer.application.logger.logger.Logger.__call__"
+  ) as mock_method:
+    yield mock_method
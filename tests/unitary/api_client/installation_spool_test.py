@@ -0,0 +1,145 @@
+import fcntl
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from xmipp3_installer.api_client import installation_spool
+
+from ... import get_assertion_message
+
+__INSTALLATION_INFOS = [{"user": f"user-{index}"} for index in range(5)]
+
+def test_stores_installation_info_when_adding_to_spool(__spool_path):
+  added = installation_spool.add_to_spool(__spool_path, __INSTALLATION_INFOS[0])
+  stored = __get_stored_infos(__spool_path)
+  assert (
+    added and stored == [__INSTALLATION_INFOS[0]]
+  ), get_assertion_message("stored installation info", [__INSTALLATION_INFOS[0]], stored)
+
+def test_discards_oldest_entries_when_spool_exceeds_max_size(__spool_path):
+  entry_size = len(json.dumps(__INSTALLATION_INFOS[0]))
+  for installation_info in __INSTALLATION_INFOS:
+    installation_spool.add_to_spool(__spool_path, installation_info, max_size=entry_size * 2)
+  stored = __get_stored_infos(__spool_path)
+  expected_stored = __INSTALLATION_INFOS[-2:]
+  assert (
+    stored == expected_stored
+  ), get_assertion_message("stored installation info", expected_stored, stored)
+
+def test_returns_false_when_installation_info_does_not_fit_in_spool(__spool_path):
+  added = installation_spool.add_to_spool(__spool_path, __INSTALLATION_INFOS[0], max_size=1)
+  stored = __get_stored_infos(__spool_path)
+  assert (
+    not added and not stored
+  ), get_assertion_message("stored installation info", [], stored)
+
+def test_returns_false_when_installation_info_is_not_serializable(__spool_path):
+  added = installation_spool.add_to_spool(__spool_path, {"user": object()})
+  spool_content = os.listdir(__spool_path)
+  assert (
+    not added and not spool_content
+  ), get_assertion_message("spool content", [], spool_content)
+
+def test_returns_false_when_spool_cannot_be_created(tmp_path):
+  blocking_file = tmp_path / "file"
+  blocking_file.write_text("")
+  added = installation_spool.add_to_spool(str(blocking_file / "spool"), __INSTALLATION_INFOS[0])
+  assert (
+    not added
+  ), get_assertion_message("installation info added", False, added)
+
+def test_does_not_send_anything_when_spool_does_not_exist(
+  __spool_path,
+  __mock_send_installation_attempts
+):
+  n_sent = installation_spool.drain_spool(os.path.join(__spool_path, "missing"))
+  __mock_send_installation_attempts.assert_not_called()
+  assert (
+    n_sent == 0
+  ), get_assertion_message("sent installation attempts", 0, n_sent)
+
+def test_sends_spooled_entries_oldest_first(
+  __spool_path,
+  __mock_send_installation_attempts
+):
+  __add_entries(__spool_path)
+  installation_spool.drain_spool(__spool_path)
+  __mock_send_installation_attempts.assert_called_once_with(__INSTALLATION_INFOS)
+
+@pytest.mark.parametrize(
+  "__mock_send_installation_attempts,expected_n_sent,expected_stored",
+  [
+    pytest.param((0, 0), 0, __INSTALLATION_INFOS),
+    pytest.param((2, 2), 2, __INSTALLATION_INFOS[2:]),
+    pytest.param((2, 1), 1, __INSTALLATION_INFOS[2:]),
+    pytest.param((5, 5), 5, [])
+  ],
+  indirect=["__mock_send_installation_attempts"]
+)
+def test_removes_only_accepted_or_rejected_entries_when_draining_spool(
+  __spool_path,
+  __mock_send_installation_attempts,
+  expected_n_sent,
+  expected_stored
+):
+  __add_entries(__spool_path)
+  n_sent = installation_spool.drain_spool(__spool_path)
+  stored = __get_stored_infos(__spool_path)
+  assert (
+    n_sent == expected_n_sent and stored == expected_stored
+  ), get_assertion_message("stored installation info", expected_stored, stored)
+
+def test_removes_unreadable_entries_when_draining_spool(
+  __spool_path,
+  __mock_send_installation_attempts
+):
+  installation_spool.add_to_spool(__spool_path, __INSTALLATION_INFOS[0])
+  with open(os.path.join(__spool_path, "0-broken.json"), "w") as broken_file:
+    broken_file.write("{")
+  installation_spool.drain_spool(__spool_path)
+  __mock_send_installation_attempts.assert_called_once_with([__INSTALLATION_INFOS[0]])
+
+def test_does_not_send_anything_when_another_process_is_draining_spool(
+  __spool_path,
+  __mock_send_installation_attempts
+):
+  __add_entries(__spool_path)
+  with open(os.path.join(__spool_path, ".lock"), "w") as lock_file:
+    fcntl.flock(lock_file, fcntl.LOCK_EX)
+    n_sent = installation_spool.drain_spool(__spool_path)
+  __mock_send_installation_attempts.assert_not_called()
+  assert (
+    n_sent == 0
+  ), get_assertion_message("sent installation attempts", 0, n_sent)
+
+def __add_entries(spool_path: str):
+  for index, installation_info in enumerate(__INSTALLATION_INFOS):
+    with patch("time.time_ns", return_value=index):
+      installation_spool.add_to_spool(spool_path, installation_info)
+
+def __get_stored_infos(spool_path: str) -> list:
+  stored = []
+  for name in sorted(os.listdir(spool_path)):
+    if name.endswith(".json"):
+      with open(os.path.join(spool_path, name)) as entry_file:
+        stored.append(json.load(entry_file))
+  return stored
+
+@pytest.fixture
+def __spool_path(tmp_path):
+  spool_path = tmp_path / "spool"
+  spool_path.mkdir()
+  yield str(spool_path)
+
+@pytest.fixture
+def __mock_send_installation_attempts(request):
+  with patch(
+    "xmipp3_installer.api_client.api_client.send_installation_attempts"
+  ) as mock_method:
+    result = getattr(request, 'param', None)
+    mock_method.side_effect = lambda installation_infos: (
+      (len(installation_infos), len(installation_infos)) if result is None else result
+    )
+    yield mock_method
@@ -15,7 +15,8 @@ __DEFAULT_JOBS = 4
 __DEFAULT_COMPILATION_ARGS = {
   "branch": None,
   "jobs": __DEFAULT_JOBS,
-  "keep_output": False
+  "keep_output": False,
+  "trace": None
 }
 
 def test_calls_add_default_usage_mode(
@@ -65,6 +66,10 @@ def test_calls_parse_args(
       ["addModel", __USER, __DUMMY_PATH, "--update"],
       {"login": __USER, "modelPath": __DUMMY_PATH, "update": True}
     ),
+    pytest.param(
+      ["addModel", __USER, __DUMMY_PATH, "--trace", "trace.json"],
+      {"login": __USER, "modelPath": __DUMMY_PATH, "trace": "trace.json"}
+    ),
   ],
   indirect=["__mock_sys_argv"]
 )
@@ -76,7 +81,7 @@ def test_returns_expected_mode_add_model(
   __mock_run_installer,
   __mock_sys_exit
 ):
-  __test_args_in_mode("addModel", {"update": False}, expected_args, __mock_run_installer)
+  __test_args_in_mode("addModel", {"update": False, "trace": None}, expected_args, __mock_run_installer)
 
 @pytest.mark.parametrize(
   "__mock_sys_argv,expected_args",
@@ -90,6 +95,11 @@ def test_returns_expected_mode_add_model(
     pytest.param(["--branch", "test2"], {"branch": "test2"}),
     pytest.param(["--branch=test2"], {"branch": "test2"}),
     pytest.param(["--keep-output"], {"keep_output": True}),
+    pytest.param(["--clone-strategy", "shallow"], {"clone_strategy": "shallow"}),
+    pytest.param(["--clone-strategy=partial"], {"clone_strategy": "partial"}),
+    pytest.param(["--resume"], {"resume": True}),
+    pytest.param(["--force"], {"force": True}),
+    pytest.param(["--trace", "trace.json"], {"trace": "trace.json"}),
     pytest.param(
       ["-j=20", "--keep-output", "-b", "test_branch"],
       {"jobs": 20, "keep_output": True, "branch": "test_branch"}
@@ -106,26 +116,54 @@ def test_returns_expected_mode_all_args(
   __mock_run_installer,
   __mock_sys_exit
 ):
-  __test_args_in_mode("all", __DEFAULT_COMPILATION_ARGS, expected_args, __mock_run_installer)
+  __test_args_in_mode(
+    "all",
+    {**__DEFAULT_COMPILATION_ARGS, "clone_strategy": None, "resume": False, "force": False},
+    expected_args,
+    __mock_run_installer
+  )
 
+@pytest.mark.parametrize(
+  "__mock_sys_argv,expected_args",
+  [
+    pytest.param(["cleanAll"], {}),
+    pytest.param(["cleanAll", "--dry-run"], {"dry_run": True}),
+    pytest.param(["cleanAll", "--report", "report.json"], {"report": "report.json"}),
+    pytest.param(["cleanAll", "--trace", "trace.json"], {"trace": "trace.json"})
+  ],
+  indirect=["__mock_sys_argv"]
+)
 def test_returns_expected_mode_clean_all_args(
   __mock_sys_argv,
+  expected_args,
   __mock_validate_args,
   __mock_stdout_stderr,
   __mock_run_installer,
   __mock_sys_exit
 ):
-  with patch.object(sys, 'argv', [arguments.XMIPP_PROGRAM_NAME, "cleanAll"]):
-    __test_args_in_mode("cleanAll", {}, {}, __mock_run_installer)
+  __test_args_in_mode("cleanAll", {"dry_run": False, "report": None, "trace": None}, expected_args, __mock_run_installer)
 
+@pytest.mark.parametrize(
+  "__mock_sys_argv,expected_args",
+  [
+    pytest.param(["cleanBin"], {}),
+    pytest.param(["cleanBin", "--dry-run"], {"dry_run": True}),
+    pytest.param(
+      ["cleanBin", "--dry-run", "--report=report.json"],
+      {"dry_run": True, "report": "report.json"}
+    )
+  ],
+  indirect=["__mock_sys_argv"]
+)
 def test_returns_expected_mode_clean_bin_args(
+  __mock_sys_argv,
+  expected_args,
   __mock_validate_args,
   __mock_stdout_stderr,
   __mock_run_installer,
   __mock_sys_exit
 ):
-  with patch.object(sys, 'argv', [arguments.XMIPP_PROGRAM_NAME, "cleanBin"]):
-    __test_args_in_mode("cleanBin", {}, {}, __mock_run_installer)
+  __test_args_in_mode("cleanBin", {"dry_run": False, "report": None, "trace": None}, expected_args, __mock_run_installer)
 
 @pytest.mark.parametrize(
   "__mock_sys_argv,expected_args",
@@ -160,7 +198,9 @@ def test_returns_expected_mode_compile_and_install_args(
   "__mock_sys_argv,expected_args",
   [
     pytest.param(["configBuild"], {}),
-    pytest.param(["configBuild", "--keep-output"], {"keep_output": True})
+    pytest.param(["configBuild", "--keep-output"], {"keep_output": True}),
+    pytest.param(["configBuild", "--force"], {"force": True}),
+    pytest.param(["configBuild", "--trace", "trace.json"], {"trace": "trace.json"})
   ],
   indirect=["__mock_sys_argv"]
 )
@@ -172,14 +212,15 @@ def test_returns_expected_mode_config_build_args(
   __mock_run_installer,
   __mock_sys_exit
 ):
-  __test_args_in_mode("configBuild", {"keep_output": False}, expected_args, __mock_run_installer)
+  __test_args_in_mode("configBuild", {"keep_output": False, "force": False, "trace": None}, expected_args, __mock_run_installer)
 
 @pytest.mark.parametrize(
   "__mock_sys_argv,expected_args",
   [
     pytest.param(["config"], {}),
     pytest.param(["config", "-o"], {"overwrite": True}),
-    pytest.param(["config", "--overwrite"], {"overwrite": True})
+    pytest.param(["config", "--overwrite"], {"overwrite": True}),
+    pytest.param(["config", "--trace", "trace.json"], {"trace": "trace.json"})
   ],
   indirect=["__mock_sys_argv"]
 )
@@ -191,7 +232,7 @@ def test_returns_expected_mode_config_args(
   __mock_run_installer,
   __mock_sys_exit
 ):
-  __test_args_in_mode("config", {"overwrite": False}, expected_args, __mock_run_installer)
+  __test_args_in_mode("config", {"overwrite": False, "trace": None}, expected_args, __mock_run_installer)
 
 @pytest.mark.parametrize(
   "__mock_sys_argv,expected_args",
@@ -199,7 +240,8 @@ def test_returns_expected_mode_config_args(
     pytest.param(["getModels"], {"directory": os.path.abspath(arguments.DEFAULT_MODELS_DIR)}),
     pytest.param(["getModels", "-d", __DUMMY_PATH], {"directory": __DUMMY_PATH}),
     pytest.param(["getModels", "--directory", __DUMMY_PATH], {"directory": __DUMMY_PATH}),
-    pytest.param(["getModels", f"-d={__DUMMY_PATH}"], {"directory": __DUMMY_PATH})
+    pytest.param(["getModels", f"-d={__DUMMY_PATH}"], {"directory": __DUMMY_PATH}),
+    pytest.param(["getModels", "-d", __DUMMY_PATH, "--trace", "trace.json"], {"directory": __DUMMY_PATH, "trace": "trace.json"})
   ],
   indirect=["__mock_sys_argv"]
 )
@@ -211,7 +253,7 @@ def test_returns_expected_mode_get_models_args(
   __mock_run_installer,
   __mock_sys_exit
 ):
-  __test_args_in_mode("getModels", {"directory": os.path.join(__DUMMY_PATH, "default")}, expected_args, __mock_run_installer)
+  __test_args_in_mode("getModels", {"directory": os.path.join(__DUMMY_PATH, "default"), "trace": None}, expected_args, __mock_run_installer)
 
 @pytest.mark.parametrize(
   "__mock_sys_argv,expected_args",
@@ -221,6 +263,9 @@ def test_returns_expected_mode_get_models_args(
     pytest.param(["getSources", "--branch", "test_branch"], {"branch": "test_branch"}),
     pytest.param(["getSources", "-b=test_branch"], {"branch": "test_branch"}),
     pytest.param(["getSources", "--keep-output"], {"keep_output": True}),
+    pytest.param(["getSources", "-j", "1"], {"jobs": 1}),
+    pytest.param(["getSources", "--clone-strategy", "shallow"], {"clone_strategy": "shallow"}),
+    pytest.param(["getSources", "--clone-strategy=full"], {"clone_strategy": "full"}),
     pytest.param(
       ["getSources", "--branch=test_branch", "--keep-output"],
       {"branch": "test_branch", "keep_output": True}
@@ -232,11 +277,12 @@ def test_returns_expected_mode_get_sources_args(
   expected_args,
   __mock_sys_argv,
   __mock_validate_args,
+  __mock_get_default_job_number,
   __mock_stdout_stderr,
   __mock_run_installer,
   __mock_sys_exit
 ):
-  __test_args_in_mode("getSources", {"branch": None, "keep_output": False}, expected_args, __mock_run_installer)
+  __test_args_in_mode("getSources", {"jobs": __DEFAULT_JOBS, "branch": None, "clone_strategy": None, "keep_output": False, "trace": None}, expected_args, __mock_run_installer)
 
 def test_returns_expected_mode_git_args(
   __mock_validate_args,
@@ -245,7 +291,7 @@ def test_returns_expected_mode_git_args(
   __mock_sys_exit
 ):
   with patch.object(sys, 'argv', [arguments.XMIPP_PROGRAM_NAME, "git", "clone", "test_url"]):
-    __test_args_in_mode("git", {}, {"command": ["clone", "test_url"]}, __mock_run_installer)
+    __test_args_in_mode("git", {"trace": None}, {"command": ["clone", "test_url"]}, __mock_run_installer)
 
 @pytest.mark.parametrize(
   "__mock_sys_argv,expected_args",
@@ -253,7 +299,8 @@ def test_returns_expected_mode_git_args(
     pytest.param(["test", "mytest", "test2"], {"testNames": ["mytest", "test2"]}),
     pytest.param(["test", "--show"], {"show": True}),
     pytest.param(["test", "--all-functions"], {"all_functions": True}),
-    pytest.param(["test", "--all-programs"], {"all_programs": True})
+    pytest.param(["test", "--all-programs"], {"all_programs": True}),
+    pytest.param(["test", "--show", "--trace", "trace.json"], {"show": True, "trace": "trace.json"})
   ],
   indirect=["__mock_sys_argv"]
 )
@@ -267,7 +314,7 @@ def test_returns_expected_mode_test_args(
 ):
   __test_args_in_mode(
     "test",
-    {"testNames": [], "show": False, "all_functions": False, "all_programs": False},
+    {"testNames": [], "show": False, "all_functions": False, "all_programs": False, "trace": None},
     expected_args,
     __mock_run_installer
   )
@@ -297,6 +344,7 @@ def test_exits_due_to_mixed_use_of_mutually_exclusive_groups_on_mode_test_when_p
   [
     pytest.param(["version"], {}),
     pytest.param(["version", "--short"], {"short": True}),
+    pytest.param(["version", "--trace", "trace.json"], {"trace": "trace.json"}),
   ],
   indirect=["__mock_sys_argv"]
 )
@@ -308,7 +356,7 @@ def test_returns_expected_mode_version_args(
   __mock_run_installer,
   __mock_sys_exit
 ):
-  __test_args_in_mode("version", {"short": False}, expected_args, __mock_run_installer)
+  __test_args_in_mode("version", {"short": False, "trace": None}, expected_args, __mock_run_installer)
 
 def test_calls_validate_args(
   __mock_sys_argv,
@@ -50,12 +50,14 @@ def test_formats_help(
   __mock_get_epilog,
   __mock_get_note,
   __mock_get_formatting_tabs,
+  __mock_get_mode_arg_group_str,
   __setup_formatter
 ):
   formatted_help = __setup_formatter.format_help()
   expected_formatted_help = "Run Xmipp's installer script\n\nUsage: xmipp [options]\n"
   expected_formatted_help += __mock_get_section_message("section1")
   expected_formatted_help += __mock_get_section_message("section2")
+  expected_formatted_help += f"\nCommon options of all modes: {__mock_get_mode_arg_group_str(modes.COMMON_ARGS)}\n"
   expected_formatted_help += f"\n{__mock_get_epilog()}"
   expected_formatted_help += __mock_get_note()
   expected_formatted_help = __mock_get_formatting_tabs(expected_formatted_help)
@@ -215,6 +217,14 @@ def __mock_get_section_message():
     mock_method.side_effect = lambda section: f"section message for section {section}"
     yield mock_method
 
+@pytest.fixture
+def __mock_get_mode_arg_group_str():
+  with patch(
+    "xmipp3_installer.application.cli.parsers.general_help_formatter.GeneralHelpFormatter._get_mode_arg_group_str"
+  ) as mock_method:
+    mock_method.side_effect = lambda args: f"[group-{'*'.join(args)}]"
+    yield mock_method
+
 @pytest.fixture
 def __mock_get_epilog():
   with patch(
@@ -251,7 +251,7 @@ def test_does_not_call_logger_yellow_if_no_optional_params_and_no_exclusive_grou
   __setup_formatter._get_args_message(mode)
   __mock_logger_yellow.assert_not_called()
 
-def test_does_not_call_get_help_separator_when_getting_args_message(
+def test_only_calls_get_help_separator_for_common_options_when_getting_args_message(
   __mock_mode_args,
   __mock_xmipp_program_name,
   __mock_get_param_first_name,
@@ -259,11 +259,26 @@ def test_does_not_call_get_help_separator_when_getting_args_message(
   __mock_logger_yellow,
   __mock_get_help_separator,
   __mock_get_args_info,
+  __mock_get_args_group_info,
   __setup_formatter
 ):
   mode = "mode2"
   __setup_formatter._get_args_message(mode)
-  __mock_get_help_separator.assert_not_called()
+  __mock_get_help_separator.assert_called_once_with()
+
+def test_calls_get_args_group_info_with_common_args_when_getting_args_message(
+  __mock_mode_args,
+  __mock_xmipp_program_name,
+  __mock_get_param_first_name,
+  __mock_args_contain_optional,
+  __mock_logger_yellow,
+  __mock_get_help_separator,
+  __mock_get_args_info,
+  __mock_get_args_group_info,
+  __setup_formatter
+):
+  __setup_formatter._get_args_message("mode1")
+  __mock_get_args_group_info.assert_called_once_with(modes.COMMON_ARGS)
 
 @pytest.mark.parametrize(
   "mode",
@@ -302,6 +317,7 @@ def test_returns_expected_args_message(
   __mock_logger_yellow,
   __mock_get_help_separator,
   __mock_get_args_info,
+  __mock_get_args_group_info,
   __setup_formatter
 ):
   expected_help_message = __get_args_help_message(
@@ -309,7 +325,8 @@ def test_returns_expected_args_message(
     __mock_args_contain_optional.return_value,
     __setup_formatter,
     __mock_logger_yellow,
-    __mock_get_args_info
+    __mock_get_args_info,
+    __mock_get_args_group_info
   )
   help_message = __setup_formatter._get_args_message(mode)
   assert (
@@ -401,7 +418,8 @@ def __get_args_help_message(
   contains_optional: bool,
   formatter: ModeHelpFormatter,
   logger_yellow,
-  get_args_info
+  get_args_info,
+  get_args_group_info
 ) -> str:
   args = __MODE_ARGS[mode]
   exist_args = len(args) > 0
@@ -410,7 +428,9 @@ def __get_args_help_message(
     f"Usage: {arguments.XMIPP_PROGRAM_NAME} {mode}",
     f"{' [options]' if len(args) > 0 else ''}\n",
     f"{formatter._get_help_separator()}\t# Options #\n\n" if exist_args else "",
-    get_args_info(args)
+    get_args_info(args),
+    f"{formatter._get_help_separator()}\t# Common options #\n\n",
+    get_args_group_info(modes.COMMON_ARGS)
   ])
 
 @pytest.fixture
@@ -511,6 +531,14 @@ def __mock_get_args_info():
     mock_method.side_effect = side_effect
     yield mock_method
 
+@pytest.fixture
+def __mock_get_args_group_info():
+  with patch(
+    "xmipp3_installer.application.cli.parsers.mode_help_formatter.ModeHelpFormatter._get_args_group_info"
+  ) as mock_method:
+    mock_method.side_effect = lambda args: f'group-info-{"*".join(args)}-group-info'
+    yield mock_method
+
 @pytest.fixture
 def __mock_get_mode():
   with patch(
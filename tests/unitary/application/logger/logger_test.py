@@ -3,7 +3,7 @@ from unittest.mock import patch, Mock, call, MagicMock
 import pytest
 
 from xmipp3_installer.shared.singleton import Singleton
-from xmipp3_installer.application.logger.logger import Logger
+from xmipp3_installer.application.logger.logger import DeferredOutput, Logger
 from xmipp3_installer.application.logger import errors
 from xmipp3_installer.installer import urls
 
@@ -390,6 +390,57 @@ def test_calls_logger_with_expected_params_when_logging_in_streaming(
     ) for line in __STREAM_READLINE_DECODED
   ])
 
+def test_holds_messages_when_calling_logger_with_deferred_output(__mock_print):
+  logger = Logger()
+  deferred_output = DeferredOutput()
+  logger.defer_output(deferred_output)
+  try:
+    logger(__SAMPLE_TEXT)
+  finally:
+    logger.defer_output(None)
+  __mock_print.assert_not_called()
+
+def test_prints_held_messages_in_order_when_releasing_output(__mock_print):
+  logger = Logger()
+  deferred_output = DeferredOutput()
+  logger.defer_output(deferred_output)
+  try:
+    logger("first")
+    logger("second", show_in_terminal=False)
+    logger("third")
+  finally:
+    logger.defer_output(None)
+  logger.release_output(deferred_output)
+  expected_calls = [call("first", flush=True), call("third", flush=True)]
+  assert (
+    __mock_print.call_args_list == expected_calls
+  ), get_assertion_message("print calls", expected_calls, __mock_print.call_args_list)
+
+@pytest.mark.parametrize(
+  "deferred,released,expected_held",
+  [
+    pytest.param(True, False, True),
+    pytest.param(True, True, False),
+    pytest.param(False, False, False)
+  ]
+)
+def test_returns_expected_value_when_holding_message(deferred, released, expected_held):
+  deferred_output = DeferredOutput(deferred=deferred)
+  if released:
+    deferred_output.release(Mock())
+  held = deferred_output.hold(__SAMPLE_TEXT, True, False)
+  assert (
+    held == expected_held
+  ), get_assertion_message("message held", expected_held, held)
+
+def test_logs_held_messages_with_their_params_when_releasing():
+  deferred_output = DeferredOutput()
+  deferred_output.hold("first", True, False)
+  deferred_output.hold("second", False, True)
+  log = Mock()
+  deferred_output.release(log)
+  log.assert_has_calls([call("first", True, False), call("second", False, True)])
+
 def __get_substitution_chars(up_char: str, remove_line_char: str, n_lines: int):
   substitution_chars = ''
   for _ in range(n_lines):
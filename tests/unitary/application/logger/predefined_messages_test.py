@@ -1,3 +1,5 @@
+import subprocess
+import sys
 from unittest.mock import patch
 
 import pytest
@@ -127,6 +129,36 @@ def test_returns_expected_success_message(
     success_message == expected_success_message
   ), get_assertion_message("success message", expected_success_message, success_message)
 
+def test_git_handler_is_usable_from_several_threads_at_once_after_importing_installer():
+  # Runs in a new interpreter so git_handler has not been imported yet
+  code = """
+import sys
+import threading
+sys.setswitchinterval(1e-6)
+from xmipp3_installer.installer import installer_service
+from xmipp3_installer.installer.modes import mode_get_sources_executor
+barrier = threading.Barrier(8)
+errors = []
+def use_git_handler():
+  barrier.wait()
+  try:
+    mode_get_sources_executor.git_handler.get_clonable_branch
+  except AttributeError as error:
+    errors.append(error)
+threads = [threading.Thread(target=use_git_handler) for _ in range(8)]
+for thread in threads:
+  thread.start()
+for thread in threads:
+  thread.join()
+print(len(errors))
+"""
+  n_errors = subprocess.run(
+    [sys.executable, "-c", code], capture_output=True, text=True, check=True
+  ).stdout.strip()
+  assert (
+    n_errors == "0"
+  ), get_assertion_message("failed attribute accesses", "0", n_errors)
+
 @pytest.fixture
 def __mock_logger_green():
   with patch(
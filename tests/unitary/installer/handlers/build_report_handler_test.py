@@ -0,0 +1,138 @@
+import json
+import os
+
+import pytest
+
+from xmipp3_installer.installer.handlers import build_report_handler
+
+from .... import get_assertion_message
+
+__LOG_HEADER = "# ninja log v5\n"
+__PREVIOUS_BUILD = "0\t5000\t0\tlib/old.o\taaaa\n"
+__RECOMPACTED_BUILD = "0\t200\t0\tlib/older.o\teeee\n"
+__CURRENT_BUILD = "".join([
+  "0\t1000\t0\tlib/a.o\tbbbb\n",
+  "0\t3000\t0\tlib/b.o\tcccc\n",
+  "3000\t4000\t0\tlib/libx.so\tdddd\n",
+  "3000\t4000\t0\tlib/libx.so.1\tdddd\n",
+  "invalid line\n"
+])
+__ENTRIES = [
+  ("lib/a.o", 0, 1000),
+  ("lib/b.o", 0, 3000),
+  ("lib/libx.so", 3000, 4000)
+]
+
+def test_returns_log_size_and_inode_when_getting_log_position(tmp_path):
+  log_path = tmp_path / ".ninja_log"
+  log_path.write_text(__LOG_HEADER)
+  position = build_report_handler.get_log_position(str(log_path))
+  expected_position = (len(__LOG_HEADER), os.stat(log_path).st_ino)
+  assert (
+    position == expected_position
+  ), get_assertion_message("log position", expected_position, position)
+
+def test_returns_zero_when_getting_position_of_missing_log(tmp_path):
+  position = build_report_handler.get_log_position(str(tmp_path / ".ninja_log"))
+  assert (
+    position == (0, 0)
+  ), get_assertion_message("log position", (0, 0), position)
+
+@pytest.mark.parametrize(
+  "offset,expected_entries",
+  [
+    pytest.param(len(__LOG_HEADER) + len(__PREVIOUS_BUILD), __ENTRIES, id="Entries after offset"),
+    pytest.param(None, [("lib/old.o", 0, 5000), *__ENTRIES], id="All entries"),
+    pytest.param(10 ** 6, __ENTRIES, id="Shrunk log")
+  ]
+)
+def test_returns_expected_build_entries(offset, expected_entries, tmp_path):
+  log_path = tmp_path / ".ninja_log"
+  log_path.write_text(f"{__LOG_HEADER}{__PREVIOUS_BUILD}{__CURRENT_BUILD}")
+  position = None if offset is None else (offset, os.stat(log_path).st_ino)
+  entries = build_report_handler.get_build_entries(str(log_path), position)
+  assert (
+    entries == expected_entries
+  ), get_assertion_message("build entries", expected_entries, entries)
+
+def test_returns_last_run_build_entries_if_log_was_replaced(tmp_path):
+  log_path = tmp_path / ".ninja_log"
+  log_path.write_text(f"{__LOG_HEADER}{__PREVIOUS_BUILD}")
+  position = build_report_handler.get_log_position(str(log_path))
+  recompacted_path = tmp_path / ".ninja_log.recompact"
+  recompacted_path.write_text(f"{__LOG_HEADER}{__RECOMPACTED_BUILD}{__PREVIOUS_BUILD}{__CURRENT_BUILD}")
+  os.replace(recompacted_path, log_path)
+  entries = build_report_handler.get_build_entries(str(log_path), position)
+  assert (
+    entries == __ENTRIES
+  ), get_assertion_message("build entries", __ENTRIES, entries)
+
+def test_returns_no_build_entries_if_log_does_not_exist(tmp_path):
+  entries = build_report_handler.get_build_entries(str(tmp_path / ".ninja_log"))
+  assert (
+    entries == []
+  ), get_assertion_message("build entries", [], entries)
+
+def test_returns_expected_build_report():
+  report = build_report_handler.get_build_report(__ENTRIES, top_targets=2)
+  expected_report = {
+    "targets": 3,
+    "cpu_time": 5.0,
+    "wall_time": 4.0,
+    "parallelism": 1.25,
+    "slowest": [
+      {"target": "lib/b.o", "kind": "compile", "duration": 3.0},
+      {"target": "lib/a.o", "kind": "compile", "duration": 1.0}
+    ],
+    "durations": {"lib/a.o": 1.0, "lib/b.o": 3.0, "lib/libx.so": 1.0}
+  }
+  assert (
+    report == expected_report
+  ), get_assertion_message("build report", expected_report, report)
+
+def test_returns_empty_build_report_when_there_are_no_entries():
+  report = build_report_handler.get_build_report([])
+  expected_report = {
+    "targets": 0, "cpu_time": 0, "wall_time": 0.0, "parallelism": 0.0, "slowest": [], "durations": {}
+  }
+  assert (
+    report == expected_report
+  ), get_assertion_message("build report", expected_report, report)
+
+def test_lists_link_steps_as_link_in_build_report():
+  report = build_report_handler.get_build_report([("bin/xmipp_program", 0, 1000)])
+  kind = report["slowest"][0]["kind"]
+  assert (
+    kind == "link"
+  ), get_assertion_message("target kind", "link", kind)
+
+def test_writes_build_report(tmp_path):
+  report_path = os.path.join(tmp_path, "build-report.json")
+  report = build_report_handler.get_build_report(__ENTRIES)
+  build_report_handler.write_build_report(report, report_path)
+  with open(report_path, encoding="utf-8") as report_file:
+    written_report = json.load(report_file)
+  assert (
+    written_report == report
+  ), get_assertion_message("written build report", report, written_report)
+
+@pytest.mark.parametrize(
+  "entries,expected_message",
+  [
+    pytest.param(
+      [],
+      "Build report saved to build/build-report.json: 0 targets, 0.0s of CPU time in 0.0s (0.0x parallelism)."
+    ),
+    pytest.param(
+      __ENTRIES,
+      "Build report saved to build/build-report.json: 3 targets, 5.0s of CPU time in 4.0s (1.2x parallelism). "
+      "Slowest: lib/b.o (3.0s)."
+    )
+  ]
+)
+def test_returns_expected_build_report_message(entries, expected_message):
+  report = build_report_handler.get_build_report(entries)
+  message = build_report_handler.get_build_report_message(report, "build/build-report.json")
+  assert (
+    message == expected_message
+  ), get_assertion_message("build report message", expected_message, message)
@@ -120,6 +120,49 @@ def test_returns_expected_cmake_params(
     cmake_vars == expected_params
   ), get_assertion_message("CMake variables string", expected_params, cmake_vars)
 
+@pytest.mark.parametrize(
+  "__mock_os_path_exists,name,expected_value",
+  [
+    pytest.param(False, "CMAKE_CXX_COMPILER_LAUNCHER", None, id="Missing file"),
+    pytest.param(True, "CMAKE_CXX_COMPILER_LAUNCHER", "/usr/bin/ccache", id="Typed variable"),
+    pytest.param(True, "CMAKE_GENERATOR", "Unix Makefiles", id="Internal variable"),
+    pytest.param(True, "EMPTY_VARIABLE", "", id="Empty variable"),
+    pytest.param(True, "CMAKE_C_COMPILER_LAUNCHER", None, id="Missing variable")
+  ],
+  indirect=["__mock_os_path_exists"]
+)
+def test_returns_expected_cmake_cache_variable(__mock_os_path_exists, name, expected_value):
+  cache_content = "\n".join([
+    "# This is the CMakeCache file.",
+    "CMAKE_CXX_COMPILER_LAUNCHER:UNINITIALIZED=/usr/bin/ccache",
+    "CMAKE_GENERATOR:INTERNAL=Unix Makefiles",
+    "EMPTY_VARIABLE:STRING="
+  ])
+  with patch(
+    "xmipp3_installer.installer.handlers.cmake.cmake_handler.open",
+    mock_open(read_data=cache_content)
+  ):
+    value = cmake_handler.get_cmake_cache_variable(__FILE_PATH, name)
+  assert (
+    value == expected_value
+  ), get_assertion_message("CMake cache variable", expected_value, value)
+
+@pytest.mark.parametrize(
+  "environment,__mock_which,expected_generator",
+  [
+    pytest.param({}, None, None, id="No generator"),
+    pytest.param({}, "/usr/bin/ninja", cmake_constants.NINJA_GENERATOR, id="Ninja installed"),
+    pytest.param({"CMAKE_GENERATOR": "Unix Makefiles"}, "/usr/bin/ninja", "Unix Makefiles", id="Environment generator")
+  ],
+  indirect=["__mock_which"]
+)
+def test_returns_expected_default_generator(environment, __mock_which, expected_generator):
+  with patch.dict("os.environ", environment, clear=True):
+    generator = cmake_handler.get_default_generator()
+  assert (
+    generator == expected_generator
+  ), get_assertion_message("default generator", expected_generator, generator)
+
 @pytest.fixture
 def __mock_which(request):
   with patch("shutil.which") as mock_method:
@@ -0,0 +1,115 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from xmipp3_installer.installer.handlers import compiler_cache_handler
+
+from .... import get_assertion_message
+
+__CCACHE_PATH = "/usr/bin/ccache"
+__SCCACHE_PATH = "/usr/bin/sccache"
+__CCACHE_OUTPUT = "\n".join([
+  "stats_updated_timestamp\t1700000000",
+  "direct_cache_hit\t10",
+  "preprocessed_cache_hit\t5",
+  "cache_miss\t7",
+  "unsupported_compiler_option\t1"
+])
+__SCCACHE_OUTPUT = json.dumps({
+  "stats": {
+    "cache_hits": {"counts": {"C/C++": 8, "CUDA": 2}},
+    "cache_misses": {"counts": {"C/C++": 3}}
+  }
+})
+
+@pytest.mark.parametrize(
+  "available_caches,expected_launcher",
+  [
+    pytest.param({}, None),
+    pytest.param({"sccache": __SCCACHE_PATH}, __SCCACHE_PATH),
+    pytest.param({"ccache": __CCACHE_PATH}, __CCACHE_PATH),
+    pytest.param({"ccache": __CCACHE_PATH, "sccache": __SCCACHE_PATH}, __CCACHE_PATH)
+  ]
+)
+def test_returns_expected_compiler_launcher(available_caches, expected_launcher, __mock_which):
+  __mock_which.side_effect = available_caches.get
+  launcher = compiler_cache_handler.get_compiler_launcher()
+  assert (
+    launcher == expected_launcher
+  ), get_assertion_message("compiler launcher", expected_launcher, launcher)
+
+@pytest.mark.parametrize(
+  "launcher,expected_command",
+  [
+    pytest.param(__CCACHE_PATH, f"{__CCACHE_PATH} --print-stats"),
+    pytest.param(__SCCACHE_PATH, f"{__SCCACHE_PATH} --show-stats --stats-format=json")
+  ]
+)
+def test_calls_run_shell_command_when_getting_statistics(
+  launcher,
+  expected_command,
+  __mock_run_shell_command
+):
+  compiler_cache_handler.get_statistics(launcher)
+  __mock_run_shell_command.assert_called_once_with(expected_command)
+
+def test_does_not_call_run_shell_command_when_getting_statistics_of_unknown_launcher(
+  __mock_run_shell_command
+):
+  statistics = compiler_cache_handler.get_statistics("/usr/bin/distcc")
+  __mock_run_shell_command.assert_not_called()
+  assert (
+    statistics is None
+  ), get_assertion_message("statistics", None, statistics)
+
+@pytest.mark.parametrize(
+  "launcher,command_result,expected_statistics",
+  [
+    pytest.param(__CCACHE_PATH, (1, __CCACHE_OUTPUT), None, id="ccache error"),
+    pytest.param(__CCACHE_PATH, (0, "unexpected output"), None, id="ccache unexpected output"),
+    pytest.param(__CCACHE_PATH, (0, __CCACHE_OUTPUT), (15, 7), id="ccache"),
+    pytest.param(__SCCACHE_PATH, (1, __SCCACHE_OUTPUT), None, id="sccache error"),
+    pytest.param(__SCCACHE_PATH, (0, "not json"), None, id="sccache invalid json"),
+    pytest.param(__SCCACHE_PATH, (0, '{"stats": {}}'), None, id="sccache missing counts"),
+    pytest.param(__SCCACHE_PATH, (0, __SCCACHE_OUTPUT), (10, 3), id="sccache")
+  ]
+)
+def test_returns_expected_statistics(
+  launcher,
+  command_result,
+  expected_statistics,
+  __mock_run_shell_command
+):
+  __mock_run_shell_command.return_value = command_result
+  statistics = compiler_cache_handler.get_statistics(launcher)
+  assert (
+    statistics == expected_statistics
+  ), get_assertion_message("statistics", expected_statistics, statistics)
+
+@pytest.mark.parametrize(
+  "start,end,expected_message",
+  [
+    pytest.param((0, 0), (0, 0), "Compiler cache (ccache): 0 hits, 0 misses."),
+    pytest.param((5, 5), (8, 6), "Compiler cache (ccache): 3 hits, 1 misses (75.0% hit rate)."),
+    pytest.param((5, 5), (1, 1), "Compiler cache (ccache): 1 hits, 1 misses (50.0% hit rate).", id="Statistics reset")
+  ]
+)
+def test_returns_expected_statistics_message(start, end, expected_message):
+  message = compiler_cache_handler.get_statistics_message(__CCACHE_PATH, start, end)
+  assert (
+    message == expected_message
+  ), get_assertion_message("statistics message", expected_message, message)
+
+@pytest.fixture
+def __mock_which():
+  with patch("shutil.which") as mock_method:
+    yield mock_method
+
+@pytest.fixture
+def __mock_run_shell_command():
+  with patch(
+    "xmipp3_installer.installer.handlers.shell_handler.run_shell_command"
+  ) as mock_method:
+    mock_method.return_value = (0, "")
+    yield mock_method
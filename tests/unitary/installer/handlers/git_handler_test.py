@@ -2,13 +2,13 @@ from unittest.mock import patch, call, Mock
 
 import pytest
 
+from xmipp3_installer.installer.constants import paths
 from xmipp3_installer.installer.handlers import git_handler
 
 from .... import get_assertion_message
 
 __CWD = "/path/to/dummy"
 __COMMIT1 = "4156gc81921is"
-__COMMIT2 = "792cq86301pqw"
 __SHORT_COMMIT = "5c3a24f"
 __TAG_NAME = "tags/v3.24.06-Oceanus"
 __RAW_COMMIT_NAME = f"{__SHORT_COMMIT} tags/v3.24.06-Oceanus"
@@ -16,6 +16,20 @@ __BRANCH_NAME = "main"
 __REF_TAG_NAME = "v1.0.0"
 __GIT_LS_REMOTE_OUTPUT_BRANCH = f"4fb11a33809108b5f4550ac2657cb7cac448253f\trefs/heads/{__BRANCH_NAME}"
 __GIT_LS_REMOTE_OUTPUT_TAG = f"4fb11a33809108b5f4550ac2657cb7cac448253f\trefs/tags/{__REF_TAG_NAME}"
+__COMMIT_HASH = "4fb11a33809108b5f4550ac2657cb7cac448253f"
+__PEELED_COMMIT_HASH = "9a1c2d33809108b5f4550ac2657cb7cac4480000"
+__ANNOTATED_TAG_NAME = "v2.0.0"
+__GIT_LS_REMOTE_OUTPUT = "\n".join([
+  f"{__COMMIT_HASH}\trefs/heads/{__BRANCH_NAME}",
+  f"{__COMMIT_HASH}\trefs/heads/feature/with/slashes",
+  f"{__COMMIT_HASH}\trefs/tags/{__REF_TAG_NAME}",
+  f"{__COMMIT_HASH}\trefs/tags/{__ANNOTATED_TAG_NAME}",
+  f"{__PEELED_COMMIT_HASH}\trefs/tags/{__ANNOTATED_TAG_NAME}^{{}}",
+  f"{__COMMIT_HASH}\trefs/pull/1/head",
+  "malformed line"
+])
+__CACHE_TTL = 60
+__TIMEOUT = 5
 __GIT_COMMAND = "git command"
 __SOURCE = "source"
 __SOURCE_PATH = "/path/to/source"
@@ -30,13 +44,52 @@ __SOURCE_PATH = "/path/to/source"
 )
 def test_returns_expected_branch_when_getting_current_branch(
   __mock_run_shell_command,
-  expected_branch_name
+  expected_branch_name,
+  tmp_path
 ):
-  branch_name = git_handler.get_current_branch()
+  branch_name = git_handler.get_current_branch(dir=str(tmp_path))
   assert (
     branch_name == expected_branch_name
   ), get_assertion_message("branch name", expected_branch_name, branch_name)
 
+@pytest.mark.parametrize(
+  "head_content,expected_branch_name,expected_call_number",
+  [
+    pytest.param(f"ref: refs/heads/{__BRANCH_NAME}\n", __BRANCH_NAME, 0),
+    pytest.param("ref: refs/heads/feature/with/slashes\n", "feature/with/slashes", 0),
+    pytest.param(f"{__COMMIT_HASH}\n", "default_output", 1),
+    pytest.param("ref: refs/heads/\n", "default_output", 1)
+  ]
+)
+def test_reads_head_file_before_calling_git_when_getting_current_branch(
+  __mock_run_shell_command,
+  head_content,
+  expected_branch_name,
+  expected_call_number,
+  tmp_path
+):
+  git_dir = tmp_path / ".git"
+  git_dir.mkdir()
+  (git_dir / "HEAD").write_text(head_content)
+  branch_name = git_handler.get_current_branch(dir=str(tmp_path))
+  assert (
+    (branch_name, __mock_run_shell_command.call_count) == (expected_branch_name, expected_call_number)
+  ), get_assertion_message(
+    "branch name and git calls",
+    (expected_branch_name, expected_call_number),
+    (branch_name, __mock_run_shell_command.call_count)
+  )
+
+def test_calls_git_if_git_is_not_a_folder_when_getting_current_branch(
+  __mock_run_shell_command,
+  tmp_path
+):
+  (tmp_path / ".git").write_text("gitdir: /path/to/worktree")
+  git_handler.get_current_branch(dir=str(tmp_path))
+  __mock_run_shell_command.assert_called_once_with(
+    "git rev-parse --abbrev-ref HEAD", cwd=str(tmp_path)
+  )
+
 @pytest.mark.parametrize(
   "__mock_run_shell_command, expected_is_tag",
   [
@@ -65,23 +118,26 @@ def test_calls_run_shell_command_when_checking_if_branch_is_up_to_date(
   __mock_get_current_branch,
   __mock_run_shell_command
 ):
-  git_handler.is_branch_up_to_date(dir=__CWD)
+  git_handler.is_branch_up_to_date(dir=__CWD, timeout=__TIMEOUT)
   __mock_run_shell_command.assert_has_calls([
-    call("git fetch", cwd=__CWD),
-    call(f"git rev-parse {__mock_get_current_branch()}", cwd=__CWD),
-    call(f"git rev-parse origin/{__mock_get_current_branch()}")
+    call("git rev-parse HEAD", cwd=__CWD),
+    call(
+      f"git ls-remote --heads origin refs/heads/{__mock_get_current_branch()}",
+      cwd=__CWD,
+      timeout=__TIMEOUT
+    )
   ])
 
 @pytest.mark.parametrize(
   "__mock_get_current_branch,run_shell_command_returns,expected_is_up_to_date",
   [
-    pytest.param(None, [(0, ""), (0, __COMMIT1), (0, __COMMIT1)], False),
-    pytest.param("main", [(1, ""), (0, __COMMIT1), (0, __COMMIT1)], False),
-    pytest.param("main", [(0, ""), (0, __COMMIT1), (1, __COMMIT1)], False),
-    pytest.param("main", [(0, ""), (0, __COMMIT1), (0, __COMMIT2)], False),
-    pytest.param("main", [(0, ""), (1, __COMMIT1), (0, __COMMIT1)], True),
-    pytest.param("main", [(0, ""), (1, __COMMIT2), (0, __COMMIT1)], False),
-    pytest.param("main", [(0, ""), (0, __COMMIT1), (0, __COMMIT1)], True)
+    pytest.param("", [], None),
+    pytest.param("HEAD", [], None),
+    pytest.param(__BRANCH_NAME, [(1, "")], None),
+    pytest.param(__BRANCH_NAME, [(0, __COMMIT_HASH), (1, "")], None),
+    pytest.param(__BRANCH_NAME, [(0, __COMMIT_HASH), (0, "")], None),
+    pytest.param(__BRANCH_NAME, [(0, __PEELED_COMMIT_HASH), (0, __GIT_LS_REMOTE_OUTPUT_BRANCH)], False),
+    pytest.param(__BRANCH_NAME, [(0, __COMMIT_HASH), (0, __GIT_LS_REMOTE_OUTPUT_BRANCH)], True)
   ],
   indirect=["__mock_get_current_branch"]
 )
@@ -104,6 +160,128 @@ def test_returns_expected_value_when_checking_if_branch_is_up_to_date(
       is_up_to_date == expected_is_up_to_date
     ), get_assertion_message("is branch up to date result", expected_is_up_to_date, is_up_to_date)
 
+@pytest.mark.parametrize(
+  "__mock_get_cached_value,expected_is_up_to_date",
+  [
+    pytest.param(__COMMIT_HASH, True),
+    pytest.param(__PEELED_COMMIT_HASH, False)
+  ],
+  indirect=["__mock_get_cached_value"]
+)
+def test_uses_disk_cache_when_checking_if_branch_is_up_to_date(
+  __mock_get_current_branch,
+  __mock_get_cached_value,
+  __mock_remote_heads_cache_file,
+  expected_is_up_to_date
+):
+  with patch(
+    "xmipp3_installer.installer.handlers.shell_handler.run_shell_command",
+    return_value=(0, __COMMIT_HASH)
+  ) as mock_run_shell_command:
+    is_up_to_date = git_handler.is_branch_up_to_date(dir=__CWD, cache_ttl=__CACHE_TTL)
+  mock_run_shell_command.assert_called_once_with("git rev-parse HEAD", cwd=__CWD)
+  __mock_get_cached_value.assert_called_once_with(
+    __mock_remote_heads_cache_file, f"{__CWD}:{__mock_get_current_branch()}", __CACHE_TTL
+  )
+  assert (
+    is_up_to_date == expected_is_up_to_date
+  ), get_assertion_message("is branch up to date result", expected_is_up_to_date, is_up_to_date)
+
+@pytest.mark.parametrize(
+  "cache_ttl,ls_remote_return,expected_stored",
+  [
+    pytest.param(0, (0, __GIT_LS_REMOTE_OUTPUT_BRANCH), False),
+    pytest.param(__CACHE_TTL, (1, ""), False),
+    pytest.param(__CACHE_TTL, (0, ""), False),
+    pytest.param(__CACHE_TTL, (0, __GIT_LS_REMOTE_OUTPUT_BRANCH), True)
+  ]
+)
+def test_stores_remote_branch_commit_in_disk_cache_only_if_enabled_and_listed(
+  cache_ttl,
+  ls_remote_return,
+  expected_stored,
+  __mock_get_cached_value,
+  __mock_set_cached_value,
+  __mock_remote_heads_cache_file
+):
+  with patch(
+    "xmipp3_installer.installer.handlers.git_handler.get_current_branch",
+    return_value=__BRANCH_NAME
+  ), patch(
+    "xmipp3_installer.installer.handlers.shell_handler.run_shell_command",
+    side_effect=[(0, __COMMIT_HASH), ls_remote_return]
+  ):
+    git_handler.is_branch_up_to_date(dir=__CWD, cache_ttl=cache_ttl)
+  if expected_stored:
+    __mock_set_cached_value.assert_called_once_with(
+      __mock_remote_heads_cache_file, f"{__CWD}:{__BRANCH_NAME}", __COMMIT_HASH
+    )
+  else:
+    __mock_set_cached_value.assert_not_called()
+
+def test_calls_run_shell_command_when_checking_if_repository_is_shallow(__mock_run_shell_command):
+  git_handler.is_shallow_repository(dir=__CWD)
+  __mock_run_shell_command.assert_called_once_with(
+    "git rev-parse --is-shallow-repository",
+    cwd=__CWD
+  )
+
+@pytest.mark.parametrize(
+  "__mock_run_shell_command,expected_is_shallow",
+  [
+    pytest.param((0, "true"), True),
+    pytest.param((0, "false"), False),
+    pytest.param((1, "true"), False)
+  ],
+  indirect=["__mock_run_shell_command"]
+)
+def test_returns_expected_result_when_checking_if_repository_is_shallow(
+  __mock_run_shell_command,
+  expected_is_shallow
+):
+  is_shallow = git_handler.is_shallow_repository()
+  assert (
+    is_shallow == expected_is_shallow
+  ), get_assertion_message("is shallow repository result", expected_is_shallow, is_shallow)
+
+@pytest.mark.parametrize(
+  "__mock_run_shell_command,expected_calls",
+  [
+    pytest.param(
+      (0, ""),
+      [
+        call('git remote set-branches origin "*"', cwd=__CWD),
+        call("git fetch --unshallow --tags origin", cwd=__CWD)
+      ]
+    ),
+    pytest.param(
+      (1, "error"),
+      [call('git remote set-branches origin "*"', cwd=__CWD)]
+    )
+  ],
+  indirect=["__mock_run_shell_command"]
+)
+def test_calls_run_shell_command_when_unshallowing_repository(
+  __mock_run_shell_command,
+  expected_calls
+):
+  git_handler.unshallow_repository(dir=__CWD)
+  assert (
+    __mock_run_shell_command.call_args_list == expected_calls
+  ), get_assertion_message("shell commands", expected_calls, __mock_run_shell_command.call_args_list)
+
+@pytest.mark.parametrize(
+  "__mock_run_shell_command",
+  [pytest.param((0, "")), pytest.param((1, "error"))],
+  indirect=["__mock_run_shell_command"]
+)
+def test_returns_expected_result_when_unshallowing_repository(__mock_run_shell_command):
+  result = git_handler.unshallow_repository()
+  expected_result = __mock_run_shell_command()
+  assert (
+    result == expected_result
+  ), get_assertion_message("unshallow result", expected_result, result)
+
 def test_calls_run_shell_command_when_getting_current_commit(__mock_run_shell_command):
   git_handler.get_current_commit()
   __mock_run_shell_command.assert_called_once_with(
@@ -162,9 +340,9 @@ def test_calls_ref_exists_in_repo_when_checking_if_branch_exists(
   branch,
   __mock_ref_exists_in_repo
 ):
-  git_handler.branch_exists_in_repo(repo, branch)
+  git_handler.branch_exists_in_repo(repo, branch, cache_ttl=__CACHE_TTL)
   __mock_ref_exists_in_repo.assert_called_once_with(
-    repo, branch, True
+    repo, branch, True, __CACHE_TTL
   )
 
 @pytest.mark.parametrize(
@@ -192,9 +370,9 @@ def test_calls_ref_exists_in_repo_when_checking_if_tag_exists(
   tag,
   __mock_ref_exists_in_repo
 ):
-  git_handler.tag_exists_in_repo(repo, tag)
+  git_handler.tag_exists_in_repo(repo, tag, cache_ttl=__CACHE_TTL)
   __mock_ref_exists_in_repo.assert_called_once_with(
-    repo, tag, False
+    repo, tag, False, __CACHE_TTL
   )
 
 @pytest.mark.parametrize(
@@ -211,26 +389,126 @@ def test_returns_expected_value_when_checking_if_tag_exists(
   ), get_assertion_message("tag existence value", __mock_ref_exists_in_repo(), exists)
 
 @pytest.mark.parametrize(
-  "is_branch,repo,ref,expected_ref_type",
+  "repo,cache_ttl",
   [
-    pytest.param(False, "repo1", "ref1", "tags"),
-    pytest.param(False, "repo2", "ref2", "tags"),
-    pytest.param(True, "repo1", "ref1", "heads"),
-    pytest.param(True, "repo2", "ref2", "heads")
+    pytest.param("repo1", 0),
+    pytest.param("repo2", __CACHE_TTL)
   ]
 )
-def test_calls_run_shell_command_when_checking_if_ref_exists(
-  is_branch,
+def test_calls_get_remote_refs_when_checking_if_ref_exists(
+  repo,
+  cache_ttl,
+  __mock_get_remote_refs
+):
+  git_handler.__ref_exists_in_repo(repo, "ref", True, cache_ttl)
+  __mock_get_remote_refs.assert_called_once_with(repo, cache_ttl=cache_ttl)
+
+@pytest.mark.parametrize(
+  "repo",
+  [pytest.param("repo1"), pytest.param("repo2")]
+)
+def test_calls_run_shell_command_once_per_repository_when_getting_remote_refs(
   repo,
-  ref,
-  expected_ref_type,
   __mock_run_shell_command
 ):
-  git_handler.__ref_exists_in_repo(repo, ref, is_branch)
+  git_handler.get_remote_refs(repo)
+  git_handler.get_remote_refs(repo)
+  git_handler.branch_exists_in_repo(repo, __BRANCH_NAME)
+  git_handler.tag_exists_in_repo(repo, __REF_TAG_NAME)
   __mock_run_shell_command.assert_called_once_with(
-    f"git ls-remote --{expected_ref_type} {repo}.git refs/{expected_ref_type}/{ref}"
+    f"git ls-remote --heads --tags {repo}"
   )
 
+def test_calls_run_shell_command_again_after_clearing_remote_refs(
+  __mock_run_shell_command
+):
+  git_handler.get_remote_refs("repo")
+  git_handler.clear_remote_refs()
+  git_handler.get_remote_refs("repo")
+  expected_calls = [call("git ls-remote --heads --tags repo")] * 2
+  assert (
+    __mock_run_shell_command.call_args_list == expected_calls
+  ), get_assertion_message("shell calls", expected_calls, __mock_run_shell_command.call_args_list)
+
+def test_calls_run_shell_command_again_if_listing_remote_refs_failed(
+  __mock_run_shell_command
+):
+  __mock_run_shell_command.return_value = (1, "error")
+  git_handler.get_remote_refs("repo")
+  git_handler.get_remote_refs("repo")
+  expected_calls = [call("git ls-remote --heads --tags repo")] * 2
+  assert (
+    __mock_run_shell_command.call_args_list == expected_calls
+  ), get_assertion_message("shell calls", expected_calls, __mock_run_shell_command.call_args_list)
+
+@pytest.mark.parametrize(
+  "__mock_run_shell_command,expected_refs",
+  [
+    pytest.param((1, __GIT_LS_REMOTE_OUTPUT), {"heads": {}, "tags": {}}),
+    pytest.param((0, ""), {"heads": {}, "tags": {}}),
+    pytest.param(
+      (0, __GIT_LS_REMOTE_OUTPUT),
+      {
+        "heads": {__BRANCH_NAME: __COMMIT_HASH, "feature/with/slashes": __COMMIT_HASH},
+        "tags": {__REF_TAG_NAME: __COMMIT_HASH, __ANNOTATED_TAG_NAME: __PEELED_COMMIT_HASH}
+      }
+    )
+  ],
+  indirect=["__mock_run_shell_command"]
+)
+def test_returns_expected_remote_refs(__mock_run_shell_command, expected_refs):
+  remote_refs = git_handler.get_remote_refs("repo")
+  assert (
+    remote_refs == expected_refs
+  ), get_assertion_message("remote refs", expected_refs, remote_refs)
+
+@pytest.mark.parametrize(
+  "__mock_get_cached_value,expected_shell_calls",
+  [
+    pytest.param(None, 1),
+    pytest.param({"heads": {}, "tags": {}}, 0)
+  ],
+  indirect=["__mock_get_cached_value"]
+)
+def test_uses_disk_cache_when_getting_remote_refs(
+  __mock_get_cached_value,
+  expected_shell_calls,
+  __mock_run_shell_command,
+  __mock_remote_refs_cache_file
+):
+  git_handler.get_remote_refs("repo", cache_ttl=__CACHE_TTL)
+  __mock_get_cached_value.assert_called_once_with(
+    __mock_remote_refs_cache_file, "repo", __CACHE_TTL
+  )
+  assert (
+    __mock_run_shell_command.call_count == expected_shell_calls
+  ), get_assertion_message("call count", expected_shell_calls, __mock_run_shell_command.call_count)
+
+@pytest.mark.parametrize(
+  "cache_ttl,__mock_run_shell_command,expected_stored",
+  [
+    pytest.param(0, (0, __GIT_LS_REMOTE_OUTPUT_BRANCH), False),
+    pytest.param(__CACHE_TTL, (1, "error"), False),
+    pytest.param(__CACHE_TTL, (0, __GIT_LS_REMOTE_OUTPUT_BRANCH), True)
+  ],
+  indirect=["__mock_run_shell_command"]
+)
+def test_stores_remote_refs_in_disk_cache_only_if_enabled_and_listed(
+  cache_ttl,
+  __mock_run_shell_command,
+  expected_stored,
+  __mock_get_cached_value,
+  __mock_set_cached_value,
+  __mock_remote_refs_cache_file
+):
+  remote_refs = git_handler.get_remote_refs("repo", cache_ttl=cache_ttl)
+  expected_calls = [
+    call(__mock_remote_refs_cache_file, "repo", remote_refs)
+  ] if expected_stored else []
+  assert (
+    __mock_set_cached_value.call_args_list == expected_calls
+  ), get_assertion_message("cache writes", expected_calls, __mock_set_cached_value.call_args_list)
+
 @pytest.mark.parametrize(
   "__mock_run_shell_command,ref_name,is_branch,expected_exists",
   [
@@ -263,7 +541,7 @@ def test_returns_expected_value_when_checking_if_ref_exists(
   is_branch,
   expected_exists
 ):
-  exists = git_handler.__ref_exists_in_repo("repo_url", ref_name, is_branch)
+  exists = git_handler.__ref_exists_in_repo("repo_url", ref_name, is_branch, 0)
   assert (
     exists == expected_exists
   ), get_assertion_message("ref existence value", expected_exists, exists)
@@ -281,8 +559,8 @@ def test_calls_branch_exists_in_repo_when_getting_clonable_branch(
   __mock_branch_exists_in_repo,
   __mock_tag_exists_in_repo
 ):
-  git_handler.get_clonable_branch(repo, branch, "tag_name")
-  __mock_branch_exists_in_repo.assert_called_once_with(repo, branch)
+  git_handler.get_clonable_branch(repo, branch, "tag_name", cache_ttl=__CACHE_TTL)
+  __mock_branch_exists_in_repo.assert_called_once_with(repo, branch, cache_ttl=__CACHE_TTL)
 
 @pytest.mark.parametrize(
   "repo,branch,tag",
@@ -299,8 +577,8 @@ def test_calls_tag_exists_in_repo_when_getting_clonable_branch_and_branch_does_n
   __mock_tag_exists_in_repo
 ):
   __mock_branch_exists_in_repo.return_value = False
-  git_handler.get_clonable_branch(repo, branch, tag)
-  __mock_tag_exists_in_repo.assert_called_once_with(repo, tag)
+  git_handler.get_clonable_branch(repo, branch, tag, cache_ttl=__CACHE_TTL)
+  __mock_tag_exists_in_repo.assert_called_once_with(repo, tag, cache_ttl=__CACHE_TTL)
 
 def test_does_not_call_tag_exists_in_repo_when_getting_clonable_branch_and_branch_exists(
   __mock_branch_exists_in_repo,
@@ -465,6 +743,46 @@ def __mock_tag_exists_in_repo(request):
     mock_method.return_value = getattr(request, 'param', True)
     yield mock_method
 
+@pytest.fixture
+def __mock_get_remote_refs():
+  with patch(
+    "xmipp3_installer.installer.handlers.git_handler.get_remote_refs"
+  ) as mock_method:
+    mock_method.return_value = {"heads": {}, "tags": {}}
+    yield mock_method
+
+@pytest.fixture
+def __mock_get_cached_value(request):
+  with patch(
+    "xmipp3_installer.shared.ttl_cache.get_cached_value"
+  ) as mock_method:
+    mock_method.return_value = getattr(request, 'param', None)
+    yield mock_method
+
+@pytest.fixture
+def __mock_set_cached_value():
+  with patch(
+    "xmipp3_installer.shared.ttl_cache.set_cached_value"
+  ) as mock_method:
+    yield mock_method
+
+@pytest.fixture
+def __mock_remote_refs_cache_file():
+  cache_file = "/path/to/remote-refs.json"
+  with patch.object(paths, "REMOTE_REFS_CACHE_FILE", cache_file):
+    yield cache_file
+
+@pytest.fixture
+def __mock_remote_heads_cache_file():
+  cache_file = "/path/to/remote-heads.json"
+  with patch.object(paths, "REMOTE_HEADS_CACHE_FILE", cache_file):
+    yield cache_file
+
+@pytest.fixture(autouse=True)
+def __clear_remote_refs():
+  with patch.dict(git_handler.__REMOTE_REFS, clear=True):
+    yield
+
 @pytest.fixture(autouse=True)
 def __mock_get_path_source():
   with patch(
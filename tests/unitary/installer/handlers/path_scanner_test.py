@@ -0,0 +1,100 @@
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from xmipp3_installer.installer.handlers import path_scanner
+
+from .... import get_assertion_message
+
+__SOURCES = "src"
+__PROGRAMS = os.path.join(__SOURCES, "programs")
+__RULES = [
+  ("", "*.dblite", path_scanner.MATCH_FILES),
+  (__SOURCES, "*.o", path_scanner.MATCH_FILES),
+  (__PROGRAMS, "*", path_scanner.MATCH_EMPTY_DIRS),
+  ("", "__pycache__", path_scanner.MATCH_DIRS)
+]
+__TREE = [
+  "config.dblite",
+  os.path.join("docs", "other.o"),
+  os.path.join(__SOURCES, "lib", "file.o"),
+  os.path.join(__SOURCES, "lib", "file.cpp"),
+  os.path.join(__SOURCES, "lib", "__pycache__", "module.pyc"),
+  os.path.join(__PROGRAMS, "program", "main.cpp"),
+  os.path.join(__PROGRAMS, "empty", ""),
+  os.path.join("empty", ""),
+  os.path.join("build", "nested.o"),
+  os.path.join("build", "cache.dblite")
+]
+
+def test_returns_expected_matching_paths(__tree):
+  matching_paths = path_scanner.scan_paths(__RULES, root=__tree)
+  expected_paths = sorted([
+    "config.dblite",
+    os.path.join("build", "cache.dblite"),
+    os.path.join(__PROGRAMS, "empty"),
+    os.path.join(__SOURCES, "lib", "__pycache__"),
+    os.path.join(__SOURCES, "lib", "file.o")
+  ])
+  assert (
+    matching_paths == expected_paths
+  ), get_assertion_message("matching paths", expected_paths, matching_paths)
+
+def test_does_not_return_paths_inside_pruned_paths(__tree):
+  matching_paths = path_scanner.scan_paths(__RULES, pruned_paths=["build"], root=__tree)
+  pruned_matches = [path for path in matching_paths if path.startswith("build")]
+  assert (
+    pruned_matches == []
+  ), get_assertion_message("matches inside pruned paths", [], pruned_matches)
+
+@pytest.mark.parametrize(
+  "pruned_path",
+  [
+    pytest.param("build", id="Pruned path"),
+    pytest.param(os.path.join(__SOURCES, "lib", "__pycache__"), id="Matching directory")
+  ]
+)
+def test_does_not_enter_pruned_directories(pruned_path, __tree):
+  original_scandir = os.scandir
+  with patch("os.scandir", side_effect=original_scandir) as mock_scandir:
+    path_scanner.scan_paths(__RULES, pruned_paths=[pruned_path], root=__tree)
+  scanned_dir = os.path.join(__tree, pruned_path)
+  assert (
+    scanned_dir not in [args[0] for args, _ in mock_scandir.call_args_list]
+  ), get_assertion_message("scanned pruned directory", False, True)
+
+def test_scans_each_directory_once(__tree):
+  original_scandir = os.scandir
+  with patch("os.scandir", side_effect=original_scandir) as mock_scandir:
+    path_scanner.scan_paths(__RULES, root=__tree)
+  scanned_dirs = [args[0] for args, _ in mock_scandir.call_args_list]
+  assert (
+    len(scanned_dirs) == len(set(scanned_dirs))
+  ), get_assertion_message("scanned directories", sorted(set(scanned_dirs)), sorted(scanned_dirs))
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Symlinks need extra privileges")
+def test_does_not_follow_symlinks(__tree):
+  os.symlink(os.path.join(__tree, __SOURCES), os.path.join(__tree, "link"))
+  matching_paths = path_scanner.scan_paths(__RULES, root=__tree)
+  linked_matches = [path for path in matching_paths if path.startswith("link")]
+  assert (
+    linked_matches == []
+  ), get_assertion_message("matches inside symlinks", [], linked_matches)
+
+def test_returns_no_paths_if_root_does_not_exist(tmp_path):
+  matching_paths = path_scanner.scan_paths(__RULES, root=str(tmp_path / "missing"))
+  assert (
+    matching_paths == []
+  ), get_assertion_message("matching paths", [], matching_paths)
+
+@pytest.fixture
+def __tree(tmp_path):
+  for path in __TREE:
+    full_path = os.path.join(str(tmp_path), path)
+    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+    if os.path.basename(full_path):
+      with open(full_path, "w") as file:
+        file.write("")
+  yield str(tmp_path)
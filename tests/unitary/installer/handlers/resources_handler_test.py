@@ -0,0 +1,267 @@
+import os
+from unittest.mock import patch, mock_open
+
+import pytest
+
+from xmipp3_installer.installer.handlers import resources_handler
+
+from .... import get_assertion_message
+
+__MB = 1024 * 1024
+__MEMINFO = "\n".join([
+  "MemTotal:       16384000 kB",
+  "MemFree:         1024000 kB",
+  "MemAvailable:    8192000 kB"
+])
+__MEMINFO_AVAILABLE = 8192000 * 1024
+__CGROUP_V2_LIMIT_FILE = "/sys/fs/cgroup/memory.max"
+__CGROUP_V2_USAGE_FILE = "/sys/fs/cgroup/memory.current"
+__CGROUP_V1_LIMIT_FILE = "/sys/fs/cgroup/memory/memory.limit_in_bytes"
+__CGROUP_V1_USAGE_FILE = "/sys/fs/cgroup/memory/memory.usage_in_bytes"
+
+__CGROUP_V2_CPU_MAX_FILE = "/sys/fs/cgroup/cpu.max"
+__CGROUP_V1_CPU_QUOTA_FILE = "/sys/fs/cgroup/cpu/cpu.cfs_quota_us"
+__CGROUP_V1_CPU_PERIOD_FILE = "/sys/fs/cgroup/cpu/cpu.cfs_period_us"
+__AFFINITY = set(range(16))
+__PROC_CGROUP_FILE = "/proc/self/cgroup"
+__PROC_CGROUP_V2 = "0::/user.slice/build.scope"
+__PROC_CGROUP_V1 = "\n".join([
+  "5:memory:/batch/job",
+  "4:cpu,cpuacct:/batch/job",
+  "0::/"
+])
+
+@pytest.mark.parametrize(
+  "files,environment,expected_cpu_count",
+  [
+    pytest.param({}, {}, 16, id="Affinity"),
+    pytest.param({__CGROUP_V2_CPU_MAX_FILE: "max 100000"}, {}, 16, id="Unlimited cgroup v2"),
+    pytest.param({__CGROUP_V2_CPU_MAX_FILE: "400000 100000"}, {}, 4, id="cgroup v2 quota"),
+    pytest.param({__CGROUP_V2_CPU_MAX_FILE: "150000 100000"}, {}, 2, id="Fractional cgroup v2 quota"),
+    pytest.param({__CGROUP_V2_CPU_MAX_FILE: "invalid"}, {}, 16, id="Invalid cgroup v2 quota"),
+    pytest.param(
+      {__CGROUP_V1_CPU_QUOTA_FILE: "-1", __CGROUP_V1_CPU_PERIOD_FILE: "100000"}, {}, 16, id="Unlimited cgroup v1"
+    ),
+    pytest.param(
+      {__CGROUP_V1_CPU_QUOTA_FILE: "300000", __CGROUP_V1_CPU_PERIOD_FILE: "100000"}, {}, 3, id="cgroup v1 quota"
+    ),
+    pytest.param({}, {"SLURM_CPUS_PER_TASK": "6"}, 6, id="Slurm"),
+    pytest.param({}, {"NSLOTS": "5"}, 5, id="Grid Engine"),
+    pytest.param({}, {"PBS_NP": "0", "LSB_DJOB_NUMPROC": "7"}, 7, id="Invalid variables ignored"),
+    pytest.param({__CGROUP_V2_CPU_MAX_FILE: "200000 100000"}, {"SLURM_CPUS_PER_TASK": "6"}, 2, id="Lowest limit"),
+    pytest.param(
+      {
+        __PROC_CGROUP_FILE: __PROC_CGROUP_V2,
+        "/sys/fs/cgroup/user.slice/build.scope/cpu.max": "max 100000",
+        "/sys/fs/cgroup/user.slice/cpu.max": "500000 100000"
+      },
+      {},
+      5,
+      id="Quota of an ancestor of the process cgroup"
+    ),
+    pytest.param(
+      {
+        __PROC_CGROUP_FILE: __PROC_CGROUP_V1,
+        "/sys/fs/cgroup/cpu/batch/job/cpu.cfs_quota_us": "300000",
+        "/sys/fs/cgroup/cpu/batch/job/cpu.cfs_period_us": "100000"
+      },
+      {},
+      3,
+      id="cgroup v1 quota of the process cgroup"
+    ),
+    pytest.param({}, {"SLURM_CPUS_PER_TASK": "64"}, 16, id="Affinity below scheduler allocation")
+  ]
+)
+def test_returns_expected_available_cpu_count(
+  files,
+  environment,
+  expected_cpu_count,
+  __mock_open_files,
+  __mock_sched_getaffinity
+):
+  __mock_open_files.update(files)
+  with patch.dict(os.environ, environment, clear=True):
+    cpu_count = resources_handler.get_available_cpu_count()
+  assert (
+    cpu_count == expected_cpu_count
+  ), get_assertion_message("available CPU count", expected_cpu_count, cpu_count)
+
+@pytest.mark.parametrize(
+  "cpu_count,expected_cpu_count",
+  [
+    pytest.param(4, 4),
+    pytest.param(None, 1)
+  ]
+)
+def test_returns_cpu_count_if_affinity_is_not_available(
+  cpu_count,
+  expected_cpu_count,
+  __mock_open_files,
+  __mock_sched_getaffinity
+):
+  __mock_sched_getaffinity.side_effect = AttributeError()
+  with patch.dict(os.environ, {}, clear=True), patch("os.cpu_count", return_value=cpu_count):
+    available_cpu_count = resources_handler.get_available_cpu_count()
+  assert (
+    available_cpu_count == expected_cpu_count
+  ), get_assertion_message("available CPU count", expected_cpu_count, available_cpu_count)
+
+@pytest.mark.parametrize(
+  "cpu_count,expected_jobs",
+  [
+    pytest.param(1, 1),
+    pytest.param(4, 4),
+    pytest.param(10, 12)
+  ]
+)
+def test_returns_expected_default_job_number(cpu_count, expected_jobs):
+  with patch(
+    "xmipp3_installer.installer.handlers.resources_handler.get_available_cpu_count"
+  ) as mock_get_available_cpu_count:
+    mock_get_available_cpu_count.return_value = cpu_count
+    jobs = resources_handler.get_default_job_number()
+  assert (
+    jobs == expected_jobs
+  ), get_assertion_message("default job number", expected_jobs, jobs)
+
+@pytest.mark.parametrize(
+  "files,expected_memory",
+  [
+    pytest.param({}, None, id="Nothing readable"),
+    pytest.param({"/proc/meminfo": "MemTotal: 1 kB"}, None, id="No MemAvailable"),
+    pytest.param({"/proc/meminfo": __MEMINFO}, __MEMINFO_AVAILABLE // __MB, id="System memory"),
+    pytest.param(
+      {"/proc/meminfo": __MEMINFO, __CGROUP_V2_LIMIT_FILE: "max", __CGROUP_V1_LIMIT_FILE: str(2 ** 63)},
+      __MEMINFO_AVAILABLE // __MB,
+      id="Unlimited cgroups"
+    ),
+    pytest.param(
+      {"/proc/meminfo": __MEMINFO, __CGROUP_V2_LIMIT_FILE: str(4096 * __MB), __CGROUP_V2_USAGE_FILE: str(1024 * __MB)},
+      3072,
+      id="cgroup v2 limit"
+    ),
+    pytest.param(
+      {"/proc/meminfo": __MEMINFO, __CGROUP_V1_LIMIT_FILE: str(2048 * __MB), __CGROUP_V1_USAGE_FILE: str(512 * __MB)},
+      1536,
+      id="cgroup v1 limit"
+    ),
+    pytest.param(
+      {__CGROUP_V2_LIMIT_FILE: str(1024 * __MB), __CGROUP_V2_USAGE_FILE: str(2048 * __MB)},
+      0,
+      id="cgroup usage above limit"
+    ),
+    pytest.param(
+      {"/proc/meminfo": "MemAvailable: 1024 kB", __CGROUP_V2_LIMIT_FILE: str(4096 * __MB)},
+      1,
+      id="System memory below cgroup limit"
+    ),
+    pytest.param(
+      {
+        "/proc/meminfo": __MEMINFO,
+        __PROC_CGROUP_FILE: __PROC_CGROUP_V2,
+        "/sys/fs/cgroup/user.slice/build.scope/memory.max": str(2048 * __MB),
+        "/sys/fs/cgroup/user.slice/build.scope/memory.current": str(1024 * __MB),
+        "/sys/fs/cgroup/user.slice/memory.max": str(4096 * __MB),
+        "/sys/fs/cgroup/user.slice/memory.current": str(3584 * __MB)
+      },
+      512,
+      id="Lowest limit of the process cgroup and its ancestors"
+    ),
+    pytest.param(
+      {
+        "/proc/meminfo": __MEMINFO,
+        __PROC_CGROUP_FILE: __PROC_CGROUP_V1,
+        "/sys/fs/cgroup/memory/batch/job/memory.limit_in_bytes": str(2048 * __MB),
+        "/sys/fs/cgroup/memory/batch/job/memory.usage_in_bytes": str(512 * __MB)
+      },
+      1536,
+      id="cgroup v1 limit of the process cgroup"
+    ),
+    pytest.param(
+      {
+        "/proc/meminfo": __MEMINFO,
+        __PROC_CGROUP_FILE: "0::/docker/container",
+        __CGROUP_V2_LIMIT_FILE: str(1024 * __MB)
+      },
+      1024,
+      id="Process cgroup not visible from the container"
+    )
+  ]
+)
+def test_returns_expected_available_memory(files, expected_memory, __mock_open_files):
+  __mock_open_files.update(files)
+  available_memory = resources_handler.get_available_memory_mb()
+  assert (
+    available_memory == expected_memory
+  ), get_assertion_message("available memory", expected_memory, available_memory)
+
+@pytest.mark.parametrize(
+  "jobs,job_memory,__mock_get_available_memory_mb,expected_jobs",
+  [
+    pytest.param(8, 2048, None, 8, id="Unknown memory"),
+    pytest.param(8, 0, 1024, 8, id="Limit disabled"),
+    pytest.param(8, 2048, 32768, 8, id="Enough memory"),
+    pytest.param(8, 2048, 8192, 4, id="Limited by memory"),
+    pytest.param(8, 2048, 1024, 1, id="Always at least one job")
+  ],
+  indirect=["__mock_get_available_memory_mb"]
+)
+def test_returns_expected_memory_limited_jobs(
+  jobs,
+  job_memory,
+  __mock_get_available_memory_mb,
+  expected_jobs
+):
+  limited_jobs = resources_handler.get_memory_limited_jobs(jobs, job_memory)
+  assert (
+    limited_jobs == expected_jobs
+  ), get_assertion_message("memory limited jobs", expected_jobs, limited_jobs)
+
+def test_does_not_call_get_available_memory_mb_if_limit_is_disabled(
+  __mock_get_available_memory_mb
+):
+  resources_handler.get_memory_limited_jobs(8, 0)
+  __mock_get_available_memory_mb.assert_not_called()
+
+@pytest.mark.parametrize(
+  "load_average,expected_load",
+  [
+    pytest.param((1.5, 1.0, 0.5), 1.5),
+    pytest.param(OSError(), None),
+    pytest.param(AttributeError(), None)
+  ]
+)
+def test_returns_expected_load_average(load_average, expected_load):
+  with patch("os.getloadavg", create=True) as mock_getloadavg:
+    if isinstance(load_average, Exception):
+      mock_getloadavg.side_effect = load_average
+    else:
+      mock_getloadavg.return_value = load_average
+    load = resources_handler.get_load_average()
+  assert (
+    load == expected_load
+  ), get_assertion_message("load average", expected_load, load)
+
+@pytest.fixture
+def __mock_open_files():
+  files = {}
+  def __open(path, *_, **__):
+    if path not in files:
+      raise FileNotFoundError(path)
+    return mock_open(read_data=files[path])()
+  with patch("builtins.open", side_effect=__open):
+    yield files
+
+@pytest.fixture
+def __mock_get_available_memory_mb(request):
+  with patch(
+    "xmipp3_installer.installer.handlers.resources_handler.get_available_memory_mb"
+  ) as mock_method:
+    mock_method.return_value = getattr(request, 'param', None)
+    yield mock_method
+
+@pytest.fixture
+def __mock_sched_getaffinity():
+  with patch("os.sched_getaffinity", create=True) as mock_method:
+    mock_method.return_value = __AFFINITY
+    yield mock_method
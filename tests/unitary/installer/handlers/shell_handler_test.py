@@ -1,3 +1,7 @@
+import os
+import signal
+import subprocess
+from io import BytesIO
 from subprocess import PIPE
 from unittest.mock import patch, Mock, call
 
@@ -11,6 +15,8 @@ from .... import get_assertion_message
 
 __COMMAND = "echo Hi"
 __RET_CODE_TEXT = "return code"
+__CWD = "/path/to/cwd"
+__PID = 1234
 
 def test_calls_logger_to_show_command_when_running_shell_command(
   __mock_logger,
@@ -50,33 +56,186 @@ def test_calls_logger_to_show_error_when_running_shell_command(
     __mock_logger_red(__mock_run_command()[1])
   )
 
+@pytest.mark.parametrize(
+  "capture,tail_size,timeout",
+  [
+    pytest.param(shell_handler.CAPTURE_FULL, shell_handler.DEFAULT_TAIL_SIZE, None),
+    pytest.param(shell_handler.CAPTURE_TAIL, 10, 5)
+  ]
+)
+def test_calls_run_command_when_running_shell_command(
+  capture,
+  tail_size,
+  timeout,
+  __mock_run_command
+):
+  shell_handler.run_shell_command(
+    __COMMAND,
+    cwd=__CWD,
+    capture=capture,
+    tail_size=tail_size,
+    timeout=timeout
+  )
+  __mock_run_command.assert_called_once_with(
+    __COMMAND,
+    cwd=__CWD,
+    capture=capture,
+    tail_size=tail_size,
+    timeout=timeout
+  )
+
+@pytest.mark.parametrize(
+  "timeout,expected_new_session",
+  [
+    pytest.param(None, False),
+    pytest.param(5, True)
+  ]
+)
+def test_calls_popen_when_running_command(
+  timeout,
+  expected_new_session,
+  __mock_command_process
+):
+  shell_handler.__run_command(__COMMAND, cwd=__CWD, timeout=timeout)
+  __mock_command_process.assert_called_once_with(
+    __COMMAND,
+    cwd=__CWD,
+    env=os.environ,
+    stdout=PIPE,
+    stderr=PIPE,
+    shell=True,
+    start_new_session=expected_new_session
+  )
+
+@pytest.mark.parametrize("ret_code", [pytest.param(0), pytest.param(1)])
+def test_records_command_span_when_running_command(
+  ret_code,
+  __mock_command_process,
+  __mock_tracer_span
+):
+  __mock_command_process().wait.return_value = ret_code
+  shell_handler.__run_command(__COMMAND, cwd=__CWD)
+  __mock_tracer_span.assert_called_once_with(__COMMAND, "command", cwd=__CWD)
+  expected_args = {"pid": __PID, "ret_code": ret_code}
+  assert (
+    __mock_tracer_span.recorded_args == expected_args
+  ), get_assertion_message("span args", expected_args, __mock_tracer_span.recorded_args)
+
 def test_returns_interrupted_error_if_receives_keyboard_interrupt_when_running_command(
-  __mock_process_wait_keyboard_interrupt
+  __mock_command_process
 ):
+  __mock_command_process().wait.side_effect = [KeyboardInterrupt, 0]
   ret_code = shell_handler.__run_command(__COMMAND)[0]
   assert (
     ret_code == errors.INTERRUPTED_ERROR
   ), get_assertion_message(__RET_CODE_TEXT, errors.INTERRUPTED_ERROR, ret_code)
+  __mock_command_process().send_signal.assert_called_once_with(signal.SIGTERM)
 
 @pytest.mark.parametrize(
-  "ret_code,__mock_process_communicate,expected_message",
+  "ret_code,__mock_command_process,expected_message",
   [
-    pytest.param(0, ("test_output", "test_error"), "test_output"),
-    pytest.param(1, ("test_output", "test_error"), "test_error")
+    pytest.param(0, (b"test_output\n", b"test_error\n"), "test_output"),
+    pytest.param(0, (b"", b"test_error\n"), "test_error"),
+    pytest.param(1, (b"test_output\n", b"test_error\n"), "test_error"),
+    pytest.param(0, (b"\xff\xfeoutput", b""), "\ufffd\ufffdoutput")
   ],
-  indirect=["__mock_process_communicate"]
+  indirect=["__mock_command_process"]
 )
 def test_returns_expected_ret_code_and_message_when_running_command(
   ret_code,
-  __mock_process_communicate,
+  __mock_command_process,
   expected_message
 ):
-  __mock_process_communicate().returncode = ret_code
+  __mock_command_process().wait.return_value = ret_code
   return_values = shell_handler.__run_command(__COMMAND)
   assert (
     return_values == (ret_code, expected_message)
   ), get_assertion_message("return values", (ret_code, expected_message), return_values)
 
+@pytest.mark.parametrize(
+  "capture,tail_size,expected_message",
+  [
+    pytest.param(shell_handler.CAPTURE_FULL, 4, "0123456789"),
+    pytest.param(shell_handler.CAPTURE_TAIL, 4, "6789"),
+    pytest.param(shell_handler.CAPTURE_TAIL, 20, "0123456789"),
+    pytest.param(shell_handler.CAPTURE_TAIL, 0, ""),
+    pytest.param(shell_handler.CAPTURE_NONE, 4, "")
+  ]
+)
+def test_returns_captured_output_when_running_command(
+  capture,
+  tail_size,
+  expected_message,
+  __mock_command_process
+):
+  __mock_command_process().stdout = BytesIO(b"0123456789")
+  message = shell_handler.__run_command(__COMMAND, capture=capture, tail_size=tail_size)[1]
+  assert (
+    message == expected_message
+  ), get_assertion_message("message", expected_message, message)
+
+@pytest.mark.parametrize(
+  "wait_side_effect,expected_signals",
+  [
+    pytest.param(
+      [subprocess.TimeoutExpired(__COMMAND, 5), 0],
+      [call(__PID, signal.SIGTERM), call(__PID, signal.SIGKILL)]
+    ),
+    pytest.param(
+      [subprocess.TimeoutExpired(__COMMAND, 5), subprocess.TimeoutExpired(__COMMAND, 5), 0],
+      [call(__PID, signal.SIGTERM), call(__PID, signal.SIGKILL), call(__PID, signal.SIGKILL)]
+    )
+  ]
+)
+def test_terminates_process_group_when_command_times_out(
+  wait_side_effect,
+  expected_signals,
+  __mock_command_process,
+  __mock_killpg
+):
+  __mock_command_process().wait.side_effect = wait_side_effect
+  shell_handler.__run_command(__COMMAND, timeout=5)
+  assert (
+    __mock_killpg.call_args_list == expected_signals
+  ), get_assertion_message("signals sent", expected_signals, __mock_killpg.call_args_list)
+
+@pytest.mark.parametrize(
+  "__mock_command_process,expected_message",
+  [
+    pytest.param(
+      (b"", b""),
+      f"Command '{__COMMAND}' timed out after 5 seconds."
+    ),
+    pytest.param(
+      (b"output", b"error\n"),
+      f"error\nCommand '{__COMMAND}' timed out after 5 seconds."
+    )
+  ],
+  indirect=["__mock_command_process"]
+)
+def test_returns_timeout_error_when_command_times_out(
+  __mock_command_process,
+  expected_message,
+  __mock_killpg
+):
+  __mock_command_process().wait.side_effect = [subprocess.TimeoutExpired(__COMMAND, 5), 0]
+  return_values = shell_handler.__run_command(__COMMAND, timeout=5)
+  expected_return_values = (errors.TIMEOUT_ERROR, expected_message)
+  assert (
+    return_values == expected_return_values
+  ), get_assertion_message("return values", expected_return_values, return_values)
+
+def test_does_not_raise_when_process_group_no_longer_exists(
+  __mock_command_process,
+  __mock_killpg
+):
+  __mock_command_process().wait.side_effect = [subprocess.TimeoutExpired(__COMMAND, 5), 0]
+  __mock_killpg.side_effect = ProcessLookupError
+  ret_code = shell_handler.__run_command(__COMMAND, timeout=5)[0]
+  assert (
+    ret_code == errors.TIMEOUT_ERROR
+  ), get_assertion_message(__RET_CODE_TEXT, errors.TIMEOUT_ERROR, ret_code)
+
 @pytest.mark.parametrize(
   "substitute",
   [pytest.param(False), pytest.param(True)]
@@ -98,7 +257,41 @@ def test_calls_popen_when_running_shell_command_in_streaming(
   __mock_log_in_streaming
 ):
   shell_handler.run_shell_command_in_streaming(__COMMAND)
-  __mock_popen.assert_called_with(__COMMAND, cwd='./', stdout=PIPE, stderr=PIPE, shell=True)
+  __mock_popen.assert_called_with(__COMMAND, cwd='./', env=None, stdout=PIPE, stderr=PIPE, shell=True)
+
+def test_calls_popen_with_extended_environment_when_running_shell_command_in_streaming(
+  __mock_popen,
+  __mock_thread,
+  __mock_logger,
+  __mock_log_in_streaming
+):
+  env = {"MAKEFLAGS": "-j4"}
+  with patch.dict(os.environ, {"PATH": "/usr/bin"}, clear=True):
+    shell_handler.run_shell_command_in_streaming(__COMMAND, env=env)
+  __mock_popen.assert_called_with(
+    __COMMAND,
+    cwd='./',
+    env={"PATH": "/usr/bin", **env},
+    stdout=PIPE,
+    stderr=PIPE,
+    shell=True
+  )
+
+def test_records_command_span_when_running_shell_command_in_streaming(
+  __mock_popen,
+  __mock_thread,
+  __mock_logger,
+  __mock_log_in_streaming,
+  __mock_tracer_span
+):
+  __mock_popen().pid = __PID
+  __mock_popen().returncode = 0
+  shell_handler.run_shell_command_in_streaming(__COMMAND, cwd=__CWD)
+  __mock_tracer_span.assert_called_once_with(__COMMAND, "command", cwd=__CWD)
+  expected_args = {"pid": __PID, "ret_code": 0}
+  assert (
+    __mock_tracer_span.recorded_args == expected_args
+  ), get_assertion_message("span args", expected_args, __mock_tracer_span.recorded_args)
 
 @pytest.mark.parametrize(
   "show_output,show_error,substitute",
@@ -221,11 +414,30 @@ def __mock_process_wait_keyboard_interrupt(__mock_popen):
   yield __mock_popen
 
 @pytest.fixture
-def __mock_process_communicate(request, __mock_popen):
-  raw_messages = getattr(request, 'param', ('defaulf_output', 'default_err'))
-  messages = (raw_messages[0].encode(), raw_messages[1].encode())
-  __mock_popen().communicate.return_value = messages
-  yield __mock_popen
+def __mock_command_process(request):
+  stdout, stderr = getattr(request, 'param', (b"default_output", b"default_err"))
+  with patch("subprocess.Popen") as mock_method:
+    mock_process = Mock()
+    mock_process.pid = __PID
+    mock_process.stdout = BytesIO(stdout)
+    mock_process.stderr = BytesIO(stderr)
+    mock_process.wait.return_value = 0
+    mock_method.return_value = mock_process
+    yield mock_method
+
+@pytest.fixture
+def __mock_tracer_span():
+  with patch(
+    "xmipp3_installer.installer.tracer.Tracer.span"
+  ) as mock_method:
+    mock_method.recorded_args = {}
+    mock_method.return_value.__enter__.return_value = mock_method.recorded_args
+    yield mock_method
+
+@pytest.fixture
+def __mock_killpg():
+  with patch("os.killpg") as mock_method:
+    yield mock_method
 
 @pytest.fixture
 def __mock_log_in_streaming():
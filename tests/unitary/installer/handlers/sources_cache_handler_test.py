@@ -0,0 +1,173 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from xmipp3_installer.installer.constants import paths
+from xmipp3_installer.installer.handlers import sources_cache_handler
+
+from .... import get_assertion_message
+
+__SOURCE = "source"
+__REPO_URL = "https://repo/source.git"
+__MB = 1024 * 1024
+
+def test_returns_expected_mirror_path(__mock_sources_cache_path):
+  mirror_path = sources_cache_handler.get_mirror_path(__SOURCE)
+  expected_path = os.path.join(__mock_sources_cache_path, f"{__SOURCE}.git")
+  assert (
+    mirror_path == expected_path
+  ), get_assertion_message("mirror path", expected_path, mirror_path)
+
+def test_returns_expected_mirror_url(__mock_sources_cache_path):
+  mirror_url = sources_cache_handler.get_mirror_url(__SOURCE)
+  expected_url = f"file://{os.path.abspath(os.path.join(__mock_sources_cache_path, __SOURCE))}.git"
+  assert (
+    mirror_url == expected_url
+  ), get_assertion_message("mirror url", expected_url, mirror_url)
+
+@pytest.mark.parametrize("exists", [pytest.param(False), pytest.param(True)])
+def test_returns_expected_result_when_checking_if_mirror_exists(
+  exists,
+  __mock_sources_cache_path
+):
+  if exists:
+    os.makedirs(sources_cache_handler.get_mirror_path(__SOURCE))
+  result = sources_cache_handler.mirror_exists(__SOURCE)
+  assert (
+    result == exists
+  ), get_assertion_message("mirror existence", exists, result)
+
+def test_clones_mirror_when_updating_non_existing_mirror(
+  __mock_sources_cache_path,
+  __mock_run_shell_command
+):
+  sources_cache_handler.update_mirror(__SOURCE, __REPO_URL)
+  __mock_run_shell_command.assert_called_once_with(
+    f"git clone --mirror {__REPO_URL} {sources_cache_handler.get_mirror_path(__SOURCE)}"
+  )
+
+def test_returns_error_without_cloning_if_cache_cannot_be_created(
+  tmp_path,
+  __mock_run_shell_command
+):
+  cache_parent = tmp_path / "file"
+  cache_parent.write_text("")
+  with patch.object(paths, "SOURCES_CACHE_PATH", str(cache_parent / "sources")):
+    ret_code, _ = sources_cache_handler.update_mirror(__SOURCE, __REPO_URL)
+  __mock_run_shell_command.assert_not_called()
+  assert (
+    ret_code == 1
+  ), get_assertion_message("return code", 1, ret_code)
+
+def test_ignores_errors_when_marking_mirror_as_used(__mock_sources_cache_path):
+  os.makedirs(sources_cache_handler.get_mirror_path(__SOURCE))
+  with patch("os.utime", side_effect=PermissionError()) as mock_utime:
+    sources_cache_handler.mark_mirror_as_used(__SOURCE)
+  mock_utime.assert_called_once()
+
+def test_fetches_when_updating_existing_mirror(
+  __mock_sources_cache_path,
+  __mock_run_shell_command
+):
+  mirror_path = sources_cache_handler.get_mirror_path(__SOURCE)
+  os.makedirs(mirror_path)
+  sources_cache_handler.update_mirror(__SOURCE, __REPO_URL)
+  __mock_run_shell_command.assert_called_once_with(
+    "git fetch --prune --tags origin",
+    cwd=mirror_path
+  )
+
+@pytest.mark.parametrize(
+  "__mock_run_shell_command,expected_used",
+  [
+    pytest.param((0, ""), True),
+    pytest.param((1, "error"), False)
+  ],
+  indirect=["__mock_run_shell_command"]
+)
+def test_marks_mirror_as_used_only_on_success_when_updating_mirror(
+  __mock_run_shell_command,
+  expected_used,
+  __mock_sources_cache_path,
+  __mock_mark_mirror_as_used
+):
+  result = sources_cache_handler.update_mirror(__SOURCE, __REPO_URL)
+  assert (
+    __mock_mark_mirror_as_used.called == expected_used
+  ), get_assertion_message("mirror marked as used", expected_used, __mock_mark_mirror_as_used.called)
+  assert (
+    result == __mock_run_shell_command()
+  ), get_assertion_message("result", __mock_run_shell_command(), result)
+
+def test_returns_zero_size_when_cache_does_not_exist(__mock_sources_cache_path):
+  size = sources_cache_handler.get_cache_size()
+  assert (
+    size == 0
+  ), get_assertion_message("cache size", 0, size)
+
+def test_returns_expected_size_of_mirrors_when_getting_cache_size(__mock_sources_cache_path):
+  __create_mirror("a", 3)
+  __create_mirror("b", 5)
+  os.makedirs(os.path.join(__mock_sources_cache_path, "not-a-mirror"))
+  size = sources_cache_handler.get_cache_size()
+  expected_size = 3 + 5
+  assert (
+    size == expected_size
+  ), get_assertion_message("cache size", expected_size, size)
+
+def test_evicts_least_recently_used_mirrors_first(__mock_sources_cache_path):
+  __create_mirror("old", __MB, mtime=100)
+  __create_mirror("middle", __MB, mtime=200)
+  __create_mirror("new", __MB, mtime=300)
+  evicted = sources_cache_handler.evict_mirrors(2)
+  expected_evicted = [sources_cache_handler.get_mirror_path("old")]
+  assert (
+    evicted == expected_evicted
+  ), get_assertion_message("evicted mirrors", expected_evicted, evicted)
+
+def test_evicts_recently_used_mirrors_when_cache_is_still_over_size(__mock_sources_cache_path):
+  __create_mirror("used", __MB)
+  __create_mirror("other", __MB)
+  sources_cache_handler.mark_mirror_as_used("used")
+  sources_cache_handler.evict_mirrors(0)
+  remaining = [source for source in ("used", "other") if sources_cache_handler.mirror_exists(source)]
+  assert (
+    remaining == []
+  ), get_assertion_message("remaining mirrors", [], remaining)
+
+def test_does_not_evict_when_cache_fits(__mock_sources_cache_path):
+  __create_mirror("mirror", __MB)
+  evicted = sources_cache_handler.evict_mirrors(1)
+  assert (
+    evicted == []
+  ), get_assertion_message("evicted mirrors", [], evicted)
+
+def __create_mirror(source, size, mtime=None):
+  mirror_path = sources_cache_handler.get_mirror_path(source)
+  os.makedirs(mirror_path)
+  with open(os.path.join(mirror_path, "pack"), "wb") as pack_file:
+    pack_file.write(b"0" * size)
+  if mtime is not None:
+    os.utime(mirror_path, (mtime, mtime))
+
+@pytest.fixture
+def __mock_sources_cache_path(tmp_path):
+  cache_path = str(tmp_path / "sources")
+  with patch.object(paths, "SOURCES_CACHE_PATH", cache_path):
+    yield cache_path
+
+@pytest.fixture
+def __mock_run_shell_command(request):
+  with patch(
+    "xmipp3_installer.installer.handlers.shell_handler.run_shell_command"
+  ) as mock_method:
+    mock_method.return_value = getattr(request, 'param', (0, ""))
+    yield mock_method
+
+@pytest.fixture
+def __mock_mark_mirror_as_used():
+  with patch(
+    "xmipp3_installer.installer.handlers.sources_cache_handler.mark_mirror_as_used"
+  ) as mock_method:
+    yield mock_method
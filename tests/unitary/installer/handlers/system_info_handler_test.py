@@ -0,0 +1,100 @@
+from unittest.mock import patch
+
+import pytest
+
+from xmipp3_installer.installer.handlers import system_info_handler
+
+from .... import get_assertion_message
+
+__X86_CPUINFO = "\n".join([
+  "processor\t: 0",
+  "model name\t: Intel(R) Core(TM) i7",
+  "flags\t\t: fpu vme  sse2 avx2",
+  "",
+  "processor\t: 1",
+  "flags\t\t: fpu",
+  ""
+])
+__ARM_CPUINFO = "\n".join([
+  "processor\t: 0",
+  "Features\t: fp asimd evtstrm",
+  ""
+])
+__ETH_MAC_ADDRESS = "00:08:9b:c4:30:31"
+__WLP_MAC_ADDRESS = "00:08:9b:c4:30:32"
+__ETHERNET_TYPE = "1"
+__LOOPBACK_TYPE = "772"
+
+@pytest.mark.parametrize(
+  "cpuinfo,expected_flags",
+  [
+    pytest.param(__X86_CPUINFO, ["fpu", "vme", "sse2", "avx2"], id="x86"),
+    pytest.param(__ARM_CPUINFO, ["fp", "asimd", "evtstrm"], id="ARM"),
+    pytest.param("processor\t: 0\n", [], id="No flags"),
+    pytest.param(None, [], id="No cpuinfo")
+  ]
+)
+def test_returns_expected_cpu_flags(cpuinfo, expected_flags, tmp_path):
+  cpuinfo_file = tmp_path / "cpuinfo"
+  if cpuinfo is not None:
+    cpuinfo_file.write_text(cpuinfo)
+  with patch.object(system_info_handler, "__CPUINFO_FILE", str(cpuinfo_file)):
+    flags = system_info_handler.get_cpu_flags()
+  assert (
+    flags == expected_flags
+  ), get_assertion_message("CPU flags", expected_flags, flags)
+
+@pytest.mark.parametrize(
+  "interfaces,expected_mac_address",
+  [
+    pytest.param({}, None, id="No interfaces"),
+    pytest.param({"lo": (1, __LOOPBACK_TYPE, "00:00:00:00:00:00")}, None, id="Loopback"),
+    pytest.param({"docker0": (2, __ETHERNET_TYPE, __ETH_MAC_ADDRESS)}, None, id="Virtual interface"),
+    pytest.param({"eth0": (2, __ETHERNET_TYPE, __ETH_MAC_ADDRESS)}, __ETH_MAC_ADDRESS, id="Ethernet"),
+    pytest.param({"eth0": (2, __ETHERNET_TYPE, "00:00:00:00:00:00")}, None, id="Empty address"),
+    pytest.param({"eth0": (2, "", __ETH_MAC_ADDRESS)}, None, id="Unreadable type"),
+    pytest.param(
+      {
+        "lo": (1, __LOOPBACK_TYPE, "00:00:00:00:00:00"),
+        "wlp2s0": (3, __ETHERNET_TYPE, __WLP_MAC_ADDRESS),
+        "enp0s31f6": (2, __ETHERNET_TYPE, __ETH_MAC_ADDRESS)
+      },
+      __ETH_MAC_ADDRESS,
+      id="Lowest index first"
+    ),
+    pytest.param(
+      {
+        "ens10": (10, __ETHERNET_TYPE, __ETH_MAC_ADDRESS),
+        "eno9": (9, __ETHERNET_TYPE, __WLP_MAC_ADDRESS)
+      },
+      __WLP_MAC_ADDRESS,
+      id="Numeric index order"
+    )
+  ]
+)
+def test_returns_expected_mac_address(interfaces, expected_mac_address, __net_path):
+  for interface, (index, interface_type, address) in interfaces.items():
+    interface_path = __net_path / interface
+    interface_path.mkdir()
+    (interface_path / "ifindex").write_text(f"{index}\n")
+    if interface_type:
+      (interface_path / "type").write_text(f"{interface_type}\n")
+    (interface_path / "address").write_text(f"{address}\n")
+  mac_address = system_info_handler.get_mac_address()
+  assert (
+    mac_address == expected_mac_address
+  ), get_assertion_message("MAC address", expected_mac_address, mac_address)
+
+def test_returns_none_when_network_interfaces_cannot_be_listed(tmp_path):
+  with patch.object(system_info_handler, "__NET_INTERFACES_PATH", str(tmp_path / "missing")):
+    mac_address = system_info_handler.get_mac_address()
+  assert (
+    mac_address is None
+  ), get_assertion_message("MAC address", None, mac_address)
+
+@pytest.fixture
+def __net_path(tmp_path):
+  net_path = tmp_path / "net"
+  net_path.mkdir()
+  with patch.object(system_info_handler, "__NET_INTERFACES_PATH", str(net_path)):
+    yield net_path
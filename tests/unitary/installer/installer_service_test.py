@@ -2,7 +2,7 @@ from unittest.mock import patch, MagicMock
 
 import pytest
 
-from xmipp3_installer.application.cli.arguments import modes
+from xmipp3_installer.application.cli.arguments import modes, params
 from xmipp3_installer.application.logger import errors
 from xmipp3_installer.installer import installer_service, constants
 from xmipp3_installer.installer.constants import paths
@@ -15,9 +15,6 @@ from ... import get_assertion_message
 __MODE_NAME = "mode1"
 __SELECTED_MODE_MESASGE = "selected mode"
 __MODE_ALL_MESSAGE = "mode all"
-__INSTALLATION_INFO = {
-  'user': 'some-user-id'
-}
 __SEND_INSTALLATION_INFO_KEY = "send-info"
 __CONFIG_VALUES = {
   'key1': 'value1',
@@ -172,15 +169,14 @@ def test_calls_get_success_message_when_running_installer_with_zero_exit_code_de
     pytest.param(1, True, True)
   ]
 )
-def test_calls_get_installation_info_when_running_installer_deppending_on_attributes(
+def test_sends_installation_info_in_background_when_running_installer_deppending_on_attributes(
   __mock_mode_executors,
   ret_code,
   sends_installation_info,
   config_sends_installation_info,
   __mock_logger_log_error,
   __mock_logger,
-  __mock_get_installation_info,
-  __mock_versions_manager
+  __mock_send_in_background
 ):
   all_executor = __mock_mode_executors['all'](None)
   all_executor.sends_installation_info = sends_installation_info
@@ -192,41 +188,9 @@ def test_calls_get_installation_info_when_running_installer_deppending_on_attrib
   }
   installation_manager.run_installer()
   if sends_installation_info and config_sends_installation_info:
-    __mock_get_installation_info.assert_called_once_with(
-      __mock_versions_manager(),
-      ret_code=ret_code
-    )
-  else:
-    __mock_get_installation_info.assert_not_called()
-
-@pytest.mark.parametrize(
-  "sends_info,config_sends_info",
-  [
-    pytest.param(False, False),
-    pytest.param(False, True),
-    pytest.param(True, False),
-    pytest.param(True, True)
-  ]
-)
-def test_calls_send_installation_attempt_when_running_installer_deppending_on_attribute(
-  sends_info,
-  config_sends_info,
-  __mock_mode_executors,
-  __mock_logger,
-  __mock_get_installation_info,
-  __mock_send_installation_info
-):
-  __mock_mode_executors['all'](None).sends_installation_info = sends_info
-  installation_manager = installer_service.InstallationManager({})
-  installation_manager.context = {
-    **installation_manager.context,
-    __SEND_INSTALLATION_INFO_KEY: config_sends_info
-  }
-  installation_manager.run_installer()
-  if sends_info and config_sends_info:
-    __mock_send_installation_info.assert_called_once_with(__mock_get_installation_info())
+    __mock_send_in_background.assert_called_once_with(ret_code)
   else:
-    __mock_send_installation_info.assert_not_called()
+    __mock_send_in_background.assert_not_called()
 
 @pytest.mark.parametrize(
   "sends_info,config_sends_info",
@@ -242,9 +206,7 @@ def test_calls_logger_to_send_installation_info_deppending_on_attribute_when_run
   config_sends_info,
   __mock_mode_executors,
   __mock_logger_log_error,
-  __mock_logger,
-  __mock_get_installation_info,
-  __mock_send_installation_info
+  __mock_logger
 ):
   __mock_mode_executors['all'](None).sends_installation_info = sends_info
   installation_manager = installer_service.InstallationManager({})
@@ -342,28 +304,82 @@ def test_returns_interrupted_error_when_running_installer_and_user_interrupts_ex
     ret_code == errors.INTERRUPTED_ERROR
   ), get_assertion_message("return code", errors.INTERRUPTED_ERROR, ret_code)
 
-def test_does_not_send_installation_info_when_no_internet(
+@pytest.mark.parametrize(
+  "args,expected_trace_file",
+  [
+    pytest.param({}, None),
+    pytest.param({params.PARAM_TRACE: None}, None),
+    pytest.param({params.PARAM_TRACE: "trace.json"}, "trace.json")
+  ]
+)
+def test_stores_trace_file_out_of_context_when_initializing(
+  args,
+  expected_trace_file,
+  __mock_mode_executors
+):
+  installation_manager = installer_service.InstallationManager(args)
+  assert (
+    installation_manager.trace_file == expected_trace_file and
+    params.PARAM_TRACE not in installation_manager.context
+  ), get_assertion_message("stored trace file", expected_trace_file, installation_manager.trace_file)
+
+@pytest.mark.parametrize(
+  "trace_file,expected_started",
+  [
+    pytest.param(None, False),
+    pytest.param("trace.json", True)
+  ]
+)
+def test_starts_tracer_only_if_trace_file_is_given_when_running_installer(
+  trace_file,
+  expected_started,
   __mock_mode_executors,
-  __mock_get_installation_info,
-  __mock_send_installation_info,
-  __mock_logger,
-  __mock_internet_available
+  __mock_tracer_start
 ):
-  __mock_mode_executors['all'](None).sends_installation_info = True
-  installation_manager = installer_service.InstallationManager({})
-  installation_manager.context = {
-    **installation_manager.context,
-    __SEND_INSTALLATION_INFO_KEY: True
-  }
-  __mock_internet_available.return_value = False
+  installer_service.InstallationManager({params.PARAM_TRACE: trace_file}).run_installer()
+  started = __mock_tracer_start.called
+  assert (
+    started == expected_started
+  ), get_assertion_message("tracer started", expected_started, started)
 
-  installation_manager.run_installer()
+def test_sweeps_trash_in_background_when_running_installer(
+  __mock_mode_executors,
+  __mock_sweep_trash_in_background
+):
+  installer_service.InstallationManager({}).run_installer()
+  __mock_sweep_trash_in_background.assert_called_once_with(paths.TRASH_PATH)
 
-  __mock_send_installation_info.assert_not_called()
-  __mock_logger.assert_called_once_with(
-    "No internet connection available. Installation info will not be sent.",
-    show_in_terminal=False
-  )
+@pytest.mark.parametrize(
+  "__mock_tracer_write,expected_message",
+  [
+    pytest.param(None, None),
+    pytest.param("trace.json", "Trace of the run written to trace.json."),
+    pytest.param(OSError("denied"), "\033[93mThe trace of the run could not be written: denied\033[0m")
+  ],
+  indirect=["__mock_tracer_write"]
+)
+def test_calls_logger_with_trace_result_when_running_installer(
+  __mock_tracer_write,
+  expected_message,
+  __mock_mode_executors,
+  __mock_logger
+):
+  installer_service.InstallationManager({}).run_installer()
+  __mock_tracer_write.assert_called_once_with()
+  if expected_message:
+    __mock_logger.assert_called_once_with(expected_message)
+  else:
+    __mock_logger.assert_not_called()
+
+def test_records_mode_span_when_running_installer(
+  __mock_mode_executors,
+  __mock_logger
+):
+  with patch(
+    "xmipp3_installer.installer.tracer.Tracer.span"
+  ) as mock_span:
+    installer_service.InstallationManager({}).run_installer()
+  mock_span.assert_called_once_with(modes.MODE_ALL, "mode")
 
 def __mock_executor(ret_code, message):
   executor = MagicMock()
@@ -376,11 +392,38 @@ def __mock_executor(ret_code, message):
 def __mock_mode_executors(request):
   selected_executor = __mock_executor(getattr(request, 'param', (0, 0))[0], __SELECTED_MODE_MESASGE)
   all_executor = __mock_executor(getattr(request, 'param', (0, 0))[1], __MODE_ALL_MESSAGE)
-  with patch.object(mode_selector, 'MODE_EXECUTORS', {
+  mode_executors = {
     __MODE_NAME: lambda _: selected_executor,
     modes.MODE_ALL: lambda _: all_executor
-  }) as mock_object:
-    yield mock_object
+  }
+  with patch.object(mode_selector, 'get_mode_executor', side_effect=mode_executors.get):
+    yield mode_executors
+
+@pytest.fixture
+def __mock_tracer_start():
+  with patch(
+    "xmipp3_installer.installer.tracer.Tracer.start"
+  ) as mock_method:
+    yield mock_method
+
+@pytest.fixture(autouse=True)
+def __mock_sweep_trash_in_background():
+  with patch(
+    "xmipp3_installer.shared.file_operations.sweep_trash_in_background"
+  ) as mock_method:
+    yield mock_method
+
+@pytest.fixture(autouse=True)
+def __mock_tracer_write(request):
+  with patch(
+    "xmipp3_installer.installer.tracer.Tracer.write"
+  ) as mock_method:
+    result = getattr(request, 'param', None)
+    if isinstance(result, Exception):
+      mock_method.side_effect = result
+    else:
+      mock_method.return_value = result
+    yield mock_method
 
 @pytest.fixture
 def __mock_logger_log_error():
@@ -405,18 +448,10 @@ def __mock_logger():
     yield mock_method
 
 @pytest.fixture(autouse=True)
-def __mock_send_installation_info():
-  with patch(
-    "xmipp3_installer.api_client.api_client.send_installation_attempt"
-  ) as mock_method:
-    yield mock_method
-
-@pytest.fixture(autouse=True)
-def __mock_get_installation_info():
+def __mock_send_in_background():
   with patch(
-    "xmipp3_installer.api_client.assembler.installation_info_assembler.get_installation_info"
+    "xmipp3_installer.api_client.installation_info_sender.send_in_background"
   ) as mock_method:
-    mock_method.return_value = __INSTALLATION_INFO
     yield mock_method
 
 @pytest.fixture(autouse=True)
@@ -463,14 +498,6 @@ def __mock_logger_close():
   ) as mock_method:
     yield mock_method
 
-@pytest.fixture(autouse=True)
-def __mock_internet_available(request):
-  with patch(
-    "xmipp3_installer.api_client.api_client.internet_available"
-  ) as mock_method:
-    mock_method.return_value = getattr(request, 'param', True)
-    yield mock_method
-
 @pytest.fixture(autouse=True)
 def __mock_versions_context_key():
   with patch.object(
@@ -0,0 +1,157 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from xmipp3_installer.installer import jobserver
+
+from ... import get_assertion_message
+
+__JOBS = 4
+__JOB_MEMORY = 1024
+__CPU_COUNT = 8
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="Named pipes are not available")
+
+@pytest.mark.parametrize(
+  "build_tool,version_output,expected_support",
+  [
+    pytest.param("/usr/bin/make", "GNU Make 4.4.1\nBuilt for x86_64-pc-linux-gnu", True, id="GNU make 4.4"),
+    pytest.param("/usr/bin/make", "GNU Make 4.3\nBuilt for x86_64-pc-linux-gnu", False, id="GNU make 4.3"),
+    pytest.param("/usr/bin/ninja", "1.13.0", True, id="Ninja 1.13"),
+    pytest.param("/usr/bin/ninja-build", "1.12.1", False, id="Ninja 1.12"),
+    pytest.param("/usr/bin/gmake", "bmake 20240711", False, id="Unknown build tool"),
+    pytest.param("/usr/bin/ninja", None, False, id="Version not available"),
+    pytest.param(None, "1.13.0", False, id="Build tool not configured")
+  ]
+)
+def test_returns_expected_support_depending_on_build_tool(
+  build_tool,
+  version_output,
+  expected_support,
+  __mock_get_package_version
+):
+  __mock_get_package_version.return_value = version_output
+  is_supported = jobserver.Jobserver.is_supported(build_tool)
+  assert (
+    is_supported == expected_support
+  ), get_assertion_message("jobserver support", expected_support, is_supported)
+
+def test_creates_fifo_with_free_tokens_when_entering():
+  with jobserver.Jobserver(__JOBS, __JOB_MEMORY, interval=60) as server:
+    fifo_fd = os.open(server.fifo_path, os.O_RDONLY | os.O_NONBLOCK)
+    try:
+      tokens = os.read(fifo_fd, __JOBS)
+    finally:
+      os.close(fifo_fd)
+  assert (
+    tokens == b"+" * (__JOBS - 1)
+  ), get_assertion_message("free tokens", b"+" * (__JOBS - 1), tokens)
+
+def test_removes_fifo_when_exiting():
+  with jobserver.Jobserver(__JOBS, __JOB_MEMORY, interval=60) as server:
+    fifo_path = server.fifo_path
+  assert (
+    not os.path.exists(fifo_path)
+  ), get_assertion_message("fifo existence", False, os.path.exists(fifo_path))
+
+def test_returns_expected_environment():
+  with jobserver.Jobserver(__JOBS, __JOB_MEMORY, interval=60) as server:
+    environment = server.get_environment()
+    expected_environment = {"MAKEFLAGS": f"-j{__JOBS} --jobserver-auth=fifo:{server.fifo_path}"}
+  assert (
+    environment == expected_environment
+  ), get_assertion_message("jobserver environment", expected_environment, environment)
+
+@pytest.mark.parametrize(
+  "__mock_get_available_memory_mb,__mock_get_load_average,expected_withheld_tokens",
+  [
+    pytest.param(None, None, 0, id="Unknown resources"),
+    pytest.param(4 * __JOB_MEMORY, 1.0, 0, id="Resources available"),
+    pytest.param(__JOB_MEMORY // 2, 1.0, 1, id="Low memory"),
+    pytest.param(4 * __JOB_MEMORY, 2.0 * __CPU_COUNT, 1, id="High load"),
+    pytest.param(__JOB_MEMORY // 2, None, 1, id="Low memory and unknown load")
+  ],
+  indirect=["__mock_get_available_memory_mb", "__mock_get_load_average"]
+)
+def test_withholds_expected_tokens_when_adjusting_tokens(
+  __mock_get_available_memory_mb,
+  __mock_get_load_average,
+  expected_withheld_tokens
+):
+  with jobserver.Jobserver(__JOBS, __JOB_MEMORY, interval=60) as server:
+    server.adjust_tokens()
+    withheld_tokens = server.withheld_tokens
+  assert (
+    withheld_tokens == expected_withheld_tokens
+  ), get_assertion_message("withheld tokens", expected_withheld_tokens, withheld_tokens)
+
+@pytest.mark.parametrize(
+  "__mock_get_available_memory_mb,__mock_get_load_average",
+  [pytest.param(0, None)],
+  indirect=["__mock_get_available_memory_mb", "__mock_get_load_average"]
+)
+def test_does_not_withhold_more_than_free_tokens_when_adjusting_tokens(
+  __mock_get_available_memory_mb,
+  __mock_get_load_average
+):
+  with jobserver.Jobserver(__JOBS, __JOB_MEMORY, interval=60) as server:
+    for _ in range(2 * __JOBS):
+      server.adjust_tokens()
+    withheld_tokens = server.withheld_tokens
+  assert (
+    withheld_tokens == __JOBS - 1
+  ), get_assertion_message("withheld tokens", __JOBS - 1, withheld_tokens)
+
+def test_gives_back_withheld_token_when_resources_are_available_again(
+  __mock_get_available_memory_mb,
+  __mock_get_load_average
+):
+  __mock_get_available_memory_mb.return_value = 0
+  with jobserver.Jobserver(__JOBS, __JOB_MEMORY, interval=60) as server:
+    server.adjust_tokens()
+    __mock_get_available_memory_mb.return_value = 2 * __JOB_MEMORY
+    server.adjust_tokens()
+    withheld_tokens = server.withheld_tokens
+  assert (
+    withheld_tokens == 0
+  ), get_assertion_message("withheld tokens", 0, withheld_tokens)
+
+def test_does_not_get_available_memory_if_job_memory_is_disabled(
+  __mock_get_available_memory_mb,
+  __mock_get_load_average
+):
+  with jobserver.Jobserver(__JOBS, 0, interval=60) as server:
+    server.adjust_tokens()
+  __mock_get_available_memory_mb.assert_not_called()
+
+@pytest.fixture(autouse=True)
+def __mock_get_available_cpu_count():
+  with patch(
+    "xmipp3_installer.installer.handlers.resources_handler.get_available_cpu_count"
+  ) as mock_method:
+    mock_method.return_value = __CPU_COUNT
+    yield mock_method
+
+@pytest.fixture
+def __mock_get_available_memory_mb(request):
+  with patch(
+    "xmipp3_installer.installer.handlers.resources_handler.get_available_memory_mb"
+  ) as mock_method:
+    mock_method.return_value = getattr(request, 'param', None)
+    yield mock_method
+
+@pytest.fixture
+def __mock_get_load_average(request):
+  with patch(
+    "xmipp3_installer.installer.handlers.resources_handler.get_load_average"
+  ) as mock_method:
+    mock_method.return_value = getattr(request, 'param', None)
+    yield mock_method
+
+@pytest.fixture
+def __mock_get_package_version():
+  with patch(
+    "xmipp3_installer.installer.handlers.generic_package_handler.get_package_version"
+  ) as mock_method:
+    yield mock_method
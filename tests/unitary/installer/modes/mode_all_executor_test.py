@@ -2,7 +2,8 @@ from unittest.mock import patch, MagicMock, call
 
 import pytest
 
-from xmipp3_installer.application.cli.arguments import params
+from xmipp3_installer.application.cli.arguments import modes, params
+from xmipp3_installer.installer.constants import paths
 from xmipp3_installer.installer.modes.mode_get_sources_executor import ModeGetSourcesExecutor
 from xmipp3_installer.installer.modes.mode_executor import ModeExecutor
 from xmipp3_installer.installer.modes.mode_all_executor import ModeAllExecutor
@@ -13,10 +14,12 @@ from xmipp3_installer.installer.modes.mode_cmake.mode_compile_and_install_execut
 from .... import get_assertion_message
 
 __PARAM_OVERWRITE = "param_overwrite"
-__DUMMY_CONTEXT = {"key": "value"}
+__PARAM_RESUME = "param_resume"
+__CONTEXT = {__PARAM_RESUME: False}
+__DUMMY_CONTEXT = {**__CONTEXT, "key": "value"}
 
 def test_implements_interface_mode_cmake_executor():
-  executor = ModeAllExecutor({})
+  executor = ModeAllExecutor(__CONTEXT)
   assert (
     isinstance(executor, ModeExecutor)
   ), get_assertion_message(
@@ -27,7 +30,7 @@ def test_implements_interface_mode_cmake_executor():
 
 def test_overrides_expected_parent_config_values(__dummy_test_mode_cmake_executor):
   base_executor = __dummy_test_mode_cmake_executor({})
-  executor = ModeAllExecutor({})
+  executor = ModeAllExecutor(__CONTEXT)
   base_config = (
     not base_executor.logs_to_file,
     not base_executor.prints_with_substitution,
@@ -64,47 +67,48 @@ def test_calls_compile_and_install_executor_when_initializing(__mock_compile_and
     __DUMMY_CONTEXT
   )
 
-def test_instantiates_expected_executors_when_initializing(
+def test_builds_pipeline_with_expected_stages_when_initializing(
   __mock_config_executor,
   __mock_get_sources_executor,
   __mock_config_build_executor,
   __mock_compile_and_install_executor
 ):
-  executor = ModeAllExecutor({})
-  expected_executors = [
-    __mock_config_executor(),
-    __mock_get_sources_executor(),
-    __mock_config_build_executor(),
-    __mock_compile_and_install_executor()
+  executor = ModeAllExecutor(__CONTEXT)
+  expected_stages = [
+    (modes.MODE_CONFIG, __mock_config_executor().run),
+    (modes.MODE_GET_SOURCES, __mock_get_sources_executor().run),
+    (modes.MODE_CONFIG_BUILD, __mock_config_build_executor().run),
+    (modes.MODE_COMPILE_AND_INSTALL, __mock_compile_and_install_executor().run)
   ]
+  stages = [(stage.name, stage.run) for stage in executor.pipeline.stages]
   assert (
-    executor.executors == expected_executors
-  ), get_assertion_message("stored executors", expected_executors, executor.executors)
+    stages == expected_stages
+  ), get_assertion_message("pipeline stages", expected_stages, stages)
 
 def test_calls_config_executor_run_when_running_executor(
   __mock_config_executor
 ):
-  ModeAllExecutor({}).run()
+  ModeAllExecutor(__CONTEXT).run()
   __mock_config_executor().run.assert_called_once_with()
 
 def test_calls_get_sources_executor_run_if_config_executor_run_succeeds_when_running_executor(
   __mock_get_sources_executor
 ):
-  ModeAllExecutor({}).run()
+  ModeAllExecutor(__CONTEXT).run()
   __mock_get_sources_executor().run.assert_called_once_with()
 
-def test_does_not_call_get_sources_executor_run_if_config_executor_run_fails_when_running_executor(
+def test_calls_get_sources_executor_run_even_if_config_executor_run_fails_when_running_executor(
   __mock_config_executor,
   __mock_get_sources_executor
 ):
   __mock_config_executor().run.return_value = (1, "error")
-  ModeAllExecutor({}).run()
-  __mock_get_sources_executor().run.assert_not_called()
+  ModeAllExecutor(__CONTEXT).run()
+  __mock_get_sources_executor().run.assert_called_once_with()
 
 def test_calls_config_build_executor_run_if_config_get_sources_executor_run_succeed_when_running_executor(
   __mock_config_build_executor
 ):
-  ModeAllExecutor({}).run()
+  ModeAllExecutor(__CONTEXT).run()
   __mock_config_build_executor().run.assert_called_once_with()
 
 @pytest.mark.parametrize(
@@ -121,13 +125,13 @@ def test_does_not_call_config_build_executor_run_if_config_or_get_sources_execut
   __mock_get_sources_executor,
   __mock_config_build_executor
 ):
-  ModeAllExecutor({}).run()
+  ModeAllExecutor(__CONTEXT).run()
   __mock_config_build_executor().run.assert_not_called()
 
 def test_calls_compile_and_install_executor_run_if_other_executors_run_succeed_when_running_executor(
   __mock_compile_and_install_executor
 ):
-  ModeAllExecutor({}).run()
+  ModeAllExecutor(__CONTEXT).run()
   __mock_compile_and_install_executor().run.assert_called_once_with()
 
 @pytest.mark.parametrize(
@@ -149,52 +153,36 @@ def test_does_not_call_compile_and_install_executor_run_if_any_of_other_executor
   __mock_config_build_executor,
   __mock_compile_and_install_executor
 ):
-  ModeAllExecutor({}).run()
+  ModeAllExecutor(__CONTEXT).run()
   __mock_compile_and_install_executor().run.assert_not_called()
 
-@pytest.mark.parametrize(
-  "__mock_config_executor,__mock_get_sources_executor,"
-  "__mock_config_build_executor,__mock_compile_and_install_executor,"
-  "expected_call_number",
-  [
-    pytest.param((1, "error"), (1, "error"), (1, "error"), (1, "error"), 0),
-    pytest.param((1, "error"), (1, "error"), (1, "error"), (0, ""), 0),
-    pytest.param((1, "error"), (1, "error"), (0, ""), (1, "error"), 0),
-    pytest.param((1, "error"), (1, "error"), (0, ""), (0, ""), 0),
-    pytest.param((1, "error"), (0, ""), (1, "error"), (1, "error"), 0),
-    pytest.param((1, "error"), (0, ""), (1, "error"), (0, ""), 0),
-    pytest.param((1, "error"), (0, ""), (0, ""), (1, "error"), 0),
-    pytest.param((1, "error"), (0, ""), (0, ""), (0, ""), 0),
-    pytest.param((0, ""), (1, "error"), (1, "error"), (1, "error"), 1),
-    pytest.param((0, ""), (1, "error"), (1, "error"), (0, ""), 1),
-    pytest.param((0, ""), (1, "error"), (0, ""), (1, "error"), 1),
-    pytest.param((0, ""), (1, "error"), (0, ""), (0, ""), 1),
-    pytest.param((0, ""), (0, ""), (1, "error"), (1, "error"), 2),
-    pytest.param((0, ""), (0, ""), (1, "error"), (0, ""), 2),
-    pytest.param((0, ""), (0, ""), (0, ""), (1, "error"), 3),
-    pytest.param((0, ""), (0, ""), (0, ""), (0, ""), 3)
-  ],
-  indirect=[
-    "__mock_config_executor",
-    "__mock_get_sources_executor",
-    "__mock_config_build_executor",
-    "__mock_compile_and_install_executor"
-  ]
-)
-def test_calls_logger_expected_amount_of_times_when_running_executor(
-  __mock_config_executor,
-  __mock_get_sources_executor,
-  __mock_config_build_executor,
-  __mock_compile_and_install_executor,
-  expected_call_number,
+def test_builds_pipeline_with_expected_dependencies_when_initializing():
+  dependencies = ModeAllExecutor(__CONTEXT).pipeline.dependencies
+  expected_dependencies = {
+    modes.MODE_CONFIG: [],
+    modes.MODE_GET_SOURCES: [],
+    modes.MODE_CONFIG_BUILD: [modes.MODE_CONFIG, modes.MODE_GET_SOURCES],
+    modes.MODE_COMPILE_AND_INSTALL: [modes.MODE_CONFIG_BUILD]
+  }
+  assert (
+    dependencies == expected_dependencies
+  ), get_assertion_message("stage dependencies", expected_dependencies, dependencies)
+
+@pytest.mark.parametrize("resume", [pytest.param(False), pytest.param(True)])
+def test_calls_pipeline_run_when_running_executor(resume, __mock_pipeline_run):
+  ModeAllExecutor({__PARAM_RESUME: resume}).run()
+  __mock_pipeline_run.assert_called_once_with(resume=resume)
+
+def test_logs_timings_summary_when_running_executor(
+  __mock_pipeline_run,
+  __mock_get_timings_summary,
   __mock_logger
 ):
-  ModeAllExecutor({}).run()
-  expected_calls = [call("") for _ in range(expected_call_number)]
-  __mock_logger.assert_has_calls(expected_calls)
+  ModeAllExecutor(__CONTEXT).run()
+  expected_calls = [call(""), call(__mock_get_timings_summary())]
   assert (
-    __mock_logger.call_count == expected_call_number
-  ), get_assertion_message("call count", expected_call_number, __mock_logger.call_count)
+    __mock_logger.call_args_list == expected_calls
+  ), get_assertion_message("logger calls", expected_calls, __mock_logger.call_args_list)
 
 @pytest.mark.parametrize(
   "__mock_config_executor,__mock_get_sources_executor,__mock_config_build_executor,"
@@ -231,7 +219,7 @@ def test_returns_expected_result_when_running_executor(
   __mock_compile_and_install_executor,
   expected_result
 ):
-  result = ModeAllExecutor({}).run()
+  result = ModeAllExecutor(__CONTEXT).run()
   assert (
     result == expected_result
   ), get_assertion_message("executor run result", expected_result, result)
@@ -291,6 +279,36 @@ def __mock_param_overwrite():
   ) as mock_object:
     yield mock_object
 
+@pytest.fixture(autouse=True)
+def __mock_param_resume():
+  with patch.object(
+    params, "PARAM_RESUME", __PARAM_RESUME
+  ) as mock_object:
+    yield mock_object
+
+@pytest.fixture(autouse=True)
+def __mock_progress_file(tmp_path):
+  with patch.object(
+    paths, "PIPELINE_PROGRESS_FILE", str(tmp_path / "progress.json")
+  ) as mock_object:
+    yield mock_object
+
+@pytest.fixture
+def __mock_pipeline_run():
+  with patch(
+    "xmipp3_installer.installer.pipeline.Pipeline.run"
+  ) as mock_method:
+    mock_method.return_value = (0, "")
+    yield mock_method
+
+@pytest.fixture
+def __mock_get_timings_summary():
+  with patch(
+    "xmipp3_installer.installer.pipeline.Pipeline.get_timings_summary"
+  ) as mock_method:
+    mock_method.return_value = "summary"
+    yield mock_method
+
 @pytest.fixture(autouse=True)
 def __mock_logger():
   with patch(
@@ -1,9 +1,11 @@
-from unittest.mock import patch, MagicMock, call
+import os
+from unittest.mock import patch
 
 import pytest
 
 from xmipp3_installer.installer import constants
 from xmipp3_installer.installer.constants import paths
+from xmipp3_installer.installer.handlers import path_scanner
 from xmipp3_installer.installer.modes.mode_clean.mode_clean_bin_executor import ModeCleanBinExecutor
 from xmipp3_installer.installer.modes.mode_clean.mode_clean_executor import ModeCleanExecutor
 
@@ -63,148 +65,27 @@ def test_returns_expected_confirmation_message(__mock_logger_yellow):
     confirmation_message == expected_confirmation_message
   ), get_assertion_message("confirmation message", expected_confirmation_message, confirmation_message)
 
-def test_calls_path_rglob_when_getting_pycache_dirs(
-  __mock_path
-):
-  ModeCleanBinExecutor._get_pycache_dirs()
-  __mock_path().rglob.assert_called_once_with("__pycache__")
-  
-@pytest.mark.parametrize(
-  "expected_dirs",
-  [
-    pytest.param([]),
-    pytest.param(["/path/to/file1"]),
-    pytest.param(["/path/to/file1", "/path/to/file2"])
-  ]
-)
-def test_returns_expected_pycache_dirs(__mock_path, expected_dirs):
-  __mock_path().rglob.return_value = expected_dirs
-  pycache_dirs = ModeCleanBinExecutor._get_pycache_dirs()
-  assert (
-    pycache_dirs == expected_dirs
-  ), get_assertion_message("pycache dirs", expected_dirs, pycache_dirs)
-
-def test_calls_os_walk_when_getting_empty_dirs(
-  __mock_os_walk,
-  __mock_os_path_join
-):
-  ModeCleanBinExecutor._get_empty_dirs()
-  __mock_os_walk.assert_called_once_with(
-    __mock_os_path_join(
-      paths.SOURCES_PATH,
-      constants.XMIPP,
-      "applications",
-      "programs"
-    )
-  )
-
-def test_returns_expected_empty_dirs(__mock_os_walk):
-  __mock_os_walk.side_effect = None
-  __mock_os_walk.return_value = [
-    (paths.INSTALL_PATH, ["folder1", "folder2"], []),
-    (f"{paths.INSTALL_PATH}/folder1", [], ["file1"]),
-    (f"{paths.INSTALL_PATH}/folder2", ["subfolder1", "subfolder2"], []),
-    (f"{paths.INSTALL_PATH}/folder2/subfolder1", [], []),
-    (f"{paths.INSTALL_PATH}/folder2/subfolder2", ["empty"], []),
-    (f"{paths.INSTALL_PATH}/folder2/subfolder2/empty", [], [])
-  ]
-  expected_empty_dirs = [
-    f"{paths.INSTALL_PATH}/folder2/subfolder1",
-    f"{paths.INSTALL_PATH}/folder2/subfolder2/empty"
-  ]
-  empty_dirs = ModeCleanBinExecutor._get_empty_dirs()
-  assert (
-    empty_dirs == expected_empty_dirs
-  ), get_assertion_message("empty directories", expected_empty_dirs, empty_dirs)
-
-def test_calls_os_walk_when_getting_compilation_files(__mock_os_walk):
-  ModeCleanBinExecutor._get_compilation_files()
-  __mock_os_walk.assert_called_once_with(paths.SOURCES_PATH)
-
-def test_calls_glob_when_getting_compilation_files(
-  __mock_os_walk,
-  __mock_fnmatch_filter
-):
-  __mock_os_walk.side_effect = None
-  files = ["file1", "file2", "file3"]
-  __mock_os_walk.return_value = [("root", [], files)]
-  ModeCleanBinExecutor._get_compilation_files()
-  expected_calls = [
-    call(files, '*.so'),
-    call(files, '*.os'),
-    call(files, '*.o')
-  ]
-  __mock_fnmatch_filter.assert_has_calls(expected_calls)
-  assert (
-    __mock_fnmatch_filter.call_count == len(expected_calls)
-  ), get_assertion_message(
-    "call count",
-    len(expected_calls),
-    __mock_fnmatch_filter.call_count
-  )
-
-def test_returns_expected_compilation_files(
-  __mock_fnmatch_filter,
-  __mock_os_path_join
-):
-  __mock_fnmatch_filter.side_effect = [["file1"], ["file2", "file3"], ["file4"]]
-  expected_compilation_files = [
-    __mock_os_path_join(paths.SOURCES_PATH, file_name)
-    for file_name in ["file1", "file2", "file3", "file4"]
-  ]
-  compilation_files = ModeCleanBinExecutor._get_compilation_files()
-  assert (
-    compilation_files == expected_compilation_files
-  ), get_assertion_message("compilation files", expected_compilation_files, compilation_files)
-
-def test_calls_glob_when_getting_paths_to_delete(
-  __mock_glob,
-  __mock_get_compilation_files,
-  __mock_get_empty_dirs,
-  __mock_get_pycache_dirs
-):
-  ModeCleanBinExecutor({})._get_paths_to_delete()
-  __mock_glob.assert_called_once_with("**/*.dblite", recursive=True)
-
-def test_calls_get_compilation_files_when_getting_paths_to_delete(
-  __mock_glob,
-  __mock_get_compilation_files,
-  __mock_get_empty_dirs,
-  __mock_get_pycache_dirs
-):
-  ModeCleanBinExecutor({})._get_paths_to_delete()
-  __mock_get_compilation_files.assert_called_once_with()
-
-def test_calls_get_empty_dirs_when_getting_paths_to_delete(
-  __mock_glob,
-  __mock_get_compilation_files,
-  __mock_get_empty_dirs,
-  __mock_get_pycache_dirs
-):
+def test_calls_scan_paths_when_getting_paths_to_delete(__mock_scan_paths):
   ModeCleanBinExecutor({})._get_paths_to_delete()
-  __mock_get_empty_dirs.assert_called_once_with()
-
-def test_calls_get_pycache_dirs_when_getting_paths_to_delete(
-  __mock_glob,
-  __mock_get_compilation_files,
-  __mock_get_empty_dirs,
-  __mock_get_pycache_dirs
-):
-  ModeCleanBinExecutor({})._get_paths_to_delete()
-  __mock_get_pycache_dirs.assert_called_once_with()
+  __mock_scan_paths.assert_called_once_with(
+    [
+      ("", "*.dblite", path_scanner.MATCH_FILES),
+      (paths.SOURCES_PATH, "*.so", path_scanner.MATCH_FILES),
+      (paths.SOURCES_PATH, "*.os", path_scanner.MATCH_FILES),
+      (paths.SOURCES_PATH, "*.o", path_scanner.MATCH_FILES),
+      (
+        os.path.join(paths.SOURCES_PATH, constants.XMIPP, "applications", "programs"),
+        "*",
+        path_scanner.MATCH_EMPTY_DIRS
+      ),
+      ("", "__pycache__", path_scanner.MATCH_DIRS)
+    ],
+    pruned_paths=[paths.BUILD_PATH, paths.BINARIES_PATH, paths.TRASH_PATH]
+  )
 
-def test_returns_expected_paths_to_delete(
-  __mock_glob,
-  __mock_get_compilation_files,
-  __mock_get_empty_dirs,
-  __mock_get_pycache_dirs
-):
-  __mock_glob.return_value = ["globfile"]
+def test_returns_expected_paths_to_delete(__mock_scan_paths):
   expected_paths_to_delete = [
-    *__mock_glob(),
-    *__mock_get_compilation_files(),
-    *__mock_get_empty_dirs(),
-    *__mock_get_pycache_dirs(),
+    *__mock_scan_paths(),
     paths.BUILD_PATH,
     paths.BINARIES_PATH
   ]
@@ -251,61 +132,10 @@ def __mock_get_user_confirmation(request):
     mock_method.return_value = getattr(request, 'param', True)
     yield mock_method
 
-@pytest.fixture(autouse=True)
-def __mock_path():
-  new_path = MagicMock()
-  new_path.rglob.return_value = ['/path/to/file1', '/path/to/file2']
-  with patch("pathlib.Path") as mock_object:
-    mock_object.return_value = new_path
-    yield mock_object
-
-@pytest.fixture(autouse=True)
-def __mock_os_walk():
-  with patch("os.walk") as mock_method:
-    mock_method.side_effect = lambda root: [(root, [], [])]
-    yield mock_method
-
-@pytest.fixture(autouse=True)
-def __mock_os_path_join():
-  def __join_with_foward_slashes(*args):
-    args = [arg.rstrip("/") for arg in args]
-    return '/'.join([*args])
-  with patch("os.path.join") as mock_method:
-    mock_method.side_effect = __join_with_foward_slashes
-    yield mock_method
-
-@pytest.fixture(autouse=True)
-def __mock_fnmatch_filter():
-  with patch("fnmatch.filter") as mock_method:
-    mock_method.return_value = []
-    yield mock_method
-
-@pytest.fixture
-def __mock_glob():
-  with patch("glob.glob") as mock_method:
-    mock_method.return_value = []
-    yield mock_method
-
-@pytest.fixture
-def __mock_get_compilation_files():
-  with patch(
-    "xmipp3_installer.installer.modes.mode_clean.mode_clean_bin_executor.ModeCleanBinExecutor._get_compilation_files"
-  ) as mock_method:
-    mock_method.return_value = ["compilation_file1", "compilation_file2"]
-    yield mock_method
-
-@pytest.fixture
-def __mock_get_empty_dirs():
-  with patch(
-    "xmipp3_installer.installer.modes.mode_clean.mode_clean_bin_executor.ModeCleanBinExecutor._get_empty_dirs"
-  ) as mock_method:
-    mock_method.return_value = ["empty_dir"]
-    yield mock_method
-
 @pytest.fixture
-def __mock_get_pycache_dirs():
+def __mock_scan_paths():
   with patch(
-    "xmipp3_installer.installer.modes.mode_clean.mode_clean_bin_executor.ModeCleanBinExecutor._get_pycache_dirs"
+    "xmipp3_installer.installer.handlers.path_scanner.scan_paths"
   ) as mock_method:
-    mock_method.return_value = ["__pycache__"]
+    mock_method.return_value = ["file.dblite", "__pycache__"]
     yield mock_method
@@ -1,9 +1,13 @@
-from unittest.mock import patch
+import json
+from unittest.mock import patch, call
 
 import pytest
 
+from xmipp3_installer.application.cli.arguments import params
 from xmipp3_installer.application.logger import errors
+from xmipp3_installer.installer.constants import paths
 from xmipp3_installer.installer.modes.mode_executor import ModeExecutor
+from xmipp3_installer.installer.modes.mode_clean import mode_clean_executor
 from xmipp3_installer.installer.modes.mode_clean.mode_clean_executor import ModeCleanExecutor
 
 from ..... import get_assertion_message
@@ -114,26 +118,107 @@ def test_calls_get_paths_to_delete_when_running_executor(
   __dummy_test_mode_clean_executor({}).run()
   __mock_get_paths_to_delete.assert_called_once_with()
 
-def test_calls_delete_paths_to_delete_when_running_executor(
+def test_calls_move_to_trash_when_running_executor(
   __dummy_test_mode_clean_executor,
   __mock_get_confirmation,
   __mock_get_paths_to_delete,
+  __mock_move_to_trash
+):
+  __dummy_test_mode_clean_executor({}).run()
+  __mock_move_to_trash.assert_called_once_with(__mock_get_paths_to_delete(), paths.TRASH_PATH)
+
+def test_calls_delete_paths_with_unmoved_paths_when_running_executor(
+  __dummy_test_mode_clean_executor,
+  __mock_get_confirmation,
+  __mock_get_paths_to_delete,
+  __mock_move_to_trash,
   __mock_delete_paths
 ):
   __dummy_test_mode_clean_executor({}).run()
-  __mock_delete_paths.assert_called_once_with(__mock_get_paths_to_delete())
+  __mock_delete_paths.assert_called_once_with(__mock_move_to_trash()[1])
+
+def test_sweeps_new_batch_in_background_when_running_executor(
+  __dummy_test_mode_clean_executor,
+  __mock_get_confirmation,
+  __mock_get_paths_to_delete,
+  __mock_sweep_trash_in_background,
+  __mock_sweep_trash
+):
+  __dummy_test_mode_clean_executor({}).run()
+  __mock_sweep_trash_in_background.assert_called_once_with(paths.TRASH_PATH, ["batch"])
+  __mock_sweep_trash.assert_not_called()
+
+@pytest.mark.parametrize(
+  "__mock_move_to_trash",
+  [pytest.param((None, []))],
+  indirect=["__mock_move_to_trash"]
+)
+def test_does_not_sweep_trash_when_nothing_was_moved(
+  __dummy_test_mode_clean_executor,
+  __mock_get_confirmation,
+  __mock_get_paths_to_delete,
+  __mock_move_to_trash,
+  __mock_sweep_trash_in_background,
+  __mock_sweep_trash
+):
+  __dummy_test_mode_clean_executor({}).run()
+  __mock_sweep_trash_in_background.assert_not_called()
+  __mock_sweep_trash.assert_not_called()
+
+@pytest.mark.parametrize(
+  "__mock_sweep_trash_in_background",
+  [pytest.param(False)],
+  indirect=["__mock_sweep_trash_in_background"]
+)
+def test_sweeps_new_batch_in_foreground_when_background_sweep_cannot_start(
+  __dummy_test_mode_clean_executor,
+  __mock_get_confirmation,
+  __mock_get_paths_to_delete,
+  __mock_sweep_trash_in_background,
+  __mock_sweep_trash
+):
+  __dummy_test_mode_clean_executor({}).run()
+  __mock_sweep_trash.assert_called_once_with(paths.TRASH_PATH, ["batch"])
+
+def test_does_not_delete_paths_when_not_confirmed(
+  __dummy_test_mode_clean_executor,
+  __mock_get_confirmation,
+  __mock_move_to_trash,
+  __mock_delete_paths,
+  __mock_sweep_trash_in_background,
+  __mock_sweep_trash
+):
+  __mock_get_confirmation.return_value = False
+  __dummy_test_mode_clean_executor({}).run()
+  __mock_move_to_trash.assert_not_called()
+  __mock_delete_paths.assert_not_called()
+  __mock_sweep_trash_in_background.assert_not_called()
+  __mock_sweep_trash.assert_not_called()
 
+@pytest.mark.parametrize(
+  "__mock_sweep_trash_in_background,__mock_sweep_trash,expected_message",
+  [
+    pytest.param(True, 0, "The disk space is being freed in the background."),
+    pytest.param(False, 0, "Freed 0.0 MB of disk space."),
+    pytest.param(False, 3 * 1024 * 1024 + 512 * 1024, "Freed 3.5 MB of disk space.")
+  ],
+  indirect=["__mock_sweep_trash_in_background", "__mock_sweep_trash"]
+)
 def test_calls_logger_when_running_executor(
   __dummy_test_mode_clean_executor,
   __mock_get_confirmation,
   __mock_get_paths_to_delete,
+  __mock_sweep_trash_in_background,
+  __mock_sweep_trash,
+  expected_message,
   __mock_logger,
   __mock_get_done_message
 ):
   __dummy_test_mode_clean_executor({}).run()
-  __mock_logger.assert_called_once_with(
-    __mock_get_done_message()
-  )
+  __mock_logger.assert_has_calls([
+    call(__mock_get_done_message()),
+    call(expected_message)
+  ])
 
 @pytest.mark.parametrize(
   "__mock_get_confirmation",
@@ -151,6 +236,131 @@ def test_returns_expected_values_when_running_executor(
     values == expected_values
   ), get_assertion_message("return values", expected_values, values)
 
+@pytest.mark.parametrize(
+  "context,expected_values",
+  [
+    pytest.param({}, (False, None)),
+    pytest.param({params.PARAM_DRY_RUN: True, params.PARAM_REPORT: "report.json"}, (True, "report.json"))
+  ]
+)
+def test_sets_dry_run_and_report_file_values_in_constructor(
+  __dummy_test_mode_clean_executor,
+  context,
+  expected_values
+):
+  executor = __dummy_test_mode_clean_executor(context)
+  values = (executor.dry_run, executor.report_file)
+  assert (
+    values == expected_values
+  ), get_assertion_message("dry run and report file", expected_values, values)
+
+def test_does_not_ask_confirmation_nor_delete_when_running_dry_run(
+  __dummy_test_mode_clean_executor,
+  __mock_get_confirmation,
+  __mock_get_paths_to_delete,
+  __mock_get_report,
+  __mock_move_to_trash,
+  __mock_delete_paths,
+  __mock_sweep_trash_in_background,
+  __mock_sweep_trash
+):
+  values = __dummy_test_mode_clean_executor({params.PARAM_DRY_RUN: True}).run()
+  __mock_get_confirmation.assert_not_called()
+  __mock_move_to_trash.assert_not_called()
+  __mock_delete_paths.assert_not_called()
+  __mock_sweep_trash_in_background.assert_not_called()
+  __mock_sweep_trash.assert_not_called()
+  assert (
+    values == (0, "")
+  ), get_assertion_message("return values", (0, ""), values)
+
+def test_calls_logger_with_report_message_when_running_dry_run(
+  __dummy_test_mode_clean_executor,
+  __mock_get_paths_to_delete,
+  __mock_get_report,
+  __mock_logger
+):
+  __dummy_test_mode_clean_executor({params.PARAM_DRY_RUN: True}).run()
+  __mock_get_report.assert_called_once_with(__mock_get_paths_to_delete())
+  __mock_logger.assert_called_once_with(mode_clean_executor._get_report_message(__mock_get_report()))
+
+@pytest.mark.parametrize("dry_run", [pytest.param(False), pytest.param(True)])
+def test_writes_report_file_when_running_executor(
+  __dummy_test_mode_clean_executor,
+  dry_run,
+  __mock_get_confirmation,
+  __mock_get_paths_to_delete,
+  __mock_get_report,
+  tmp_path
+):
+  report_file = str(tmp_path / "report.json")
+  __dummy_test_mode_clean_executor({params.PARAM_DRY_RUN: dry_run, params.PARAM_REPORT: report_file}).run()
+  with open(report_file, encoding="utf-8") as report:
+    written_report = json.load(report)
+  assert (
+    written_report == __mock_get_report()
+  ), get_assertion_message("written report", __mock_get_report(), written_report)
+
+def test_does_not_get_report_when_running_executor_without_report_file(
+  __dummy_test_mode_clean_executor,
+  __mock_get_confirmation,
+  __mock_get_paths_to_delete,
+  __mock_get_report
+):
+  __dummy_test_mode_clean_executor({}).run()
+  __mock_get_report.assert_not_called()
+
+def test_returns_io_error_and_does_not_delete_when_report_cannot_be_written(
+  __dummy_test_mode_clean_executor,
+  __mock_get_confirmation,
+  __mock_get_paths_to_delete,
+  __mock_get_report,
+  __mock_move_to_trash,
+  tmp_path
+):
+  report_file = str(tmp_path / "missing" / "report.json")
+  ret_code, _ = __dummy_test_mode_clean_executor({params.PARAM_REPORT: report_file}).run()
+  __mock_move_to_trash.assert_not_called()
+  assert (
+    ret_code == errors.IO_ERROR
+  ), get_assertion_message("return code", errors.IO_ERROR, ret_code)
+
+def test_returns_existing_paths_with_sizes_when_getting_report(__mock_get_sizes):
+  with patch("os.path.lexists", side_effect=lambda path: path != "missing"):
+    report = mode_clean_executor._get_report(["build", "missing", "dist/bin"])
+  __mock_get_sizes.assert_called_once_with(["build", "dist/bin"])
+  expected_report = {
+    "paths": [{"path": "build", "size": 2048}, {"path": "dist/bin", "size": 1024}],
+    "total_size": 3072
+  }
+  assert (
+    report == expected_report
+  ), get_assertion_message("report", expected_report, report)
+
+@pytest.mark.parametrize(
+  "report,expected_message",
+  [
+    pytest.param({"paths": [], "total_size": 0}, "Nothing to delete."),
+    pytest.param(
+      {
+        "paths": [{"path": "build", "size": 3 * 1024 * 1024}, {"path": "dist/bin", "size": 512 * 1024}],
+        "total_size": 3 * 1024 * 1024 + 512 * 1024
+      },
+      "\n".join([
+        "The following paths would be deleted:",
+        "      3.0 MB  build",
+        "      0.5 MB  dist/bin",
+        "Total: 3.5 MB"
+      ])
+    )
+  ]
+)
+def test_returns_expected_report_message(report, expected_message):
+  message = mode_clean_executor._get_report_message(report)
+  assert (
+    message == expected_message
+  ), get_assertion_message("report message", expected_message, message)
+
 @pytest.fixture
 def __no_implementation_child():
   class DummyModeExecutor(ModeCleanExecutor):
@@ -229,6 +439,46 @@ def __mock_delete_paths():
   ) as mock_method:
     yield mock_method
 
+@pytest.fixture(autouse=True)
+def __mock_move_to_trash(request):
+  with patch(
+    "xmipp3_installer.shared.file_operations.move_to_trash"
+  ) as mock_method:
+    mock_method.return_value = getattr(request, 'param', ("batch", ["unmoved"]))
+    yield mock_method
+
+@pytest.fixture(autouse=True)
+def __mock_sweep_trash_in_background(request):
+  with patch(
+    "xmipp3_installer.shared.file_operations.sweep_trash_in_background"
+  ) as mock_method:
+    mock_method.return_value = getattr(request, 'param', True)
+    yield mock_method
+
+@pytest.fixture(autouse=True)
+def __mock_sweep_trash(request):
+  with patch(
+    "xmipp3_installer.shared.file_operations.sweep_trash"
+  ) as mock_method:
+    mock_method.return_value = getattr(request, 'param', 0)
+    yield mock_method
+
+@pytest.fixture
+def __mock_get_report():
+  with patch(
+    "xmipp3_installer.installer.modes.mode_clean.mode_clean_executor._get_report"
+  ) as mock_method:
+    mock_method.return_value = {"paths": [{"path": "path1", "size": 1024}], "total_size": 1024}
+    yield mock_method
+
+@pytest.fixture
+def __mock_get_sizes():
+  with patch(
+    "xmipp3_installer.shared.file_operations.get_sizes"
+  ) as mock_method:
+    mock_method.return_value = [2048, 1024]
+    yield mock_method
+
 @pytest.fixture(autouse=True)
 def __mock_get_done_message():
   with patch(
@@ -6,6 +6,7 @@ from xmipp3_installer.application.cli.arguments import params
 from xmipp3_installer.application.logger import errors
 from xmipp3_installer.installer import constants
 from xmipp3_installer.installer.constants import paths
+from xmipp3_installer.installer.handlers.cmake import cmake_constants
 from xmipp3_installer.installer.modes.mode_cmake.mode_cmake_executor import ModeCMakeExecutor
 from xmipp3_installer.installer.modes.mode_cmake.mode_compile_and_install_executor import ModeCompileAndInstallExecutor
 from xmipp3_installer.repository.config_vars import variables
@@ -22,13 +23,18 @@ __BUILD_PATH = "build_path"
 __BUILD_TYPE = "build_type"
 __CMAKE_KEY = "cmake_key"
 __N_JOBS = 5
+__JOB_MEMORY = 1024
+__JOBSERVER_ENVIRONMENT = {"MAKEFLAGS": "-j5 --jobserver-auth=fifo:/tmp/jobserver"}
+__LAUNCHER = "/usr/bin/ccache"
 __CONTEXT = {
   __PARAM_BRANCH: None,
   constants.VERSIONS_CONTEXT_KEY: DummyVersionsManager(),
   __PARAM_KEEP_OUTPUT: False,
   __PARAM_JOBS: __N_JOBS,
   __BUILD_TYPE: "Release",
-  __CMAKE_KEY: "/path/to/cmake"
+  __CMAKE_KEY: "/path/to/cmake",
+  variables.BUILD_JOB_MEMORY: str(__JOB_MEMORY),
+  variables.BUILD_JOBSERVER: False
 }
 __CALL_COUNT_ASSERTION_MESSAGE = "call count"
 __COMPILING_MESSAGE = "Compiling with CMake"
@@ -80,6 +86,35 @@ def test_stores_expected_context_values_when_initializing(jobs):
     executor.jobs == jobs
   ), get_assertion_message("stored jobs", jobs, executor.jobs)
 
+@pytest.mark.parametrize(
+  "job_memory,expected_job_memory",
+  [
+    pytest.param("4096", 4096),
+    pytest.param("0", 0),
+    pytest.param("invalid", 2048),
+    pytest.param(None, 2048)
+  ]
+)
+def test_stores_expected_job_memory_when_initializing(job_memory, expected_job_memory):
+  executor = ModeCompileAndInstallExecutor({
+    **__CONTEXT, variables.BUILD_JOB_MEMORY: job_memory
+  })
+  assert (
+    executor.job_memory == expected_job_memory
+  ), get_assertion_message("stored job memory", expected_job_memory, executor.job_memory)
+
+@pytest.mark.parametrize(
+  "use_jobserver",
+  [pytest.param(False), pytest.param(True)]
+)
+def test_stores_expected_jobserver_usage_when_initializing(use_jobserver):
+  executor = ModeCompileAndInstallExecutor({
+    **__CONTEXT, variables.BUILD_JOBSERVER: use_jobserver
+  })
+  assert (
+    executor.use_jobserver == use_jobserver
+  ), get_assertion_message("stored jobserver usage", use_jobserver, executor.use_jobserver)
+
 def test_calls_get_section_message_once_if_compilation_fails_when_running_cmake_mode(
   __mock_get_section_message,
   __mock_run_shell_command_in_streaming
@@ -267,6 +302,219 @@ def test_returns_expected_result_when_running_cmake_mode(
     result == expected_output
   ), get_assertion_message("cmake mode result", expected_output, result)
 
+@pytest.mark.parametrize(
+  "__mock_get_cmake_cache_variable,expected_calls",
+  [
+    pytest.param(None, []),
+    pytest.param(__LAUNCHER, [call(__LAUNCHER), call(__LAUNCHER)])
+  ],
+  indirect=["__mock_get_cmake_cache_variable"]
+)
+def test_calls_get_statistics_only_if_compiler_launcher_is_set_when_running_cmake_mode(
+  __mock_get_cmake_cache_variable,
+  expected_calls,
+  __mock_get_statistics
+):
+  ModeCompileAndInstallExecutor(__CONTEXT.copy())._run_cmake_mode(__CMAKE)
+  assert (
+    __mock_get_statistics.call_args_list == expected_calls
+  ), get_assertion_message("get statistics calls", expected_calls, __mock_get_statistics.call_args_list)
+
+@pytest.mark.parametrize(
+  "__mock_get_cmake_cache_variable", [pytest.param(__LAUNCHER)], indirect=True
+)
+def test_calls_logger_with_compiler_cache_statistics_when_running_cmake_mode(
+  __mock_get_cmake_cache_variable,
+  __mock_get_statistics,
+  __mock_logger
+):
+  __mock_get_statistics.side_effect = [(1, 2), (11, 12)]
+  ModeCompileAndInstallExecutor(__CONTEXT.copy())._run_cmake_mode(__CMAKE)
+  __mock_logger.assert_any_call("Compiler cache (ccache): 10 hits, 10 misses (50.0% hit rate).")
+
+@pytest.mark.parametrize(
+  "statistics",
+  [
+    pytest.param([None, None]),
+    pytest.param([None, (11, 12)]),
+    pytest.param([(1, 2), None])
+  ]
+)
+def test_does_not_log_compiler_cache_statistics_if_not_available_when_running_cmake_mode(
+  statistics,
+  __mock_get_cmake_cache_variable,
+  __mock_get_statistics,
+  __mock_logger
+):
+  __mock_get_cmake_cache_variable.return_value = __LAUNCHER
+  __mock_get_statistics.side_effect = statistics
+  ModeCompileAndInstallExecutor(__CONTEXT.copy())._run_cmake_mode(__CMAKE)
+  logged_texts = [logger_call.args[0] for logger_call in __mock_logger.call_args_list]
+  assert (
+    not any(text.startswith("Compiler cache") for text in logged_texts)
+  ), get_assertion_message("logged messages", "no compiler cache statistics", logged_texts)
+
+def test_calls_get_memory_limited_jobs_when_running_cmake_mode(
+  __mock_get_memory_limited_jobs
+):
+  ModeCompileAndInstallExecutor(__CONTEXT.copy())._run_cmake_mode(__CMAKE)
+  __mock_get_memory_limited_jobs.assert_called_once_with(__N_JOBS, __JOB_MEMORY)
+
+@pytest.mark.parametrize(
+  "__mock_get_memory_limited_jobs,expected_logged",
+  [
+    pytest.param(__N_JOBS, False),
+    pytest.param(2, True)
+  ],
+  indirect=["__mock_get_memory_limited_jobs"]
+)
+def test_calls_logger_with_reduced_jobs_only_if_memory_limits_them_when_running_cmake_mode(
+  __mock_get_memory_limited_jobs,
+  expected_logged,
+  __mock_logger
+):
+  ModeCompileAndInstallExecutor(__CONTEXT.copy())._run_cmake_mode(__CMAKE)
+  logged_texts = [logger_call[0][0] for logger_call in __mock_logger.call_args_list]
+  logged = any(f"Compiling with 2 jobs instead of {__N_JOBS}" in text for text in logged_texts)
+  assert (
+    logged == expected_logged
+  ), get_assertion_message("reduced jobs message logged", expected_logged, logged)
+
+@pytest.mark.parametrize(
+  "__mock_get_memory_limited_jobs",
+  [pytest.param(2)],
+  indirect=["__mock_get_memory_limited_jobs"]
+)
+def test_calls_run_shell_command_in_streaming_with_memory_limited_jobs_when_running_cmake_mode(
+  __mock_get_memory_limited_jobs,
+  __mock_run_shell_command_in_streaming,
+  __mock_build_path,
+  __mock_build_type
+):
+  ModeCompileAndInstallExecutor(__CONTEXT.copy())._run_cmake_mode(__CMAKE)
+  assert (
+    __mock_run_shell_command_in_streaming.call_args_list[0] == call(
+      f"{__CMAKE} --build {__mock_build_path} --config {__CONTEXT[__mock_build_type]} -j 2",
+      show_output=True,
+      substitute=True
+    )
+  ), get_assertion_message(
+    "compilation command",
+    "command with 2 jobs",
+    __mock_run_shell_command_in_streaming.call_args_list[0]
+  )
+
+@pytest.mark.parametrize(
+  "use_jobserver,is_supported,expected_jobserver",
+  [
+    pytest.param(False, False, False),
+    pytest.param(False, True, False),
+    pytest.param(True, False, False),
+    pytest.param(True, True, True)
+  ]
+)
+def test_uses_jobserver_only_if_enabled_and_supported_when_running_cmake_mode(
+  use_jobserver,
+  is_supported,
+  expected_jobserver,
+  __mock_jobserver,
+  __mock_run_shell_command_in_streaming,
+  __mock_build_path,
+  __mock_build_type
+):
+  __mock_jobserver.is_supported.return_value = is_supported
+  ModeCompileAndInstallExecutor({
+    **__CONTEXT, variables.BUILD_JOBSERVER: use_jobserver
+  })._run_cmake_mode(__CMAKE)
+  expected_command = f"{__CMAKE} --build {__mock_build_path} --config {__CONTEXT[__mock_build_type]}"
+  expected_call = call(
+    expected_command, show_output=True, substitute=True, env=__JOBSERVER_ENVIRONMENT
+  ) if expected_jobserver else call(
+    f"{expected_command} -j {__N_JOBS}", show_output=True, substitute=True
+  )
+  assert (
+    __mock_run_shell_command_in_streaming.call_args_list[0] == expected_call
+  ), get_assertion_message(
+    "compilation command", expected_call, __mock_run_shell_command_in_streaming.call_args_list[0]
+  )
+  if expected_jobserver:
+    __mock_jobserver.assert_called_once_with(__N_JOBS, __JOB_MEMORY)
+  else:
+    __mock_jobserver.assert_not_called()
+
+@pytest.mark.parametrize(
+  "__mock_get_cmake_cache_variable",
+  [pytest.param("/usr/bin/ninja")],
+  indirect=["__mock_get_cmake_cache_variable"]
+)
+def test_checks_jobserver_support_of_configured_build_tool_when_running_cmake_mode(
+  __mock_get_cmake_cache_variable,
+  __mock_jobserver
+):
+  ModeCompileAndInstallExecutor({
+    **__CONTEXT, variables.BUILD_JOBSERVER: True
+  })._run_cmake_mode(__CMAKE)
+  __mock_get_cmake_cache_variable.assert_any_call(paths.CMAKE_CACHE_FILE, cmake_constants.CMAKE_MAKE_PROGRAM)
+  __mock_jobserver.is_supported.assert_called_once_with("/usr/bin/ninja")
+
+def test_calls_get_build_entries_with_log_position_when_running_cmake_mode(
+  __mock_get_log_position,
+  __mock_get_build_entries
+):
+  ModeCompileAndInstallExecutor(__CONTEXT.copy())._run_cmake_mode(__CMAKE)
+  __mock_get_build_entries.assert_called_once_with(paths.NINJA_LOG_FILE, __mock_get_log_position())
+
+@pytest.mark.parametrize(
+  "__mock_run_shell_command_in_streaming",
+  [pytest.param(1)],
+  indirect=["__mock_run_shell_command_in_streaming"]
+)
+def test_does_not_call_get_build_entries_if_compilation_fails_when_running_cmake_mode(
+  __mock_run_shell_command_in_streaming,
+  __mock_get_build_entries
+):
+  ModeCompileAndInstallExecutor(__CONTEXT.copy())._run_cmake_mode(__CMAKE)
+  __mock_get_build_entries.assert_not_called()
+
+@pytest.mark.parametrize(
+  "__mock_get_build_entries,expected_written",
+  [
+    pytest.param([], False),
+    pytest.param([("lib/a.o", 0, 1000)], True)
+  ],
+  indirect=["__mock_get_build_entries"]
+)
+def test_writes_build_report_only_if_targets_were_built_when_running_cmake_mode(
+  __mock_get_build_entries,
+  expected_written,
+  __mock_write_build_report,
+  __mock_logger
+):
+  ModeCompileAndInstallExecutor(__CONTEXT.copy())._run_cmake_mode(__CMAKE)
+  written = __mock_write_build_report.called
+  logged_texts = [logger_call[0][0] for logger_call in __mock_logger.call_args_list]
+  logged = any(text.startswith("Build report saved to") for text in logged_texts)
+  assert (
+    written == logged == expected_written
+  ), get_assertion_message("build report written and logged", expected_written, (written, logged))
+
+@pytest.mark.parametrize(
+  "__mock_get_build_entries",
+  [pytest.param([("lib/a.o", 0, 1000)])],
+  indirect=["__mock_get_build_entries"]
+)
+def test_does_not_log_build_report_if_it_cannot_be_written_when_running_cmake_mode(
+  __mock_get_build_entries,
+  __mock_write_build_report,
+  __mock_logger
+):
+  __mock_write_build_report.side_effect = OSError()
+  ret_code, _ = ModeCompileAndInstallExecutor(__CONTEXT.copy())._run_cmake_mode(__CMAKE)
+  logged_texts = [logger_call[0][0] for logger_call in __mock_logger.call_args_list]
+  assert (
+    ret_code == 0 and not any(text.startswith("Build report saved to") for text in logged_texts)
+  ), get_assertion_message("build report logged", False, logged_texts)
+
 @pytest.fixture
 def __dummy_test_mode_cmake_executor():
   class TestExecutor(ModeCMakeExecutor):
@@ -361,6 +609,48 @@ def __mock_build_type():
   ) as mock_object:
     yield mock_object
 
+@pytest.fixture(autouse=True)
+def __mock_get_memory_limited_jobs(request):
+  with patch(
+    "xmipp3_installer.installer.handlers.resources_handler.get_memory_limited_jobs"
+  ) as mock_method:
+    if hasattr(request, 'param'):
+      mock_method.return_value = request.param
+    else:
+      mock_method.side_effect = lambda jobs, _: jobs
+    yield mock_method
+
+@pytest.fixture(autouse=True)
+def __mock_get_log_position():
+  with patch(
+    "xmipp3_installer.installer.handlers.build_report_handler.get_log_position"
+  ) as mock_method:
+    mock_method.return_value = (128, 1)
+    yield mock_method
+
+@pytest.fixture(autouse=True)
+def __mock_get_build_entries(request):
+  with patch(
+    "xmipp3_installer.installer.handlers.build_report_handler.get_build_entries"
+  ) as mock_method:
+    mock_method.return_value = getattr(request, 'param', [])
+    yield mock_method
+
+@pytest.fixture
+def __mock_write_build_report():
+  with patch(
+    "xmipp3_installer.installer.handlers.build_report_handler.write_build_report"
+  ) as mock_method:
+    yield mock_method
+
+@pytest.fixture
+def __mock_jobserver():
+  with patch(
+    "xmipp3_installer.installer.jobserver.Jobserver"
+  ) as mock_class:
+    mock_class.return_value.__enter__.return_value.get_environment.return_value = __JOBSERVER_ENVIRONMENT
+    yield mock_class
+
 @pytest.fixture(autouse=True)
 def __mock_cmake():
   with patch.object(
@@ -383,3 +673,19 @@ def __mock_get_error_code(request):
   ) as mock_method:
     mock_method.return_value = getattr(request, 'param', 1)
     yield mock_method
+
+@pytest.fixture(autouse=True)
+def __mock_get_cmake_cache_variable(request):
+  with patch(
+    "xmipp3_installer.installer.handlers.cmake.cmake_handler.get_cmake_cache_variable"
+  ) as mock_method:
+    mock_method.return_value = getattr(request, 'param', None)
+    yield mock_method
+
+@pytest.fixture
+def __mock_get_statistics():
+  with patch(
+    "xmipp3_installer.installer.handlers.compiler_cache_handler.get_statistics"
+  ) as mock_method:
+    mock_method.return_value = (0, 0)
+    yield mock_method
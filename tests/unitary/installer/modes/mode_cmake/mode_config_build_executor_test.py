@@ -1,4 +1,5 @@
-from unittest.mock import patch, call
+import os
+from unittest.mock import patch, call, Mock
 
 import pytest
 
@@ -16,6 +17,7 @@ from ..... import get_assertion_message
 
 __PARAM_BRANCH = "branch_param"
 __PARAM_KEEP_OUTPUT = "keep-output"
+__PARAM_FORCE = "force"
 __INTERNAL_VARIABLE1 = "iternal1"
 __INTERNAL_VARIABLE2 = "iternal2"
 __VAR1_KEY = "section1_var1"
@@ -40,10 +42,26 @@ __CMAKE_VARS = f"-D{__VAR1_KEY}={__VAR1_VALUE} -D{__VAR2_KEY}={__VAR2_VALUE} -D{
 __BUILD_PATH = "build_path"
 __BUILD_TYPE = "build_type"
 __CMAKE = "cmake_key"
+__FINGERPRINT = "fingerprint"
+__CC = "cc_key"
+__CXX = "cxx_key"
+__CUDA_COMPILER = "cuda_compiler_key"
+__CUDA = "cuda_key"
+__COMPILER_CACHE = "compiler_cache_key"
+__LAUNCHER = "/path/to/ccache"
+__CMAKE_GENERATOR = "generator_key"
+__GENERATOR = "Ninja"
 __CONTEXT = {
   __PARAM_BRANCH: constants.MAIN_BRANCHNAME,
   constants.VERSIONS_CONTEXT_KEY: DummyVersionsManager(),
   __PARAM_KEEP_OUTPUT: False,
+  __PARAM_FORCE: False,
+  __CC: "gcc",
+  __CXX: None,
+  __CUDA_COMPILER: "",
+  __CUDA: False,
+  __COMPILER_CACHE: True,
+  __CMAKE_GENERATOR: None,
   __VAR1_KEY: __VAR1_VALUE,
   __VAR2_KEY: __VAR2_VALUE,
   __VAR3_KEY: __VAR3_VALUE,
@@ -236,6 +254,374 @@ def test_reurns_expected_result_when_running_cmake_mode(
     result == expected_output
   ), get_assertion_message("CMake mode output", expected_output, result)
 
+@pytest.mark.parametrize(
+  "__mock_is_configuration_up_to_date,force,expected_run",
+  [
+    pytest.param(False, False, True),
+    pytest.param(False, True, True),
+    pytest.param(True, False, False),
+    pytest.param(True, True, True)
+  ],
+  indirect=["__mock_is_configuration_up_to_date"]
+)
+def test_runs_configuration_only_if_not_up_to_date_or_forced_when_running_cmake_mode(
+  __mock_is_configuration_up_to_date,
+  force,
+  expected_run,
+  __mock_get_cmake_vars,
+  __mock_run_shell_command_in_streaming
+):
+  result = ModeConfigBuildExecutor(
+    {**__CONTEXT, __PARAM_FORCE: force}
+  )._run_cmake_mode(__CMAKE)
+  run = __mock_run_shell_command_in_streaming.called
+  assert (
+    (run, result) == (expected_run, (0, ""))
+  ), get_assertion_message("configuration run and result", (expected_run, (0, "")), (run, result))
+
+def test_calls_get_configuration_fingerprint_when_running_cmake_mode(
+  __mock_get_cmake_vars,
+  __mock_get_configuration_fingerprint
+):
+  ModeConfigBuildExecutor(__CONTEXT.copy())._run_cmake_mode(__CMAKE)
+  __mock_get_configuration_fingerprint.assert_called_once_with(__CMAKE, None, __mock_get_cmake_vars())
+
+@pytest.mark.parametrize(
+  "__mock_is_configuration_up_to_date", [pytest.param(True)], indirect=True
+)
+def test_calls_logger_with_skip_message_if_up_to_date_when_running_cmake_mode(
+  __mock_is_configuration_up_to_date,
+  __mock_logger,
+  __mock_get_section_message,
+  __mock_get_done_message,
+  __mock_get_cmake_vars
+):
+  ModeConfigBuildExecutor(__CONTEXT.copy())._run_cmake_mode(__CMAKE)
+  __mock_logger.assert_has_calls([
+    call(__mock_get_section_message()),
+    call("Nothing changed since the last configuration, skipping it. Use --force to configure anyway."),
+    call(__mock_get_done_message(), substitute=True)
+  ])
+
+def test_deletes_previous_fingerprint_before_configuring_when_running_cmake_mode(
+  __mock_get_cmake_vars,
+  __mock_delete_paths,
+  __mock_run_shell_command_in_streaming
+):
+  manager = Mock()
+  manager.attach_mock(__mock_delete_paths, "delete_paths")
+  manager.attach_mock(__mock_run_shell_command_in_streaming, "run_shell_command_in_streaming")
+  ModeConfigBuildExecutor(__CONTEXT.copy())._run_cmake_mode(__CMAKE)
+  method_names = [method_call[0] for method_call in manager.mock_calls]
+  expected_names = ["delete_paths", "run_shell_command_in_streaming"]
+  assert (
+    method_names == expected_names
+  ), get_assertion_message("call order", expected_names, method_names)
+
+@pytest.mark.parametrize(
+  "__mock_run_shell_command_in_streaming,expected_calls",
+  [
+    pytest.param(0, [call(__FINGERPRINT)]),
+    pytest.param(1, [])
+  ],
+  indirect=["__mock_run_shell_command_in_streaming"]
+)
+def test_writes_fingerprint_only_if_configuration_succeeds_when_running_cmake_mode(
+  __mock_run_shell_command_in_streaming,
+  expected_calls,
+  __mock_get_cmake_vars,
+  __mock_get_configuration_fingerprint,
+  __mock_write_configuration_fingerprint
+):
+  ModeConfigBuildExecutor(__CONTEXT.copy())._run_cmake_mode(__CMAKE)
+  assert (
+    __mock_write_configuration_fingerprint.call_args_list == expected_calls
+  ), get_assertion_message(
+    "write fingerprint calls",
+    expected_calls,
+    __mock_write_configuration_fingerprint.call_args_list
+  )
+
+@pytest.mark.parametrize(
+  "changed_value",
+  [
+    pytest.param("cmake"),
+    pytest.param("generator"),
+    pytest.param("cmake_vars"),
+    pytest.param("build_type"),
+    pytest.param("commit"),
+    pytest.param("compiler")
+  ]
+)
+def test_returns_different_fingerprint_when_configuration_changes(
+  changed_value,
+  __mock_get_current_commit,
+  __mock_isdir,
+  __mock_which
+):
+  executor = ModeConfigBuildExecutor(__CONTEXT.copy())
+  fingerprint = executor._get_configuration_fingerprint(__CMAKE, None, __CMAKE_VARS)
+  cmake, generator, cmake_vars = __CMAKE, None, __CMAKE_VARS
+  if changed_value == "cmake":
+    cmake = "other_cmake"
+  elif changed_value == "generator":
+    generator = __GENERATOR
+  elif changed_value == "cmake_vars":
+    cmake_vars = "-DOTHER=1"
+  elif changed_value == "build_type":
+    executor.build_type = "Debug"
+  elif changed_value == "commit":
+    __mock_get_current_commit.return_value = "other_commit"
+  else:
+    __mock_which.side_effect = lambda executable: f"/other/{executable}"
+  new_fingerprint = executor._get_configuration_fingerprint(cmake, generator, cmake_vars)
+  assert (
+    new_fingerprint != fingerprint
+  ), get_assertion_message("fingerprint change", "a different fingerprint", new_fingerprint)
+
+def test_returns_same_fingerprint_when_configuration_does_not_change(
+  __mock_get_current_commit,
+  __mock_isdir,
+  __mock_which
+):
+  fingerprints = [
+    ModeConfigBuildExecutor(__CONTEXT.copy())._get_configuration_fingerprint(__CMAKE, __GENERATOR, __CMAKE_VARS)
+    for _ in range(2)
+  ]
+  assert (
+    fingerprints[0] == fingerprints[1]
+  ), get_assertion_message("fingerprint", fingerprints[0], fingerprints[1])
+
+def test_does_not_get_commit_of_missing_sources_when_getting_fingerprint(
+  __mock_get_current_commit,
+  __mock_isdir,
+  __mock_which
+):
+  __mock_isdir.return_value = False
+  ModeConfigBuildExecutor(__CONTEXT.copy())._get_configuration_fingerprint(__CMAKE, __GENERATOR, __CMAKE_VARS)
+  __mock_get_current_commit.assert_not_called()
+
+@pytest.mark.parametrize(
+  "executable,which_result,expected_path",
+  [
+    pytest.param("gcc", None, "gcc"),
+    pytest.param("gcc", "/usr/bin/gcc", "/real/usr/bin/gcc")
+  ]
+)
+def test_returns_expected_resolved_executable(
+  executable,
+  which_result,
+  expected_path,
+  __mock_which,
+  __mock_realpath
+):
+  __mock_which.side_effect = None
+  __mock_which.return_value = which_result
+  resolved_path = mode_config_build_executor._resolve_executable(executable)
+  assert (
+    resolved_path == expected_path
+  ), get_assertion_message("resolved executable", expected_path, resolved_path)
+
+def test_returns_expected_compiler_paths(__mock_which, __mock_realpath):
+  with patch.dict(os.environ, {"CC": "clang"}, clear=True):
+    compiler_paths = mode_config_build_executor._get_compiler_paths(["gcc", None, ""])
+  expected_paths = [
+    "/real/usr/bin/gcc", None, None, "/real/usr/bin/clang", None, None, "/real/usr/bin/cc", "/real/usr/bin/c++"
+  ]
+  assert (
+    compiler_paths == expected_paths
+  ), get_assertion_message("compiler paths", expected_paths, compiler_paths)
+
+@pytest.mark.parametrize(
+  "cache_exists,stored_fingerprint,expected_up_to_date",
+  [
+    pytest.param(False, __FINGERPRINT, False),
+    pytest.param(True, None, False),
+    pytest.param(True, "other", False),
+    pytest.param(True, f"{__FINGERPRINT}\n", True)
+  ]
+)
+def test_returns_expected_is_configuration_up_to_date(
+  cache_exists,
+  stored_fingerprint,
+  expected_up_to_date,
+  __mock_fingerprint_paths
+):
+  cache_file, fingerprint_file = __mock_fingerprint_paths
+  if cache_exists:
+    cache_file.write_text("")
+  if stored_fingerprint is not None:
+    fingerprint_file.write_text(stored_fingerprint)
+  up_to_date = mode_config_build_executor._is_configuration_up_to_date(__FINGERPRINT)
+  assert (
+    up_to_date == expected_up_to_date
+  ), get_assertion_message("configuration up to date", expected_up_to_date, up_to_date)
+
+def test_writes_expected_configuration_fingerprint(__mock_fingerprint_paths):
+  _, fingerprint_file = __mock_fingerprint_paths
+  mode_config_build_executor._write_configuration_fingerprint(__FINGERPRINT)
+  content = fingerprint_file.read_text()
+  assert (
+    content == __FINGERPRINT
+  ), get_assertion_message("fingerprint file content", __FINGERPRINT, content)
+
+def test_ignores_error_when_writing_configuration_fingerprint(tmp_path):
+  with patch.object(paths, "CMAKE_FINGERPRINT_FILE", str(tmp_path / "missing" / "fingerprint")):
+    mode_config_build_executor._write_configuration_fingerprint(__FINGERPRINT)
+
+@pytest.mark.parametrize(
+  "__mock_get_compiler_launcher,compiler_cache,cuda,expected_params",
+  [
+    pytest.param(__LAUNCHER, False, False, ""),
+    pytest.param(None, True, False, ""),
+    pytest.param(
+      __LAUNCHER,
+      True,
+      False,
+      f"-DCMAKE_C_COMPILER_LAUNCHER={__LAUNCHER} -DCMAKE_CXX_COMPILER_LAUNCHER={__LAUNCHER}"
+    ),
+    pytest.param(
+      __LAUNCHER,
+      True,
+      True,
+      (
+        f"-DCMAKE_C_COMPILER_LAUNCHER={__LAUNCHER} -DCMAKE_CXX_COMPILER_LAUNCHER={__LAUNCHER} "
+        f"-DCMAKE_CUDA_COMPILER_LAUNCHER={__LAUNCHER}"
+      )
+    )
+  ],
+  indirect=["__mock_get_compiler_launcher"]
+)
+def test_returns_expected_compiler_launcher_params(
+  __mock_get_compiler_launcher,
+  compiler_cache,
+  cuda,
+  expected_params
+):
+  launcher_params = ModeConfigBuildExecutor(
+    {**__CONTEXT, __COMPILER_CACHE: compiler_cache, __CUDA: cuda}
+  )._get_compiler_launcher_params()
+  assert (
+    launcher_params == expected_params
+  ), get_assertion_message("compiler launcher params", expected_params, launcher_params)
+
+@pytest.mark.parametrize(
+  "compiler_cache,cuda,expected_params",
+  [
+    pytest.param(False, False, "-UCMAKE_C_COMPILER_LAUNCHER -UCMAKE_CXX_COMPILER_LAUNCHER"),
+    pytest.param(
+      False,
+      True,
+      "-UCMAKE_C_COMPILER_LAUNCHER -UCMAKE_CXX_COMPILER_LAUNCHER -UCMAKE_CUDA_COMPILER_LAUNCHER"
+    )
+  ]
+)
+def test_removes_previous_compiler_launchers_when_compiler_cache_is_not_used(
+  compiler_cache,
+  cuda,
+  expected_params,
+  __mock_fingerprint_paths
+):
+  cache_file, _ = __mock_fingerprint_paths
+  cache_file.write_text("\n".join([
+    f"CMAKE_C_COMPILER_LAUNCHER:UNINITIALIZED={__LAUNCHER}",
+    f"CMAKE_CXX_COMPILER_LAUNCHER:UNINITIALIZED={__LAUNCHER}",
+    f"CMAKE_CUDA_COMPILER_LAUNCHER:UNINITIALIZED={__LAUNCHER}"
+  ]))
+  launcher_params = ModeConfigBuildExecutor(
+    {**__CONTEXT, __COMPILER_CACHE: compiler_cache, __CUDA: cuda}
+  )._get_compiler_launcher_params()
+  assert (
+    launcher_params == expected_params
+  ), get_assertion_message("compiler launcher params", expected_params, launcher_params)
+
+@pytest.mark.parametrize(
+  "__mock_get_compiler_launcher", [pytest.param(__LAUNCHER)], indirect=True
+)
+def test_calls_run_shell_command_in_streaming_with_compiler_launcher_when_running_cmake_mode(
+  __mock_get_compiler_launcher,
+  __mock_get_cmake_vars,
+  __mock_run_shell_command_in_streaming,
+  __mock_build_path,
+  __mock_build_type
+):
+  ModeConfigBuildExecutor(__CONTEXT.copy())._run_cmake_mode(__CMAKE)
+  __mock_run_shell_command_in_streaming.assert_called_once_with(
+    (
+      f"{__CMAKE} -S . -B {__mock_build_path} -DCMAKE_BUILD_TYPE={__CONTEXT[__mock_build_type]} {__mock_get_cmake_vars()} "
+      f"-DCMAKE_C_COMPILER_LAUNCHER={__LAUNCHER} -DCMAKE_CXX_COMPILER_LAUNCHER={__LAUNCHER}"
+    ),
+    show_output=True,
+    substitute=True
+  )
+
+@pytest.mark.parametrize(
+  "selected_generator,configured_generator,__mock_get_default_generator,expected_generator_param",
+  [
+    pytest.param(None, None, None, "", id="CMake default"),
+    pytest.param(None, None, __GENERATOR, f'-G "{__GENERATOR}" ', id="Default generator"),
+    pytest.param(None, "Unix Makefiles", __GENERATOR, '-G "Unix Makefiles" ', id="Already configured generator"),
+    pytest.param("Unix Makefiles", None, __GENERATOR, '-G "Unix Makefiles" ', id="Selected generator"),
+    pytest.param(__GENERATOR, __GENERATOR, None, f'-G "{__GENERATOR}" ', id="Matching generator")
+  ],
+  indirect=["__mock_get_default_generator"]
+)
+def test_calls_run_shell_command_in_streaming_with_expected_generator_when_running_cmake_mode(
+  selected_generator,
+  configured_generator,
+  __mock_get_default_generator,
+  expected_generator_param,
+  __mock_get_cmake_vars,
+  __mock_run_shell_command_in_streaming,
+  __mock_fingerprint_paths,
+  __mock_build_path,
+  __mock_build_type
+):
+  cache_file, _ = __mock_fingerprint_paths
+  if configured_generator:
+    cache_file.write_text(f"CMAKE_GENERATOR:INTERNAL={configured_generator}\n")
+  ModeConfigBuildExecutor(
+    {**__CONTEXT, __CMAKE_GENERATOR: selected_generator}
+  )._run_cmake_mode(__CMAKE)
+  __mock_run_shell_command_in_streaming.assert_called_once_with(
+    (
+      f"{__CMAKE} {expected_generator_param}-S . -B {__mock_build_path} "
+      f"-DCMAKE_BUILD_TYPE={__CONTEXT[__mock_build_type]} {__mock_get_cmake_vars()}"
+    ),
+    show_output=True,
+    substitute=True
+  )
+
+def test_returns_error_if_generator_does_not_match_configured_one_when_running_cmake_mode(
+  __mock_get_cmake_vars,
+  __mock_run_shell_command_in_streaming,
+  __mock_fingerprint_paths
+):
+  cache_file, _ = __mock_fingerprint_paths
+  cache_file.write_text("CMAKE_GENERATOR:INTERNAL=Unix Makefiles\n")
+  result = ModeConfigBuildExecutor(
+    {**__CONTEXT, __CMAKE_GENERATOR: __GENERATOR}
+  )._run_cmake_mode(__CMAKE)
+  expected_result = (
+    errors.CMAKE_CONFIGURE_ERROR,
+    mode_config_build_executor._get_generator_mismatch_message("Unix Makefiles", __GENERATOR)
+  )
+  __mock_run_shell_command_in_streaming.assert_not_called()
+  assert (
+    result == expected_result
+  ), get_assertion_message("CMake mode output", expected_result, result)
+
+def test_returns_expected_generator_mismatch_message():
+  message = mode_config_build_executor._get_generator_mismatch_message("Unix Makefiles", __GENERATOR)
+  expected_message = "\n".join([
+    f"The build directory was configured with the 'Unix Makefiles' generator, but '{__GENERATOR}' is selected in {paths.CONFIG_FILE}.",
+    f"To rebuild with '{__GENERATOR}', remove the build directory with './xmipp cleanBin' and run the installation again.",
+    f"To keep the current build, set {__CMAKE_GENERATOR}=Unix Makefiles in {paths.CONFIG_FILE}, or leave it empty."
+  ])
+  assert (
+    message == expected_message
+  ), get_assertion_message("generator mismatch message", expected_message, message)
+
 @pytest.fixture
 def __dummy_test_mode_cmake_executor():
   class TestExecutor(ModeCMakeExecutor):
@@ -258,6 +644,26 @@ def __mock_param_keep_output():
   ) as mock_object:
     yield mock_object
 
+@pytest.fixture(autouse=True)
+def __mock_param_force():
+  with patch.object(
+    params, "PARAM_FORCE", __PARAM_FORCE
+  ) as mock_object:
+    yield mock_object
+
+@pytest.fixture(autouse=True)
+def __mock_compiler_variables():
+  with patch.multiple(
+    variables,
+    CC=__CC,
+    CXX=__CXX,
+    CUDA_COMPILER=__CUDA_COMPILER,
+    CUDA=__CUDA,
+    COMPILER_CACHE=__COMPILER_CACHE,
+    CMAKE_GENERATOR=__CMAKE_GENERATOR
+  ):
+    yield
+
 @pytest.fixture(autouse=True)
 def __mock_config_variables():
   with patch.object(
@@ -347,3 +753,85 @@ def __mock_get_error_code(request):
   ) as mock_method:
     mock_method.return_value = getattr(request, 'param', 1)
     yield mock_method
+
+
+@pytest.fixture
+def __mock_get_configuration_fingerprint():
+  with patch(
+    "xmipp3_installer.installer.modes.mode_cmake.mode_config_build_executor.ModeConfigBuildExecutor._get_configuration_fingerprint"
+  ) as mock_method:
+    mock_method.return_value = __FINGERPRINT
+    yield mock_method
+
+@pytest.fixture
+def __mock_is_configuration_up_to_date(request):
+  with patch(
+    "xmipp3_installer.installer.modes.mode_cmake.mode_config_build_executor._is_configuration_up_to_date"
+  ) as mock_method:
+    mock_method.return_value = getattr(request, 'param', False)
+    yield mock_method
+
+@pytest.fixture
+def __mock_write_configuration_fingerprint():
+  with patch(
+    "xmipp3_installer.installer.modes.mode_cmake.mode_config_build_executor._write_configuration_fingerprint"
+  ) as mock_method:
+    yield mock_method
+
+@pytest.fixture
+def __mock_delete_paths():
+  with patch(
+    "xmipp3_installer.shared.file_operations.delete_paths"
+  ) as mock_method:
+    yield mock_method
+
+@pytest.fixture(autouse=True)
+def __mock_fingerprint_paths(tmp_path):
+  cache_file = tmp_path / "CMakeCache.txt"
+  fingerprint_file = tmp_path / "fingerprint.txt"
+  with patch.multiple(
+    paths, CMAKE_CACHE_FILE=str(cache_file), CMAKE_FINGERPRINT_FILE=str(fingerprint_file)
+  ):
+    yield cache_file, fingerprint_file
+
+@pytest.fixture(autouse=True)
+def __mock_get_current_commit():
+  with patch(
+    "xmipp3_installer.installer.handlers.git_handler.get_current_commit"
+  ) as mock_method:
+    mock_method.return_value = "commit"
+    yield mock_method
+
+@pytest.fixture
+def __mock_isdir():
+  with patch("os.path.isdir") as mock_method:
+    mock_method.return_value = True
+    yield mock_method
+
+@pytest.fixture
+def __mock_which():
+  with patch("shutil.which") as mock_method:
+    mock_method.side_effect = lambda executable: f"/usr/bin/{executable}"
+    yield mock_method
+
+@pytest.fixture
+def __mock_realpath():
+  with patch("os.path.realpath") as mock_method:
+    mock_method.side_effect = lambda path: f"/real{path}"
+    yield mock_method
+
+@pytest.fixture(autouse=True)
+def __mock_get_compiler_launcher(request):
+  with patch(
+    "xmipp3_installer.installer.handlers.compiler_cache_handler.get_compiler_launcher"
+  ) as mock_method:
+    mock_method.return_value = getattr(request, 'param', None)
+    yield mock_method
+
+@pytest.fixture(autouse=True)
+def __mock_get_default_generator(request):
+  with patch(
+    "xmipp3_installer.installer.handlers.cmake.cmake_handler.get_default_generator"
+  ) as mock_method:
+    mock_method.return_value = getattr(request, 'param', None)
+    yield mock_method
@@ -1,4 +1,6 @@
-from unittest.mock import patch, call
+import os
+from concurrent.futures import Future
+from unittest.mock import patch, call, MagicMock
 
 import pytest
 
@@ -9,6 +11,7 @@ from xmipp3_installer.installer.constants import paths
 from xmipp3_installer.installer.modes import mode_get_sources_executor
 from xmipp3_installer.installer.modes.mode_executor import ModeExecutor
 from xmipp3_installer.installer.modes.mode_get_sources_executor import ModeGetSourcesExecutor
+from xmipp3_installer.repository.config_vars import variables
 
 from ... import DummyVersionsManager
 from .... import (
@@ -18,10 +21,19 @@ from .... import (
 
 __PARAM_BRANCH = "branch_param"
 __PARAM_KEEP_OUTPUT = "keep-output"
+__PARAM_JOBS = "jobs_param"
+__PARAM_CLONE_STRATEGY = "clone_strategy_param"
 __CONTEXT = {
   __PARAM_BRANCH: constants.MAIN_BRANCHNAME,
+  __PARAM_JOBS: 8,
+  __PARAM_CLONE_STRATEGY: None,
   constants.VERSIONS_CONTEXT_KEY: DummyVersionsManager(),
-  __PARAM_KEEP_OUTPUT: False
+  __PARAM_KEEP_OUTPUT: False,
+  variables.SOURCES_CACHE: False,
+  variables.OFFLINE: False,
+  variables.SOURCES_CACHE_MAX_SIZE: "1024",
+  variables.CLONE_STRATEGY: constants.CLONE_STRATEGY_FULL,
+  variables.REMOTE_REFS_CACHE_TTL: "60"
 }
 __BRANCH_NAME = "test_branch"
 __REPO_URL = "repourl"
@@ -34,8 +46,11 @@ __PARAMS = {
   }
 }
 __SOURCES_PATH = "sources_path"
+__SOURCES_CACHE_PATH = "sources_cache_path"
 __I2PC_REPOSITORY_URL = "i2pc_repository_url"
 __XMIPP_SOURCES = ["source1", "source2"]
+__MIRROR_PATH = "/cache/mirror.git"
+__MIRROR_URL = "/cache/mirror"
 
 def test_implements_interface_mode_executor():
   executor = ModeGetSourcesExecutor(__CONTEXT.copy())
@@ -70,12 +85,14 @@ def test_stores_expected_values_when_initializing():
   executor = ModeGetSourcesExecutor(__CONTEXT.copy())
   values = (
     executor.substitute,
+    executor.jobs,
     executor.target_branch,
     executor.xmipp_tag_name,
     executor.source_versions
   )
   expected_values = (
     True,
+    __CONTEXT[__PARAM_JOBS],
     constants.MAIN_BRANCHNAME,
     JSON_XMIPP_VERSION_NAME,
     {
@@ -87,11 +104,123 @@ def test_stores_expected_values_when_initializing():
     values == expected_values
   ), get_assertion_message("stored values", expected_values, values)
 
+@pytest.mark.parametrize(
+  "sources_cache,offline,expected_use_cache",
+  [
+    pytest.param(False, False, False),
+    pytest.param(True, False, True),
+    pytest.param(False, True, True),
+    pytest.param(True, True, True)
+  ]
+)
+def test_enables_cache_when_initializing(sources_cache, offline, expected_use_cache):
+  executor = ModeGetSourcesExecutor({
+    **__CONTEXT,
+    variables.SOURCES_CACHE: sources_cache,
+    variables.OFFLINE: offline
+  })
+  assert (
+    executor.use_cache == expected_use_cache
+  ), get_assertion_message("cache usage", expected_use_cache, executor.use_cache)
+
+@pytest.mark.parametrize(
+  "max_size,expected_max_size",
+  [
+    pytest.param("20", 20),
+    pytest.param("not-a-number", 1024),
+    pytest.param("-5", 1024),
+    pytest.param(None, 1024)
+  ]
+)
+def test_stores_expected_cache_max_size_when_initializing(max_size, expected_max_size):
+  executor = ModeGetSourcesExecutor({
+    **__CONTEXT,
+    variables.SOURCES_CACHE_MAX_SIZE: max_size
+  })
+  assert (
+    executor.cache_max_size == expected_max_size
+  ), get_assertion_message("cache max size", expected_max_size, executor.cache_max_size)
+
+@pytest.mark.parametrize(
+  "ttl,expected_ttl",
+  [
+    pytest.param("0", 0),
+    pytest.param("300", 300),
+    pytest.param("-1", 60),
+    pytest.param("not-a-number", 60),
+    pytest.param(None, 60)
+  ]
+)
+def test_stores_expected_refs_cache_ttl_when_initializing(ttl, expected_ttl):
+  executor = ModeGetSourcesExecutor({
+    **__CONTEXT,
+    variables.REMOTE_REFS_CACHE_TTL: ttl
+  })
+  assert (
+    executor.refs_cache_ttl == expected_ttl
+  ), get_assertion_message("refs cache ttl", expected_ttl, executor.refs_cache_ttl)
+
+@pytest.mark.parametrize(
+  "param_value,config_value,expected_strategy",
+  [
+    pytest.param(None, None, constants.CLONE_STRATEGY_FULL),
+    pytest.param(None, constants.CLONE_STRATEGY_PARTIAL, constants.CLONE_STRATEGY_PARTIAL),
+    pytest.param(constants.CLONE_STRATEGY_SHALLOW, None, constants.CLONE_STRATEGY_SHALLOW),
+    pytest.param(constants.CLONE_STRATEGY_SHALLOW, constants.CLONE_STRATEGY_PARTIAL, constants.CLONE_STRATEGY_SHALLOW),
+    pytest.param(None, "unknown", constants.CLONE_STRATEGY_FULL)
+  ]
+)
+def test_stores_expected_clone_strategy_when_initializing(
+  param_value,
+  config_value,
+  expected_strategy
+):
+  executor = ModeGetSourcesExecutor({
+    **__CONTEXT,
+    __PARAM_CLONE_STRATEGY: param_value,
+    variables.CLONE_STRATEGY: config_value
+  })
+  assert (
+    executor.clone_strategy == expected_strategy
+  ), get_assertion_message("clone strategy", expected_strategy, executor.clone_strategy)
+
+@pytest.mark.parametrize(
+  "clone_strategy,expected_warning",
+  [
+    pytest.param(constants.CLONE_STRATEGY_SHALLOW, False),
+    pytest.param("unknown", True)
+  ]
+)
+def test_calls_logger_only_for_unknown_clone_strategy_when_getting_clone_strategy(
+  clone_strategy,
+  expected_warning,
+  __mock_logger,
+  __mock_logger_yellow
+):
+  mode_get_sources_executor._get_clone_strategy(None, clone_strategy)
+  expected_calls = [
+    call(__mock_logger_yellow(
+      f"Warning: unknown clone strategy '{clone_strategy}'. "
+      f"Valid values are: {', '.join(constants.CLONE_STRATEGIES)}. "
+      f"Falling back to '{constants.CLONE_STRATEGY_FULL}'."
+    ))
+  ] if expected_warning else []
+  assert (
+    __mock_logger.call_args_list == expected_calls
+  ), get_assertion_message("logger calls", expected_calls, __mock_logger.call_args_list)
+
 @pytest.mark.parametrize(
   "variable_key",
   [
     pytest.param(__PARAM_KEEP_OUTPUT),
+    pytest.param(__PARAM_JOBS),
     pytest.param(__PARAM_BRANCH),
+    pytest.param(variables.SOURCES_CACHE),
+    pytest.param(variables.OFFLINE),
+    pytest.param(variables.SOURCES_CACHE_MAX_SIZE),
+    pytest.param(__PARAM_CLONE_STRATEGY),
+    pytest.param(variables.CLONE_STRATEGY),
+    pytest.param(variables.REMOTE_REFS_CACHE_TTL),
     pytest.param(constants.VERSIONS_CONTEXT_KEY)
   ]
 )
@@ -135,7 +264,7 @@ def test_calls_get_clonable_branch_when_selecting_ref_to_clone(
     source_name, __REPO_URL
   )
   __mock_get_clonable_branch.assert_called_once_with(
-    __REPO_URL, __CONTEXT[params.PARAM_BRANCH], expected_tag_name
+    __REPO_URL, __CONTEXT[params.PARAM_BRANCH], expected_tag_name, cache_ttl=60
   )
 
 @pytest.mark.parametrize(
@@ -220,7 +349,91 @@ def test_calls_run_shell_command_if_source_does_not_exist_when_running_source_co
     constants.XMIPP_CORE, __REPO_URL, target_branch
   )
   __mock_run_shell_command.assert_called_once_with(
-    f"git clone{expected_branch_str} {__REPO_URL}.git",
+    f"git clone{expected_branch_str} {__REPO_URL}",
+    cwd=__mock_sources_path
+  )
+
+@pytest.mark.parametrize(
+  "clone_strategy,expected_strategy_str",
+  [
+    pytest.param(constants.CLONE_STRATEGY_FULL, ""),
+    pytest.param(constants.CLONE_STRATEGY_SHALLOW, " --depth 1"),
+    pytest.param(constants.CLONE_STRATEGY_PARTIAL, " --filter=blob:none")
+  ]
+)
+def test_calls_run_shell_command_with_clone_strategy_when_running_source_command(
+  clone_strategy,
+  expected_strategy_str,
+  __mock_os_path_exists,
+  __mock_run_shell_command,
+  __mock_sources_path
+):
+  __mock_os_path_exists.return_value = False
+  mode_get_sources_executor._run_source_command(
+    constants.XMIPP_CORE,
+    __REPO_URL,
+    __BRANCH_NAME,
+    reference=__MIRROR_PATH,
+    clone_strategy=clone_strategy
+  )
+  __mock_run_shell_command.assert_called_once_with(
+    f"git clone {__PARAMS[__PARAM_BRANCH][__LONG_VERSION]} {__BRANCH_NAME}"
+    f"{expected_strategy_str} --reference {__MIRROR_PATH} --dissociate {__REPO_URL}",
+    cwd=__mock_sources_path
+  )
+
+@pytest.mark.parametrize(
+  "__mock_is_shallow_repository,expected_unshallow_calls",
+  [
+    pytest.param(False, []),
+    pytest.param(True, [call(dir=f"sources/{constants.XMIPP_CORE}")])
+  ],
+  indirect=["__mock_is_shallow_repository"]
+)
+def test_unshallows_existing_shallow_source_before_checkout_when_running_source_command(
+  __mock_is_shallow_repository,
+  expected_unshallow_calls,
+  __mock_unshallow_repository,
+  __mock_get_source_path,
+  __mock_run_shell_command
+):
+  mode_get_sources_executor._run_source_command(
+    constants.XMIPP_CORE, __REPO_URL, __BRANCH_NAME
+  )
+  assert (
+    __mock_unshallow_repository.call_args_list == expected_unshallow_calls
+  ), get_assertion_message("unshallow calls", expected_unshallow_calls, __mock_unshallow_repository.call_args_list)
+  __mock_run_shell_command.assert_called_once_with(
+    f"git checkout {__BRANCH_NAME}",
+    cwd=__mock_get_source_path(constants.XMIPP_CORE)
+  )
+
+def test_returns_error_if_source_cannot_be_unshallowed_when_running_source_command(
+  __mock_is_shallow_repository,
+  __mock_unshallow_repository,
+  __mock_run_shell_command
+):
+  __mock_is_shallow_repository.return_value = True
+  __mock_unshallow_repository.return_value = (1, "error")
+  result = mode_get_sources_executor._run_source_command(
+    constants.XMIPP_CORE, __REPO_URL, __BRANCH_NAME
+  )
+  __mock_run_shell_command.assert_not_called()
+  assert (
+    result == (1, "error")
+  ), get_assertion_message("result", (1, "error"), result)
+
+def test_calls_run_shell_command_with_reference_when_running_source_command(
+  __mock_os_path_exists,
+  __mock_run_shell_command,
+  __mock_sources_path
+):
+  __mock_os_path_exists.return_value = False
+  mode_get_sources_executor._run_source_command(
+    constants.XMIPP_CORE, __REPO_URL, None, reference=__MIRROR_PATH
+  )
+  __mock_run_shell_command.assert_called_once_with(
+    f"git clone --reference {__MIRROR_PATH} --dissociate {__REPO_URL}",
     cwd=__mock_sources_path
   )
 
@@ -253,8 +466,8 @@ def test_returns_expected_result_when_running_source_command(
   ), get_assertion_message("result", expected_result, result)
 
 @pytest.mark.parametrize(
-  "target_branch,source_name,__mock_select_ref_to_clone,"
-  "__mock_run_source_command,substitute",
+  "target_branch,source_name,clone_branch,"
+  "clone_result,substitute",
   [
     pytest.param(None, constants.XMIPP_CORE, None, (0, ""), False),
     pytest.param(None, constants.XMIPP_CORE, None, (0, ""), True),
@@ -288,14 +501,13 @@ def test_returns_expected_result_when_running_source_command(
     pytest.param(__BRANCH_NAME, constants.XMIPP_VIZ, __BRANCH_NAME, (0, ""), True),
     pytest.param(__BRANCH_NAME, constants.XMIPP_VIZ, __BRANCH_NAME, (1, "error"), False),
     pytest.param(__BRANCH_NAME, constants.XMIPP_VIZ, __BRANCH_NAME, (1, "error"), True)
-  ],
-  indirect=["__mock_select_ref_to_clone", "__mock_run_source_command"]
+  ]
 )
 def test_calls_logger_when_getting_source(
   target_branch,
   source_name,
-  __mock_select_ref_to_clone,
-  __mock_run_source_command,
+  clone_branch,
+  clone_result,
   substitute,
   __mock_logger,
   __mock_logger_yellow,
@@ -305,12 +517,12 @@ def test_calls_logger_when_getting_source(
 ):
   ModeGetSourcesExecutor(
     {**__CONTEXT, __PARAM_BRANCH: target_branch, __PARAM_KEEP_OUTPUT: not substitute},
-  )._get_source(source_name)
+  )._get_source(source_name, __get_resolved_future((*clone_result, clone_branch)))
   expected_calls = [
     call(f"Cloning {source_name}...", substitute=substitute),
     call(__mock_get_working_message(), substitute=substitute),
   ]
-  if target_branch and not __mock_select_ref_to_clone():
+  if target_branch and not clone_branch:
     expected_calls.append(
       call(
         "\n".join([
@@ -320,7 +532,7 @@ def test_calls_logger_when_getting_source(
         substitute=substitute
       )
     )
-  if not __mock_run_source_command()[0]:
+  if not clone_result[0]:
     expected_calls.append(
       call(__mock_get_done_message(), substitute=substitute)
     )
@@ -330,30 +542,51 @@ def test_calls_logger_when_getting_source(
   ), get_assertion_message("call count", len(expected_calls), __mock_logger.call_count)
 
 def test_calls_get_working_message_when_getting_source(
-  __mock_get_working_message,
-  __mock_select_ref_to_clone,
-  __mock_run_source_command
+  __mock_get_working_message
 ):
   ModeGetSourcesExecutor(__CONTEXT.copy())._get_source(
-    constants.XMIPP_CORE
+    constants.XMIPP_CORE, __get_resolved_future((0, "", __BRANCH_NAME))
   )
   __mock_get_working_message.assert_called_once_with()
 
+def test_calls_get_done_message_when_getting_source(
+  __mock_get_done_message
+):
+  ModeGetSourcesExecutor(__CONTEXT.copy())._get_source(
+    constants.XMIPP_CORE, __get_resolved_future((0, "", __BRANCH_NAME))
+  )
+  __mock_get_done_message.assert_called_once_with()
+
+@pytest.mark.parametrize(
+  "clone_result",
+  [
+    pytest.param((1, "error", __BRANCH_NAME)),
+    pytest.param((0, "", None))
+  ]
+)
+def test_returns_expected_result_when_getting_source(clone_result):
+  result = ModeGetSourcesExecutor(__CONTEXT.copy())._get_source(
+    constants.XMIPP_CORE, __get_resolved_future(clone_result)
+  )
+  assert (
+    result == clone_result[:2]
+  ), get_assertion_message("result", clone_result[:2], result)
+
 @pytest.mark.parametrize(
   "source_name",
   [pytest.param(constants.XMIPP_CORE), pytest.param(constants.XMIPP_VIZ)]
 )
-def test_calls_select_ref_to_clone_when_getting_source(
+def test_calls_select_ref_to_clone_when_cloning_source(
   source_name,
   __mock_select_ref_to_clone,
   __mock_run_source_command,
   __mock_i2pc_repo_url
 ):
-  ModeGetSourcesExecutor(__CONTEXT.copy())._get_source(
+  ModeGetSourcesExecutor(__CONTEXT.copy())._clone_source(
     source_name
   )
   __mock_select_ref_to_clone.assert_called_once_with(
-    source_name, f"{__mock_i2pc_repo_url}{source_name}"
+    source_name, f"{__mock_i2pc_repo_url}{source_name}.git"
   )
 
 @pytest.mark.parametrize(
@@ -366,53 +599,196 @@ def test_calls_select_ref_to_clone_when_getting_source(
   ],
   indirect=["__mock_select_ref_to_clone"]
 )
-def test_calls_run_source_command_when_getting_source(
+def test_calls_run_source_command_when_cloning_source(
   source_name,
   __mock_select_ref_to_clone,
   __mock_run_source_command,
   __mock_i2pc_repo_url
 ):
-  ModeGetSourcesExecutor(__CONTEXT.copy())._get_source(
+  ModeGetSourcesExecutor(__CONTEXT.copy())._clone_source(
     source_name
   )
   __mock_run_source_command.assert_called_once_with(
     source_name,
-    f"{__mock_i2pc_repo_url}{source_name}",
-    __mock_select_ref_to_clone()
+    f"{__mock_i2pc_repo_url}{source_name}.git",
+    __mock_select_ref_to_clone(),
+    reference=None,
+    clone_strategy=constants.CLONE_STRATEGY_FULL
   )
 
-def test_calls_get_done_message_when_getting_source(
-  __mock_get_done_message,
+@pytest.mark.parametrize(
+  "__mock_select_ref_to_clone,__mock_run_source_command",
+  [
+    pytest.param(None, (1, "error")),
+    pytest.param(__BRANCH_NAME, (0, ""))
+  ],
+  indirect=["__mock_select_ref_to_clone", "__mock_run_source_command"]
+)
+def test_returns_expected_result_when_cloning_source(
   __mock_select_ref_to_clone,
   __mock_run_source_command
 ):
-  ModeGetSourcesExecutor(__CONTEXT.copy())._get_source(
+  result = ModeGetSourcesExecutor(__CONTEXT.copy())._clone_source(
     constants.XMIPP_CORE
   )
-  __mock_get_done_message.assert_called_once_with()
+  expected_result = (*__mock_run_source_command(), __mock_select_ref_to_clone())
+  assert (
+    result == expected_result
+  ), get_assertion_message("result", expected_result, result)
 
 @pytest.mark.parametrize(
-  "__mock_run_source_command",
+  "sources_cache,__mock_os_path_exists,expected_called",
   [
-    pytest.param((1, "error")),
-    pytest.param((0, ""))
+    pytest.param(False, False, False),
+    pytest.param(True, True, False),
+    pytest.param(True, False, True)
   ],
-  indirect=["__mock_run_source_command"]
+  indirect=["__mock_os_path_exists"]
 )
-def test_returns_expected_result_when_getting_source(
+def test_calls_prepare_source_mirror_when_cloning_source(
+  sources_cache,
+  __mock_os_path_exists,
+  expected_called,
   __mock_select_ref_to_clone,
-  __mock_run_source_command
+  __mock_run_source_command,
+  __mock_prepare_source_mirror,
+  __mock_i2pc_repo_url
 ):
-  result = ModeGetSourcesExecutor(__CONTEXT.copy())._get_source(
-    constants.XMIPP_CORE
+  ModeGetSourcesExecutor(
+    {**__CONTEXT, variables.SOURCES_CACHE: sources_cache}
+  )._clone_source(constants.XMIPP_CORE)
+  if expected_called:
+    __mock_prepare_source_mirror.assert_called_once_with(
+      constants.XMIPP_CORE, f"{__mock_i2pc_repo_url}{constants.XMIPP_CORE}.git", False
+    )
+  else:
+    __mock_prepare_source_mirror.assert_not_called()
+
+def test_returns_error_if_mirror_cannot_be_prepared_when_cloning_source(
+  __mock_os_path_exists,
+  __mock_select_ref_to_clone,
+  __mock_run_source_command,
+  __mock_prepare_source_mirror
+):
+  __mock_os_path_exists.return_value = False
+  __mock_prepare_source_mirror.return_value = (1, "error", None)
+  result = ModeGetSourcesExecutor(
+    {**__CONTEXT, variables.SOURCES_CACHE: True}
+  )._clone_source(constants.XMIPP_CORE)
+  __mock_run_source_command.assert_not_called()
+  assert (
+    result == (1, "error", None)
+  ), get_assertion_message("result", (1, "error", None), result)
+
+def test_clones_with_reference_when_cloning_source_with_cache(
+  __mock_os_path_exists,
+  __mock_select_ref_to_clone,
+  __mock_run_source_command,
+  __mock_prepare_source_mirror,
+  __mock_i2pc_repo_url
+):
+  __mock_os_path_exists.return_value = False
+  ModeGetSourcesExecutor(
+    {**__CONTEXT, variables.SOURCES_CACHE: True}
+  )._clone_source(constants.XMIPP_CORE)
+  __mock_run_source_command.assert_called_once_with(
+    constants.XMIPP_CORE,
+    f"{__mock_i2pc_repo_url}{constants.XMIPP_CORE}.git",
+    __mock_select_ref_to_clone(),
+    reference=__MIRROR_PATH,
+    clone_strategy=constants.CLONE_STRATEGY_FULL
   )
+
+def test_clones_from_mirror_and_restores_origin_when_cloning_source_offline(
+  __mock_os_path_exists,
+  __mock_select_ref_to_clone,
+  __mock_run_source_command,
+  __mock_prepare_source_mirror,
+  __mock_get_mirror_url,
+  __mock_run_shell_command,
+  __mock_get_source_path,
+  __mock_i2pc_repo_url
+):
+  __mock_os_path_exists.return_value = False
+  ModeGetSourcesExecutor(
+    {**__CONTEXT, variables.OFFLINE: True}
+  )._clone_source(constants.XMIPP_CORE)
+  __mock_select_ref_to_clone.assert_called_once_with(constants.XMIPP_CORE, __MIRROR_URL)
+  __mock_run_source_command.assert_called_once_with(
+    constants.XMIPP_CORE,
+    __MIRROR_URL,
+    __mock_select_ref_to_clone(),
+    reference=None,
+    clone_strategy=constants.CLONE_STRATEGY_FULL
+  )
+  __mock_run_shell_command.assert_called_once_with(
+    f"git remote set-url origin {__mock_i2pc_repo_url}{constants.XMIPP_CORE}.git",
+    cwd=__mock_get_source_path(constants.XMIPP_CORE)
+  )
+
+@pytest.mark.parametrize(
+  "__mock_mirror_exists,expected_result",
+  [
+    pytest.param(True, (0, "", __MIRROR_PATH)),
+    pytest.param(
+      False,
+      (1, f"Source {constants.XMIPP_CORE} is not available in the cache at {__SOURCES_CACHE_PATH}, and offline mode is enabled.", None)
+    )
+  ],
+  indirect=["__mock_mirror_exists"]
+)
+def test_returns_expected_result_when_preparing_source_mirror_offline(
+  __mock_mirror_exists,
+  expected_result,
+  __mock_update_mirror,
+  __mock_sources_cache_path
+):
+  result = mode_get_sources_executor._prepare_source_mirror(
+    constants.XMIPP_CORE, __REPO_URL, True
+  )
+  __mock_update_mirror.assert_not_called()
   assert (
-    result == __mock_run_source_command()
-  ), get_assertion_message("result", __mock_run_source_command(), result)
+    result == expected_result
+  ), get_assertion_message("result", expected_result, result)
+
+@pytest.mark.parametrize(
+  "__mock_update_mirror,expected_result",
+  [
+    pytest.param((0, ""), (0, "", __MIRROR_PATH)),
+    pytest.param((1, "error"), (0, "", None))
+  ],
+  indirect=["__mock_update_mirror"]
+)
+def test_returns_expected_result_when_preparing_source_mirror_online(
+  __mock_update_mirror,
+  expected_result
+):
+  result = mode_get_sources_executor._prepare_source_mirror(
+    constants.XMIPP_CORE, __REPO_URL, False
+  )
+  __mock_update_mirror.assert_called_once_with(constants.XMIPP_CORE, __REPO_URL)
+  assert (
+    result == expected_result
+  ), get_assertion_message("result", expected_result, result)
+
+@pytest.mark.parametrize(
+  "jobs,expected_workers",
+  [
+    pytest.param(1, 1),
+    pytest.param(2, 2),
+    pytest.param(50, len(__XMIPP_SOURCES))
+  ]
+)
+def test_returns_expected_number_of_workers(jobs, expected_workers):
+  n_workers = ModeGetSourcesExecutor({**__CONTEXT, __PARAM_JOBS: jobs})._get_n_workers()
+  assert (
+    n_workers == expected_workers
+  ), get_assertion_message("number of workers", expected_workers, n_workers)
 
 def test_calls_logger_when_running_executor(
   __mock_logger,
   __mock_get_section_message,
+  __mock_clone_source,
   __mock_get_source
 ):
   ModeGetSourcesExecutor(__CONTEXT.copy()).run()
@@ -420,18 +796,79 @@ def test_calls_logger_when_running_executor(
     __mock_get_section_message("Getting Xmipp sources")
   )
 
-def test_calls_get_source_when_running_executor(
+def test_calls_clear_remote_refs_before_cloning_when_running_executor(
+  __mock_clear_remote_refs,
+  __mock_clone_source
+):
+  parent_mock = MagicMock()
+  parent_mock.attach_mock(__mock_clear_remote_refs, "clear_remote_refs")
+  parent_mock.attach_mock(__mock_clone_source, "clone_source")
+  ModeGetSourcesExecutor(__CONTEXT.copy()).run()
+  first_call = parent_mock.mock_calls[0]
+  assert (
+    first_call == call.clear_remote_refs()
+  ), get_assertion_message("first call", call.clear_remote_refs(), first_call)
+
+def test_calls_clone_source_for_every_source_when_running_executor(
   __mock_xmipp_sources,
-  __mock_get_source
+  __mock_clone_source
 ):
   ModeGetSourcesExecutor(__CONTEXT.copy()).run()
   expected_calls = [
     call(source) for source in __mock_xmipp_sources
   ]
-  __mock_get_source.assert_has_calls(expected_calls)
+  __mock_clone_source.assert_has_calls(expected_calls, any_order=True)
+  assert (
+    __mock_clone_source.call_count == len(expected_calls)
+  ), get_assertion_message("call count", len(expected_calls), __mock_clone_source.call_count)
+
+def test_calls_get_source_in_order_when_running_executor(
+  __mock_xmipp_sources,
+  __mock_clone_source,
+  __mock_get_source
+):
+  ModeGetSourcesExecutor(__CONTEXT.copy()).run()
+  sources = [args[0] for args, _ in __mock_get_source.call_args_list]
   assert (
-    __mock_get_source.call_count == len(expected_calls)
-  ), get_assertion_message("call count", len(expected_calls), __mock_get_source.call_count)
+    sources == __mock_xmipp_sources
+  ), get_assertion_message("reported sources", __mock_xmipp_sources, sources)
+
+def test_stops_reporting_sources_after_first_failure_when_running_executor(
+  __mock_clone_source,
+  __mock_get_source
+):
+  __mock_get_source.return_value = (1, "error")
+  ModeGetSourcesExecutor(__CONTEXT.copy()).run()
+  __mock_get_source.assert_called_once()
+
+@pytest.mark.parametrize(
+  "sources_cache,offline,__mock_get_source,expected_called",
+  [
+    pytest.param(False, False, (0, ""), False),
+    pytest.param(True, False, (0, ""), True),
+    pytest.param(True, False, (1, "error"), False),
+    pytest.param(True, True, (0, ""), False)
+  ],
+  indirect=["__mock_get_source"]
+)
+def test_calls_evict_mirrors_when_running_executor(
+  sources_cache,
+  offline,
+  __mock_get_source,
+  expected_called,
+  __mock_clone_source,
+  __mock_evict_mirrors,
+  __mock_xmipp_sources
+):
+  ModeGetSourcesExecutor({
+    **__CONTEXT,
+    variables.SOURCES_CACHE: sources_cache,
+    variables.OFFLINE: offline
+  }).run()
+  if expected_called:
+    __mock_evict_mirrors.assert_called_once_with(1024)
+  else:
+    __mock_evict_mirrors.assert_not_called()
 
 @pytest.mark.parametrize(
   "__mock_get_source,expected_result",
@@ -442,6 +879,7 @@ def test_calls_get_source_when_running_executor(
   indirect=["__mock_get_source"]
 )
 def test_returns_expected_result_when_running_executor(
+  __mock_clone_source,
   __mock_get_source,
   expected_result
 ):
@@ -450,6 +888,62 @@ def test_returns_expected_result_when_running_executor(
     result == expected_result
   ), get_assertion_message("executor result", expected_result, result)
 
+@pytest.mark.parametrize(
+  "__mock_evict_mirrors,expected_warned",
+  [pytest.param([], False), pytest.param(["/cache/mirror.git"], True)],
+  indirect=["__mock_evict_mirrors"]
+)
+def test_warns_only_if_mirrors_are_evicted_when_running_executor(
+  __mock_clone_source,
+  __mock_get_source,
+  __mock_evict_mirrors,
+  __mock_logger,
+  expected_warned
+):
+  ModeGetSourcesExecutor({**__CONTEXT, variables.SOURCES_CACHE: True}).run()
+  warned = any(
+    "yellow-Warning: the sources cache exceeded" in str(args[0])
+    for args, _ in __mock_logger.call_args_list
+  )
+  assert (
+    warned == expected_warned
+  ), get_assertion_message("eviction warning", expected_warned, warned)
+
+def test_evicts_current_mirrors_over_cache_size_when_running_executor(
+  __mock_clone_source,
+  __mock_get_source,
+  __mock_xmipp_sources,
+  tmp_path
+):
+  mirror_paths = [str(tmp_path / f"{source}.git") for source in __mock_xmipp_sources]
+  for mirror_path in mirror_paths:
+    os.makedirs(mirror_path)
+    with open(os.path.join(mirror_path, "pack"), "wb") as pack_file:
+      pack_file.write(b"0" * 1024)
+  with patch.object(paths, "SOURCES_CACHE_PATH", str(tmp_path)):
+    ModeGetSourcesExecutor({
+      **__CONTEXT,
+      variables.SOURCES_CACHE: True,
+      variables.SOURCES_CACHE_MAX_SIZE: "0"
+    }).run()
+  remaining = [mirror_path for mirror_path in mirror_paths if os.path.isdir(mirror_path)]
+  assert (
+    remaining == []
+  ), get_assertion_message("remaining mirrors", [], remaining)
+
+def test_returns_clone_error_if_getting_source_raises_an_exception():
+  future = Future()
+  future.set_exception(NotADirectoryError("not a directory"))
+  ret_code, _ = ModeGetSourcesExecutor(__CONTEXT.copy())._get_source(constants.XMIPP_CORE, future)
+  assert (
+    ret_code == errors.SOURCE_CLONE_ERROR
+  ), get_assertion_message("return code", errors.SOURCE_CLONE_ERROR, ret_code)
+
+def __get_resolved_future(result):
+  future = Future()
+  future.set_result(result)
+  return future
+
 @pytest.fixture
 def __dummy_test_mode_executor():
   class TestExecutor(ModeExecutor):
@@ -474,6 +968,13 @@ def __mock_get_clonable_branch(request):
     mock_method.return_value = getattr(request, 'param', __BRANCH_NAME)
     yield mock_method
 
+@pytest.fixture(autouse=True)
+def __mock_clear_remote_refs():
+  with patch(
+    "xmipp3_installer.installer.handlers.git_handler.clear_remote_refs"
+  ) as mock_method:
+    yield mock_method
+
 @pytest.fixture(autouse=True)
 def __mock_get_source_path():
   with patch(
@@ -503,6 +1004,20 @@ def __mock_param_keep_output():
   ) as mock_object:
     yield mock_object
 
+@pytest.fixture(autouse=True)
+def __mock_param_jobs():
+  with patch.object(
+    params, "PARAM_JOBS", __PARAM_JOBS
+  ) as mock_object:
+    yield mock_object
+
+@pytest.fixture(autouse=True)
+def __mock_param_clone_strategy():
+  with patch.object(
+    params, "PARAM_CLONE_STRATEGY", __PARAM_CLONE_STRATEGY
+  ) as mock_object:
+    yield mock_object
+
 @pytest.fixture(autouse=True)
 def __mock_param_branch():
   with patch.object(
@@ -601,9 +1116,95 @@ def __mock_get_source(request):
     mock_method.return_value = getattr(request, 'param', (0, ""))
     yield mock_method
 
+@pytest.fixture
+def __mock_clone_source():
+  with patch(
+    "xmipp3_installer.installer.modes.mode_get_sources_executor.ModeGetSourcesExecutor._clone_source"
+  ) as mock_method:
+    mock_method.return_value = (0, "", __BRANCH_NAME)
+    yield mock_method
+
+@pytest.fixture
+def __mock_prepare_source_mirror():
+  with patch(
+    "xmipp3_installer.installer.modes.mode_get_sources_executor._prepare_source_mirror"
+  ) as mock_method:
+    mock_method.return_value = (0, "", __MIRROR_PATH)
+    yield mock_method
+
+@pytest.fixture(autouse=True)
+def __mock_get_mirror_path():
+  with patch(
+    "xmipp3_installer.installer.handlers.sources_cache_handler.get_mirror_path"
+  ) as mock_method:
+    mock_method.return_value = __MIRROR_PATH
+    yield mock_method
+
+@pytest.fixture
+def __mock_get_mirror_url():
+  with patch(
+    "xmipp3_installer.installer.handlers.sources_cache_handler.get_mirror_url"
+  ) as mock_method:
+    mock_method.return_value = __MIRROR_URL
+    yield mock_method
+
+@pytest.fixture
+def __mock_mirror_exists(request):
+  with patch(
+    "xmipp3_installer.installer.handlers.sources_cache_handler.mirror_exists"
+  ) as mock_method:
+    mock_method.return_value = getattr(request, 'param', True)
+    yield mock_method
+
+@pytest.fixture(autouse=True)
+def __mock_mark_mirror_as_used():
+  with patch(
+    "xmipp3_installer.installer.handlers.sources_cache_handler.mark_mirror_as_used"
+  ) as mock_method:
+    yield mock_method
+
+@pytest.fixture
+def __mock_update_mirror(request):
+  with patch(
+    "xmipp3_installer.installer.handlers.sources_cache_handler.update_mirror"
+  ) as mock_method:
+    mock_method.return_value = getattr(request, 'param', (0, ""))
+    yield mock_method
+
+@pytest.fixture
+def __mock_evict_mirrors(request):
+  with patch(
+    "xmipp3_installer.installer.handlers.sources_cache_handler.evict_mirrors"
+  ) as mock_method:
+    mock_method.return_value = getattr(request, 'param', [])
+    yield mock_method
+
+@pytest.fixture
+def __mock_sources_cache_path():
+  with patch.object(
+    paths, "SOURCES_CACHE_PATH", __SOURCES_CACHE_PATH
+  ) as mock_object:
+    yield mock_object
+
 @pytest.fixture(autouse=True)
 def __mock_xmipp_sources():
   with patch.object(
     constants, "XMIPP_SOURCES", __XMIPP_SOURCES
   ) as mock_object:
     yield mock_object
+
+@pytest.fixture(autouse=True)
+def __mock_is_shallow_repository(request):
+  with patch(
+    "xmipp3_installer.installer.handlers.git_handler.is_shallow_repository"
+  ) as mock_method:
+    mock_method.return_value = getattr(request, 'param', False)
+    yield mock_method
+
+@pytest.fixture
+def __mock_unshallow_repository():
+  with patch(
+    "xmipp3_installer.installer.handlers.git_handler.unshallow_repository"
+  ) as mock_method:
+    mock_method.return_value = (0, "")
+    yield mock_method
@@ -114,6 +114,67 @@ def test_returns_expected_values_when_running_executor(
     return_values == expected_return_values
   ), get_assertion_message(__RETURN_VALUES_STR, expected_return_values, return_values)
 
+@pytest.mark.parametrize(
+  "__mock_os_path_exists,__mock_is_shallow_repository,expected_calls",
+  [
+    pytest.param(False, True, []),
+    pytest.param(True, False, []),
+    pytest.param(True, True, [call(dir=__SOURCE_PATH) for _ in __SOURCES])
+  ],
+  indirect=["__mock_os_path_exists", "__mock_is_shallow_repository"]
+)
+def test_unshallows_only_existing_shallow_sources_when_running_executor(
+  __mock_os_path_exists,
+  __mock_is_shallow_repository,
+  expected_calls,
+  __mock_unshallow_repository
+):
+  ModeGitExecutor(__CONTEXT.copy()).run()
+  assert (
+    __mock_unshallow_repository.call_args_list == expected_calls
+  ), get_assertion_message("unshallow calls", expected_calls, __mock_unshallow_repository.call_args_list)
+
+def test_calls_logger_when_unshallowing_source(
+  __mock_logger,
+  __mock_is_shallow_repository,
+  __mock_unshallow_repository
+):
+  __mock_is_shallow_repository.return_value = True
+  ModeGitExecutor(__CONTEXT.copy()).run()
+  expected_calls = [
+    call(f"Source {source} is a shallow clone. Fetching its whole history...")
+    for source in __SOURCES
+  ]
+  __mock_logger.assert_has_calls(expected_calls, any_order=True)
+
+@pytest.mark.parametrize(
+  "__mock_unshallow_repository,expected_return_values,expected_git_command_calls",
+  [
+    pytest.param((0, ""), (0, ""), len(__SOURCES)),
+    pytest.param((1, "error"), (1, "error"), 0)
+  ],
+  indirect=["__mock_unshallow_repository"]
+)
+def test_returns_expected_values_when_unshallowing_source(
+  __mock_unshallow_repository,
+  expected_return_values,
+  expected_git_command_calls,
+  __mock_is_shallow_repository,
+  __mock_execute_git_command_for_source
+):
+  __mock_is_shallow_repository.return_value = True
+  return_values = ModeGitExecutor(__CONTEXT.copy()).run()
+  assert (
+    return_values == expected_return_values
+  ), get_assertion_message(__RETURN_VALUES_STR, expected_return_values, return_values)
+  assert (
+    __mock_execute_git_command_for_source.call_count == expected_git_command_calls
+  ), get_assertion_message(
+    __CALL_COUNT_ASSERTION_MESSAGE,
+    expected_git_command_calls,
+    __mock_execute_git_command_for_source.call_count
+  )
+
 @pytest.fixture
 def __dummy_test_mode_executor():
   class TestExecutor(ModeExecutor):
@@ -152,3 +213,25 @@ def __mock_get_path_source():
   ) as mock_method:
     mock_method.return_value = __SOURCE_PATH
     yield mock_method
+
+@pytest.fixture(autouse=True)
+def __mock_os_path_exists(request):
+  with patch("os.path.exists") as mock_method:
+    mock_method.return_value = getattr(request, 'param', True)
+    yield mock_method
+
+@pytest.fixture(autouse=True)
+def __mock_is_shallow_repository(request):
+  with patch(
+    "xmipp3_installer.installer.handlers.git_handler.is_shallow_repository"
+  ) as mock_method:
+    mock_method.return_value = getattr(request, 'param', False)
+    yield mock_method
+
+@pytest.fixture(autouse=True)
+def __mock_unshallow_repository(request):
+  with patch(
+    "xmipp3_installer.installer.handlers.git_handler.unshallow_repository"
+  ) as mock_method:
+    mock_method.return_value = getattr(request, 'param', (0, ""))
+    yield mock_method
@@ -0,0 +1,32 @@
+import pytest
+
+from xmipp3_installer.application.cli.arguments import modes
+from xmipp3_installer.installer.modes import mode_selector
+from xmipp3_installer.installer.modes.mode_executor import ModeExecutor
+from xmipp3_installer.installer.modes.mode_version_executor import ModeVersionExecutor
+
+from .... import get_assertion_message
+
+def test_registers_an_executor_for_every_mode():
+  expected_modes = sorted(mode for mode_group in modes.MODES.values() for mode in mode_group)
+  registered_modes = sorted(mode_selector.MODE_EXECUTORS)
+  assert (
+    registered_modes == expected_modes
+  ), get_assertion_message("registered modes", expected_modes, registered_modes)
+
+@pytest.mark.parametrize("mode", [pytest.param(mode) for mode in mode_selector.MODE_EXECUTORS])
+def test_returns_mode_executor_subclass_when_getting_mode_executor(mode):
+  executor_class = mode_selector.get_mode_executor(mode)
+  assert (
+    issubclass(executor_class, ModeExecutor)
+  ), get_assertion_message("executor parent class", ModeExecutor.__name__, executor_class.__mro__)
+
+def test_returns_expected_executor_when_getting_mode_executor():
+  executor_class = mode_selector.get_mode_executor(modes.MODE_VERSION)
+  assert (
+    executor_class is ModeVersionExecutor
+  ), get_assertion_message("executor class", ModeVersionExecutor, executor_class)
+
+def test_raises_key_error_when_getting_executor_of_unknown_mode():
+  with pytest.raises(KeyError):
+    mode_selector.get_mode_executor("unknown")
@@ -1,4 +1,5 @@
-import multiprocessing
+import threading
+import time
 from unittest.mock import patch, MagicMock
 
 import pytest
@@ -7,34 +8,88 @@ from xmipp3_installer.installer import orquestrator
 
 from ... import get_assertion_message
 
+__TIMEOUT = 0.1
+__DEFAULT = "default"
+
 @pytest.mark.parametrize(
-  "n_jobs", [pytest.param(0), pytest.param(1), pytest.param(5)]
+  "executor,expected_pool",
+  [
+    pytest.param(orquestrator.EXECUTOR_THREAD, "__mock_thread_pool"),
+    pytest.param(orquestrator.EXECUTOR_PROCESS, "__mock_process_pool")
+  ]
 )
-def test_calls_pool_when_running_parallel_jobs(n_jobs, __mock_pool):
-  orquestrator.run_parallel_jobs([max], [(1, 3)], n_jobs=n_jobs)
-  __mock_pool.assert_called_once_with(n_jobs)
+def test_calls_expected_pool_when_running_parallel_jobs(
+  executor,
+  expected_pool,
+  __mock_thread_pool,
+  __mock_process_pool,
+  request
+):
+  orquestrator.run_parallel_jobs([max], [(1, 3)], executor=executor)
+  request.getfixturevalue(expected_pool).assert_called_once_with(max_workers=1)
 
-def test_calls_pool_with_all_logical_cores_by_default_when_running_parallel_jobs(__mock_pool):
-  orquestrator.run_parallel_jobs([max], [(1, 2)])
-  __mock_pool.assert_called_once_with(multiprocessing.cpu_count())
-
-def test_calls_zip_when_running_parallel_jobs(__mock_pool, __mock_starmap, __mock_zip):
-  functions = [max, min, sum]
-  args = [(1, 2), (1, 2), (1, 2)]
-  orquestrator.run_parallel_jobs(functions, args)
-  __mock_zip.assert_called_once_with(functions, args)
-
-def test_calls_pool_starmap_when_running_parallel_jobs(
-  __mock_starmap,
-  __mock_run_lambda,
-  __mock_zip
+@pytest.mark.parametrize(
+  "n_jobs,expected_workers",
+  [
+    pytest.param(None, 3),
+    pytest.param(0, 3),
+    pytest.param(1, 1),
+    pytest.param(2, 2),
+    pytest.param(128, 3)
+  ]
+)
+def test_sizes_pool_to_number_of_tasks_when_running_parallel_jobs(
+  n_jobs,
+  expected_workers,
+  __mock_thread_pool
 ):
-  orquestrator.run_parallel_jobs([], [])
-  __mock_starmap.assert_called_once_with(
-    __mock_run_lambda,
-    __mock_zip()
-  )
+  orquestrator.run_parallel_jobs([max, min, sum], [(1, 2), (1, 2), ((1, 2),)], n_jobs=n_jobs)
+  __mock_thread_pool.assert_called_once_with(max_workers=expected_workers)
+
+@pytest.mark.parametrize(
+  "n_jobs,expected_workers",
+  [
+    pytest.param(None, 2),
+    pytest.param(3, 3)
+  ]
+)
+def test_limits_process_pool_to_default_job_number_when_running_parallel_jobs(
+  n_jobs,
+  expected_workers,
+  __mock_process_pool
+):
+  with patch(
+    "xmipp3_installer.installer.handlers.resources_handler.get_default_job_number"
+  ) as mock_get_default_job_number:
+    mock_get_default_job_number.return_value = 2
+    orquestrator.run_parallel_jobs(
+      [max, min, sum], [(1, 2), (1, 2), ((1, 2),)], n_jobs=n_jobs, executor=orquestrator.EXECUTOR_PROCESS
+    )
+  __mock_process_pool.assert_called_once_with(max_workers=expected_workers)
+
+@pytest.mark.parametrize(
+  "executor",
+  [pytest.param(orquestrator.EXECUTOR_INLINE), pytest.param(orquestrator.EXECUTOR_THREAD)]
+)
+def test_does_not_create_pool_when_there_is_nothing_to_run_or_running_inline(
+  executor,
+  __mock_thread_pool,
+  __mock_process_pool
+):
+  funcs = [max] if executor == orquestrator.EXECUTOR_INLINE else []
+  args = [(1, 2)] if funcs else []
+  orquestrator.run_parallel_jobs(funcs, args, executor=executor)
+  __mock_thread_pool.assert_not_called()
+  __mock_process_pool.assert_not_called()
 
+@pytest.mark.parametrize(
+  "executor",
+  [
+    pytest.param(orquestrator.EXECUTOR_THREAD),
+    pytest.param(orquestrator.EXECUTOR_PROCESS),
+    pytest.param(orquestrator.EXECUTOR_INLINE)
+  ]
+)
 @pytest.mark.parametrize(
   "funcs,args,expected_results",
   [
@@ -42,12 +97,70 @@ def test_calls_pool_starmap_when_running_parallel_jobs(
     pytest.param([], [], [])
   ]
 )
-def test_returns_expected_results_when_running_parallel_jobs(funcs, args, expected_results):
-  results = orquestrator.run_parallel_jobs(funcs, args, n_jobs=1)
+def test_returns_expected_results_when_running_parallel_jobs(executor, funcs, args, expected_results):
+  results = orquestrator.run_parallel_jobs(funcs, args, executor=executor)
+  assert (
+    results == expected_results
+  ), get_assertion_message("parallel execution results", expected_results, results)
+
+@pytest.mark.parametrize(
+  "executor",
+  [
+    pytest.param(orquestrator.EXECUTOR_THREAD),
+    pytest.param(orquestrator.EXECUTOR_PROCESS),
+    pytest.param(orquestrator.EXECUTOR_INLINE)
+  ]
+)
+def test_returns_partial_results_when_a_job_fails(executor):
+  results = orquestrator.run_parallel_jobs(
+    [max, int, min],
+    [(1, 2), ("not a number",), (1, 2)],
+    executor=executor,
+    default=__DEFAULT
+  )
+  expected_results = [2, __DEFAULT, 1]
   assert (
     results == expected_results
   ), get_assertion_message("parallel execution results", expected_results, results)
 
+def test_returns_partial_results_when_a_job_times_out():
+  release_event = threading.Event()
+  start_time = time.monotonic()
+  results = orquestrator.run_parallel_jobs(
+    [max, release_event.wait],
+    [(1, 2), ()],
+    timeout=__TIMEOUT,
+    default=__DEFAULT
+  )
+  duration = time.monotonic() - start_time
+  release_event.set()
+  expected_results = [2, __DEFAULT]
+  assert (
+    results == expected_results
+  ), get_assertion_message("parallel execution results", expected_results, results)
+  assert (
+    duration < 1
+  ), get_assertion_message("duration", "< 1", duration)
+
+def test_shuts_down_pool_without_waiting_when_running_parallel_jobs(__mock_thread_pool):
+  orquestrator.run_parallel_jobs([max], [(1, 2)])
+  __mock_thread_pool().shutdown.assert_called_once_with(wait=False)
+
+@pytest.mark.parametrize(
+  "n_jobs,n_tasks,expected_workers",
+  [
+    pytest.param(None, 5, 5),
+    pytest.param(-1, 5, 5),
+    pytest.param(2, 5, 2),
+    pytest.param(10, 5, 5)
+  ]
+)
+def test_returns_expected_number_of_workers(n_jobs, n_tasks, expected_workers):
+  n_workers = orquestrator.__get_n_workers(n_jobs, n_tasks)
+  assert (
+    n_workers == expected_workers
+  ), get_assertion_message("number of workers", expected_workers, n_workers)
+
 @pytest.mark.parametrize(
   "func,args,expected_result",
   [
@@ -62,23 +175,17 @@ def test_returns_expected_result_when_running_lambda(func, args, expected_result
   ), get_assertion_message("lambda function execution result", expected_result, result)
 
 @pytest.fixture
-def __mock_pool():
-  mock_pool = MagicMock()
-  with patch("multiprocessing.Pool", return_value=mock_pool) as mock_method:
-    yield mock_method
-
-@pytest.fixture
-def __mock_starmap():
-  with patch("multiprocessing.pool.Pool.starmap") as mock_method:
+def __mock_thread_pool():
+  with patch(
+    "xmipp3_installer.installer.orquestrator.ThreadPoolExecutor",
+    return_value=MagicMock()
+  ) as mock_method:
     yield mock_method
 
 @pytest.fixture
-def __mock_zip():
-  with patch("builtins.zip") as mock_method:
-    mock_method.return_value = MagicMock()
+def __mock_process_pool():
+  with patch(
+    "concurrent.futures.ProcessPoolExecutor",
+    return_value=MagicMock()
+  ) as mock_method:
     yield mock_method
-
-@pytest.fixture
-def __mock_run_lambda():
-  with patch("xmipp3_installer.installer.orquestrator.__run_lambda") as mock_method:
-    yield mock_method
\ No newline at end of file
@@ -0,0 +1,241 @@
+import json
+import threading
+from unittest.mock import patch, Mock, call
+
+import pytest
+
+from xmipp3_installer.application.logger import errors
+from xmipp3_installer.installer import pipeline
+
+from ... import get_assertion_message
+
+__FIRST = "first"
+__SECOND = "second"
+__THIRD = "third"
+
+def test_computes_dependencies_from_inputs_and_outputs():
+  stages = [
+    pipeline.Stage(__FIRST, Mock(), outputs=["a"]),
+    pipeline.Stage(__SECOND, Mock(), outputs=["b"]),
+    pipeline.Stage(__THIRD, Mock(), inputs=["a", "b", "c"])
+  ]
+  dependencies = pipeline.Pipeline(stages, "progress.json").dependencies
+  expected_dependencies = {__FIRST: [], __SECOND: [], __THIRD: [__FIRST, __SECOND]}
+  assert (
+    dependencies == expected_dependencies
+  ), get_assertion_message("dependencies", expected_dependencies, dependencies)
+
+def test_runs_independent_stages_at_the_same_time(__progress_file):
+  both_started = threading.Barrier(2, timeout=5)
+  def __run():
+    both_started.wait()
+    return 0, ""
+  stages = [pipeline.Stage(__FIRST, __run), pipeline.Stage(__SECOND, __run)]
+  result = pipeline.Pipeline(stages, __progress_file).run()
+  assert (
+    result == (0, "")
+  ), get_assertion_message("pipeline result", (0, ""), result)
+
+def test_runs_dependent_stage_after_its_dependencies(__progress_file):
+  finished = []
+  def __get_run(name):
+    def __run():
+      finished.append(name)
+      return 0, ""
+    return __run
+  stages = [
+    pipeline.Stage(__FIRST, __get_run(__FIRST), outputs=["a"]),
+    pipeline.Stage(__SECOND, __get_run(__SECOND), inputs=["a"], outputs=["b"]),
+    pipeline.Stage(__THIRD, __get_run(__THIRD), inputs=["b"])
+  ]
+  pipeline.Pipeline(stages, __progress_file).run()
+  expected_order = [__FIRST, __SECOND, __THIRD]
+  assert (
+    finished == expected_order
+  ), get_assertion_message("stage order", expected_order, finished)
+
+def test_does_not_run_stages_depending_on_failed_one(__progress_file):
+  dependent_run = Mock(return_value=(0, ""))
+  stages = [
+    pipeline.Stage(__FIRST, Mock(return_value=(1, "error")), outputs=["a"]),
+    pipeline.Stage(__SECOND, dependent_run, inputs=["a"])
+  ]
+  result = pipeline.Pipeline(stages, __progress_file).run()
+  dependent_run.assert_not_called()
+  assert (
+    result == (1, "error")
+  ), get_assertion_message("pipeline result", (1, "error"), result)
+
+@pytest.mark.parametrize(
+  "first_result,second_result,expected_result",
+  [
+    pytest.param((0, ""), (0, ""), (0, "")),
+    pytest.param((1, "first"), (0, ""), (1, "first")),
+    pytest.param((0, ""), (2, "second"), (2, "second")),
+    pytest.param((1, "first"), (2, "second"), (1, "first"))
+  ]
+)
+def test_returns_first_failure_in_declaration_order(
+  first_result,
+  second_result,
+  expected_result,
+  __progress_file
+):
+  stages = [
+    pipeline.Stage(__FIRST, Mock(return_value=first_result)),
+    pipeline.Stage(__SECOND, Mock(return_value=second_result))
+  ]
+  result = pipeline.Pipeline(stages, __progress_file).run()
+  assert (
+    result == expected_result
+  ), get_assertion_message("pipeline result", expected_result, result)
+
+def test_shows_output_of_overlapping_stages_in_declaration_order(__progress_file, __mock_print):
+  second_finished = threading.Event()
+  def __run_first():
+    second_finished.wait(5)
+    pipeline.logger("first output")
+    return 0, ""
+  def __run_second():
+    pipeline.logger("second output")
+    second_finished.set()
+    return 0, ""
+  stages = [pipeline.Stage(__FIRST, __run_first), pipeline.Stage(__SECOND, __run_second)]
+  pipeline.Pipeline(stages, __progress_file).run()
+  expected_calls = [call("first output", flush=True), call("", flush=True), call("second output", flush=True)]
+  assert (
+    __mock_print.call_args_list == expected_calls
+  ), get_assertion_message("printed output", expected_calls, __mock_print.call_args_list)
+
+def test_records_completed_stages_in_progress_file(__progress_file):
+  stages = [
+    pipeline.Stage(__FIRST, Mock(return_value=(0, "")), outputs=["a"]),
+    pipeline.Stage(__SECOND, Mock(return_value=(1, "error")), inputs=["a"])
+  ]
+  pipeline.Pipeline(stages, __progress_file).run()
+  with open(__progress_file) as progress:
+    content = json.load(progress)
+  expected_content = {"completed": [__FIRST]}
+  assert (
+    content == expected_content
+  ), get_assertion_message("progress file content", expected_content, content)
+
+@pytest.mark.parametrize(
+  "completed,existing_outputs,expected_calls",
+  [
+    pytest.param([], ["a", "b"], (1, 1, 1)),
+    pytest.param([__FIRST], ["a", "b"], (0, 1, 1)),
+    pytest.param([__FIRST, __SECOND], ["a", "b"], (0, 0, 1)),
+    pytest.param([__FIRST, __SECOND], ["b"], (1, 1, 1)),
+    pytest.param([__SECOND], ["a", "b"], (1, 1, 1))
+  ]
+)
+def test_skips_leading_completed_stages_when_resuming(
+  completed,
+  existing_outputs,
+  expected_calls,
+  __progress_file,
+  tmp_path
+):
+  with open(__progress_file, "w") as progress:
+    json.dump({"completed": completed}, progress)
+  for output in existing_outputs:
+    (tmp_path / output).write_text("")
+  runs = [Mock(return_value=(0, "")) for _ in range(3)]
+  stages = [
+    pipeline.Stage(__FIRST, runs[0], outputs=[str(tmp_path / "a")]),
+    pipeline.Stage(__SECOND, runs[1], outputs=[str(tmp_path / "b")]),
+    pipeline.Stage(__THIRD, runs[2])
+  ]
+  pipeline.Pipeline(stages, __progress_file).run(resume=True)
+  call_counts = tuple(run.call_count for run in runs)
+  assert (
+    call_counts == expected_calls
+  ), get_assertion_message("stage run calls", expected_calls, call_counts)
+
+def test_runs_all_stages_when_not_resuming(__progress_file):
+  with open(__progress_file, "w") as progress:
+    json.dump({"completed": [__FIRST]}, progress)
+  run = Mock(return_value=(0, ""))
+  pipeline.Pipeline([pipeline.Stage(__FIRST, run)], __progress_file).run()
+  run.assert_called_once_with()
+
+def test_records_span_of_each_stage_when_running(__progress_file):
+  stages = [
+    pipeline.Stage(__FIRST, Mock(return_value=(0, "")), outputs=["a"]),
+    pipeline.Stage(__SECOND, Mock(return_value=(1, "error")), inputs=["a"])
+  ]
+  with patch("xmipp3_installer.installer.tracer.Tracer.span") as mock_span:
+    mock_span.return_value.__enter__.side_effect = dict
+    pipeline.Pipeline(stages, __progress_file).run()
+  expected_calls = [call(__FIRST, "stage"), call(__SECOND, "stage")]
+  assert (
+    mock_span.call_args_list == expected_calls
+  ), get_assertion_message("stage spans", expected_calls, mock_span.call_args_list)
+
+@pytest.mark.parametrize(
+  "content",
+  [pytest.param("not json"), pytest.param("[]"), pytest.param('{"completed": "first"}')]
+)
+def test_runs_all_stages_when_resuming_with_invalid_progress_file(content, __progress_file):
+  with open(__progress_file, "w") as progress:
+    progress.write(content)
+  run = Mock(return_value=(0, ""))
+  pipeline.Pipeline([pipeline.Stage(__FIRST, run)], __progress_file).run(resume=True)
+  run.assert_called_once_with()
+
+def test_returns_interrupted_error_when_keyboard_interrupt_while_running(
+  __progress_file,
+  __mock_wait
+):
+  __mock_wait.side_effect = KeyboardInterrupt
+  stages = [pipeline.Stage(__FIRST, Mock(return_value=(0, "")))]
+  result = pipeline.Pipeline(stages, __progress_file).run()
+  expected_result = (errors.INTERRUPTED_ERROR, "")
+  assert (
+    result == expected_result
+  ), get_assertion_message("pipeline result", expected_result, result)
+
+def test_returns_expected_timings_summary(__progress_file, tmp_path, __mock_monotonic):
+  (tmp_path / "a").write_text("")
+  with open(__progress_file, "w") as progress:
+    json.dump({"completed": [__FIRST]}, progress)
+  stages = [
+    pipeline.Stage(__FIRST, Mock(return_value=(0, "")), outputs=[str(tmp_path / "a")]),
+    pipeline.Stage(__SECOND, Mock(return_value=(1, "error")), outputs=["b"]),
+    pipeline.Stage(__THIRD, Mock(return_value=(0, "")), inputs=["b"])
+  ]
+  test_pipeline = pipeline.Pipeline(stages, __progress_file)
+  test_pipeline.run(resume=True)
+  summary = test_pipeline.get_timings_summary()
+  expected_summary = "\n".join([
+    pipeline.predefined_messages.get_section_message("Stage timings"),
+    f"{__FIRST} (skipped)",
+    f"{__SECOND} (1.5s)",
+    "Total (4.5s)"
+  ])
+  assert (
+    summary == expected_summary
+  ), get_assertion_message("timings summary", expected_summary, summary)
+
+@pytest.fixture
+def __progress_file(tmp_path):
+  build_path = tmp_path / "build"
+  build_path.mkdir()
+  yield str(build_path / "progress.json")
+
+@pytest.fixture
+def __mock_print():
+  with patch("builtins.print") as mock_method:
+    yield mock_method
+
+@pytest.fixture
+def __mock_wait():
+  with patch("xmipp3_installer.installer.pipeline.wait") as mock_method:
+    yield mock_method
+
+@pytest.fixture
+def __mock_monotonic():
+  with patch("time.monotonic") as mock_method:
+    mock_method.side_effect = [0, 1.5, 3, 4.5]
+    yield mock_method
@@ -0,0 +1,103 @@
+import json
+import os
+import threading
+
+import pytest
+
+from xmipp3_installer.installer.tracer import Tracer, tracer
+
+from ... import get_assertion_message
+
+__SPAN_NAME = "git clone"
+
+def test_is_not_enabled_until_started():
+  is_enabled = tracer.is_enabled
+  assert (
+    not is_enabled
+  ), get_assertion_message("tracer enabled", False, is_enabled)
+
+def test_is_enabled_when_started(__trace_file):
+  tracer.start(__trace_file)
+  is_enabled = tracer.is_enabled
+  assert (
+    is_enabled
+  ), get_assertion_message("tracer enabled", True, is_enabled)
+
+def test_returns_none_when_writing_without_starting():
+  trace_file = tracer.write()
+  assert (
+    trace_file is None
+  ), get_assertion_message("written trace file", None, trace_file)
+
+def test_yields_span_args_when_not_enabled():
+  with tracer.span(__SPAN_NAME, Tracer.CATEGORY_COMMAND, cwd="./") as trace_args:
+    trace_args[Tracer.ARG_RET_CODE] = 0
+  expected_args = {"cwd": "./", Tracer.ARG_RET_CODE: 0}
+  assert (
+    trace_args == expected_args
+  ), get_assertion_message("span args", expected_args, trace_args)
+
+def test_writes_recorded_spans(__trace_file):
+  tracer.start(__trace_file)
+  with tracer.span(__SPAN_NAME, Tracer.CATEGORY_COMMAND, cwd="./") as trace_args:
+    trace_args[Tracer.ARG_PID] = 1234
+    trace_args[Tracer.ARG_RET_CODE] = 0
+  written_file = tracer.write()
+  events = __read_events(__trace_file)
+  span = events[-1]
+  expected_span = {
+    "name": __SPAN_NAME,
+    "cat": Tracer.CATEGORY_COMMAND,
+    "ph": "X",
+    "pid": os.getpid(),
+    "tid": threading.get_ident(),
+    "args": {"cwd": "./", Tracer.ARG_PID: 1234, Tracer.ARG_RET_CODE: 0}
+  }
+  assert (
+    written_file == __trace_file and
+    {key: value for key, value in span.items() if key not in ("ts", "dur")} == expected_span and
+    span["ts"] >= 0 and span["dur"] >= 0
+  ), get_assertion_message("written span", expected_span, span)
+
+def test_writes_process_name_metadata(__trace_file):
+  tracer.start(__trace_file)
+  tracer.write()
+  metadata = __read_events(__trace_file)[0]
+  expected_metadata = {
+    "name": "process_name", "ph": "M", "pid": os.getpid(), "args": {"name": "xmipp3-installer"}
+  }
+  assert (
+    metadata == expected_metadata
+  ), get_assertion_message("trace metadata", expected_metadata, metadata)
+
+def test_records_span_when_exception_is_raised(__trace_file):
+  tracer.start(__trace_file)
+  with pytest.raises(KeyboardInterrupt), tracer.span(__SPAN_NAME, Tracer.CATEGORY_MODE):
+    raise KeyboardInterrupt()
+  tracer.write()
+  span_names = [event["name"] for event in __read_events(__trace_file)[1:]]
+  assert (
+    span_names == [__SPAN_NAME]
+  ), get_assertion_message("recorded spans", [__SPAN_NAME], span_names)
+
+def test_stops_recording_after_writing(__trace_file):
+  tracer.start(__trace_file)
+  tracer.write()
+  is_enabled = tracer.is_enabled
+  assert (
+    not is_enabled
+  ), get_assertion_message("tracer enabled", False, is_enabled)
+
+def __read_events(trace_file: str) -> list:
+  with open(trace_file, encoding="utf-8") as trace:
+    return json.load(trace)["traceEvents"]
+
+@pytest.fixture
+def __trace_file(tmp_path):
+  yield str(tmp_path / "trace.json")
+
+@pytest.fixture(autouse=True)
+def __reset_tracer():
+  yield
+  tracer._trace_file = None
+  tracer._events = []
@@ -35,6 +35,7 @@ __CONVERTED_CORRECT_FILE_LINES = {
 __TOGGLES_SECTION = "section1"
 __LOCATIONS_SECTION = "section2"
 __COMPILATION_FLAGS_SECTION = "section3"
+__INSTALLER_SECTION = "section4"
 __CONFIG_VARIABLES = {
 	__TOGGLES_SECTION: [
 		"variable1-section1", "variable2-section1", "variable3-section1"
@@ -42,7 +43,8 @@ __CONFIG_VARIABLES = {
 	__LOCATIONS_SECTION: [
 		"variable1-section2", "variable2-section2", "variable3-section2"
 	],
-	__COMPILATION_FLAGS_SECTION: ["variable1-section3"]
+	__COMPILATION_FLAGS_SECTION: ["variable1-section3"],
+	__INSTALLER_SECTION: ["variable1-section4"]
 }
 __CONFIG_VALUES = {
 	"variable1-section1": "test",
@@ -58,7 +60,8 @@ __DEFAULT_CONFIG_VALUES = {
 	"variable1-section2": "default1-section2",
 	"variable2-section2": "default2-section2",
 	"variable3-section2": "default3-section2",
-	"variable1-section3": "default-section3"
+	"variable1-section3": "default-section3",
+	"variable1-section4": "default-section4"
 }
 __INVALID_LINE_ERROR_MESSAGE = "invalid line error message"
 
@@ -663,6 +666,7 @@ def test_calls_get_toggle_lines_when_writing_config(
 	__mock_config_toggles,
 	__mock_config_locations,
 	__mock_config_flags,
+	__mock_config_installer,
 	__mock_get_toggle_lines,
 	__mock_open,
 	__mock_get_file_values_from_context_values
@@ -678,10 +682,14 @@ def test_calls_get_toggle_lines_when_writing_config(
 	values_after_locations = {
 		k:v for k,v in values_after_toggles.items() if k not in __CONFIG_VARIABLES[__LOCATIONS_SECTION]
 	}
+	values_after_flags = {
+		k:v for k,v in values_after_locations.items() if k not in __CONFIG_VARIABLES[__COMPILATION_FLAGS_SECTION]
+	}
 	expected_call_params = [
 		(__mock_config_toggles, __CONFIG_VALUES),
 		(__mock_config_locations, values_after_toggles),
-		(__mock_config_flags, values_after_locations)
+		(__mock_config_flags, values_after_locations),
+		(__mock_config_installer, values_after_flags)
 	]
 	config_handler = ConfigurationFileHandler()
 	config_handler.values = __CONFIG_VALUES.copy()
@@ -717,6 +725,7 @@ def test_does_not_call_get_unkown_variable_lines_when_writing_config_with_no_unk
 	__mock_config_toggles,
 	__mock_config_locations,
 	__mock_config_flags,
+	__mock_config_installer,
 	__mock_get_toggle_lines,
 	__mock_get_unkown_variable_lines,
 	__mock_datetime_strftime,
@@ -735,6 +744,7 @@ def test_calls_get_unkown_variable_lines_when_writing_config_with_no_unkown_vari
 	__mock_config_toggles,
 	__mock_config_locations,
 	__mock_config_flags,
+	__mock_config_installer,
 	__mock_get_toggle_lines,
 	__mock_get_unkown_variable_lines,
 	__mock_datetime_strftime,
@@ -762,6 +772,7 @@ def test_calls_file_writelines_when_writing_config(
 	__mock_config_toggles,
 	__mock_config_locations,
 	__mock_config_flags,
+	__mock_config_installer,
 	__mock_get_toggle_lines,
 	__mock_get_unkown_variable_lines,
 	__mock_datetime_strftime,
@@ -784,6 +795,9 @@ def test_calls_file_writelines_when_writing_config(
 		"\n##### COMPILATION FLAGS #####\n",
 		"# We recommend not modifying this variables unless you know what you are doing.\n",
 		*__mock_get_toggle_lines(__mock_config_flags, config_reference_values),
+		"\n##### INSTALLER SECTION #####\n",
+		"# Use this variables to tune the behaviour of the installer itself.\n",
+		*__mock_get_toggle_lines(__mock_config_installer, config_reference_values),
 		*__add_unknown_variable_lines(config_reference_values, __mock_get_unkown_variable_lines),
 		f"\n# {ConfigurationFileHandler._LAST_MODIFIED_TEXT} {__mock_datetime_strftime.now().strftime()}\n"
 	])
@@ -936,6 +950,13 @@ def __mock_config_flags():
 	) as mock_object:
 		yield mock_object
 
+@pytest.fixture
+def __mock_config_installer():
+	with patch.object(
+		variables, "INSTALLER", __INSTALLER_SECTION
+	) as mock_object:
+		yield mock_object
+
 @pytest.fixture
 def __mock_datetime_now():
 	with patch("xmipp3_installer.repository.config.datetime") as mock_lib:
@@ -0,0 +1,41 @@
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from xmipp3_installer.shared import background_process
+
+from ... import get_assertion_message
+
+__CODE = "print('hello')"
+
+def test_starts_detached_interpreter_process(__mock_popen):
+  background_process.start_detached_python(__CODE)
+  __mock_popen.assert_called_once_with(
+    [sys.executable, "-c", __CODE],
+    stdin=subprocess.DEVNULL,
+    stdout=subprocess.DEVNULL,
+    stderr=subprocess.DEVNULL,
+    start_new_session=True
+  )
+
+@pytest.mark.parametrize(
+  "__mock_popen,expected_started",
+  [
+    pytest.param(None, True),
+    pytest.param(OSError(), False)
+  ],
+  indirect=["__mock_popen"]
+)
+def test_returns_whether_process_was_started(__mock_popen, expected_started):
+  started = background_process.start_detached_python(__CODE)
+  assert (
+    started == expected_started
+  ), get_assertion_message("process started", expected_started, started)
+
+@pytest.fixture
+def __mock_popen(request):
+  with patch("subprocess.Popen") as mock_method:
+    mock_method.side_effect = getattr(request, 'param', None)
+    yield mock_method
@@ -1,3 +1,7 @@
+import fcntl
+import os
+import subprocess
+import threading
 from unittest.mock import patch, call
 
 import pytest
@@ -8,6 +12,7 @@ from ... import get_assertion_message
 
 __PATHS = ['/path/to/file1', '/path/to/file2']
 __NUMBER_OF_CALLS_TEXT = "number of calls"
+__TREE_SIZE = 350
 
 @pytest.mark.parametrize(
   "paths",
@@ -19,7 +24,10 @@ __NUMBER_OF_CALLS_TEXT = "number of calls"
 )
 def test_calls_os_path_exists_for_each_path_when_deleting_paths(
   paths,
-  __mock_os_path_exists
+  __mock_os_path_exists,
+  __mock_os_path_isdir,
+  __mock_rmtree,
+  __mock_os_remove
 ):
   __mock_os_path_exists.return_value = False
   file_operations.delete_paths(paths)
@@ -41,7 +49,10 @@ def test_calls_os_path_exists_for_each_path_when_deleting_paths(
 )
 def test_calls_isdir_when_deleting_paths_that_exist(
   paths,
-  __mock_os_path_isdir
+  __mock_os_path_isdir,
+  __mock_os_path_exists,
+  __mock_rmtree,
+  __mock_os_remove
 ):
   file_operations.delete_paths(paths)
   expected_calls = [
@@ -63,7 +74,9 @@ def test_calls_isdir_when_deleting_paths_that_exist(
 def test_calls_rmtree_when_deleting_dirs_that_exist(
   paths,
   __mock_os_path_isdir,
-  __mock_rmtree
+  __mock_rmtree,
+  __mock_os_path_exists,
+  __mock_os_remove
 ):
   __mock_os_path_isdir.return_value = True
   file_operations.delete_paths(paths)
@@ -85,7 +98,10 @@ def test_calls_rmtree_when_deleting_dirs_that_exist(
 )
 def test_calls_os_remove_when_deleting_files_that_exist(
   paths,
-  __mock_os_remove
+  __mock_os_remove,
+  __mock_os_path_exists,
+  __mock_os_path_isdir,
+  __mock_rmtree
 ):
   file_operations.delete_paths(paths)
   expected_calls = [
@@ -109,37 +125,240 @@ def test_does_not_call_isdir_rmtree_os_remove_when_deleting_paths_that_do_not_ex
   __mock_os_remove.assert_not_called()
 
 def test_does_not_call_rmtree_when_deleting_files(
-  __mock_rmtree
+  __mock_rmtree,
+  __mock_os_path_exists,
+  __mock_os_path_isdir,
+  __mock_os_remove
 ):
   file_operations.delete_paths(__PATHS)
   __mock_rmtree.assert_not_called()
 
 def test_does_not_call_os_remove_when_deleting_dirs(
   __mock_os_path_isdir,
-  __mock_os_remove
+  __mock_os_remove,
+  __mock_os_path_exists,
+  __mock_rmtree
 ):
   __mock_os_path_isdir.return_value = True
   file_operations.delete_paths(__PATHS)
   __mock_os_remove.assert_not_called()
 
-@pytest.fixture(autouse=True)
+@pytest.mark.parametrize(
+  "content,n_lines,expected_tail",
+  [
+    pytest.param("a\nb\nc\n", 2, "b\nc\n", id="Trailing newline"),
+    pytest.param("a\nb\nc", 2, "b\nc", id="No trailing newline"),
+    pytest.param("a\nb\n", 5, "a\nb\n", id="Fewer lines than requested"),
+    pytest.param("a\nb\n", 0, "", id="No lines requested"),
+    pytest.param("", 3, "", id="Empty file"),
+    pytest.param("a\rb\nc\n", 2, "a\rb\nc\n", id="Carriage returns are not line breaks")
+  ]
+)
+def test_returns_expected_tail_when_reading_tail(content, n_lines, expected_tail, tmp_path):
+  text_file = tmp_path / "file.log"
+  text_file.write_bytes(content.encode())
+  tail = file_operations.read_tail(str(text_file), n_lines)
+  assert (
+    tail == expected_tail
+  ), get_assertion_message("tail", expected_tail, tail)
+
+def test_reads_tail_spanning_several_blocks(tmp_path):
+  lines = [f"line {index}: {'x' * 100}\n" for index in range(1000)]
+  text_file = tmp_path / "file.log"
+  text_file.write_text("".join(lines))
+  tail = file_operations.read_tail(str(text_file), 300)
+  expected_tail = "".join(lines[-300:])
+  assert (
+    tail == expected_tail
+  ), get_assertion_message("tail", expected_tail[:100], tail[:100])
+
+def test_returns_none_when_reading_tail_of_missing_file(tmp_path):
+  tail = file_operations.read_tail(str(tmp_path / "missing.log"), 3)
+  assert (
+    tail is None
+  ), get_assertion_message("tail", None, tail)
+
+def test_moves_existing_paths_into_a_batch_when_moving_to_trash(__trash_path, __tree):
+  paths = [str(__tree / "dir"), str(__tree / "file.txt"), str(__tree / "missing")]
+  batch, unmoved_paths = file_operations.move_to_trash(paths, __trash_path)
+  moved_names = sorted(os.listdir(batch))
+  expected_names = ["0-dir", "1-file.txt"]
+  assert (
+    os.path.dirname(batch) == __trash_path and
+    moved_names == expected_names and
+    not unmoved_paths and
+    not any(os.path.lexists(path) for path in paths)
+  ), get_assertion_message("moved paths", expected_names, moved_names)
+
+def test_does_not_create_trash_when_moving_paths_that_do_not_exist(__trash_path, __tree):
+  result = file_operations.move_to_trash([str(__tree / "missing")], __trash_path)
+  assert (
+    result == (None, []) and not os.path.exists(__trash_path)
+  ), get_assertion_message("move result", (None, []), result)
+
+def test_returns_paths_that_cannot_be_moved_when_moving_to_trash(__trash_path, __tree):
+  paths = [str(__tree / "file.txt")]
+  with patch("os.rename", side_effect=OSError):
+    _, unmoved_paths = file_operations.move_to_trash(paths, __trash_path)
+  assert (
+    unmoved_paths == paths
+  ), get_assertion_message("unmoved paths", paths, unmoved_paths)
+
+def test_returns_all_paths_as_unmoved_when_trash_cannot_be_created(__trash_path, __tree):
+  paths = [str(__tree / "dir"), str(__tree / "file.txt")]
+  with patch("tempfile.mkdtemp", side_effect=OSError):
+    result = file_operations.move_to_trash(paths, __trash_path)
+  expected_result = (None, paths)
+  assert (
+    result == expected_result
+  ), get_assertion_message("move result", expected_result, result)
+
+@pytest.mark.parametrize("n_jobs", [pytest.param(1), pytest.param(None)])
+def test_deletes_batches_and_returns_freed_bytes_when_deleting_from_trash(n_jobs, __trash_path, __tree):
+  batch, _ = file_operations.move_to_trash([str(__tree / "dir"), str(__tree / "file.txt")], __trash_path)
+  freed_bytes = file_operations.delete_from_trash(__trash_path, [batch], n_jobs=n_jobs)
+  assert (
+    freed_bytes == __TREE_SIZE and not os.path.exists(__trash_path)
+  ), get_assertion_message("freed bytes", __TREE_SIZE, freed_bytes)
+
+def test_keeps_other_batches_when_deleting_from_trash(__trash_path, __tree):
+  batch, _ = file_operations.move_to_trash([str(__tree / "dir")], __trash_path)
+  other_batch, _ = file_operations.move_to_trash([str(__tree / "file.txt")], __trash_path)
+  file_operations.delete_from_trash(__trash_path, [batch])
+  remaining_batches = os.listdir(__trash_path)
+  expected_batches = [os.path.basename(other_batch)]
+  assert (
+    remaining_batches == expected_batches
+  ), get_assertion_message("remaining batches", expected_batches, remaining_batches)
+
+def test_does_not_follow_symlinks_when_deleting_from_trash(__trash_path, __tree, tmp_path):
+  outside_file = tmp_path / "outside.txt"
+  outside_file.write_text("keep")
+  (__tree / "dir" / "link").symlink_to(outside_file)
+  batch, _ = file_operations.move_to_trash([str(__tree / "dir")], __trash_path)
+  file_operations.delete_from_trash(__trash_path, [batch])
+  assert (
+    outside_file.read_text() == "keep"
+  ), get_assertion_message("symlink target content", "keep", outside_file.read_text())
+
+@pytest.mark.parametrize("n_jobs", [pytest.param(1), pytest.param(None)])
+def test_returns_size_of_each_path_when_getting_sizes(n_jobs, __tree):
+  paths = [str(__tree / "dir"), str(__tree / "missing"), str(__tree / "file.txt"), str(__tree)]
+  sizes = file_operations.get_sizes(paths, n_jobs=n_jobs)
+  expected_sizes = [300, 0, 50, __TREE_SIZE]
+  assert (
+    sizes == expected_sizes
+  ), get_assertion_message("sizes", expected_sizes, sizes)
+
+def test_does_not_follow_symlinks_when_getting_sizes(__tree, tmp_path):
+  outside_file = tmp_path / "outside.txt"
+  outside_file.write_bytes(b"d" * 1000)
+  link = __tree / "dir" / "link"
+  link.symlink_to(outside_file)
+  sizes = file_operations.get_sizes([str(__tree / "dir")])
+  expected_sizes = [300 + os.lstat(link).st_size]
+  assert (
+    sizes == expected_sizes
+  ), get_assertion_message("sizes", expected_sizes, sizes)
+
+def test_does_not_start_process_when_there_is_no_trash(__trash_path):
+  with patch("subprocess.Popen") as mock_popen:
+    started = file_operations.sweep_trash_in_background(__trash_path)
+  assert (
+    not started and not mock_popen.called
+  ), get_assertion_message("sweep started", False, started)
+
+def test_starts_detached_process_when_sweeping_trash(__trash_path, __tree):
+  file_operations.move_to_trash([str(__tree / "dir")], __trash_path)
+  with patch("subprocess.Popen") as mock_popen:
+    started = file_operations.sweep_trash_in_background(__trash_path)
+  kwargs = mock_popen.call_args.kwargs
+  assert (
+    started and kwargs["start_new_session"] and kwargs["stdout"] == subprocess.DEVNULL
+  ), get_assertion_message("detached process", True, kwargs)
+
+def test_sweeps_batches_present_when_started(__trash_path, __tree):
+  file_operations.move_to_trash([str(__tree / "dir")], __trash_path)
+  with patch("subprocess.Popen") as mock_popen:
+    file_operations.sweep_trash_in_background(__trash_path)
+  file_operations.move_to_trash([str(__tree / "file.txt")], __trash_path)
+  subprocess.run(mock_popen.call_args.args[0], check=True)
+  remaining_entries = sorted(name for _, _, files in os.walk(__trash_path) for name in files)
+  expected_entries = ["0-file.txt"]
+  assert (
+    remaining_entries == expected_entries
+  ), get_assertion_message("remaining entries", expected_entries, remaining_entries)
+
+def test_sweeps_only_given_batches_when_sweeping_trash_in_background(__trash_path, __tree):
+  file_operations.move_to_trash([str(__tree / "dir")], __trash_path)
+  batch, _ = file_operations.move_to_trash([str(__tree / "file.txt")], __trash_path)
+  with patch("subprocess.Popen") as mock_popen:
+    file_operations.sweep_trash_in_background(__trash_path, [batch])
+  subprocess.run(mock_popen.call_args.args[0], check=True)
+  remaining_entries = sorted(name for _, _, files in os.walk(__trash_path) for name in files)
+  expected_entries = ["a.o", "b.so"]
+  assert (
+    remaining_entries == expected_entries
+  ), get_assertion_message("remaining entries", expected_entries, remaining_entries)
+
+def test_returns_freed_bytes_when_sweeping_trash(__trash_path, __tree):
+  batch, _ = file_operations.move_to_trash([str(__tree / "dir"), str(__tree / "file.txt")], __trash_path)
+  freed_bytes = file_operations.sweep_trash(__trash_path, [batch])
+  assert (
+    freed_bytes == __TREE_SIZE and not os.path.exists(__trash_path)
+  ), get_assertion_message("freed bytes", __TREE_SIZE, freed_bytes)
+
+def test_returns_zero_when_sweeping_missing_trash(__trash_path):
+  freed_bytes = file_operations.sweep_trash(__trash_path, [os.path.join(__trash_path, "batch")])
+  assert (
+    freed_bytes == 0
+  ), get_assertion_message("freed bytes", 0, freed_bytes)
+
+def test_waits_for_running_sweep_when_sweeping_trash(__trash_path, __tree):
+  batch, _ = file_operations.move_to_trash([str(__tree / "dir")], __trash_path)
+  trash_fd = os.open(__trash_path, os.O_RDONLY)
+  fcntl.flock(trash_fd, fcntl.LOCK_EX)
+  sweep = threading.Thread(target=file_operations.sweep_trash, args=(__trash_path, [batch]))
+  sweep.start()
+  sweep.join(timeout=0.2)
+  swept_while_locked = not os.path.exists(batch)
+  os.close(trash_fd)
+  sweep.join()
+  assert (
+    not swept_while_locked and not os.path.exists(batch)
+  ), get_assertion_message("swept while another sweep was running", False, swept_while_locked)
+
+@pytest.fixture
+def __trash_path(tmp_path):
+  yield str(tmp_path / "trash")
+
+@pytest.fixture
+def __tree(tmp_path):
+  tree = tmp_path / "tree"
+  (tree / "dir" / "nested").mkdir(parents=True)
+  (tree / "dir" / "a.o").write_bytes(b"a" * 100)
+  (tree / "dir" / "nested" / "b.so").write_bytes(b"b" * 200)
+  (tree / "file.txt").write_bytes(b"c" * 50)
+  yield tree
+
+@pytest.fixture
 def __mock_os_path_exists(request):
   with patch("os.path.exists") as mock_method:
     mock_method.return_value = getattr(request, 'param', True)
     yield mock_method
 
-@pytest.fixture(autouse=True)
+@pytest.fixture
 def __mock_os_path_isdir(request):
   with patch("os.path.isdir") as mock_method:
     mock_method.return_value = getattr(request, 'param', False)
     yield mock_method
 
-@pytest.fixture(autouse=True)
+@pytest.fixture
 def __mock_rmtree():
   with patch("shutil.rmtree") as mock_method:
     yield mock_method
 
-@pytest.fixture(autouse=True)
+@pytest.fixture
 def __mock_os_remove():
   with patch("os.remove") as mock_method:
     yield mock_method
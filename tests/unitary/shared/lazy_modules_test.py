@@ -0,0 +1,49 @@
+import sys
+import types
+from unittest.mock import patch
+
+import pytest
+
+from xmipp3_installer.shared import lazy_modules
+
+from ... import get_assertion_message
+
+__MODULE_NAME = "json.tool"
+
+def test_returns_imported_module_if_already_imported():
+  module = lazy_modules.lazy_import(__name__)
+  assert (
+    module is sys.modules[__name__]
+  ), get_assertion_message("returned module", sys.modules[__name__], module)
+
+def test_does_not_load_module_until_it_is_used(__mock_sys_modules):
+  module = lazy_modules.lazy_import(__MODULE_NAME)
+  is_loaded = type(module) is types.ModuleType
+  assert (
+    not is_loaded
+  ), get_assertion_message("module loaded", False, is_loaded)
+
+def test_loads_module_when_it_is_used(__mock_sys_modules):
+  module = lazy_modules.lazy_import(__MODULE_NAME)
+  is_callable = callable(module.main)
+  is_loaded = type(module) is types.ModuleType
+  assert (
+    is_callable and is_loaded
+  ), get_assertion_message("module loaded", True, is_loaded)
+
+def test_registers_lazy_module_as_imported(__mock_sys_modules):
+  module = lazy_modules.lazy_import(__MODULE_NAME)
+  registered_module = __mock_sys_modules[__MODULE_NAME]
+  assert (
+    registered_module is module
+  ), get_assertion_message("registered module", module, registered_module)
+
+def test_raises_module_not_found_error_when_module_does_not_exist():
+  with pytest.raises(ModuleNotFoundError):
+    lazy_modules.lazy_import("xmipp3_installer.non_existing_module")
+
+@pytest.fixture
+def __mock_sys_modules():
+  sys.modules.pop(__MODULE_NAME, None)
+  with patch.dict(sys.modules) as mock_object:
+    yield mock_object
@@ -0,0 +1,23 @@
+import pytest
+
+from xmipp3_installer.shared import numeric
+
+from ... import get_assertion_message
+
+__DEFAULT_VALUE = 5
+
+@pytest.mark.parametrize(
+  "value,expected_number",
+  [
+    pytest.param("100", 100),
+    pytest.param("0", 0),
+    pytest.param("-1", __DEFAULT_VALUE),
+    pytest.param("abc", __DEFAULT_VALUE),
+    pytest.param(None, __DEFAULT_VALUE)
+  ]
+)
+def test_returns_expected_non_negative_int(value, expected_number):
+  number = numeric.get_non_negative_int(value, __DEFAULT_VALUE)
+  assert (
+    number == expected_number
+  ), get_assertion_message("parsed number", expected_number, number)
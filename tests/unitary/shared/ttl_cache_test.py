@@ -0,0 +1,133 @@
+import json
+import os
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from xmipp3_installer.shared import ttl_cache
+
+from ... import get_assertion_message
+
+__KEY = "key"
+__VALUE = {"some": ["json", "value"]}
+__TTL = 60
+__NOW = 1000
+__N_WRITERS = 8
+__N_KEYS_PER_WRITER = 20
+
+def test_returns_none_when_getting_value_from_non_existing_cache(__cache_file):
+  value = ttl_cache.get_cached_value(__cache_file, __KEY, __TTL)
+  assert (
+    value is None
+  ), get_assertion_message("cached value", None, value)
+
+def test_returns_stored_value_when_getting_recent_value(__cache_file):
+  ttl_cache.set_cached_value(__cache_file, __KEY, __VALUE)
+  value = ttl_cache.get_cached_value(__cache_file, __KEY, __TTL)
+  assert (
+    value == __VALUE
+  ), get_assertion_message("cached value", __VALUE, value)
+
+@pytest.mark.parametrize(
+  "stored_at,ttl,expected_value",
+  [
+    pytest.param(__NOW - 10, __TTL, __VALUE),
+    pytest.param(__NOW - __TTL, __TTL, __VALUE),
+    pytest.param(__NOW - __TTL - 1, __TTL, None),
+    pytest.param(__NOW + 10, __TTL, None),
+    pytest.param(__NOW, 0, None),
+    pytest.param(__NOW, -1, None)
+  ]
+)
+def test_returns_expected_value_depending_on_its_age(
+  stored_at,
+  ttl,
+  expected_value,
+  __cache_file,
+  __mock_time
+):
+  __mock_time.return_value = stored_at
+  ttl_cache.set_cached_value(__cache_file, __KEY, __VALUE)
+  __mock_time.return_value = __NOW
+  value = ttl_cache.get_cached_value(__cache_file, __KEY, ttl)
+  assert (
+    value == expected_value
+  ), get_assertion_message("cached value", expected_value, value)
+
+@pytest.mark.parametrize(
+  "content",
+  [
+    pytest.param("not json"),
+    pytest.param(json.dumps(["not", "a", "dict"])),
+    pytest.param(json.dumps({__KEY: "not an entry"})),
+    pytest.param(json.dumps({__KEY: {"timestamp": __NOW}})),
+    pytest.param(json.dumps({__KEY: {"timestamp": "now", "value": __VALUE}}))
+  ]
+)
+def test_returns_none_when_getting_value_from_invalid_cache(
+  content,
+  __cache_file,
+  __mock_time
+):
+  with open(__cache_file, "w") as cache:
+    cache.write(content)
+  value = ttl_cache.get_cached_value(__cache_file, __KEY, __TTL)
+  assert (
+    value is None
+  ), get_assertion_message("cached value", None, value)
+
+def test_keeps_other_values_when_setting_value(__cache_file):
+  ttl_cache.set_cached_value(__cache_file, "other", "other_value")
+  ttl_cache.set_cached_value(__cache_file, __KEY, __VALUE)
+  values = (
+    ttl_cache.get_cached_value(__cache_file, "other", __TTL),
+    ttl_cache.get_cached_value(__cache_file, __KEY, __TTL)
+  )
+  expected_values = ("other_value", __VALUE)
+  assert (
+    values == expected_values
+  ), get_assertion_message("cached values", expected_values, values)
+
+def test_does_not_leave_temporary_files_when_value_cannot_be_serialized(__cache_file):
+  ttl_cache.set_cached_value(__cache_file, __KEY, object())
+  files = os.listdir(os.path.dirname(__cache_file))
+  expected_files = [f"{os.path.basename(__cache_file)}.lock"]
+  assert (
+    files == expected_files
+  ), get_assertion_message("files in cache directory", expected_files, files)
+
+def test_keeps_values_of_all_concurrent_writers(__cache_file):
+  barrier = threading.Barrier(__N_WRITERS)
+  def __write_keys(writer: int):
+    barrier.wait()
+    for index in range(__N_KEYS_PER_WRITER):
+      ttl_cache.set_cached_value(__cache_file, f"{writer}-{index}", index)
+  writers = [threading.Thread(target=__write_keys, args=(writer,)) for writer in range(__N_WRITERS)]
+  for writer in writers:
+    writer.start()
+  for writer in writers:
+    writer.join()
+  with open(__cache_file) as cache:
+    n_keys = len(json.load(cache))
+  expected_n_keys = __N_WRITERS * __N_KEYS_PER_WRITER
+  assert (
+    n_keys == expected_n_keys
+  ), get_assertion_message("number of cached keys", expected_n_keys, n_keys)
+
+def test_does_not_raise_when_cache_directory_cannot_be_created(tmp_path):
+  blocking_file = tmp_path / "file"
+  blocking_file.write_text("")
+  ttl_cache.set_cached_value(str(blocking_file / "cache.json"), __KEY, __VALUE)
+
+@pytest.fixture
+def __cache_file(tmp_path):
+  cache_dir = tmp_path / "cache"
+  cache_dir.mkdir()
+  yield str(cache_dir / "cache.json")
+
+@pytest.fixture
+def __mock_time():
+  with patch("time.time") as mock_method:
+    mock_method.return_value = __NOW
+    yield mock_method